@@ -0,0 +1,142 @@
+import json
+import logging
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import click
+
+DATASET_SIZES = {"10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+ALLOWED_PERSISTENCE_ENGINES = ["sql", "file"]
+COMPARED_METRICS = ["p50_ms", "p95_ms", "p99_ms", "mean_ms"]
+STARTUP_MODULES = ["entrypoints.rest"]
+RESULTS_PATH = Path(__file__).parent / "results"
+
+
+@click.group()
+def cli() -> None:
+    pass
+
+
+@cli.command()
+@click.option("--size", type=click.Choice(list(DATASET_SIZES), case_sensitive=False), default="10k", show_default=True)
+@click.option(
+    "--engine",
+    "engines",
+    type=click.Choice(ALLOWED_PERSISTENCE_ENGINES, case_sensitive=False),
+    multiple=True,
+    default=ALLOWED_PERSISTENCE_ENGINES,
+    show_default=True,
+)
+@click.option("--iterations", type=click.IntRange(min=1), default=200, show_default=True)
+@click.option("--warmup", type=click.IntRange(min=0), default=5, show_default=True)
+@click.option("--time-budget", type=click.FloatRange(min=0), default=30.0, show_default=True, help="Seconds per case.")
+@click.option("--seed", type=int, default=0, show_default=True)
+@click.option(
+    "--data-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Keeps the generated datasets here, so later runs with the same size and seed reuse them.",
+)
+@click.option("--output", type=click.Path(dir_okay=False, path_type=Path))
+def run(
+    size: str,
+    engines: tuple[str, ...],
+    iterations: int,
+    warmup: int,
+    time_budget: float,
+    seed: int,
+    data_dir: Path | None,
+    output: Path | None,
+) -> None:
+    """Benchmark query services and REST endpoints against a generated dataset."""
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    with tempfile.TemporaryDirectory(prefix="crm-benchmark-") as temporary_dir:
+        root = (data_dir or Path(temporary_dir)) / size.lower()
+        data_paths = {"SQL": root / "sql", "FILE": root / "file"}
+        for path in data_paths.values():
+            path.mkdir(parents=True, exist_ok=True)
+        # configuration modules read these on import, so they have to be set before the suite is imported
+        os.environ["DB_URL"] = f"sqlite:///{data_paths['SQL'] / 'crm.db'}"
+        os.environ["ROOT_FILES_PATH"] = str(data_paths["FILE"])
+
+        from benchmarks.dataset import DatasetSpec
+        from benchmarks.runner import RunSettings
+        from benchmarks.suite import run_suite
+        from containers.config import PersistenceEngine
+
+        report = run_suite(
+            spec=DatasetSpec(size=DATASET_SIZES[size.lower()], seed=seed),
+            engines=[PersistenceEngine(engine.upper()) for engine in dict.fromkeys(engines)],
+            settings=RunSettings(iterations=iterations, warmup=warmup, time_budget=time_budget),
+            data_paths=data_paths,
+        )
+
+    if output is None:
+        revision = (report["commit"] or "unknown")[:12]
+        output = RESULTS_PATH / f"{revision}-{size.lower()}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    click.echo(f"Results written to {output}")
+
+
+@cli.command()
+@click.argument("baseline", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.argument("current", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.option("--metric", type=click.Choice(COMPARED_METRICS), default="p95_ms", show_default=True)
+@click.option("--threshold", type=float, default=0.2, show_default=True, help="Allowed relative slowdown.")
+def compare(baseline: Path, current: Path, metric: str, threshold: float) -> None:
+    """Compare two result files and fail if any case got slower than the threshold allows."""
+    from benchmarks.runner import compare_reports
+
+    comparisons = compare_reports(json.loads(baseline.read_text()), json.loads(current.read_text()), metric)
+    regressions = [comparison for comparison in comparisons if comparison.change > threshold]
+    for comparison in comparisons:
+        marker = "REGRESSION" if comparison in regressions else ""
+        click.echo(
+            f"{comparison.engine:<5} {comparison.name:<60} "
+            f"{comparison.baseline:>10.3f} -> {comparison.current:>10.3f} {metric} "
+            f"({comparison.change:+.1%}) {marker}".rstrip()
+        )
+    if regressions:
+        click.echo(f"{len(regressions)} case(s) regressed by more than {threshold:.0%}", err=True)
+        sys.exit(1)
+
+
+@cli.command()
+@click.option("--module", "modules", multiple=True, default=STARTUP_MODULES, show_default=True)
+@click.option("--repeat", type=click.IntRange(min=1), default=10, show_default=True)
+@click.option(
+    "--engine",
+    type=click.Choice(ALLOWED_PERSISTENCE_ENGINES, case_sensitive=False),
+    default="sql",
+    show_default=True,
+)
+@click.option("--output", type=click.Path(dir_okay=False, path_type=Path))
+def startup(modules: tuple[str, ...], repeat: int, engine: str, output: Path | None) -> None:
+    """Measure how long importing the app takes in a fresh interpreter."""
+    from attrs import asdict
+
+    from benchmarks.startup import measure_import
+
+    with tempfile.TemporaryDirectory(prefix="crm-startup-") as temporary_dir:
+        env = {
+            "PERSISTENCE_ENGINE": engine.upper(),
+            "DB_URL": f"sqlite:///{Path(temporary_dir) / 'crm.db'}",
+            "ROOT_FILES_PATH": temporary_dir,
+        }
+        summaries = [measure_import(module, repeat, env) for module in modules]
+
+    for summary in summaries:
+        click.echo(
+            f"{summary.module:<40} min={summary.min_ms:.1f}ms median={summary.median_ms:.1f}ms "
+            f"max={summary.max_ms:.1f}ms loaded={','.join(summary.loaded_modules) or '-'}"
+        )
+    if output is not None:
+        output.write_text(json.dumps([asdict(summary) for summary in summaries], indent=2))
+        click.echo(f"Results written to {output}")
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,172 @@
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any
+
+from attrs import define
+from fastapi.testclient import TestClient
+
+from benchmarks.dataset import BENCHMARK_SALESMAN_ID, DatasetSpec, get_entity_id
+from building_blocks.application.filters import FilterCondition, FilterConditionType
+
+QUERY_SERVICE_KIND = "query_service"
+REST_KIND = "rest"
+BY_IDS_SAMPLE_SIZE = 20
+
+
+class UnexpectedResponse(Exception):
+    def __init__(self, method: str, path: str, status_code: int) -> None:
+        self.message = f"{method} {path} returned {status_code}"
+        super().__init__(self.message)
+
+
+@define(frozen=True)
+class BenchmarkCase:
+    kind: str
+    name: str
+    call: Callable[[], Any]
+
+
+@define(frozen=True, kw_only=True)
+class SampleIds:
+    customer_id: str
+    lead_id: str
+    opportunity_id: str
+    representative_id: str
+    customer_ids: Sequence[str]
+    lead_ids: Sequence[str]
+    opportunity_ids: Sequence[str]
+    representative_ids: Sequence[str]
+
+    @classmethod
+    def from_spec(cls, spec: DatasetSpec) -> "SampleIds":
+        return cls(
+            customer_id=get_entity_id("customer", 0),
+            lead_id=get_entity_id("lead", 0),
+            opportunity_id=get_entity_id("opportunity", 0),
+            representative_id=BENCHMARK_SALESMAN_ID,
+            customer_ids=_get_ids("customer", spec.customers),
+            lead_ids=_get_ids("lead", spec.leads),
+            opportunity_ids=_get_ids("opportunity", spec.opportunities),
+            representative_ids=_get_ids("representative", spec.sales_representatives),
+        )
+
+
+def _get_ids(kind: str, count: int) -> Sequence[str]:
+    return tuple(get_entity_id(kind, index) for index in range(min(count, BY_IDS_SAMPLE_SIZE)))
+
+
+def _equals(field: str, value: Any) -> list[FilterCondition]:
+    return [FilterCondition(field=field, value=value, condition_type=FilterConditionType.EQUALS)]
+
+
+def get_query_service_cases(query_services: dict[str, Any], ids: SampleIds) -> list[BenchmarkCase]:
+    calls: dict[str, dict[str, Callable[[Any], Any]]] = {
+        "CustomerQueryService": {
+            "get": lambda qs: qs.get(ids.customer_id),
+            "get_all": lambda qs: qs.get_all(),
+            "get_by_ids": lambda qs: qs.get_by_ids(ids.customer_ids),
+            "get_filtered": lambda qs: qs.get_filtered(_equals("relation_manager_id", ids.representative_id)),
+            "get_contact_persons": lambda qs: qs.get_contact_persons(ids.customer_id),
+        },
+        "LeadQueryService": {
+            "get": lambda qs: qs.get(ids.lead_id),
+            "get_all": lambda qs: qs.get_all(),
+            "get_by_ids": lambda qs: qs.get_by_ids(ids.lead_ids),
+            "get_filtered": lambda qs: qs.get_filtered(_equals("customer_id", ids.customer_id)),
+            "get_notes": lambda qs: qs.get_notes(ids.lead_id),
+            "get_assignment_history": lambda qs: qs.get_assignment_history(ids.lead_id),
+        },
+        "OpportunityQueryService": {
+            "get": lambda qs: qs.get(ids.opportunity_id),
+            "get_all": lambda qs: qs.get_all(),
+            "get_by_ids": lambda qs: qs.get_by_ids(ids.opportunity_ids),
+            "get_filtered": lambda qs: qs.get_filtered(_equals("owner_id", ids.representative_id)),
+            "get_notes": lambda qs: qs.get_notes(ids.opportunity_id),
+            "get_offer": lambda qs: qs.get_offer(ids.opportunity_id),
+        },
+        "SalesRepresentativeQueryService": {
+            "get": lambda qs: qs.get(ids.representative_id),
+            "get_all": lambda qs: qs.get_all(),
+            "get_by_ids": lambda qs: qs.get_by_ids(ids.representative_ids),
+        },
+        "PipelineAnalyticsQueryService": {
+            "get_pipeline_stats": lambda qs: qs.get_pipeline_stats(["stage", "currency"]),
+        },
+        "ForecastQueryService": {
+            "get_monthly_pipeline_values": lambda qs: qs.get_monthly_pipeline_values(),
+            "get_exchange_rates": lambda qs: qs.get_exchange_rates(),
+        },
+        "CustomerOverviewQueryService": {
+            "get": lambda qs: qs.get(ids.customer_id),
+        },
+    }
+    return [
+        BenchmarkCase(QUERY_SERVICE_KIND, f"{service_name}.{method_name}", _bind(call, query_services[service_name]))
+        for service_name, methods in calls.items()
+        for method_name, call in methods.items()
+    ]
+
+
+def _bind(call: Callable[[Any], Any], query_service: Any) -> Callable[[], Any]:
+    return lambda: call(query_service)
+
+
+def get_rest_cases(client: TestClient, ids: SampleIds) -> list[BenchmarkCase]:
+    customer_path = f"/customers/{ids.customer_id}"
+    lead_path = f"/leads/{ids.lead_id}"
+    opportunity_path = f"/opportunities/{ids.opportunity_id}"
+    note = {"json": {"content": "Benchmark note"}}
+    endpoints: Iterable[tuple[str, str, str, str | None, dict[str, Any]]] = (
+        ("GET", "/auth/users/me", "/auth/users/me", None, {}),
+        ("GET", "/customers/", "/customers/", None, {}),
+        ("GET", "/customers/", "/customers/", "ids", {"params": {"ids": ",".join(ids.customer_ids)}}),
+        (
+            "GET",
+            "/customers/",
+            "/customers/",
+            "relation_manager_id",
+            {"params": {"relation_manager_id": ids.representative_id}},
+        ),
+        ("GET", "/customers/{customer_id}", customer_path, None, {}),
+        ("GET", "/customers/{customer_id}/contact-persons", f"{customer_path}/contact-persons", None, {}),
+        ("GET", "/customers/{customer_id}/overview", f"{customer_path}/overview", None, {}),
+        ("GET", "/countries", "/countries", None, {}),
+        ("GET", "/languages", "/languages", None, {}),
+        ("GET", "/leads/", "/leads/", None, {}),
+        ("GET", "/leads/", "/leads/", "ids", {"params": {"ids": ",".join(ids.lead_ids)}}),
+        ("GET", "/leads/", "/leads/", "customer_id", {"params": {"customer_id": ids.customer_id}}),
+        ("GET", "/leads/{lead_id}", lead_path, None, {}),
+        ("GET", "/leads/{lead_id}/assignments", f"{lead_path}/assignments", None, {}),
+        ("GET", "/leads/{lead_id}/notes", f"{lead_path}/notes", None, {}),
+        ("POST", "/leads/{lead_id}/notes", f"{lead_path}/notes", None, note),
+        ("GET", "/opportunities/", "/opportunities/", None, {}),
+        ("GET", "/opportunities/", "/opportunities/", "ids", {"params": {"ids": ",".join(ids.opportunity_ids)}}),
+        ("GET", "/opportunities/", "/opportunities/", "owner_id", {"params": {"owner_id": ids.representative_id}}),
+        ("GET", "/opportunities/{opportunity_id}", opportunity_path, None, {}),
+        ("GET", "/opportunities/{opportunity_id}/offer-items", f"{opportunity_path}/offer-items", None, {}),
+        ("GET", "/opportunities/{opportunity_id}/notes", f"{opportunity_path}/notes", None, {}),
+        ("POST", "/opportunities/{opportunity_id}/notes", f"{opportunity_path}/notes", None, note),
+        ("GET", "/sales-representatives/", "/sales-representatives/", None, {}),
+        ("GET", "/currencies", "/currencies", None, {}),
+        ("GET", "/products", "/products", None, {}),
+        ("GET", "/analytics/pipeline", "/analytics/pipeline", None, {"params": {"group_by": ["stage", "currency"]}}),
+        ("GET", "/forecast/", "/forecast/", None, {"params": {"currency": "EUR"}}),
+        ("GET", "/forecast/exchange-rates", "/forecast/exchange-rates", None, {}),
+    )
+    return [
+        BenchmarkCase(
+            REST_KIND,
+            f"{method} {route}" if variant is None else f"{method} {route}?{variant}",
+            _make_request(client, method, path, request_kwargs),
+        )
+        for method, route, path, variant, request_kwargs in endpoints
+    ]
+
+
+def _make_request(client: TestClient, method: str, path: str, request_kwargs: dict[str, Any]) -> Callable[[], Any]:
+    def request() -> Any:
+        response = client.request(method, path, **request_kwargs)
+        if response.status_code >= 400:
+            raise UnexpectedResponse(method, path, response.status_code)
+        return response
+
+    return request
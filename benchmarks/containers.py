@@ -0,0 +1,91 @@
+from typing import Any
+
+from fastapi import FastAPI
+
+from authentication.infrastructure.exceptions import InvalidToken
+from authentication.infrastructure.service.base import AuthenticationService, UserReadModel
+from authentication.presentation.rest.api import router as auth_router
+from building_blocks.presentation.instrumentation import InstrumentationMiddleware
+from containers.config import PersistenceEngine
+from containers.container import ApplicationContainer
+from containers.file import FileApplicationContainer
+from containers.sql import SQLApplicationContainer
+from customer_management.presentation.rest.api import router as customer_management_router
+from customer_overview.presentation.rest.api import router as customer_overview_router
+from sales.presentation.rest.api import router as sales_router
+
+ROLES_SEPARATOR = ":"
+
+
+class BenchmarkAuthenticationService(AuthenticationService):
+    """Trusts unsigned "<salesman_id>[:<role>,...]" tokens, so requests measure the application instead of Firebase."""
+
+    def verify_token(self, token: str) -> UserReadModel:
+        salesman_id, _, roles = token.partition(ROLES_SEPARATOR)
+        if not salesman_id:
+            raise InvalidToken
+        return UserReadModel(id=salesman_id, salesman_id=salesman_id, roles=[role for role in roles.split(",") if role])
+
+    def has_role(self, user_data: UserReadModel, role: str) -> bool:
+        return role in user_data.roles
+
+    def create_account(self, email: str, salesman_id: str) -> None:
+        pass
+
+
+def make_benchmark_token(salesman_id: str, roles: list[str]) -> str:
+    return ROLES_SEPARATOR.join([salesman_id, ",".join(roles)])
+
+
+class BenchmarkContainerMixin:
+    _customer_qs: Any
+    _lead_qs: Any
+    _opportunity_qs: Any
+    _sr_qs: Any
+    _analytics_qs: Any
+    _forecast_qs: Any
+    _customer_overview_qs: Any
+
+    def _create_auth_service(self) -> AuthenticationService:
+        return BenchmarkAuthenticationService()
+
+    @property
+    def query_services(self) -> dict[str, Any]:
+        return {
+            "CustomerQueryService": self._customer_qs,
+            "LeadQueryService": self._lead_qs,
+            "OpportunityQueryService": self._opportunity_qs,
+            "SalesRepresentativeQueryService": self._sr_qs,
+            "PipelineAnalyticsQueryService": self._analytics_qs,
+            "ForecastQueryService": self._forecast_qs,
+            "CustomerOverviewQueryService": self._customer_overview_qs,
+        }
+
+
+class SQLBenchmarkContainer(BenchmarkContainerMixin, SQLApplicationContainer):
+    pass
+
+
+class FileBenchmarkContainer(BenchmarkContainerMixin, FileApplicationContainer):
+    pass
+
+
+_container_factory: dict[PersistenceEngine, type[SQLBenchmarkContainer | FileBenchmarkContainer]] = {
+    PersistenceEngine.SQL: SQLBenchmarkContainer,
+    PersistenceEngine.FILE: FileBenchmarkContainer,
+}
+
+
+def build_container(persistence_engine: PersistenceEngine) -> SQLBenchmarkContainer | FileBenchmarkContainer:
+    return _container_factory[persistence_engine]()
+
+
+def create_app(container: ApplicationContainer) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(InstrumentationMiddleware)
+    app.include_router(auth_router)
+    app.include_router(customer_management_router)
+    app.include_router(sales_router)
+    app.include_router(customer_overview_router)
+    app.state.container = container
+    return app
@@ -0,0 +1,311 @@
+import json
+import random
+from collections.abc import Iterable, Iterator
+from decimal import Decimal
+from functools import cached_property
+from itertools import batched
+from pathlib import Path
+from shelve import Shelf
+from typing import Any
+from uuid import UUID, uuid4, uuid5
+
+from alembic.command import upgrade as alembic_upgrade
+from alembic.config import Config
+from attrs import asdict, define
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from building_blocks.infrastructure.file.io import get_write_db
+from building_blocks.infrastructure.sql import db as sql_db
+from building_blocks.infrastructure.sql.utils import get_column_values
+from containers.container import ApplicationContainer
+from customer_management.domain.entities.customer.customer import Customer
+from customer_management.domain.value_objects.address import Address
+from customer_management.domain.value_objects.company_info import CompanyInfo
+from customer_management.domain.value_objects.company_segment import (
+    ALLOWED_COMPANY_SIZES,
+    ALLOWED_LEGAL_FORMS,
+    CompanySegment,
+)
+from customer_management.domain.value_objects.contact_method import ContactMethod
+from customer_management.domain.value_objects.country import Country
+from customer_management.domain.value_objects.industry import ALLOWED_INDUSTRY_NAMES, Industry
+from customer_management.domain.value_objects.language import Language
+from customer_management.infrastructure.file import config as customer_file_config
+from customer_management.infrastructure.sql.customer.models import CountryModel, LanguageModel
+from customer_management.infrastructure.sql.customer.repository import CustomerSQLRepository
+from sales.application.forecast.command_model import ExchangeRateCreateUpdateModel
+from sales.application.lead.command_model import AssignmentUpdateModel
+from sales.domain.entities.lead import Lead
+from sales.domain.entities.opportunity import Opportunity
+from sales.domain.entities.sales_representative import SalesRepresentative
+from sales.domain.value_objects.acquisition_source import ALLOWED_SOURCE_NAMES, AcquisitionSource
+from sales.domain.value_objects.contact_data import ContactData
+from sales.domain.value_objects.money.currency import Currency
+from sales.domain.value_objects.money.money import Money
+from sales.domain.value_objects.offer_item import OfferItem
+from sales.domain.value_objects.opportunity_stage import ALLOWED_OPPORTUNITY_STAGES, OpportunityStage
+from sales.domain.value_objects.priority import ALLOWED_PRIORITY_LEVELS, Priority
+from sales.domain.value_objects.product import Product
+from sales.infrastructure.file import config as sales_file_config
+from sales.infrastructure.sql.lead.repository import LeadSQLRepository
+from sales.infrastructure.sql.opportunity.models import CurrencyModel, OfferItemModel, OpportunityModel, ProductModel
+from sales.infrastructure.sql.sales_representative.models import SalesRepresentativeModel
+from scripts.synthetic import generator as synthetic
+
+MANIFEST_FILE_NAME = "dataset.json"
+CHUNK_SIZE = 5_000
+SQL_MIGRATIONS_FOLDER = Path(sql_db.__file__).parent / "alembic"
+
+ENTITY_ID_NAMESPACE = UUID("6f1b7c2e-8a4d-4e55-9c0b-3d2f1a7e9b10")
+
+# the reference data is shared with the synthetic data generator, so both datasets describe the same world
+COUNTRIES = tuple(Country(code=code, name=name) for code, name in synthetic.COUNTRIES)
+LANGUAGES = tuple(Language(code=code, name=name) for code, name in synthetic.LANGUAGES)
+CURRENCIES = tuple(Currency(name=name, iso_code=iso_code) for iso_code, name in synthetic.CURRENCIES)
+PRODUCTS = tuple(Product(name=name) for name in synthetic.PRODUCTS)
+
+EXCHANGE_RATES = (
+    ExchangeRateCreateUpdateModel(iso_code="EUR", rate=Decimal("1")),
+    ExchangeRateCreateUpdateModel(iso_code="NOK", rate=Decimal("0.0855")),
+    ExchangeRateCreateUpdateModel(iso_code="USD", rate=Decimal("0.9214")),
+)
+
+
+def get_entity_id(kind: str, index: int) -> str:
+    return str(uuid5(ENTITY_ID_NAMESPACE, f"{kind}-{index}"))
+
+
+BENCHMARK_SALESMAN_ID = get_entity_id("representative", 0)
+
+
+@define(frozen=True, kw_only=True)
+class DatasetSpec:
+    size: int
+    seed: int = 0
+    sales_representatives: int = 50
+
+    @property
+    def customers(self) -> int:
+        return self.size // 2
+
+    @property
+    def leads(self) -> int:
+        return self.size // 4
+
+    @property
+    def opportunities(self) -> int:
+        return self.size - self.customers - self.leads
+
+    def to_dict(self) -> dict[str, int]:
+        return {
+            **asdict(self),
+            "customers": self.customers,
+            "leads": self.leads,
+            "opportunities": self.opportunities,
+        }
+
+
+class DatasetGenerator:
+    """Deterministically generates domain objects, so every engine and every run sees the same data."""
+
+    def __init__(self, spec: DatasetSpec) -> None:
+        self.spec = spec
+        pools = synthetic.get_faker_pools(spec.seed)
+        self._first_names = pools["first_names"]
+        self._last_names = pools["last_names"]
+        self._company_names = pools["companies"]
+        self._job_titles = pools["job_titles"]
+        self._streets = pools["streets"]
+        self._cities = pools["cities"]
+
+    @cached_property
+    def representatives(self) -> tuple[SalesRepresentative, ...]:
+        rng = self._get_random("representatives")
+        return tuple(
+            SalesRepresentative(
+                id=get_entity_id("representative", index),
+                first_name=rng.choice(self._first_names),
+                last_name=rng.choice(self._last_names),
+            )
+            for index in range(self.spec.sales_representatives)
+        )
+
+    def iter_customers(self) -> Iterator[Customer]:
+        rng = self._get_random("customers")
+        for index in range(self.spec.customers):
+            yield self._make_customer(index, rng)
+
+    def iter_leads(self) -> Iterator[Lead]:
+        rng = self._get_random("leads")
+        for index in range(self.spec.leads):
+            yield Lead.make(
+                id=get_entity_id("lead", index),
+                customer_id=get_entity_id("customer", index),
+                created_by_salesman_id=self._get_representative_id(index),
+                contact_data=ContactData(
+                    first_name=rng.choice(self._first_names),
+                    last_name=rng.choice(self._last_names),
+                    email=f"lead.{index}@example.com",
+                ),
+                source=AcquisitionSource(name=rng.choice(ALLOWED_SOURCE_NAMES)),
+            )
+
+    def iter_opportunities(self) -> Iterator[Opportunity]:
+        rng = self._get_random("opportunities")
+        for index in range(self.spec.opportunities):
+            products = rng.sample(PRODUCTS, k=rng.randint(1, 3))
+            offer = tuple(
+                OfferItem(
+                    product=product,
+                    value=Money(
+                        currency=rng.choice(CURRENCIES),
+                        amount=Decimal(rng.randint(100, 1_000_000)) / 100,
+                    ),
+                )
+                for product in products
+            )
+            customer_index = 0 if index == 0 else rng.randrange(self.spec.customers)
+            yield Opportunity.make(
+                id=get_entity_id("opportunity", index),
+                created_by_id=self._get_representative_id(index),
+                customer_id=get_entity_id("customer", customer_index),
+                source=AcquisitionSource(name=rng.choice(ALLOWED_SOURCE_NAMES)),
+                stage=OpportunityStage(name=rng.choice(ALLOWED_OPPORTUNITY_STAGES)),
+                priority=Priority(level=rng.choice(ALLOWED_PRIORITY_LEVELS)),
+                offer=offer,
+            )
+
+    def _make_customer(self, index: int, rng: random.Random) -> Customer:
+        relation_manager_id = self._get_representative_id(index)
+        country = rng.choice(COUNTRIES)
+        company_info = CompanyInfo(
+            name=f"{rng.choice(self._company_names)} {index}",
+            industry=Industry(name=rng.choice(ALLOWED_INDUSTRY_NAMES)),
+            segment=CompanySegment(size=rng.choice(ALLOWED_COMPANY_SIZES), legal_form=rng.choice(ALLOWED_LEGAL_FORMS)),
+            address=Address(
+                country=country,
+                street=rng.choice(self._streets),
+                street_no=str(rng.randint(1, 200)),
+                postal_code=f"{rng.randint(0, 99999):05}",
+                city=rng.choice(self._cities),
+            ),
+        )
+        customer = Customer(
+            id=get_entity_id("customer", index), company_info=company_info, relation_manager_id=relation_manager_id
+        )
+        customer.add_contact_person(
+            editor_id=relation_manager_id,
+            contact_person_id=get_entity_id("contact-person", index),
+            first_name=rng.choice(self._first_names),
+            last_name=rng.choice(self._last_names),
+            job_title=rng.choice(self._job_titles),
+            preferred_language=LANGUAGES[COUNTRIES.index(country)],
+            contact_methods=(ContactMethod(type="email", value=f"contact.{index}@example.com", is_preferred=True),),
+        )
+        if index % 4 != 0:
+            customer.convert(requestor_id=relation_manager_id)
+        if index % 4 == 3:
+            customer.archive(requestor_id=relation_manager_id)
+        return customer
+
+    def _get_representative_id(self, index: int) -> str:
+        return self.representatives[index % len(self.representatives)].id
+
+    def _get_random(self, kind: str) -> random.Random:
+        return synthetic.get_seeded_random(self.spec.seed, kind)
+
+
+def is_dataset_ready(directory: Path, spec: DatasetSpec) -> bool:
+    manifest_path = directory / MANIFEST_FILE_NAME
+    if not manifest_path.exists():
+        return False
+    return json.loads(manifest_path.read_text()) == spec.to_dict()
+
+
+def mark_dataset_ready(directory: Path, spec: DatasetSpec) -> None:
+    (directory / MANIFEST_FILE_NAME).write_text(json.dumps(spec.to_dict()))
+
+
+def seed_sql(generator: DatasetGenerator, db_url: str) -> None:
+    alembic_cfg = Config()
+    alembic_cfg.set_main_option("script_location", str(SQL_MIGRATIONS_FOLDER.absolute()))
+    alembic_cfg.set_main_option("sqlalchemy.url", db_url)
+    alembic_upgrade(alembic_cfg, "head")
+
+    session_factory = sql_db.DbConnectionManager.get_session_factory(db_url)
+    with session_factory() as db:
+        db.add_all(SalesRepresentativeModel.from_domain(representative) for representative in generator.representatives)
+        db.add_all(CountryModel.from_domain(country) for country in COUNTRIES)
+        db.add_all(LanguageModel.from_domain(language) for language in LANGUAGES)
+        db.add_all(CurrencyModel.from_domain(currency) for currency in CURRENCIES)
+        db.add_all(ProductModel.from_domain(product) for product in PRODUCTS)
+        db.commit()
+
+        customer_repository = CustomerSQLRepository(db)
+        for customers in batched(generator.iter_customers(), CHUNK_SIZE):
+            customer_repository.create_many(customers)
+            db.commit()
+        lead_repository = LeadSQLRepository(db)
+        for leads in batched(generator.iter_leads(), CHUNK_SIZE):
+            lead_repository.create_many(leads)
+            db.commit()
+        for opportunities in batched(generator.iter_opportunities(), CHUNK_SIZE):
+            _create_opportunities(db, opportunities)
+            db.commit()
+
+
+def _create_opportunities(db: Session, opportunities: Iterable[Opportunity]) -> None:
+    product_ids = dict(db.execute(select(ProductModel.name, ProductModel.id)).tuples().all())
+    currency_ids = dict(db.execute(select(CurrencyModel.iso_code, CurrencyModel.id)).tuples().all())
+    opportunity_rows: list[dict[str, Any]] = []
+    offer_item_rows: list[dict[str, Any]] = []
+    for opportunity in opportunities:
+        opportunity_rows.append(get_column_values(OpportunityModel.from_domain(opportunity)))
+        offer_item_rows.extend(
+            get_column_values(
+                OfferItemModel.from_domain(
+                    entity=item,
+                    opportunity_id=opportunity.id,
+                    product_id=product_ids[item.product.name],
+                    currency_id=currency_ids[item.value.currency.iso_code],
+                )
+            )
+            for item in opportunity.offer
+        )
+    db.execute(insert(OpportunityModel), opportunity_rows)
+    db.execute(insert(OfferItemModel), offer_item_rows)
+
+
+def seed_files(generator: DatasetGenerator) -> None:
+    _save_to_file(sales_file_config.SALES_REPR_PATH, generator.representatives)
+    _save_to_file(customer_file_config.COUNTRIES_PATH, COUNTRIES)
+    _save_to_file(customer_file_config.LANGUAGES_PATH, LANGUAGES)
+    _save_to_file(sales_file_config.CURRENCIES_PATH, CURRENCIES)
+    _save_to_file(sales_file_config.PRODUCTS_PATH, PRODUCTS)
+    _save_to_file(customer_file_config.CUSTOMERS_PATH, generator.iter_customers())
+    _save_to_file(sales_file_config.LEAD_PATH, generator.iter_leads())
+    _save_to_file(sales_file_config.OPPORTUNITIES_PATH, generator.iter_opportunities())
+
+
+def _save_to_file(file_path: Path, entities: Iterable[Any]) -> None:
+    db: Shelf = get_write_db(file_path)
+    try:
+        for chunk in batched(entities, CHUNK_SIZE):
+            for entity in chunk:
+                key = entity.id if hasattr(entity, "id") else str(uuid4())
+                db[key] = entity
+            db.sync()
+    finally:
+        db.close()
+
+
+def prepare_application_state(container: ApplicationContainer) -> None:
+    """Writes the state that only the application layer knows how to derive from the seeded aggregates."""
+    container.exchange_rate_command_use_case.set_rates(EXCHANGE_RATES)
+    container.pipeline_stats_command_use_case.rebuild()
+    container.lead_command_use_case.update_assignment(
+        lead_id=get_entity_id("lead", 0),
+        requestor_id=BENCHMARK_SALESMAN_ID,
+        assignment_data=AssignmentUpdateModel(new_salesman_id=BENCHMARK_SALESMAN_ID),
+    )
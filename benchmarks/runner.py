@@ -0,0 +1,150 @@
+import math
+import platform
+import subprocess
+import time
+from collections.abc import Iterable, Sequence
+from datetime import datetime, timezone
+from typing import Any, Self
+
+from attrs import asdict, define
+
+from benchmarks.cases import BenchmarkCase, UnexpectedResponse
+
+PERCENTILES = {"p50": 0.5, "p95": 0.95, "p99": 0.99}
+
+
+def percentile(ordered_samples: Sequence[float], quantile: float) -> float:
+    """Nearest-rank percentile of already sorted samples."""
+    rank = max(math.ceil(quantile * len(ordered_samples)) - 1, 0)
+    return ordered_samples[rank]
+
+
+@define(frozen=True, kw_only=True)
+class RunSettings:
+    iterations: int = 200
+    warmup: int = 5
+    time_budget: float = 30.0
+
+
+@define(frozen=True, kw_only=True)
+class LatencySummary:
+    samples: int
+    errors: int
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+    throughput_per_second: float
+
+    @classmethod
+    def from_samples(cls, durations: Sequence[float], errors: int, elapsed: float) -> Self:
+        if not durations:
+            return cls(
+                samples=0,
+                errors=errors,
+                mean_ms=0.0,
+                p50_ms=0.0,
+                p95_ms=0.0,
+                p99_ms=0.0,
+                max_ms=0.0,
+                throughput_per_second=0.0,
+            )
+        ordered = sorted(durations)
+        return cls(
+            samples=len(ordered),
+            errors=errors,
+            mean_ms=sum(ordered) / len(ordered) * 1000,
+            p50_ms=percentile(ordered, PERCENTILES["p50"]) * 1000,
+            p95_ms=percentile(ordered, PERCENTILES["p95"]) * 1000,
+            p99_ms=percentile(ordered, PERCENTILES["p99"]) * 1000,
+            max_ms=ordered[-1] * 1000,
+            throughput_per_second=len(ordered) / elapsed if elapsed > 0 else 0.0,
+        )
+
+
+def run_case(case: BenchmarkCase, settings: RunSettings) -> LatencySummary:
+    for _ in range(settings.warmup):
+        try:
+            case.call()
+        except UnexpectedResponse:
+            pass
+
+    durations: list[float] = []
+    errors = 0
+    started_at = time.perf_counter()
+    while len(durations) + errors < settings.iterations:
+        call_started_at = time.perf_counter()
+        try:
+            case.call()
+        except UnexpectedResponse:
+            errors += 1
+        else:
+            durations.append(time.perf_counter() - call_started_at)
+        if time.perf_counter() - started_at >= settings.time_budget:
+            break
+    return LatencySummary.from_samples(durations, errors=errors, elapsed=time.perf_counter() - started_at)
+
+
+def get_git_revision() -> dict[str, Any]:
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, check=True, text=True).stdout.strip()
+        status = subprocess.run(["git", "status", "--porcelain"], capture_output=True, check=True, text=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return {"commit": None, "dirty": None}
+    return {"commit": commit, "dirty": bool(status.strip())}
+
+
+def build_report(
+    dataset: dict[str, Any], settings: RunSettings, results: Iterable[dict[str, Any]], seed_seconds: dict[str, float]
+) -> dict[str, Any]:
+    return {
+        **get_git_revision(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "dataset": dataset,
+        "settings": asdict(settings),
+        "seed_seconds": seed_seconds,
+        "results": list(results),
+    }
+
+
+@define(frozen=True, kw_only=True)
+class Comparison:
+    engine: str
+    kind: str
+    name: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        if self.baseline == 0:
+            return 0.0
+        return (self.current - self.baseline) / self.baseline
+
+
+def compare_reports(baseline: dict[str, Any], current: dict[str, Any], metric: str) -> list[Comparison]:
+    baseline_results = {_get_result_key(result): result for result in baseline["results"]}
+    comparisons = []
+    for result in current["results"]:
+        previous = baseline_results.get(_get_result_key(result))
+        if previous is None:
+            continue
+        comparisons.append(
+            Comparison(
+                engine=result["engine"],
+                kind=result["kind"],
+                name=result["name"],
+                metric=metric,
+                baseline=previous[metric],
+                current=result[metric],
+            )
+        )
+    return comparisons
+
+
+def _get_result_key(result: dict[str, Any]) -> tuple[str, str, str]:
+    return result["engine"], result["kind"], result["name"]
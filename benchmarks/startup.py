@@ -0,0 +1,59 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any, Self
+
+from attrs import define
+
+SRC_PATH = Path(__file__).parent.parent / "src"
+DEFERRED_MODULES = ("faker", "firebase_admin", "sqlalchemy")
+IMPORT_PROBE = """
+import json, sys, time
+started_at = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - started_at
+print(json.dumps({{"seconds": elapsed, "loaded": [name for name in {deferred!r} if name in sys.modules]}}))
+"""
+
+
+@define(frozen=True, kw_only=True)
+class StartupSummary:
+    module: str
+    samples: int
+    min_ms: float
+    median_ms: float
+    max_ms: float
+    loaded_modules: list[str]
+
+    @classmethod
+    def from_probes(cls, module: str, probes: Sequence[dict[str, Any]]) -> Self:
+        durations = [probe["seconds"] * 1000 for probe in probes]
+        return cls(
+            module=module,
+            samples=len(durations),
+            min_ms=min(durations),
+            median_ms=statistics.median(durations),
+            max_ms=max(durations),
+            loaded_modules=sorted({name for probe in probes for name in probe["loaded"]}),
+        )
+
+
+def measure_import(module: str, repeat: int, env: dict[str, str]) -> StartupSummary:
+    """Imports the module in fresh interpreters, so every sample pays the full cold start."""
+    probe = IMPORT_PROBE.format(module=module, deferred=DEFERRED_MODULES)
+    probes = []
+    for _ in range(repeat):
+        completed = subprocess.run(
+            [sys.executable, "-c", probe],
+            cwd=SRC_PATH,
+            env={**os.environ, **env},
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        probes.append(json.loads(completed.stdout.splitlines()[-1]))
+    return StartupSummary.from_probes(module, probes)
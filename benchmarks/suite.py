@@ -0,0 +1,60 @@
+import logging
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from attrs import asdict
+from fastapi.testclient import TestClient
+
+from authentication.infrastructure.roles import UserRole
+from benchmarks.cases import SampleIds, get_query_service_cases, get_rest_cases
+from benchmarks.containers import build_container, create_app, make_benchmark_token
+from benchmarks.dataset import (
+    BENCHMARK_SALESMAN_ID,
+    DatasetGenerator,
+    DatasetSpec,
+    is_dataset_ready,
+    mark_dataset_ready,
+    prepare_application_state,
+    seed_files,
+    seed_sql,
+)
+from benchmarks.runner import RunSettings, build_report, run_case
+from building_blocks.infrastructure.sql.config import SQLALCHEMY_DB_URL
+from containers.config import PersistenceEngine
+
+logger = logging.getLogger(__name__)
+
+
+def run_suite(
+    spec: DatasetSpec, engines: Iterable[PersistenceEngine], settings: RunSettings, data_paths: dict[str, Path]
+) -> dict[str, Any]:
+    generator = DatasetGenerator(spec)
+    ids = SampleIds.from_spec(spec)
+    results = []
+    seed_seconds = {}
+    for engine in engines:
+        container = build_container(engine)
+        data_path = data_paths[engine.value]
+        if not is_dataset_ready(data_path, spec):
+            logger.info("Seeding %s dataset of %d entities", engine.value, spec.size)
+            started_at = time.perf_counter()
+            if engine == PersistenceEngine.SQL:
+                seed_sql(generator, SQLALCHEMY_DB_URL or "")
+            else:
+                seed_files(generator)
+            prepare_application_state(container)
+            seed_seconds[engine.value] = time.perf_counter() - started_at
+            mark_dataset_ready(data_path, spec)
+
+        client = TestClient(
+            create_app(container),
+            headers={"Authorization": f"Bearer {make_benchmark_token(BENCHMARK_SALESMAN_ID, [UserRole.ADMIN.value])}"},
+        )
+        cases = [*get_query_service_cases(container.query_services, ids), *get_rest_cases(client, ids)]
+        for case in cases:
+            logger.info("Running %s %s", engine.value, case.name)
+            summary = run_case(case, settings)
+            results.append({"engine": engine.value, "kind": case.kind, "name": case.name, **asdict(summary)})
+    return build_report(spec.to_dict(), settings, results, seed_seconds)
@@ -0,0 +1,6 @@
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)) + "/../../src")
+# the harness runs the app on the benchmark containers
+sys.path.append(os.path.dirname(os.path.abspath(__file__)) + "/../..")
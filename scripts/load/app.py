@@ -0,0 +1,9 @@
+from fastapi import FastAPI
+
+from benchmarks.containers import build_container, create_app
+from containers.config import PersistenceEngine, get_persistence_engine
+
+
+def create_load_test_app() -> FastAPI:
+    """Serves the API from a benchmark container, which trusts the unsigned tokens the scenario sends."""
+    return create_app(build_container(PersistenceEngine(get_persistence_engine())))
@@ -0,0 +1,108 @@
+import asyncio
+import math
+import time
+from collections import Counter, defaultdict
+from collections.abc import Sequence
+from typing import Any
+
+import httpx
+from attrs import define, field
+
+from .scenario import PlannedRequest, TrafficScenario, get_auth_headers
+
+PERCENTILES = {"p50": 0.5, "p95": 0.95, "p99": 0.99}
+
+
+def percentile(ordered_samples: Sequence[float], quantile: float) -> float:
+    """Nearest-rank percentile of already sorted samples."""
+    rank = max(math.ceil(quantile * len(ordered_samples)) - 1, 0)
+    return ordered_samples[rank]
+
+
+@define
+class EndpointStats:
+    latencies: list[float] = field(factory=list)
+    statuses: Counter[str] = field(factory=Counter)
+
+    @property
+    def requests(self) -> int:
+        return sum(self.statuses.values())
+
+    @property
+    def errors(self) -> int:
+        """Server errors and requests that did not get a response at all."""
+        return sum(count for status, count in self.statuses.items() if status[0] not in "1234")
+
+    @property
+    def rejected(self) -> int:
+        """Client errors, e.g. optimistic locking conflicts between concurrent workers."""
+        return sum(count for status, count in self.statuses.items() if status[0] == "4")
+
+    def summarize(self, elapsed: float) -> dict[str, Any]:
+        ordered = sorted(self.latencies)
+        latencies = {
+            f"{name}_ms": percentile(ordered, quantile) * 1000 if ordered else 0.0
+            for name, quantile in PERCENTILES.items()
+        }
+        return {
+            "requests": self.requests,
+            "throughput_per_second": self.requests / elapsed if elapsed > 0 else 0.0,
+            **latencies,
+            "max_ms": ordered[-1] * 1000 if ordered else 0.0,
+            "errors": self.errors,
+            "rejected": self.rejected,
+            "error_rate": self.errors / self.requests if self.requests else 0.0,
+            "statuses": dict(self.statuses),
+        }
+
+
+async def run_load(
+    client: httpx.AsyncClient,
+    scenario: TrafficScenario,
+    concurrency: int,
+    duration: float,
+    max_requests: int | None = None,
+) -> dict[str, Any]:
+    stats: defaultdict[str, EndpointStats] = defaultdict(EndpointStats)
+    issued = 0
+    started_at = time.perf_counter()
+    deadline = started_at + duration
+
+    async def worker() -> None:
+        nonlocal issued
+        while time.perf_counter() < deadline and (max_requests is None or issued < max_requests):
+            issued += 1
+            planned = scenario.next_request()
+            await _send(client, planned, stats[planned.endpoint])
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started_at
+    total = EndpointStats()
+    for endpoint_stats in stats.values():
+        total.latencies.extend(endpoint_stats.latencies)
+        total.statuses.update(endpoint_stats.statuses)
+    return {
+        "concurrency": concurrency,
+        "elapsed_seconds": elapsed,
+        "total": total.summarize(elapsed),
+        "endpoints": {endpoint: stats[endpoint].summarize(elapsed) for endpoint in sorted(stats)},
+    }
+
+
+async def _send(client: httpx.AsyncClient, planned: PlannedRequest, stats: EndpointStats) -> None:
+    started_at = time.perf_counter()
+    try:
+        response = await client.request(
+            planned.method,
+            planned.path,
+            params=planned.params,
+            json=planned.json,
+            headers=get_auth_headers(planned.actor_id),
+        )
+    except httpx.HTTPError as e:
+        stats.statuses[type(e).__name__] += 1
+        return
+    stats.latencies.append(time.perf_counter() - started_at)
+    stats.statuses[str(response.status_code)] += 1
+    if response.is_success and planned.on_success is not None:
+        planned.on_success(response)
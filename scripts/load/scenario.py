@@ -0,0 +1,299 @@
+import random
+from collections.abc import Callable
+from itertools import accumulate
+from typing import Any
+
+import httpx
+from attrs import define, field
+
+from authentication.infrastructure.roles import UserRole
+from benchmarks.containers import make_benchmark_token
+
+OPERATION_KINDS = ("list", "get", "create", "update", "note", "assignment")
+DISCOVERY_ACTOR_ID = "load-test"
+SOURCES = ("website", "referral", "event", "ads")
+PRIORITIES = ("low", "medium", "high", "urgent")
+
+
+def parse_mix(mix: str) -> dict[str, int]:
+    weights = {}
+    for entry in mix.split(","):
+        kind, _, weight = entry.partition("=")
+        kind = kind.strip()
+        if kind not in OPERATION_KINDS:
+            raise ValueError(f'Unknown operation "{kind}", must be one of: {", ".join(OPERATION_KINDS)}')
+        weights[kind] = int(weight)
+    if not any(weights.values()):
+        raise ValueError("At least one operation needs a positive weight")
+    return weights
+
+
+def get_auth_headers(actor_id: str) -> dict[str, str]:
+    return {"Authorization": f"Bearer {make_benchmark_token(actor_id, [UserRole.ADMIN.value])}"}
+
+
+@define(kw_only=True)
+class PlannedRequest:
+    endpoint: str
+    method: str
+    path: str
+    actor_id: str
+    params: dict[str, Any] | None = None
+    json: dict[str, Any] | None = None
+    on_success: Callable[[httpx.Response], None] | None = None
+
+
+@define(kw_only=True)
+class TrafficState:
+    """Ids known to the load generator, together with the salesman allowed to change each of them."""
+
+    representative_ids: list[str]
+    countries: list[dict[str, Any]]
+    products: list[dict[str, Any]]
+    currencies: list[dict[str, Any]]
+    customer_managers: dict[str, str] = field(factory=dict)
+    converted_customer_ids: list[str] = field(factory=list)
+    lead_creators: dict[str, str] = field(factory=dict)
+    lead_owners: dict[str, str | None] = field(factory=dict)
+    opportunity_owners: dict[str, str] = field(factory=dict)
+    customer_ids: list[str] = field(factory=list)
+    lead_ids: list[str] = field(factory=list)
+    opportunity_ids: list[str] = field(factory=list)
+
+    def add_customer(self, customer: dict[str, Any]) -> None:
+        self.customer_managers[customer["id"]] = customer["relation_manager_id"]
+        self.customer_ids.append(customer["id"])
+        if customer["status"] == "converted":
+            self.converted_customer_ids.append(customer["id"])
+
+    def add_lead(self, lead: dict[str, Any]) -> None:
+        self.lead_creators[lead["id"]] = lead["created_by_salesman_id"]
+        self.lead_owners[lead["id"]] = lead["assigned_salesman_id"]
+        self.lead_ids.append(lead["id"])
+
+    def add_opportunity(self, opportunity: dict[str, Any]) -> None:
+        self.opportunity_owners[opportunity["id"]] = opportunity["owner_id"]
+        self.opportunity_ids.append(opportunity["id"])
+
+
+async def discover_state(client: httpx.AsyncClient, sample_size: int, rng: random.Random) -> TrafficState:
+    async def get(path: str) -> list[dict[str, Any]]:
+        response = await client.get(path, headers=get_auth_headers(DISCOVERY_ACTOR_ID))
+        response.raise_for_status()
+        return response.json()
+
+    def sample(items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        return rng.sample(items, k=min(sample_size, len(items)))
+
+    state = TrafficState(
+        representative_ids=[representative["id"] for representative in await get("/sales-representatives/")],
+        countries=await get("/countries"),
+        products=await get("/products"),
+        currencies=await get("/currencies"),
+    )
+    for customer in sample(await get("/customers/")):
+        state.add_customer(customer)
+    for lead in sample(await get("/leads/")):
+        state.add_lead(lead)
+    for opportunity in sample(await get("/opportunities/")):
+        state.add_opportunity(opportunity)
+    return state
+
+
+class TrafficScenario:
+    """Draws requests from the configured mix, acting as the salesman who is allowed to make each change."""
+
+    def __init__(self, state: TrafficState, mix: dict[str, int], rng: random.Random) -> None:
+        self.state = state
+        self.rng = rng
+        self._kinds = list(mix)
+        self._cum_weights = list(accumulate(mix.values()))
+        self._factories: dict[str, Callable[[], PlannedRequest | None]] = {
+            "list": self._list,
+            "get": self._get,
+            "create": self._create,
+            "update": self._update,
+            "note": self._note,
+            "assignment": self._assignment,
+        }
+
+    def next_request(self) -> PlannedRequest:
+        while True:
+            kind = self.rng.choices(self._kinds, cum_weights=self._cum_weights)[0]
+            planned = self._factories[kind]()
+            if planned is not None:
+                return planned
+
+    def _list(self) -> PlannedRequest | None:
+        representative_id = self.rng.choice(self.state.representative_ids)
+        path, param = self.rng.choice(
+            [("/customers/", "relation_manager_id"), ("/leads/", "salesman_id"), ("/opportunities/", "owner_id")]
+        )
+        return PlannedRequest(
+            endpoint=f"GET {path}?{param}",
+            method="GET",
+            path=path,
+            actor_id=representative_id,
+            params={param: representative_id},
+        )
+
+    def _get(self) -> PlannedRequest | None:
+        path, ids = self.rng.choice(
+            [
+                ("/customers/{id}", self.state.customer_ids),
+                ("/leads/{id}", self.state.lead_ids),
+                ("/opportunities/{id}", self.state.opportunity_ids),
+            ]
+        )
+        if not ids:
+            return None
+        return PlannedRequest(
+            endpoint=f"GET {path}",
+            method="GET",
+            path=path.format(id=self.rng.choice(ids)),
+            actor_id=DISCOVERY_ACTOR_ID,
+        )
+
+    def _create(self) -> PlannedRequest | None:
+        if self.rng.random() < 0.5 or not self.state.converted_customer_ids:
+            return self._create_customer()
+        return self._create_opportunity()
+
+    def _create_customer(self) -> PlannedRequest:
+        relation_manager_id = self.rng.choice(self.state.representative_ids)
+        country = self.rng.choice(self.state.countries)
+        return PlannedRequest(
+            endpoint="POST /customers/",
+            method="POST",
+            path="/customers/",
+            actor_id=relation_manager_id,
+            json={
+                "relation_manager_id": relation_manager_id,
+                "company_info": {
+                    "name": f"Load Test {self.rng.randrange(10**9)}",
+                    "industry": "technology",
+                    "size": "small",
+                    "legal_form": "limited",
+                    "address": {
+                        "country": {"name": country["name"], "code": country["code"]},
+                        "street": "Testowa",
+                        "street_no": str(self.rng.randint(1, 200)),
+                        "postal_code": "00-001",
+                        "city": "Warszawa",
+                    },
+                },
+            },
+            on_success=lambda response: self.state.add_customer(response.json()),
+        )
+
+    def _create_opportunity(self) -> PlannedRequest:
+        creator_id = self.rng.choice(self.state.representative_ids)
+        currency = self.rng.choice(self.state.currencies)
+        offer = [
+            {
+                "product": {"name": product["name"]},
+                "value": {"currency": currency, "amount": str(self.rng.randint(100, 100_000))},
+            }
+            for product in self.rng.sample(self.state.products, k=min(2, len(self.state.products)))
+        ]
+        return PlannedRequest(
+            endpoint="POST /opportunities/",
+            method="POST",
+            path="/opportunities/",
+            actor_id=creator_id,
+            json={
+                "customer_id": self.rng.choice(self.state.converted_customer_ids),
+                "source": self.rng.choice(SOURCES),
+                "priority": self.rng.choice(PRIORITIES),
+                "offer": offer,
+            },
+            on_success=lambda response: self.state.add_opportunity(response.json()),
+        )
+
+    def _update(self) -> PlannedRequest | None:
+        kind = self.rng.choice(["customer", "lead", "opportunity"])
+        if kind == "customer" and self.state.customer_ids:
+            return self._update_customer()
+        if kind == "lead" and self.state.lead_ids:
+            lead_id = self.rng.choice(self.state.lead_ids)
+            return PlannedRequest(
+                endpoint="PUT /leads/{id}",
+                method="PUT",
+                path=f"/leads/{lead_id}",
+                actor_id=self.state.lead_owners[lead_id] or self.state.lead_creators[lead_id],
+                json={"source": self.rng.choice(SOURCES)},
+            )
+        if kind == "opportunity" and self.state.opportunity_ids:
+            opportunity_id = self.rng.choice(self.state.opportunity_ids)
+            return PlannedRequest(
+                endpoint="PUT /opportunities/{id}",
+                method="PUT",
+                path=f"/opportunities/{opportunity_id}",
+                actor_id=self.state.opportunity_owners[opportunity_id],
+                json={"priority": self.rng.choice(PRIORITIES)},
+            )
+        return None
+
+    def _update_customer(self) -> PlannedRequest:
+        customer_id = self.rng.choice(self.state.customer_ids)
+        new_manager_id = self.rng.choice(self.state.representative_ids)
+
+        def on_success(_response: httpx.Response) -> None:
+            self.state.customer_managers[customer_id] = new_manager_id
+
+        return PlannedRequest(
+            endpoint="PUT /customers/{id}",
+            method="PUT",
+            path=f"/customers/{customer_id}",
+            actor_id=self.state.customer_managers[customer_id],
+            json={"relation_manager_id": new_manager_id},
+            on_success=on_success,
+        )
+
+    def _note(self) -> PlannedRequest | None:
+        note = {"content": f"Load test note {self.rng.randrange(10**9)}"}
+        lead_id = self.rng.choice(self.state.lead_ids) if self.state.lead_ids else None
+        lead_owner_id = self.state.lead_owners[lead_id] if lead_id is not None else None
+        if self.rng.random() < 0.5 and lead_owner_id is not None:
+            return PlannedRequest(
+                endpoint="POST /leads/{id}/notes",
+                method="POST",
+                path=f"/leads/{lead_id}/notes",
+                actor_id=lead_owner_id,
+                json=note,
+            )
+        if not self.state.opportunity_ids:
+            return None
+        opportunity_id = self.rng.choice(self.state.opportunity_ids)
+        return PlannedRequest(
+            endpoint="POST /opportunities/{id}/notes",
+            method="POST",
+            path=f"/opportunities/{opportunity_id}/notes",
+            actor_id=self.state.opportunity_owners[opportunity_id],
+            json=note,
+        )
+
+    def _assignment(self) -> PlannedRequest | None:
+        if not self.state.lead_ids or len(self.state.representative_ids) < 2:
+            return None
+        lead_id = self.rng.choice(self.state.lead_ids)
+        current_owner_id = self.state.lead_owners[lead_id]
+        new_owner_id = self.rng.choice(
+            [
+                representative_id
+                for representative_id in self.state.representative_ids
+                if representative_id != current_owner_id
+            ]
+        )
+
+        def on_success(_response: httpx.Response) -> None:
+            self.state.lead_owners[lead_id] = new_owner_id
+
+        return PlannedRequest(
+            endpoint="POST /leads/{id}/assignments",
+            method="POST",
+            path=f"/leads/{lead_id}/assignments",
+            actor_id=current_owner_id or self.state.lead_creators[lead_id],
+            json={"new_salesman_id": new_owner_id},
+            on_success=on_success,
+        )
@@ -0,0 +1,176 @@
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any
+
+import click
+import httpx
+
+ALLOWED_PERSISTENCE_ENGINES = ["sql", "file"]
+ALLOWED_TRANSPORTS = ["asgi", "uvicorn"]
+DEFAULT_MIX = "list=10,get=45,create=10,update=10,note=15,assignment=10"
+SCRIPTS_PATH = Path(__file__).parent
+SERVER_STARTUP_TIMEOUT = 30.0
+
+
+@click.group()
+def cli() -> None:
+    pass
+
+
+@cli.command()
+@click.option("--engine", type=click.Choice(ALLOWED_PERSISTENCE_ENGINES, case_sensitive=False))
+@click.option(
+    "--transport",
+    type=click.Choice(ALLOWED_TRANSPORTS, case_sensitive=False),
+    default="asgi",
+    show_default=True,
+    help="Drive the app in-process or through a local uvicorn server.",
+)
+@click.option("--port", type=int, default=8765, show_default=True, help="Port of the local uvicorn server.")
+@click.option("--concurrency", type=click.IntRange(min=1), multiple=True, default=(1, 8, 32), show_default=True)
+@click.option("--duration", type=click.FloatRange(min=0), default=30.0, show_default=True, help="Seconds per level.")
+@click.option("--requests", "max_requests", type=click.IntRange(min=1), help="Request budget per level.")
+@click.option("--mix", default=DEFAULT_MIX, show_default=True, help="Relative weights of the operation kinds.")
+@click.option("--sample-size", type=click.IntRange(min=1), default=1_000, show_default=True)
+@click.option("--seed", type=int, default=0, show_default=True)
+@click.option("--output", type=click.Path(dir_okay=False, path_type=Path))
+def run(
+    engine: str | None,
+    transport: str,
+    port: int,
+    concurrency: tuple[int, ...],
+    duration: float,
+    max_requests: int | None,
+    mix: str,
+    sample_size: int,
+    seed: int,
+    output: Path | None,
+) -> None:
+    """Replay a mix of read and write traffic against the REST API and report latency per endpoint."""
+    # the configuration module reads it on import, so it has to be set before the app is imported
+    if engine is not None:
+        os.environ["PERSISTENCE_ENGINE"] = engine.upper()
+
+    from load.scenario import parse_mix
+
+    try:
+        weights = parse_mix(mix)
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="--mix") from e
+    levels = asyncio.run(
+        _run_levels(transport.lower(), port, concurrency, duration, max_requests, weights, sample_size, seed)
+    )
+
+    for level in levels:
+        _echo_level(level)
+    if output is not None:
+        output.write_text(
+            json.dumps({"mix": weights, "seed": seed, "transport": transport, "levels": levels}, indent=2)
+        )
+        click.echo(f"Results written to {output}")
+
+
+async def _run_levels(
+    transport: str,
+    port: int,
+    concurrency: tuple[int, ...],
+    duration: float,
+    max_requests: int | None,
+    weights: dict[str, int],
+    sample_size: int,
+    seed: int,
+) -> list[dict[str, Any]]:
+    from load.runner import run_load
+    from load.scenario import TrafficScenario, discover_state
+
+    rng = random.Random(seed)
+    levels = []
+    async with _get_client(transport, port) as client:
+        state = await discover_state(client, sample_size=sample_size, rng=rng)
+        scenario = TrafficScenario(state, weights, rng)
+        for level in concurrency:
+            click.echo(f"Running {level} concurrent workers", err=True)
+            levels.append(await run_load(client, scenario, level, duration=duration, max_requests=max_requests))
+    return levels
+
+
+@asynccontextmanager
+async def _get_client(transport: str, port: int) -> AsyncIterator[httpx.AsyncClient]:
+    if transport == "asgi":
+        from load.app import create_load_test_app
+
+        app = create_load_test_app()
+        async with app.router.lifespan_context(app):
+            async with httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app, raise_app_exceptions=False), base_url="http://load-test"
+            ) as client:
+                yield client
+        return
+
+    base_url = f"http://127.0.0.1:{port}"
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "--factory",
+            "load.app:create_load_test_app",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+        ],
+        cwd=SCRIPTS_PATH,
+        env=os.environ.copy(),
+    )
+    try:
+        async with httpx.AsyncClient(base_url=base_url, timeout=30.0) as client:
+            await _wait_for_server(client, server)
+            yield client
+    finally:
+        server.terminate()
+        server.wait()
+
+
+async def _wait_for_server(client: httpx.AsyncClient, server: subprocess.Popen) -> None:
+    deadline = time.monotonic() + SERVER_STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise click.ClickException("The uvicorn server exited during startup")
+        try:
+            await client.get("/docs")
+        except httpx.TransportError:
+            await asyncio.sleep(0.2)
+        else:
+            return
+    raise click.ClickException(f"The uvicorn server did not start within {SERVER_STARTUP_TIMEOUT:.0f}s")
+
+
+def _echo_level(level: dict[str, Any]) -> None:
+    total = level["total"]
+    click.echo(
+        f"\nconcurrency={level['concurrency']} requests={total['requests']} "
+        f"throughput={total['throughput_per_second']:.1f}/s p95={total['p95_ms']:.1f}ms "
+        f"errors={total['error_rate']:.2%} rejected={total['rejected']}"
+    )
+    click.echo(
+        f"{'endpoint':<36} {'req':>7} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'err':>6} {'4xx':>6}"
+    )
+    for endpoint, summary in level["endpoints"].items():
+        click.echo(
+            f"{endpoint:<36} {summary['requests']:>7} {summary['throughput_per_second']:>8.1f} "
+            f"{summary['p50_ms']:>8.1f} {summary['p95_ms']:>8.1f} {summary['p99_ms']:>8.1f} "
+            f"{summary['errors']:>6} {summary['rejected']:>6}"
+        )
+
+
+if __name__ == "__main__":
+    cli()
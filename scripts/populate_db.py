@@ -1,3 +1,4 @@
+import time
 from importlib import import_module
 
 import click
@@ -12,10 +13,54 @@ def cli() -> None:
 
 @cli.command()
 @click.argument("persistence_engine", type=click.Choice(ALLOWED_PERSISTENCE_ENGINES, case_sensitive=False))
-def populate_db(persistence_engine: str) -> None:
-    """Populate database with example data."""
-    module_name = f"fixtures.{persistence_engine}"
-    import_module(module_name)
+@click.option("--customers", type=click.IntRange(min=1), default=1_000, show_default=True)
+@click.option("--seed", type=int, default=0, show_default=True)
+@click.option("--representatives", type=click.IntRange(min=1), default=20, show_default=True)
+@click.option("--whale-ratio", type=click.FloatRange(0, 1), default=0.02, show_default=True)
+@click.option(
+    "--whale-weight", type=click.IntRange(min=1), default=25, show_default=True, help="Opportunity weight of a whale."
+)
+@click.option("--hot-rep-ratio", type=click.FloatRange(0, 1), default=0.1, show_default=True)
+@click.option(
+    "--hot-rep-weight", type=click.IntRange(min=1), default=5, show_default=True, help="Assignment weight of a hot rep."
+)
+@click.option("--opportunities-per-customer", type=click.FloatRange(min=0), default=1.0, show_default=True)
+@click.option("--lead-ratio", type=click.FloatRange(0, 1), default=0.5, show_default=True)
+@click.option("--batch-size", type=click.IntRange(min=1), default=5_000, show_default=True)
+def populate_db(
+    persistence_engine: str,
+    customers: int,
+    seed: int,
+    representatives: int,
+    whale_ratio: float,
+    whale_weight: int,
+    hot_rep_ratio: float,
+    hot_rep_weight: int,
+    opportunities_per_customer: float,
+    lead_ratio: float,
+    batch_size: int,
+) -> None:
+    """Populate database with synthetic data, deterministic for a given seed."""
+    from synthetic.generator import GeneratorConfig, SyntheticDataGenerator
+
+    config = GeneratorConfig(
+        customers=customers,
+        seed=seed,
+        representatives=representatives,
+        whale_ratio=whale_ratio,
+        whale_weight=whale_weight,
+        hot_rep_ratio=hot_rep_ratio,
+        hot_rep_weight=hot_rep_weight,
+        opportunities_per_customer=opportunities_per_customer,
+        lead_ratio=lead_ratio,
+    )
+    module = import_module(f"synthetic.{persistence_engine.lower()}")
+    started_at = time.perf_counter()
+    counts = module.populate(SyntheticDataGenerator(config), batch_size=batch_size)
+    elapsed = time.perf_counter() - started_at
+    for name, count in counts.items():
+        click.echo(f"{name:<24} {count:>10}")
+    click.echo(f"Saved {counts.total()} rows in {elapsed:.1f}s")
 
 
 if __name__ == "__main__":
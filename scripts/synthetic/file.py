@@ -0,0 +1,196 @@
+from collections import Counter
+from collections.abc import Iterable
+from itertools import batched
+from pathlib import Path
+from shelve import Shelf
+from typing import Any
+
+from attrs import validators
+
+from building_blocks.infrastructure.file.io import get_write_db
+from customer_management.domain.entities.contact_person.contact_person import ContactPerson
+from customer_management.domain.entities.customer.customer import Customer
+from customer_management.domain.value_objects.address import Address
+from customer_management.domain.value_objects.company_info import CompanyInfo
+from customer_management.domain.value_objects.company_segment import CompanySegment
+from customer_management.domain.value_objects.contact_method import ContactMethod
+from customer_management.domain.value_objects.country import Country
+from customer_management.domain.value_objects.industry import Industry
+from customer_management.domain.value_objects.language import Language
+from customer_management.infrastructure.file.config import COUNTRIES_PATH, CUSTOMERS_PATH, LANGUAGES_PATH
+from sales.application.analytics.command import PipelineStatsCommandUseCase
+from sales.domain.entities.lead import Lead
+from sales.domain.entities.lead_assignments import LeadAssignments
+from sales.domain.entities.notes import Notes
+from sales.domain.entities.opportunity import Opportunity
+from sales.domain.entities.sales_representative import SalesRepresentative
+from sales.domain.value_objects.acquisition_source import AcquisitionSource
+from sales.domain.value_objects.contact_data import ContactData
+from sales.domain.value_objects.lead_assignment_entry import LeadAssignmentEntry
+from sales.domain.value_objects.money.currency import Currency
+from sales.domain.value_objects.money.money import Money
+from sales.domain.value_objects.note import Note
+from sales.domain.value_objects.offer_item import OfferItem
+from sales.domain.value_objects.opportunity_stage import OpportunityStage
+from sales.domain.value_objects.priority import Priority
+from sales.domain.value_objects.product import Product
+from sales.infrastructure.file.config import (
+    CURRENCIES_PATH,
+    LEAD_PATH,
+    OPEN_OPPORTUNITIES_PATH,
+    OPPORTUNITIES_PATH,
+    PIPELINE_STATS_PATH,
+    PRODUCTS_PATH,
+    SALES_REPR_PATH,
+)
+from sales.infrastructure.file.opportunity.command import OpportunityFileUnitOfWork
+
+from .generator import (
+    COUNTRIES,
+    CURRENCIES,
+    LANGUAGES,
+    PRODUCTS,
+    CustomerRecord,
+    LeadRecord,
+    NoteRecord,
+    OpportunityRecord,
+    SyntheticDataGenerator,
+)
+
+COUNTRY_OBJECTS = {code: Country(code=code, name=name) for code, name in COUNTRIES}
+LANGUAGE_OBJECTS = {code: Language(code=code, name=name) for code, name in LANGUAGES}
+CURRENCY_OBJECTS = {iso_code: Currency(name=name, iso_code=iso_code) for iso_code, name in CURRENCIES}
+PRODUCT_OBJECTS = {name: Product(name=name) for name in PRODUCTS}
+
+
+def populate(generator: SyntheticDataGenerator, batch_size: int) -> Counter[str]:
+    counts: Counter[str] = Counter()
+    representatives = (
+        SalesRepresentative(
+            id=representative.id, first_name=representative.first_name, last_name=representative.last_name
+        )
+        for representative in generator.representatives
+    )
+    counts["sales_representative"] = _save(SALES_REPR_PATH, representatives, batch_size)
+    counts["country"] = _save(COUNTRIES_PATH, COUNTRY_OBJECTS.items(), batch_size)
+    counts["language"] = _save(LANGUAGES_PATH, LANGUAGE_OBJECTS.items(), batch_size)
+    counts["currency"] = _save(CURRENCIES_PATH, CURRENCY_OBJECTS.items(), batch_size)
+    counts["product"] = _save(PRODUCTS_PATH, PRODUCT_OBJECTS.items(), batch_size)
+    # generated records are valid by construction, so the per-field domain validation is skipped for speed
+    with validators.disabled():
+        counts["customer"] = _save(CUSTOMERS_PATH, map(_to_customer, generator.iter_customers()), batch_size)
+        counts["lead"] = _save(LEAD_PATH, map(_to_lead, generator.iter_leads()), batch_size)
+        counts["opportunity"] = _save(
+            OPPORTUNITIES_PATH, map(_to_opportunity, generator.iter_opportunities()), batch_size
+        )
+    opportunity_uow = OpportunityFileUnitOfWork(OPPORTUNITIES_PATH, PIPELINE_STATS_PATH, OPEN_OPPORTUNITIES_PATH)
+    PipelineStatsCommandUseCase(opportunity_uow=opportunity_uow).rebuild()
+    # opportunities are saved around the repository, so its open-opportunities index has to be rebuilt too
+    with opportunity_uow as uow:
+        uow.repository.rebuild_open_opportunities_index()
+    return counts
+
+
+def _save(file_path: Path, entities: Iterable[Any], batch_size: int) -> int:
+    saved = 0
+    db: Shelf = get_write_db(file_path)
+    try:
+        for chunk in batched(entities, batch_size):
+            for entity in chunk:
+                key, value = entity if isinstance(entity, tuple) else (entity.id, entity)
+                db[key] = value
+            db.sync()
+            saved += len(chunk)
+    finally:
+        db.close()
+    return saved
+
+
+def _to_customer(record: CustomerRecord) -> Customer:
+    company_info = CompanyInfo(
+        name=record.company_name,
+        industry=Industry(name=record.industry),
+        segment=CompanySegment(size=record.size, legal_form=record.legal_form),
+        address=Address(
+            country=COUNTRY_OBJECTS[record.country_code],
+            street=record.street,
+            street_no=record.street_no,
+            postal_code=record.postal_code,
+            city=record.city,
+        ),
+    )
+    contact_persons = tuple(
+        ContactPerson(
+            id=person.id,
+            first_name=person.first_name,
+            last_name=person.last_name,
+            job_title=person.job_title,
+            preferred_language=LANGUAGE_OBJECTS[person.language_code],
+            contact_methods=tuple(
+                ContactMethod(type=method.type, value=method.value, is_preferred=method.is_preferred)
+                for method in person.contact_methods
+            ),
+        )
+        for person in record.contact_persons
+    )
+    return Customer.reconstitute(
+        id=record.id,
+        relation_manager_id=record.relation_manager_id,
+        company_info=company_info,
+        status=record.status,
+        contact_persons=contact_persons,
+    )
+
+
+def _to_lead(record: LeadRecord) -> Lead:
+    return Lead.reconstitute(
+        id=record.id,
+        customer_id=record.customer_id,
+        created_by_salesman_id=record.created_by_id,
+        created_at=record.created_at,
+        contact_data=ContactData(
+            first_name=record.first_name, last_name=record.last_name, phone=record.phone, email=record.email
+        ),
+        source=AcquisitionSource(name=record.source),
+        assignments=LeadAssignments(
+            history=tuple(
+                LeadAssignmentEntry(
+                    previous_owner_id=assignment.previous_owner_id,
+                    new_owner_id=assignment.new_owner_id,
+                    assigned_by_id=assignment.assigned_by_id,
+                    assigned_at=assignment.assigned_at,
+                )
+                for assignment in record.assignments
+            )
+        ),
+        notes=_to_notes(record.notes),
+    )
+
+
+def _to_opportunity(record: OpportunityRecord) -> Opportunity:
+    return Opportunity.reconstitute(
+        id=record.id,
+        created_by_id=record.created_by_id,
+        customer_id=record.customer_id,
+        owner_id=record.owner_id,
+        created_at=record.created_at,
+        source=AcquisitionSource(name=record.source),
+        stage=OpportunityStage(name=record.stage),
+        priority=Priority(level=record.priority),
+        offer=tuple(
+            OfferItem(
+                product=PRODUCT_OBJECTS[item.product_name],
+                value=Money(currency=CURRENCY_OBJECTS[item.currency_iso_code], amount=item.amount),
+            )
+            for item in record.offer
+        ),
+        notes=_to_notes(record.notes),
+    )
+
+
+def _to_notes(notes: Iterable[NoteRecord]) -> Notes:
+    return Notes(
+        history=tuple(
+            Note(created_by_id=note.created_by_id, content=note.content, created_at=note.created_at) for note in notes
+        )
+    )
@@ -0,0 +1,399 @@
+import datetime as dt
+import random
+from collections.abc import Iterator
+from decimal import Decimal
+from functools import cached_property
+from itertools import accumulate
+from uuid import UUID
+
+from attrs import define
+from faker import Faker
+
+from customer_management.domain.value_objects.company_segment import (
+    ALLOWED_COMPANY_SIZES,
+    ALLOWED_LEGAL_FORMS,
+    CompanySize,
+    LegalForm,
+)
+from customer_management.domain.value_objects.contact_method import ContactMethodType
+from customer_management.domain.value_objects.customer_status import CustomerStatusName
+from customer_management.domain.value_objects.industry import ALLOWED_INDUSTRY_NAMES, IndustryName
+from sales.domain.value_objects.acquisition_source import ALLOWED_SOURCE_NAMES, SourceName
+from sales.domain.value_objects.opportunity_stage import ALLOWED_OPPORTUNITY_STAGES, OpportunityStageName
+from sales.domain.value_objects.priority import ALLOWED_PRIORITY_LEVELS, PriorityLevel
+
+FAKER_POOL_SIZE = 1_000
+BASE_DATE = dt.datetime(2024, 1, 1)
+DATE_RANGE_MINUTES = 365 * 24 * 60
+
+KNOWN_REPRESENTATIVES = (
+    ("24a9bfa0-42a1-4dd2-ad19-2e26da3c2ce0", "John", "Doe"),
+    ("753bae00-bd6f-4182-ba2f-68942d59d1e6", "Larry", "Jackson"),
+    ("54499cbc-5a06-42e9-a850-7607af9c50f0", "Nathan", "Parker"),
+    ("e20f89a5-13a7-416c-b61b-9761f3dafd09", "Maria", "Allen"),
+)
+COUNTRIES = (("pl", "Poland"), ("de", "Germany"), ("no", "Norway"), ("es", "Spain"))
+LANGUAGES = (("pl", "Polish"), ("de", "German"), ("no", "Norwegian (bokmål)"), ("es", "Spanish"))
+CURRENCIES = (("EUR", "Euro"), ("NOK", "Norwegian krone"), ("USD", "U.S. dollar"))
+PRODUCTS = (
+    "Some product",
+    "Some service",
+    "Some other service",
+    *(f"Product {number}" for number in range(1, 18)),
+)
+MAX_CONTACT_PERSONS = 10
+PHONE_PREFIXES = ("+4850", "+4851", "+4853", "+4857")
+PHONE_NUMBERS_PER_PREFIX = 10_000_000
+
+CUSTOMER_STATUS_WEIGHTS = {
+    CustomerStatusName.INITIAL.value: 3,
+    CustomerStatusName.CONVERTED.value: 6,
+    CustomerStatusName.ARCHIVED.value: 1,
+}
+STAGE_WEIGHTS = (4, 3, 2, 2, 2)
+PRIORITY_WEIGHTS = (3, 4, 2, 1)
+ASSIGNMENT_CHAIN_WEIGHTS = (2, 5, 2, 1)
+
+
+@define(frozen=True, kw_only=True)
+class GeneratorConfig:
+    customers: int = 1_000
+    seed: int = 0
+    representatives: int = 20
+    whale_ratio: float = 0.02
+    whale_weight: int = 25
+    hot_rep_ratio: float = 0.1
+    hot_rep_weight: int = 5
+    opportunities_per_customer: float = 1.0
+    lead_ratio: float = 0.5
+
+
+@define(frozen=True, kw_only=True)
+class RepresentativeRecord:
+    id: str
+    first_name: str
+    last_name: str
+
+
+@define(frozen=True, kw_only=True)
+class ContactMethodRecord:
+    type: ContactMethodType
+    value: str
+    is_preferred: bool
+
+
+@define(frozen=True, kw_only=True)
+class ContactPersonRecord:
+    id: str
+    first_name: str
+    last_name: str
+    job_title: str
+    language_code: str
+    contact_methods: tuple[ContactMethodRecord, ...]
+
+
+@define(frozen=True, kw_only=True)
+class CustomerRecord:
+    id: str
+    relation_manager_id: str
+    status: str
+    company_name: str
+    industry: IndustryName
+    size: CompanySize
+    legal_form: LegalForm
+    country_code: str
+    street: str
+    street_no: str
+    postal_code: str
+    city: str
+    contact_persons: tuple[ContactPersonRecord, ...]
+
+
+@define(frozen=True, kw_only=True)
+class NoteRecord:
+    created_by_id: str
+    content: str
+    created_at: dt.datetime
+
+
+@define(frozen=True, kw_only=True)
+class AssignmentRecord:
+    previous_owner_id: str | None
+    new_owner_id: str
+    assigned_by_id: str
+    assigned_at: dt.datetime
+
+
+@define(frozen=True, kw_only=True)
+class LeadRecord:
+    id: str
+    customer_id: str
+    created_by_id: str
+    created_at: dt.datetime
+    source: SourceName
+    first_name: str
+    last_name: str
+    phone: str | None
+    email: str | None
+    assignments: tuple[AssignmentRecord, ...]
+    notes: tuple[NoteRecord, ...]
+
+
+@define(frozen=True, kw_only=True)
+class OfferItemRecord:
+    product_name: str
+    currency_iso_code: str
+    amount: Decimal
+
+
+@define(frozen=True, kw_only=True)
+class OpportunityRecord:
+    id: str
+    created_by_id: str
+    customer_id: str
+    owner_id: str
+    created_at: dt.datetime
+    source: SourceName
+    stage: OpportunityStageName
+    priority: PriorityLevel
+    offer: tuple[OfferItemRecord, ...]
+    notes: tuple[NoteRecord, ...]
+
+
+@define(frozen=True)
+class _PlannedCustomer:
+    id: str
+    relation_manager_id: str
+    status: str
+    is_whale: bool
+
+
+class SyntheticDataGenerator:
+    """Deterministically generates CRM data for a given config, with a skew towards whale customers and hot reps."""
+
+    def __init__(self, config: GeneratorConfig) -> None:
+        self.config = config
+
+    @cached_property
+    def _pools(self) -> dict[str, list[str]]:
+        return get_faker_pools(self.config.seed)
+
+    @cached_property
+    def representatives(self) -> tuple[RepresentativeRecord, ...]:
+        rng = self._get_random("representatives")
+        known = [
+            RepresentativeRecord(id=id, first_name=first, last_name=last) for id, first, last in KNOWN_REPRESENTATIVES
+        ]
+        generated = [
+            RepresentativeRecord(
+                id=_make_id(rng),
+                first_name=rng.choice(self._pools["first_names"]),
+                last_name=rng.choice(self._pools["last_names"]),
+            )
+            for _ in range(max(self.config.representatives - len(known), 0))
+        ]
+        return tuple([*known, *generated][: max(self.config.representatives, 1)])
+
+    @cached_property
+    def _representative_cum_weights(self) -> list[int]:
+        rng = self._get_random("hot-representatives")
+        hot_count = round(len(self.representatives) * self.config.hot_rep_ratio)
+        hot_indices = set(rng.sample(range(len(self.representatives)), k=hot_count))
+        weights = (
+            self.config.hot_rep_weight if index in hot_indices else 1 for index in range(len(self.representatives))
+        )
+        return list(accumulate(weights))
+
+    @cached_property
+    def _customer_plan(self) -> list[_PlannedCustomer]:
+        rng = self._get_random("customer-plan")
+        statuses = rng.choices(
+            list(CUSTOMER_STATUS_WEIGHTS), weights=list(CUSTOMER_STATUS_WEIGHTS.values()), k=self.config.customers
+        )
+        return [
+            _PlannedCustomer(
+                id=_make_id(rng),
+                relation_manager_id=self._pick_representative_id(rng),
+                status=status,
+                is_whale=rng.random() < self.config.whale_ratio,
+            )
+            for status in statuses
+        ]
+
+    def iter_customers(self) -> Iterator[CustomerRecord]:
+        rng = self._get_random("customers")
+        pools = self._pools
+        for number, planned in enumerate(self._customer_plan):
+            country_code = rng.choice(COUNTRIES)[0]
+            contact_persons_count = (
+                rng.randint(3, MAX_CONTACT_PERSONS) if planned.is_whale else rng.choices((1, 2, 3), (6, 3, 1))[0]
+            )
+            yield CustomerRecord(
+                id=planned.id,
+                relation_manager_id=planned.relation_manager_id,
+                status=planned.status,
+                company_name=rng.choice(pools["companies"]),
+                industry=rng.choice(ALLOWED_INDUSTRY_NAMES),
+                size="large" if planned.is_whale else rng.choice(ALLOWED_COMPANY_SIZES[:-1]),
+                legal_form=rng.choice(ALLOWED_LEGAL_FORMS),
+                country_code=country_code,
+                street=rng.choice(pools["streets"]),
+                street_no=str(rng.randint(1, 200)),
+                postal_code=f"{rng.randint(0, 99):02}-{rng.randint(0, 999):03}",
+                city=rng.choice(pools["cities"]),
+                contact_persons=tuple(
+                    self._make_contact_person(rng, country_code, number=number * MAX_CONTACT_PERSONS + index)
+                    for index in range(contact_persons_count)
+                ),
+            )
+
+    def iter_leads(self) -> Iterator[LeadRecord]:
+        rng = self._get_random("leads")
+        pools = self._pools
+        for number, planned in enumerate(self._customer_plan):
+            if rng.random() >= self.config.lead_ratio:
+                continue
+            created_at = _random_date(rng)
+            assignments = self._make_assignments(rng, created_by_id=planned.relation_manager_id, after=created_at)
+            notes: tuple[NoteRecord, ...] = ()
+            if assignments:
+                notes = self._make_notes(rng, assignments[-1].new_owner_id, after=assignments[-1].assigned_at)
+            has_phone = rng.random() < 0.5
+            yield LeadRecord(
+                id=_make_id(rng),
+                customer_id=planned.id,
+                created_by_id=planned.relation_manager_id,
+                created_at=created_at,
+                source=rng.choice(ALLOWED_SOURCE_NAMES),
+                first_name=rng.choice(pools["first_names"]),
+                last_name=rng.choice(pools["last_names"]),
+                phone=_make_phone(number) if has_phone else None,
+                email=None if has_phone and rng.random() < 0.5 else f"lead.{number}@{rng.choice(pools['domains'])}",
+                assignments=assignments,
+                notes=notes,
+            )
+
+    def iter_opportunities(self) -> Iterator[OpportunityRecord]:
+        rng = self._get_random("opportunities")
+        converted = [planned for planned in self._customer_plan if planned.status == CustomerStatusName.CONVERTED.value]
+        if not converted:
+            return
+        cum_weights = list(accumulate(self.config.whale_weight if planned.is_whale else 1 for planned in converted))
+        total = round(self.config.customers * self.config.opportunities_per_customer)
+        for customer in rng.choices(converted, cum_weights=cum_weights, k=total):
+            owner_id = self._pick_representative_id(rng)
+            created_at = _random_date(rng)
+            yield OpportunityRecord(
+                id=_make_id(rng),
+                created_by_id=owner_id,
+                customer_id=customer.id,
+                owner_id=owner_id,
+                created_at=created_at,
+                source=rng.choice(ALLOWED_SOURCE_NAMES),
+                stage=rng.choices(ALLOWED_OPPORTUNITY_STAGES, weights=STAGE_WEIGHTS)[0],
+                priority=rng.choices(ALLOWED_PRIORITY_LEVELS, weights=PRIORITY_WEIGHTS)[0],
+                offer=self._make_offer(rng, customer.is_whale),
+                notes=self._make_notes(rng, owner_id, after=created_at),
+            )
+
+    def _make_contact_person(self, rng: random.Random, country_code: str, number: int) -> ContactPersonRecord:
+        email = ContactMethodRecord(
+            type="email", value=f"contact.{number}@{rng.choice(self._pools['domains'])}", is_preferred=False
+        )
+        phone = ContactMethodRecord(type="phone", value=_make_phone(number), is_preferred=False)
+        contact_methods = [email, phone] if rng.random() < 0.6 else [email]
+        preferred = rng.randrange(len(contact_methods))
+        contact_methods[preferred] = ContactMethodRecord(
+            type=contact_methods[preferred].type, value=contact_methods[preferred].value, is_preferred=True
+        )
+        return ContactPersonRecord(
+            id=_make_id(rng),
+            first_name=rng.choice(self._pools["first_names"]),
+            last_name=rng.choice(self._pools["last_names"]),
+            job_title=rng.choice(self._pools["job_titles"]),
+            language_code=country_code,
+            contact_methods=tuple(contact_methods),
+        )
+
+    def _make_assignments(
+        self, rng: random.Random, created_by_id: str, after: dt.datetime
+    ) -> tuple[AssignmentRecord, ...]:
+        chain_length = rng.choices(range(len(ASSIGNMENT_CHAIN_WEIGHTS)), weights=ASSIGNMENT_CHAIN_WEIGHTS)[0]
+        assignments: list[AssignmentRecord] = []
+        owner_id: str | None = None
+        assigned_at = after
+        for _ in range(chain_length):
+            new_owner_id = self._pick_representative_id(rng)
+            if any(assignment.new_owner_id == new_owner_id for assignment in assignments):
+                break
+            assigned_at += dt.timedelta(hours=rng.randint(1, 72))
+            assignments.append(
+                AssignmentRecord(
+                    previous_owner_id=owner_id,
+                    new_owner_id=new_owner_id,
+                    assigned_by_id=owner_id or created_by_id,
+                    assigned_at=assigned_at,
+                )
+            )
+            owner_id = new_owner_id
+        return tuple(assignments)
+
+    def _make_notes(self, rng: random.Random, created_by_id: str, after: dt.datetime) -> tuple[NoteRecord, ...]:
+        contents = rng.sample(self._pools["sentences"], k=rng.choices((0, 1, 2, 3), (4, 3, 2, 1))[0])
+        created_at = after
+        notes = []
+        for content in contents:
+            created_at += dt.timedelta(hours=rng.randint(1, 240))
+            notes.append(NoteRecord(created_by_id=created_by_id, content=content, created_at=created_at))
+        return tuple(notes)
+
+    def _make_offer(self, rng: random.Random, is_whale: bool) -> tuple[OfferItemRecord, ...]:
+        products = rng.sample(PRODUCTS, k=rng.randint(2, 6) if is_whale else rng.randint(1, 3))
+        currency_iso_code = rng.choice(CURRENCIES)[0]
+        scale = 10 if is_whale else 1
+        return tuple(
+            OfferItemRecord(
+                product_name=product,
+                currency_iso_code=currency_iso_code,
+                amount=Decimal(max(round(rng.lognormvariate(11, 1) * scale), 100)) / 100,
+            )
+            for product in products
+        )
+
+    def _pick_representative_id(self, rng: random.Random) -> str:
+        return rng.choices(self.representatives, cum_weights=self._representative_cum_weights)[0].id
+
+    def _get_random(self, kind: str) -> random.Random:
+        return get_seeded_random(self.config.seed, kind)
+
+
+def get_faker_pools(seed: int) -> dict[str, list[str]]:
+    faker = Faker(locale="pl_PL")
+    faker.seed_instance(seed)
+    return {
+        "first_names": [faker.first_name() for _ in range(FAKER_POOL_SIZE)],
+        "last_names": [faker.last_name() for _ in range(FAKER_POOL_SIZE)],
+        "companies": [faker.company() for _ in range(FAKER_POOL_SIZE)],
+        "job_titles": [faker.job() for _ in range(FAKER_POOL_SIZE)],
+        "streets": [faker.street_name() for _ in range(FAKER_POOL_SIZE)],
+        "cities": [faker.city() for _ in range(FAKER_POOL_SIZE)],
+        "domains": [faker.domain_name() for _ in range(FAKER_POOL_SIZE)],
+        "sentences": [faker.sentence(nb_words=12) for _ in range(FAKER_POOL_SIZE)],
+    }
+
+
+def get_seeded_random(seed: int, kind: str) -> random.Random:
+    return random.Random(f"{seed}-{kind}")
+
+
+def _make_id(rng: random.Random) -> str:
+    return str(UUID(int=rng.getrandbits(128), version=4))
+
+
+def _random_date(rng: random.Random) -> dt.datetime:
+    return BASE_DATE + dt.timedelta(minutes=rng.randrange(DATE_RANGE_MINUTES))
+
+
+def _make_phone(number: int) -> str:
+    prefix = PHONE_PREFIXES[number // PHONE_NUMBERS_PER_PREFIX % len(PHONE_PREFIXES)]
+    return f"{prefix}{number % PHONE_NUMBERS_PER_PREFIX:07}"
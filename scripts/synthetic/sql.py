@@ -0,0 +1,229 @@
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from itertools import batched
+from typing import Any
+from uuid import NAMESPACE_URL, uuid5
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from building_blocks.infrastructure.sql.config import SQLALCHEMY_DB_URL
+from building_blocks.infrastructure.sql.db import Base, DbConnectionManager, get_db_session
+from customer_management.infrastructure.sql.customer.models import (
+    AddressModel,
+    CompanyDataModel,
+    ContactMethodModel,
+    ContactPersonModel,
+    CountryModel,
+    CustomerModel,
+    LanguageModel,
+)
+from sales.application.analytics.command import PipelineStatsCommandUseCase
+from sales.infrastructure.sql.lead.models import LeadAssignmentEntryModel, LeadModel, LeadNoteModel
+from sales.infrastructure.sql.opportunity.command import OpportunitySQLUnitOfWork
+from sales.infrastructure.sql.opportunity.models import (
+    CurrencyModel,
+    OfferItemModel,
+    OpportunityModel,
+    OpportunityNoteModel,
+    ProductModel,
+)
+from sales.infrastructure.sql.sales_representative.models import SalesRepresentativeModel
+
+from .generator import (
+    COUNTRIES,
+    CURRENCIES,
+    LANGUAGES,
+    PRODUCTS,
+    CustomerRecord,
+    LeadRecord,
+    NoteRecord,
+    OpportunityRecord,
+    SyntheticDataGenerator,
+)
+
+Rows = dict[type[Base], list[dict[str, Any]]]
+
+
+def _get_derived_id(kind: str, key: str) -> str:
+    return str(uuid5(NAMESPACE_URL, f"crm-{kind}-{key}"))
+
+
+COUNTRY_IDS = {code: _get_derived_id("country", code) for code, _ in COUNTRIES}
+LANGUAGE_IDS = {code: _get_derived_id("language", code) for code, _ in LANGUAGES}
+CURRENCY_IDS = {iso_code: _get_derived_id("currency", iso_code) for iso_code, _ in CURRENCIES}
+PRODUCT_IDS = {name: _get_derived_id("product", name) for name in PRODUCTS}
+
+
+def populate(generator: SyntheticDataGenerator, batch_size: int) -> Counter[str]:
+    counts: Counter[str] = Counter()
+    session_factory = DbConnectionManager.get_session_factory(SQLALCHEMY_DB_URL or "")
+    with session_factory() as db:
+        _insert(db, counts, _get_lookup_rows(generator))
+        for customers in batched(generator.iter_customers(), batch_size):
+            _insert(db, counts, _get_customer_rows(customers))
+        for leads in batched(generator.iter_leads(), batch_size):
+            _insert(db, counts, _get_lead_rows(leads))
+        for opportunities in batched(generator.iter_opportunities(), batch_size):
+            _insert(db, counts, _get_opportunity_rows(opportunities))
+    PipelineStatsCommandUseCase(opportunity_uow=OpportunitySQLUnitOfWork(get_db_session, write_lock=True)).rebuild()
+    return counts
+
+
+def _insert(db: Session, counts: Counter[str], rows: Rows) -> None:
+    for model, model_rows in rows.items():
+        if model_rows:
+            db.execute(insert(model), model_rows)
+            counts[model.__tablename__] += len(model_rows)
+    db.commit()
+
+
+def _get_lookup_rows(generator: SyntheticDataGenerator) -> Rows:
+    return {
+        SalesRepresentativeModel: [
+            {"id": representative.id, "first_name": representative.first_name, "last_name": representative.last_name}
+            for representative in generator.representatives
+        ],
+        CountryModel: [{"id": COUNTRY_IDS[code], "code": code, "name": name} for code, name in COUNTRIES],
+        LanguageModel: [{"id": LANGUAGE_IDS[code], "code": code, "name": name} for code, name in LANGUAGES],
+        CurrencyModel: [
+            {"id": CURRENCY_IDS[iso_code], "iso_code": iso_code, "name": name} for iso_code, name in CURRENCIES
+        ],
+        ProductModel: [{"id": PRODUCT_IDS[name], "name": name} for name in PRODUCTS],
+    }
+
+
+def _get_customer_rows(customers: Iterable[CustomerRecord]) -> Rows:
+    rows: Rows = {
+        CustomerModel: [],
+        AddressModel: [],
+        CompanyDataModel: [],
+        ContactPersonModel: [],
+        ContactMethodModel: [],
+    }
+    for customer in customers:
+        address_id = _get_derived_id("address", customer.id)
+        rows[CustomerModel].append(
+            {
+                "id": customer.id,
+                "relation_manager_id": customer.relation_manager_id,
+                "status_name": customer.status,
+                "version": 1,
+            }
+        )
+        rows[AddressModel].append(
+            {
+                "id": address_id,
+                "country_id": COUNTRY_IDS[customer.country_code],
+                "street": customer.street,
+                "street_no": customer.street_no,
+                "postal_code": customer.postal_code,
+                "city": customer.city,
+            }
+        )
+        rows[CompanyDataModel].append(
+            {
+                "id": _get_derived_id("company-data", customer.id),
+                "address_id": address_id,
+                "customer_id": customer.id,
+                "name": customer.company_name,
+                "industry_name": customer.industry,
+                "size": customer.size,
+                "legal_form": customer.legal_form,
+            }
+        )
+        for person in customer.contact_persons:
+            rows[ContactPersonModel].append(
+                {
+                    "id": person.id,
+                    "language_id": LANGUAGE_IDS[person.language_code],
+                    "customer_id": customer.id,
+                    "first_name": person.first_name,
+                    "last_name": person.last_name,
+                    "job_title": person.job_title,
+                }
+            )
+            rows[ContactMethodModel].extend(
+                {
+                    "contact_person_id": person.id,
+                    "value": method.value,
+                    "type": method.type,
+                    "is_preferred": method.is_preferred,
+                }
+                for method in person.contact_methods
+            )
+    return rows
+
+
+def _get_lead_rows(leads: Iterable[LeadRecord]) -> Rows:
+    rows: Rows = {LeadModel: [], LeadAssignmentEntryModel: [], LeadNoteModel: []}
+    for lead in leads:
+        rows[LeadModel].append(
+            {
+                "id": lead.id,
+                "customer_id": lead.customer_id,
+                "created_by_id": lead.created_by_id,
+                "created_at": lead.created_at,
+                "source_name": lead.source,
+                "contact_data_first_name": lead.first_name,
+                "contact_data_last_name": lead.last_name,
+                "contact_data_phone": lead.phone,
+                "contact_data_email": lead.email,
+                "version": 1,
+            }
+        )
+        rows[LeadAssignmentEntryModel].extend(
+            {
+                "lead_id": lead.id,
+                "previous_owner_id": assignment.previous_owner_id,
+                "new_owner_id": assignment.new_owner_id,
+                "assigned_by_id": assignment.assigned_by_id,
+                "assigned_at": assignment.assigned_at,
+            }
+            for assignment in lead.assignments
+        )
+        rows[LeadNoteModel].extend(_get_note_rows("lead_id", lead.id, lead.notes))
+    return rows
+
+
+def _get_opportunity_rows(opportunities: Iterable[OpportunityRecord]) -> Rows:
+    rows: Rows = {
+        OpportunityModel: [],
+        OfferItemModel: [],
+        OpportunityNoteModel: [],
+    }
+    for opportunity in opportunities:
+        rows[OpportunityModel].append(
+            {
+                "id": opportunity.id,
+                "created_by_id": opportunity.created_by_id,
+                "customer_id": opportunity.customer_id,
+                "owner_id": opportunity.owner_id,
+                "created_at": opportunity.created_at,
+                "source_name": opportunity.source,
+                "stage_name": opportunity.stage,
+                "priority_level": opportunity.priority,
+                "version": 1,
+            }
+        )
+        rows[OfferItemModel].extend(
+            {
+                "opportunity_id": opportunity.id,
+                "product_id": PRODUCT_IDS[item.product_name],
+                "currency_id": CURRENCY_IDS[item.currency_iso_code],
+                "amount": item.amount,
+            }
+            for item in opportunity.offer
+        )
+        rows[OpportunityNoteModel].extend(_get_note_rows("opportunity_id", opportunity.id, opportunity.notes))
+    return rows
+
+
+def _get_note_rows(parent_key: str, parent_id: str, notes: Iterable[NoteRecord]) -> Iterator[dict[str, Any]]:
+    for note in notes:
+        yield {
+            parent_key: parent_id,
+            "created_by_id": note.created_by_id,
+            "content": note.content,
+            "created_at": note.created_at,
+        }
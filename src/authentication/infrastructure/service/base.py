@@ -1,16 +1,14 @@
 from abc import ABC, abstractmethod
 
-from faker import Faker
 from pydantic import BaseModel, EmailStr, Field
 
 from authentication.infrastructure.roles import UserRole
-
-faker = Faker(locale="pl_PL")
+from building_blocks.application.examples import lazy_examples
 
 
 class UserReadModel(BaseModel):
-    id: str = Field(examples=[faker.uuid4()])
-    salesman_id: str | None = Field(examples=[faker.uuid4()])
+    id: str = Field(json_schema_extra=lazy_examples(lambda faker: [faker.uuid4()]))
+    salesman_id: str | None = Field(json_schema_extra=lazy_examples(lambda faker: [faker.uuid4()]))
     roles: list[str] = Field(examples=[[UserRole.ADMIN]])
 
 
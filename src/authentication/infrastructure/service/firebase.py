@@ -1,3 +1,4 @@
+import time
 from typing import Self
 
 import firebase_admin
@@ -11,8 +12,14 @@ from authentication.infrastructure.exceptions import (
     InvalidUserCreationData,
 )
 from authentication.infrastructure.service.base import AuthenticationService, UserReadModel
+from building_blocks.application.metrics import Histogram, metrics_registry
+from building_blocks.application.tracing import traced
 from building_blocks.infrastructure.exceptions import ServerError
 
+token_verification_duration = metrics_registry.register(
+    Histogram("auth_token_verification_seconds", "Latency of ID token verification with Firebase.")
+)
+
 
 class FirebaseUserReadModel(UserReadModel):
     @classmethod
@@ -28,7 +35,9 @@ class FirebaseAuthenticationService(AuthenticationService):
         if not firebase_admin._apps:
             firebase_admin.initialize_app(credentials)
 
+    @traced("FirebaseAuthenticationService.verify_token")
     def verify_token(self, token: str) -> FirebaseUserReadModel:
+        started_at = time.perf_counter()
         try:
             data = auth.verify_id_token(token)
         except (
@@ -42,6 +51,8 @@ class FirebaseAuthenticationService(AuthenticationService):
             raise AccountDisabled from e
         except auth.CertificateFetchError as e:
             raise ServerError from e
+        finally:
+            token_verification_duration.observe(time.perf_counter() - started_at)
         return FirebaseUserReadModel.from_token_data(data)
 
     def has_role(self, user_data: FirebaseUserReadModel, role: str) -> bool:
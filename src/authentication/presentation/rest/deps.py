@@ -7,8 +7,11 @@ from authentication.infrastructure.exceptions import AccountDisabled, InvalidTok
 from authentication.infrastructure.roles import UserRole
 from authentication.infrastructure.service.base import AuthenticationService, UserReadModel
 from authentication.presentation.container import get_container
+from building_blocks.application.instrumentation import timed
 from building_blocks.infrastructure.exceptions import ServerError
 
+AUTH_TIMING_NAME = "auth"
+
 security = HTTPBearer(auto_error=False)
 
 
@@ -26,7 +29,8 @@ def get_current_user(
 
     token = credentials.credentials
     try:
-        user_data = auth_service.verify_token(token)
+        with timed(AUTH_TIMING_NAME):
+            user_data = auth_service.verify_token(token)
     except InvalidToken as e:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=e.message) from e
     except AccountDisabled as e:
@@ -0,0 +1,81 @@
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+from threading import Condition, Event
+from typing import Any
+
+
+class CommandBatcher(ABC):
+    @abstractmethod
+    def submit[ResultT](self, command: Callable[[], ResultT]) -> ResultT: ...
+
+
+class ImmediateCommandBatcher(CommandBatcher):
+    def submit[ResultT](self, command: Callable[[], ResultT]) -> ResultT:
+        return command()
+
+
+class _PendingCommand:
+    def __init__(self, command: Callable[[], Any]) -> None:
+        self.command = command
+        self.result: Any = None
+        self.error: BaseException | None = None
+        self.done = Event()
+
+    def get_result(self) -> Any:
+        self.done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+class GroupCommitBatcher(CommandBatcher, ABC):
+    """Runs commands submitted concurrently within `window` seconds in one transaction, each one isolated."""
+
+    def __init__(self, window: float = 0.005, max_batch_size: int = 64) -> None:
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self._queue: list[_PendingCommand] = []
+        self._collecting = False
+        self._condition = Condition()
+
+    def submit[ResultT](self, command: Callable[[], ResultT]) -> ResultT:
+        pending = _PendingCommand(command)
+        with self._condition:
+            self._queue.append(pending)
+            is_leader = not self._collecting
+            if is_leader:
+                self._collecting = True
+                self._condition.wait_for(lambda: len(self._queue) >= self.max_batch_size, timeout=self.window)
+                batch, self._queue = self._queue, []
+                self._collecting = False
+            elif len(self._queue) >= self.max_batch_size:
+                self._condition.notify_all()
+        if is_leader:
+            self._execute(batch)
+        return pending.get_result()
+
+    def _execute(self, batch: list[_PendingCommand]) -> None:
+        try:
+            with self._transaction() as transaction:
+                for pending in batch:
+                    try:
+                        with self._isolated(transaction):
+                            pending.result = pending.command()
+                    except Exception as e:
+                        pending.error = e
+        except BaseException as e:
+            for pending in batch:
+                if pending.error is None:
+                    pending.error = e
+            if not isinstance(e, Exception):
+                raise
+        finally:
+            for pending in batch:
+                pending.done.set()
+
+    @abstractmethod
+    def _transaction(self) -> AbstractContextManager[Any]: ...
+
+    @abstractmethod
+    def _isolated(self, transaction: Any) -> AbstractContextManager[Any]: ...
@@ -0,0 +1,39 @@
+import time
+from collections.abc import Callable
+from threading import Lock
+
+
+class TTLCache[KeyT, ValueT]:
+    def __init__(self, ttl: float, clock: Callable[[], float] = time.monotonic) -> None:
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: dict[KeyT, tuple[float, ValueT]] = {}
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: KeyT) -> ValueT | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self.hits += 1
+            return value
+
+    def set(self, key: KeyT, value: ValueT) -> None:
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl, value)
+
+    def invalidate(self, key: KeyT) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -2,6 +2,12 @@ from abc import ABC, abstractmethod
 from types import TracebackType
 from typing import Self
 
+from attrs import define
+
+from building_blocks.application.exceptions import ConcurrentModification
+from building_blocks.application.tracing import tracer
+from building_blocks.domain.entity import AggregateRoot
+
 
 class BaseUnitOfWork(ABC):
     @abstractmethod
@@ -14,7 +20,8 @@ class BaseUnitOfWork(ABC):
     def rollback(self) -> None: ...
 
     def __enter__(self) -> Self:
-        self.begin()
+        with tracer.span(f"{type(self).__name__}.begin"):
+            self.begin()
         return self
 
     def __exit__(
@@ -24,7 +31,20 @@ class BaseUnitOfWork(ABC):
         traceback: TracebackType | None,
     ) -> None:
         if exc_type is None:
-            self.commit()
+            with tracer.span(f"{type(self).__name__}.commit"):
+                self.commit()
         else:
-            self.rollback()
+            with tracer.span(f"{type(self).__name__}.rollback"):
+                self.rollback()
             raise
+
+
+def ensure_version_matches(aggregate: AggregateRoot, expected_version: int | None) -> None:
+    if expected_version is not None and aggregate.version != expected_version:
+        raise ConcurrentModification
+
+
+@define(frozen=True)
+class Versioned[Result]:
+    result: Result
+    version: int
@@ -1,5 +1,20 @@
-from pydantic import BaseModel
+from collections.abc import Mapping
+from typing import Any
+
+from pydantic import BaseModel, ValidationError
+
+from building_blocks.application.exceptions import InvalidData
 
 
 class BaseCommandModel(BaseModel):
     pass
+
+
+def parse_command_model[
+    CommandModelT: BaseCommandModel
+](model: type[CommandModelT], data: Mapping[str, Any]) -> CommandModelT:
+    try:
+        return model.model_validate(data)
+    except ValidationError as e:
+        detail = "; ".join(f"{'.'.join(map(str, error['loc']))}: {error['msg']}" for error in e.errors())
+        raise InvalidData(detail) from e
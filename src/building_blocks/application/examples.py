@@ -0,0 +1,26 @@
+from collections.abc import Callable
+from functools import cache
+from typing import TYPE_CHECKING, Any
+
+from pydantic.json_schema import JsonDict
+
+if TYPE_CHECKING:
+    from faker import Faker
+
+FAKER_LOCALE = "pl_PL"
+
+
+@cache
+def get_faker() -> "Faker":
+    from faker import Faker
+
+    return Faker(locale=FAKER_LOCALE)
+
+
+def lazy_examples(factory: Callable[["Faker"], list[Any]]) -> Callable[[JsonDict], None]:
+    """Defers building field examples (and importing Faker) until the JSON schema is generated."""
+
+    def add_examples(schema: JsonDict) -> None:
+        schema["examples"] = factory(get_faker())
+
+    return add_examples
@@ -25,6 +25,10 @@ class ConflictingAction(ApplicationException):
     pass
 
 
+class ConcurrentModification(ConflictingAction):
+    message = "Object has been modified by another request, fetch it again and retry"
+
+
 class ObjectDoesNotExist(ApplicationException):
     def __init__(self, id_: str) -> None:
         message = f"Object with id={id_} does not exist"
@@ -35,3 +39,7 @@ class InvalidData(ApplicationException):
     def __init__(self, message: str) -> None:
         structured_msg = [{"msg": message}]
         super().__init__(structured_msg)
+
+
+def get_error_detail(error: InvalidData) -> str:
+    return "; ".join(entry["msg"] for entry in error.message)
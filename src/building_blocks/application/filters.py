@@ -1,10 +1,14 @@
 from abc import ABC
+from collections.abc import Iterable
 from enum import Enum
 from typing import Any
 
 from attrs import define
 
-from building_blocks.application.exceptions import InvalidFilterType
+from building_blocks.application.exceptions import InvalidData, InvalidFilterType
+
+# enough to resolve a whole table page in one call, while staying below the SQLite bound-parameter limit
+MAX_LOOKUP_IDS = 500
 
 
 class FilterConditionType(str, Enum):
@@ -27,3 +31,10 @@ class BaseFilterResolver[FilterFuncT](ABC):
         if condition_type not in self._filter_mapping:
             raise InvalidFilterType
         return self._filter_mapping[condition_type]
+
+
+def get_lookup_ids(ids: Iterable[str]) -> tuple[str, ...]:
+    unique_ids = tuple(dict.fromkeys(ids))
+    if len(unique_ids) > MAX_LOOKUP_IDS:
+        raise InvalidData(f"Cannot look up more than {MAX_LOOKUP_IDS} ids at once")
+    return unique_ids
@@ -0,0 +1,150 @@
+import math
+import time
+from bisect import bisect_right
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from functools import wraps
+from threading import Lock
+from typing import Any, cast
+
+from attrs import define
+
+from building_blocks.application.tracing import tracer
+
+
+@define
+class TimingMetric:
+    count: int = 0
+    seconds: float = 0.0
+
+
+class RequestTimings:
+    def __init__(self) -> None:
+        self._metrics: dict[str, TimingMetric] = {}
+        self._lock = Lock()
+
+    def record(self, name: str, seconds: float) -> None:
+        with self._lock:
+            metric = self._metrics.setdefault(name, TimingMetric())
+            metric.count += 1
+            metric.seconds += seconds
+
+    def get(self, name: str) -> TimingMetric:
+        with self._lock:
+            metric = self._metrics.get(name, TimingMetric())
+            return TimingMetric(count=metric.count, seconds=metric.seconds)
+
+    def items(self) -> list[tuple[str, TimingMetric]]:
+        with self._lock:
+            return [(name, TimingMetric(count=m.count, seconds=m.seconds)) for name, m in self._metrics.items()]
+
+
+_request_timings: ContextVar[RequestTimings | None] = ContextVar("request_timings", default=None)
+
+
+def start_request_timings() -> tuple[RequestTimings, Token]:
+    timings = RequestTimings()
+    return timings, _request_timings.set(timings)
+
+
+def end_request_timings(token: Token) -> None:
+    _request_timings.reset(token)
+
+
+def record_timing(name: str, seconds: float) -> None:
+    timings = _request_timings.get()
+    if timings is not None:
+        timings.record(name, seconds)
+
+
+@contextmanager
+def timed(name: str) -> Iterator[None]:
+    started_at = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_timing(name, time.perf_counter() - started_at)
+
+
+class _TimedUseCase:
+    def __init__(self, use_case: object) -> None:
+        self._use_case = use_case
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._use_case, name)
+        if name.startswith("_") or not callable(attribute):
+            return attribute
+        metric_name = f"{type(self._use_case).__name__}.{name}"
+
+        @wraps(attribute)
+        def timed_method(*args: Any, **kwargs: Any) -> Any:
+            with timed(metric_name), tracer.span(metric_name):
+                return attribute(*args, **kwargs)
+
+        return timed_method
+
+
+def timed_use_case[UseCaseT](use_case: UseCaseT) -> UseCaseT:
+    """Records the time and a span for each public method call of the use case as `<class name>.<method name>`."""
+    return cast(UseCaseT, _TimedUseCase(use_case))
+
+
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+@define(frozen=True, kw_only=True)
+class HistogramSnapshot:
+    count: int
+    total: float
+    buckets: tuple[tuple[float, int], ...]
+    p50: float
+    p95: float
+    p99: float
+    max: float
+
+
+def _percentile(ordered: list[float], percent: float) -> float:
+    rank = max(math.ceil(percent / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+class RollingHistogram:
+    """Keeps the most recent `window` observations per key, so the summary follows the current load."""
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS, window: int = 1000) -> None:
+        self.buckets = buckets
+        self.window = window
+        self._samples: dict[str, deque[float]] = {}
+        self._lock = Lock()
+
+    def observe(self, key: str, value: float) -> None:
+        with self._lock:
+            samples = self._samples.get(key)
+            if samples is None:
+                samples = self._samples[key] = deque(maxlen=self.window)
+            samples.append(value)
+
+    def snapshot(self) -> dict[str, HistogramSnapshot]:
+        with self._lock:
+            samples = {key: sorted(values) for key, values in self._samples.items()}
+        return {key: self._summarize(ordered) for key, ordered in samples.items()}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._samples.clear()
+
+    def _summarize(self, ordered: list[float]) -> HistogramSnapshot:
+        return HistogramSnapshot(
+            count=len(ordered),
+            total=sum(ordered),
+            buckets=tuple((bound, bisect_right(ordered, bound)) for bound in self.buckets),
+            p50=_percentile(ordered, 50),
+            p95=_percentile(ordered, 95),
+            p99=_percentile(ordered, 99),
+            max=ordered[-1],
+        )
+
+
+request_histogram = RollingHistogram()
@@ -0,0 +1,126 @@
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Mapping
+from itertools import accumulate
+from threading import Lock
+from typing import Protocol
+
+from building_blocks.application.instrumentation import DEFAULT_LATENCY_BUCKETS
+
+Labels = tuple[tuple[str, str], ...]
+Sample = tuple[str, Labels, float]
+
+
+def _to_labels(labels: Mapping[str, str]) -> Labels:
+    return tuple(sorted(labels.items()))
+
+
+class Metric(Protocol):
+    name: str
+    documentation: str
+    type: str
+
+    def samples(self) -> list[Sample]: ...
+
+
+class Counter:
+    type = "counter"
+
+    def __init__(self, name: str, documentation: str) -> None:
+        self.name = name
+        self.documentation = documentation
+        self._values: dict[Labels, float] = {}
+        self._lock = Lock()
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = _to_labels(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def samples(self) -> list[Sample]:
+        with self._lock:
+            return [(self.name, labels, value) for labels, value in self._values.items()]
+
+
+class Histogram:
+    type = "histogram"
+
+    def __init__(self, name: str, documentation: str, buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.buckets = buckets
+        self._counts: dict[Labels, list[int]] = {}
+        self._sums: dict[Labels, float] = {}
+        self._lock = Lock()
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = _to_labels(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._counts.get(key)
+            if counts is None:
+                counts = self._counts[key] = [0] * (len(self.buckets) + 1)
+            counts[index] += 1
+            self._sums[key] = self._sums.get(key, 0.0) + value
+
+    def samples(self) -> list[Sample]:
+        with self._lock:
+            snapshot = [(labels, list(counts), self._sums[labels]) for labels, counts in self._counts.items()]
+        samples: list[Sample] = []
+        for labels, counts, total in snapshot:
+            bounds = [*(str(bound) for bound in self.buckets), "+Inf"]
+            for bound, cumulative_count in zip(bounds, accumulate(counts)):
+                samples.append((f"{self.name}_bucket", (*labels, ("le", bound)), cumulative_count))
+            samples.append((f"{self.name}_sum", labels, total))
+            samples.append((f"{self.name}_count", labels, sum(counts)))
+        return samples
+
+
+class CallbackMetric:
+    """Reads its values on collection, for state that is already tracked elsewhere."""
+
+    def __init__(
+        self, name: str, documentation: str, type: str, collect: Callable[[], Iterable[tuple[Mapping[str, str], float]]]
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.type = type
+        self._collect = collect
+
+    def samples(self) -> list[Sample]:
+        return [(self.name, _to_labels(labels), value) for labels, value in self._collect()]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_sample(name: str, labels: Labels, value: float) -> str:
+    if not labels:
+        return f"{name} {value}"
+    formatted_labels = ",".join(f'{key}="{_escape(label)}"' for key, label in labels)
+    return f"{name}{{{formatted_labels}}} {value}"
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+        self._lock = Lock()
+
+    def register[MetricT: Metric](self, metric: MetricT) -> MetricT:
+        with self._lock:
+            self._metrics[metric.name] = metric
+        return metric
+
+    def render(self, *extra_metrics: Metric) -> str:
+        """Renders all metrics in the Prometheus text exposition format."""
+        with self._lock:
+            metrics = [*self._metrics.values(), *extra_metrics]
+        lines: list[str] = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            lines.extend(_format_sample(*sample) for sample in metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+metrics_registry = MetricsRegistry()
@@ -1,10 +1,12 @@
 import random
+from functools import cache
 
 from pydantic import BaseModel
 
 
 class NestedModel(BaseModel):
     @classmethod
+    @cache
     def get_examples(cls) -> dict:
         schema = cls.model_json_schema()
         properties = schema.get("properties", {})
@@ -0,0 +1,126 @@
+import secrets
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, cast
+
+from attrs import define, field
+
+STATUS_UNSET = "UNSET"
+STATUS_ERROR = "ERROR"
+
+
+@define(kw_only=True)
+class Span:
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None
+    start_time_ns: int
+    end_time_ns: int | None = None
+    attributes: dict[str, Any] = field(factory=dict)
+    status: str = STATUS_UNSET
+
+    @property
+    def duration_ms(self) -> float | None:
+        if self.end_time_ns is None:
+            return None
+        return (self.end_time_ns - self.start_time_ns) / 1_000_000
+
+    def to_dict(self) -> dict[str, Any]:
+        """Mirrors the JSON shape produced by the OpenTelemetry SDK console exporter."""
+        return {
+            "name": self.name,
+            "context": {"trace_id": f"0x{self.trace_id}", "span_id": f"0x{self.span_id}"},
+            "parent_id": f"0x{self.parent_id}" if self.parent_id is not None else None,
+            "start_time": self.start_time_ns,
+            "end_time": self.end_time_ns,
+            "duration_ms": self.duration_ms,
+            "attributes": self.attributes,
+            "status": {"status_code": self.status},
+        }
+
+
+class SpanExporter(ABC):
+    @abstractmethod
+    def export(self, span: Span) -> None: ...
+
+
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+
+class Tracer:
+    def __init__(self, exporter: SpanExporter | None = None) -> None:
+        self._exporter = exporter
+
+    @property
+    def enabled(self) -> bool:
+        return self._exporter is not None
+
+    def configure(self, exporter: SpanExporter | None) -> None:
+        self._exporter = exporter
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Span | None]:
+        exporter = self._exporter
+        if exporter is None:
+            yield None
+            return
+        parent = _current_span.get()
+        span = Span(
+            name=name,
+            trace_id=parent.trace_id if parent is not None else secrets.token_hex(16),
+            span_id=secrets.token_hex(8),
+            parent_id=parent.span_id if parent is not None else None,
+            start_time_ns=time.time_ns(),
+            attributes=attributes,
+        )
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.status = STATUS_ERROR
+            span.attributes["exception.type"] = type(e).__name__
+            raise
+        finally:
+            span.end_time_ns = time.time_ns()
+            _current_span.reset(token)
+            exporter.export(span)
+
+
+tracer = Tracer()
+
+
+def traced[**ParamsT, ResultT](name: str) -> Callable[[Callable[ParamsT, ResultT]], Callable[ParamsT, ResultT]]:
+    def decorator(function: Callable[ParamsT, ResultT]) -> Callable[ParamsT, ResultT]:
+        @wraps(function)
+        def wrapper(*args: ParamsT.args, **kwargs: ParamsT.kwargs) -> ResultT:
+            if not tracer.enabled:
+                return function(*args, **kwargs)
+            with tracer.span(name):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class _TracedCalls:
+    def __init__(self, target: object) -> None:
+        self._target = target
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._target, name)
+        if name.startswith("_") or not callable(attribute):
+            return attribute
+        return traced(f"{type(self._target).__name__}.{name}")(attribute)
+
+
+def traced_calls[TargetT](target: TargetT) -> TargetT:
+    """Wraps public method calls of the target in spans, returns the target unchanged if tracing is disabled."""
+    if not tracer.enabled:
+        return target
+    return cast(TargetT, _TracedCalls(target))
@@ -28,4 +28,4 @@ class ReadOnlyEntity(Entity):
 
 @define(eq=False, kw_only=True)
 class AggregateRoot(Entity):
-    pass
+    version: int = 1
@@ -30,3 +30,7 @@ class InvalidFilterField(InfrastructureException):
     def __init__(self, field: str) -> None:
         message = f'Invalid filter chain: "{field}"'
         super().__init__(message)
+
+
+class NPlusOneQueryDetected(InfrastructureException):
+    pass
@@ -3,6 +3,7 @@ from collections.abc import MutableMapping
 from pathlib import Path
 from typing import Generic, Protocol, TypeVar
 
+from building_blocks.application.tracing import traced_calls
 from building_blocks.infrastructure.exceptions import NoActiveTransaction, TransactionAlreadyActive
 from building_blocks.infrastructure.file.io import get_write_db
 
@@ -37,7 +38,7 @@ class BaseFileUnitOfWork(ABC, Generic[RepositoryT]):
             raise TransactionAlreadyActive
         self._db = self._get_db()
         self._snapshot = dict(self._db)
-        self.repository = self.RepositoryType(self._db)
+        self.repository = traced_calls(self.RepositoryType(self._db))
         self._is_active = True
 
     def commit(self) -> None:
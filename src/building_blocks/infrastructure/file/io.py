@@ -3,12 +3,24 @@ from collections.abc import Iterator
 from contextlib import contextmanager
 from pathlib import Path
 
+from building_blocks.application.instrumentation import timed
+from building_blocks.application.metrics import Counter, metrics_registry
+
+SHELF_TIMING_NAME = "shelf"
+
+shelf_opens = metrics_registry.register(Counter("shelf_opens_total", "Shelf files opened by mode."))
+
 
 @contextmanager
 def get_read_db(file_path: Path) -> Iterator[shelve.Shelf]:
-    with shelve.open(file_path, "r") as f:
+    shelf_opens.inc(mode="read")
+    with timed(SHELF_TIMING_NAME):
+        f = shelve.open(file_path, "r")
+    with f:
         yield f
 
 
 def get_write_db(file_path: Path) -> shelve.Shelf:
-    return shelve.open(file_path, "c", writeback=True)
+    shelf_opens.inc(mode="write")
+    with timed(SHELF_TIMING_NAME):
+        return shelve.open(file_path, "c", writeback=True)
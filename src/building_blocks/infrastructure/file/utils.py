@@ -0,0 +1,10 @@
+from building_blocks.application.exceptions import ConcurrentModification
+from building_blocks.domain.entity import AggregateRoot
+from building_blocks.infrastructure.file.command import FileLikeDB
+
+
+def compare_and_swap_version(db: FileLikeDB, aggregate: AggregateRoot) -> None:
+    stored = db.get(aggregate.id)
+    if stored is None or stored.version != aggregate.version:
+        raise ConcurrentModification
+    aggregate.version += 1
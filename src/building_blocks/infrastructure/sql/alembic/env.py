@@ -19,6 +19,8 @@ if not config.get_main_option("sqlalchemy.url"):
 # from sales.infrastructure.sql.sales_representative.models import *
 # from sales.infrastructure.sql.opportunity.models import *
 # from sales.infrastructure.sql.lead.models import *
+# from sales.infrastructure.sql.analytics.models import *
+# from sales.infrastructure.sql.forecast.models import *
 
 target_metadata = Base.metadata
 
@@ -0,0 +1,44 @@
+"""pipeline stats
+
+Revision ID: 156f7a26dfae
+Revises: fac9bf3b26f9
+Create Date: 2026-10-19 10:12:31.418204
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "156f7a26dfae"
+down_revision: Union[str, None] = "fac9bf3b26f9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "pipeline_stats",
+        sa.Column("owner_id", sa.String(), nullable=False),
+        sa.Column("stage_name", sa.String(), nullable=False),
+        sa.Column("currency_iso_code", sa.String(), nullable=False),
+        sa.Column("total_amount", sa.Numeric(), nullable=False),
+        sa.Column("items_count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("owner_id", "stage_name", "currency_iso_code"),
+    )
+    op.execute(
+        """
+        INSERT INTO pipeline_stats (owner_id, stage_name, currency_iso_code, total_amount, items_count)
+        SELECT opportunity.owner_id, opportunity.stage_name, currency.iso_code, SUM(offer_item.amount), COUNT(*)
+        FROM offer_item
+        JOIN opportunity ON opportunity.id = offer_item.opportunity_id
+        JOIN currency ON currency.id = offer_item.currency_id
+        GROUP BY opportunity.owner_id, opportunity.stage_name, currency.iso_code
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("pipeline_stats")
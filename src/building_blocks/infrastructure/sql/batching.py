@@ -0,0 +1,32 @@
+from contextlib import AbstractContextManager
+from typing import Any
+
+from sqlalchemy.orm import Session, SessionTransaction
+
+from building_blocks.application.batching import GroupCommitBatcher
+from building_blocks.application.command import BaseUnitOfWork
+from building_blocks.infrastructure.exceptions import NoActiveTransaction
+from building_blocks.infrastructure.sql.command import BaseSQLUnitOfWork
+from building_blocks.infrastructure.sql.db import SessionFactory
+
+
+class _BatchSQLUnitOfWork(BaseSQLUnitOfWork, BaseUnitOfWork):
+    def savepoint(self) -> SessionTransaction:
+        if self._session is None:
+            raise NoActiveTransaction("No active transaction to create a savepoint in")
+        return self._session.begin_nested()
+
+    def _create_repositories(self, session: Session) -> None:
+        pass
+
+
+class SQLGroupCommitBatcher(GroupCommitBatcher):
+    def __init__(self, session_factory: SessionFactory, window: float = 0.005, max_batch_size: int = 64) -> None:
+        super().__init__(window=window, max_batch_size=max_batch_size)
+        self._session_factory = session_factory
+
+    def _transaction(self) -> _BatchSQLUnitOfWork:
+        return _BatchSQLUnitOfWork(self._session_factory, write_lock=True)
+
+    def _isolated(self, transaction: _BatchSQLUnitOfWork) -> AbstractContextManager[Any]:
+        return transaction.savepoint()
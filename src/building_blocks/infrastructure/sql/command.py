@@ -1,10 +1,16 @@
+import time
 from abc import ABC
-from typing import Generic, Protocol, TypeVar
+from contextvars import ContextVar, Token
+from typing import Any, Generic, Protocol, Self, TypeVar, overload
 
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import Session
 
+from building_blocks.application.tracing import traced_calls
 from building_blocks.infrastructure.exceptions import NoActiveTransaction, TransactionAlreadyActive
 from building_blocks.infrastructure.sql.db import SessionFactory
+from building_blocks.infrastructure.sql.retry import RetryMetrics, RetryPolicy, is_database_locked, uow_retry_metrics
 
 
 class SQLRepositoryProtocol(Protocol):
@@ -13,35 +19,131 @@ class SQLRepositoryProtocol(Protocol):
 
 RepositoryT = TypeVar("RepositoryT", bound=SQLRepositoryProtocol)
 
+_active_transaction: ContextVar[tuple[SessionFactory, Session] | None] = ContextVar("active_transaction", default=None)
+
+
+class ContextLocal[T]:
+    """Instance attribute kept per execution context, so concurrent requests sharing an object see their own value."""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    @overload
+    def __get__(self, instance: None, owner: type) -> Self: ...
+
+    @overload
+    def __get__(self, instance: object, owner: type) -> T | None: ...
+
+    def __get__(self, instance: object | None, owner: type) -> Self | T | None:
+        if instance is None:
+            return self
+        values = self._get_values_var(instance).get()
+        return values.get(self.name) if values is not None else None
+
+    def __set__(self, instance: object, value: T | None) -> None:
+        values_var = self._get_values_var(instance)
+        values_var.set({**(values_var.get() or {}), self.name: value})
+
+    @staticmethod
+    def _get_values_var(instance: object) -> ContextVar[dict[str, Any] | None]:
+        return instance.__dict__.setdefault(
+            "_context_locals", ContextVar(f"{type(instance).__name__}_context_locals", default=None)
+        )
+
 
 class BaseSQLUnitOfWork(ABC, Generic[RepositoryT]):
     RepositoryType: type[RepositoryT]
+    retry_policy: RetryPolicy = RetryPolicy()
+    retry_metrics: RetryMetrics = uow_retry_metrics
 
-    def __init__(self, session_factory: SessionFactory) -> None:
-        self.repository: RepositoryT | None = None
+    # one instance is shared by all requests, so the transaction state must not leak between them
+    repository = ContextLocal[RepositoryT]()
+    _session = ContextLocal[Session]()
+    _transaction_token = ContextLocal[Token]()
+
+    def __init__(self, session_factory: SessionFactory, write_lock: bool = False) -> None:
         self._session_factory = session_factory
-        self._session: Session | None = None
+        self.write_lock = write_lock
+
+    @property
+    def _owns_transaction(self) -> bool:
+        return self._transaction_token is not None
 
     def begin(self) -> None:
         if self._session is not None:
             raise TransactionAlreadyActive
+        active_session = self._get_active_session()
+        if active_session is not None:
+            self._session = active_session
+            self._create_repositories(active_session)
+            return
         with self._session_factory() as session:
             self._session = session
-            self.repository = self.RepositoryType(session)
-        self._session.begin()
+            self._create_repositories(session)
+        session.begin()
+        if self.write_lock:
+            try:
+                self._acquire_write_lock(session)
+            except OperationalError:
+                session.rollback()
+                self._end_session()
+                raise
+        self._transaction_token = _active_transaction.set((self._session_factory, session))
 
     def commit(self) -> None:
-        if self._session is None:
+        session = self._session
+        if session is None:
             raise NoActiveTransaction("No active transaction to commit")
-        self._session.commit()
+        if self._owns_transaction:
+            session.commit()
+        else:
+            session.flush()
         self._end_session()
 
     def rollback(self) -> None:
-        if self._session is None:
+        session = self._session
+        if session is None:
             raise NoActiveTransaction("No active transaction to rollback")
-        self._session.rollback()
+        if self._owns_transaction:
+            session.rollback()
         self._end_session()
 
+    def _acquire_write_lock(self, session: Session) -> None:
+        """Takes the SQLite write lock up front, so a busy database is retried before any command code has run."""
+        if session.get_bind().dialect.name != "sqlite":
+            return
+        started_at = time.perf_counter()
+        for attempt in range(1, self.retry_policy.max_attempts + 1):
+            try:
+                session.execute(text("BEGIN IMMEDIATE"))
+            except OperationalError as e:
+                if not is_database_locked(e) or attempt == self.retry_policy.max_attempts:
+                    self.retry_metrics.record(
+                        attempts=attempt, wait_seconds=time.perf_counter() - started_at, acquired=False
+                    )
+                    raise
+                time.sleep(self.retry_policy.get_delay(attempt))
+            else:
+                self.retry_metrics.record(
+                    attempts=attempt, wait_seconds=time.perf_counter() - started_at, acquired=True
+                )
+                return
+
+    def _get_active_session(self) -> Session | None:
+        active_transaction = _active_transaction.get()
+        if active_transaction is None:
+            return None
+        session_factory, session = active_transaction
+        if session_factory is not self._session_factory or not session.in_transaction():
+            return None
+        return session
+
+    def _create_repositories(self, session: Session) -> None:
+        self.repository = traced_calls(self.RepositoryType(session))
+
     def _end_session(self) -> None:
+        if self._transaction_token is not None:
+            _active_transaction.reset(self._transaction_token)
+            self._transaction_token = None
         self._session = None
         self.repository = None
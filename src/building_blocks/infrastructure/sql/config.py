@@ -1,3 +1,9 @@
 import os
 
 SQLALCHEMY_DB_URL = os.getenv("DB_URL")
+_slow_query_threshold_ms = os.getenv("SLOW_QUERY_THRESHOLD_MS")
+SLOW_QUERY_THRESHOLD = float(_slow_query_threshold_ms) / 1000 if _slow_query_threshold_ms else None
+N_PLUS_ONE_DETECTION = os.getenv("N_PLUS_ONE_DETECTION", "off").lower()
+N_PLUS_ONE_THRESHOLD = int(os.getenv("N_PLUS_ONE_THRESHOLD", "3"))
+GROUP_COMMIT_WINDOW = float(os.getenv("GROUP_COMMIT_WINDOW_MS", "0")) / 1000
+GROUP_COMMIT_MAX_BATCH_SIZE = int(os.getenv("GROUP_COMMIT_MAX_BATCH_SIZE", "64"))
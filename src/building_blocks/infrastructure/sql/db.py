@@ -2,18 +2,38 @@ from collections.abc import Iterator
 from contextlib import contextmanager
 from typing import Any, Callable, ContextManager, Self
 
-from sqlalchemy import Engine, create_engine
+from sqlalchemy import Engine, create_engine, event, make_url
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
 from sqlalchemy.orm.session import Session
+from sqlalchemy.pool import QueuePool
 
-from building_blocks.infrastructure.sql.config import SQLALCHEMY_DB_URL
+from building_blocks.application.metrics import CallbackMetric, metrics_registry
+from building_blocks.application.tracing import traced
+from building_blocks.infrastructure.sql.config import (
+    N_PLUS_ONE_DETECTION,
+    N_PLUS_ONE_THRESHOLD,
+    SLOW_QUERY_THRESHOLD,
+    SQLALCHEMY_DB_URL,
+)
+from building_blocks.infrastructure.sql.instrumentation import TimedQueuePool, instrument_engine
+from building_blocks.infrastructure.sql.n_plus_one import DETECTION_OFF, DETECTION_RAISE, NPlusOneDetector
 
 _InternalSessionFactory = Callable[[], Session]
 
+SQLITE_BUSY_TIMEOUT_MS = 100
+
 
 class Base[EntityT](DeclarativeBase):
     __abstract__ = True
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        if "to_domain" in cls.__dict__:
+            setattr(cls, "to_domain", traced(f"{cls.__name__}.to_domain")(cls.__dict__["to_domain"]))
+        if "from_domain" in cls.__dict__:
+            from_domain = cls.__dict__["from_domain"].__func__
+            setattr(cls, "from_domain", classmethod(traced(f"{cls.__name__}.from_domain")(from_domain)))
+        super().__init_subclass__(**kwargs)
+
     def to_domain(self) -> EntityT:
         raise NotImplementedError
 
@@ -29,13 +49,49 @@ class DbConnectionManager:
     @classmethod
     def get_session_factory(cls, db_url: str, expire_on_commit: bool = True) -> _InternalSessionFactory:
         if not cls._factory:
-            engine = create_engine(db_url, connect_args={"check_same_thread": False})
+            engine = create_engine(db_url, connect_args={"check_same_thread": False}, **_get_pool_options(db_url))
+            if engine.dialect.name == "sqlite":
+                event.listen(engine, "connect", _configure_sqlite_connection)
+            instrument_engine(engine, slow_query_threshold=SLOW_QUERY_THRESHOLD)
             factory = sessionmaker(autocommit=False, autoflush=False, bind=engine, expire_on_commit=expire_on_commit)
+            if N_PLUS_ONE_DETECTION != DETECTION_OFF:
+                detector = NPlusOneDetector(
+                    threshold=N_PLUS_ONE_THRESHOLD, raise_on_detection=N_PLUS_ONE_DETECTION == DETECTION_RAISE
+                )
+                event.listen(factory, "do_orm_execute", detector)
             cls._factory = factory
             cls._engine = engine
         return cls._factory
 
 
+def _get_pool_options(db_url: str) -> dict[str, Any]:
+    url = make_url(db_url)
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        return {}
+    return {"poolclass": TimedQueuePool}
+
+
+def _get_pool_status() -> list[tuple[dict[str, str], float]]:
+    engine = DbConnectionManager._engine
+    if engine is None or not isinstance(engine.pool, QueuePool):
+        return []
+    return [({"state": "checked_out"}, engine.pool.checkedout()), ({"state": "idle"}, engine.pool.checkedin())]
+
+
+metrics_registry.register(
+    CallbackMetric(
+        "sql_pool_connections", "Connections in the SQL connection pool by state.", "gauge", _get_pool_status
+    )
+)
+
+
+def _configure_sqlite_connection(dbapi_connection: Any, connection_record: Any) -> None:
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+    cursor.close()
+
+
 @contextmanager
 def get_db_session(db_url: str = SQLALCHEMY_DB_URL or "") -> Iterator[Session]:
     session_factory = DbConnectionManager.get_session_factory(db_url)
@@ -0,0 +1,110 @@
+import logging
+import sys
+import time
+from types import FrameType
+from typing import Any
+
+from sqlalchemy import Connection, Engine, event
+from sqlalchemy.pool import ConnectionPoolEntry, QueuePool
+
+from building_blocks.application.instrumentation import record_timing
+from building_blocks.application.metrics import Histogram, metrics_registry
+
+SQL_TIMING_NAME = "sql"
+
+_STARTED_AT_KEY = "statement_started_at"
+_EXPLAINABLE_STATEMENTS = ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE")
+_NON_CALLER_MODULES = (
+    "sqlalchemy",
+    "contextlib",
+    __name__,
+    "building_blocks.infrastructure.sql.command",
+    "building_blocks.infrastructure.sql.utils",
+)
+
+logger = logging.getLogger(__name__)
+
+pool_checkout_wait = metrics_registry.register(
+    Histogram("sql_pool_checkout_wait_seconds", "Time spent waiting for a connection from the SQL connection pool.")
+)
+
+
+class TimedQueuePool(QueuePool):
+    def _do_get(self) -> ConnectionPoolEntry:
+        started_at = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            pool_checkout_wait.observe(time.perf_counter() - started_at)
+
+
+def instrument_engine(engine: Engine, slow_query_threshold: float | None = None) -> None:
+    """Counts statements per request and logs the ones slower than `slow_query_threshold` seconds."""
+
+    def after_cursor_execute(
+        conn: Connection, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+    ) -> None:
+        duration = time.perf_counter() - conn.info[_STARTED_AT_KEY].pop()
+        record_timing(SQL_TIMING_NAME, duration)
+        if slow_query_threshold is not None and duration >= slow_query_threshold:
+            _log_slow_query(
+                conn, statement=statement, parameters=parameters, executemany=executemany, duration=duration
+            )
+
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+def _before_cursor_execute(conn: Connection, *args: Any) -> None:
+    conn.info.setdefault(_STARTED_AT_KEY, []).append(time.perf_counter())
+
+
+def _handle_error(context: Any) -> None:
+    started_at = context.connection.info.get(_STARTED_AT_KEY) if context.connection is not None else None
+    if started_at:
+        started_at.pop()
+
+
+def _log_slow_query(conn: Connection, statement: str, parameters: Any, executemany: bool, duration: float) -> None:
+    plan = None if executemany else explain_query_plan(conn, statement=statement, parameters=parameters)
+    logger.warning(
+        "Slow query (%.1f ms) from %s\n%s\nParameters: %r\nQuery plan:\n%s",
+        duration * 1000,
+        _find_caller(),
+        statement,
+        parameters,
+        plan or "unavailable",
+    )
+
+
+def explain_query_plan(conn: Connection, statement: str, parameters: Any) -> str | None:
+    """Runs `EXPLAIN QUERY PLAN` on the connection that executed the statement, formatted as an indented tree."""
+    keyword = statement.lstrip().split(maxsplit=1)[0].upper() if statement.strip() else ""
+    dbapi_connection = conn.connection.dbapi_connection
+    if conn.dialect.name != "sqlite" or keyword not in _EXPLAINABLE_STATEMENTS or dbapi_connection is None:
+        return None
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        rows = cursor.fetchall()
+    except conn.dialect.loaded_dbapi.Error:
+        return None
+    finally:
+        cursor.close()
+    depths: dict[int, int] = {}
+    lines = []
+    for node_id, parent_id, _, detail in rows:
+        depths[node_id] = depths.get(parent_id, -1) + 1
+        lines.append(f"{'  ' * depths[node_id]}{detail}")
+    return "\n".join(lines)
+
+
+def _find_caller() -> str:
+    frame: FrameType | None = sys._getframe(1)
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if not module.startswith(_NON_CALLER_MODULES):
+            return f"{module}.{frame.f_code.co_qualname}"
+        frame = frame.f_back
+    return "unknown"
@@ -0,0 +1,68 @@
+import logging
+import re
+import sys
+from collections import Counter
+from types import FrameType
+
+from attrs import define
+from sqlalchemy.orm import ORMExecuteState
+
+from building_blocks.infrastructure.exceptions import NPlusOneQueryDetected
+
+DETECTION_OFF = "off"
+DETECTION_WARN = "warn"
+DETECTION_RAISE = "raise"
+
+_LAZY_LOADS_KEY = "lazy_loads"
+_POSTCOMPILE_PARAMETER = re.compile(r"__\[POSTCOMPILE_\w+\]")
+_WHITESPACE = re.compile(r"\s+")
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_statement(statement: str) -> str:
+    return _WHITESPACE.sub(" ", _POSTCOMPILE_PARAMETER.sub("?", statement)).strip()
+
+
+def _find_call_site() -> str:
+    """Returns the innermost `to_domain` frame, or the first frame outside SQLAlchemy if there is none."""
+    fallback = None
+    frame: FrameType | None = sys._getframe(1)
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if frame.f_code.co_name == "to_domain":
+            return f"{module}.{frame.f_code.co_qualname}:{frame.f_lineno}"
+        if fallback is None and not module.startswith(("sqlalchemy", __name__)):
+            fallback = f"{module}.{frame.f_code.co_qualname}:{frame.f_lineno}"
+        frame = frame.f_back
+    return fallback or "unknown"
+
+
+@define(frozen=True, kw_only=True)
+class NPlusOneDetector:
+    """
+    Listens to ORM executions and counts relationship loads per session by normalized SQL. A lazy load repeated
+    `threshold` times within one session is reported once, together with the call site that triggered it.
+    """
+
+    threshold: int = 3
+    raise_on_detection: bool = False
+
+    def __call__(self, orm_execute_state: ORMExecuteState) -> None:
+        if not orm_execute_state.is_relationship_load:
+            return
+        statement = normalize_statement(str(orm_execute_state.statement))
+        loads = orm_execute_state.session.info.setdefault(_LAZY_LOADS_KEY, Counter())
+        loads[statement] += 1
+        if loads[statement] != self.threshold:
+            return
+
+        parent = orm_execute_state.lazy_loaded_from
+        parent_name = parent.class_.__name__ if parent is not None else "unknown"
+        message = (
+            f"N+1 query: relationship of {parent_name} loaded {self.threshold} times in one session "
+            f"from {_find_call_site()}: {statement}"
+        )
+        if self.raise_on_detection:
+            raise NPlusOneQueryDetected(message)
+        logger.warning(message)
@@ -0,0 +1,73 @@
+import random
+from collections.abc import Callable
+from functools import partial
+from threading import Lock
+
+from attrs import define
+from sqlalchemy.exc import OperationalError
+
+from building_blocks.application.metrics import CallbackMetric, metrics_registry
+
+DATABASE_LOCKED_MESSAGES = ("database is locked", "database table is locked")
+
+
+def is_database_locked(error: OperationalError) -> bool:
+    message = str(error.orig)
+    return any(locked_message in message for locked_message in DATABASE_LOCKED_MESSAGES)
+
+
+@define(frozen=True, kw_only=True)
+class RetryPolicy:
+    max_attempts: int = 5
+    base_delay: float = 0.02
+    max_delay: float = 1.0
+
+    def get_delay(self, attempt: int, rand: Callable[[], float] = random.random) -> float:
+        """Full jitter: a random delay between zero and the exponentially growing, capped backoff."""
+        return rand() * min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+
+
+NO_RETRY = RetryPolicy(max_attempts=1)
+
+
+class RetryMetrics:
+    def __init__(self) -> None:
+        self.lock_acquisitions = 0
+        self.retries = 0
+        self.exhausted = 0
+        self.lock_wait_seconds = 0.0
+        self._lock = Lock()
+
+    def record(self, attempts: int, wait_seconds: float, acquired: bool) -> None:
+        with self._lock:
+            self.retries += attempts - 1
+            self.lock_wait_seconds += wait_seconds
+            if acquired:
+                self.lock_acquisitions += 1
+            else:
+                self.exhausted += 1
+
+    def snapshot(self) -> dict[str, float]:
+        with self._lock:
+            return {
+                "lock_acquisitions": self.lock_acquisitions,
+                "retries": self.retries,
+                "exhausted": self.exhausted,
+                "lock_wait_seconds": self.lock_wait_seconds,
+            }
+
+
+uow_retry_metrics = RetryMetrics()
+
+
+def _collect_retry_metric(key: str) -> list[tuple[dict[str, str], float]]:
+    return [({}, uow_retry_metrics.snapshot()[key])]
+
+
+for name, key, documentation in (
+    ("sqlite_write_lock_acquisitions_total", "lock_acquisitions", "SQLite write locks acquired by units of work."),
+    ("sqlite_write_lock_retries_total", "retries", "Retried attempts to acquire the SQLite write lock."),
+    ("sqlite_write_lock_exhausted_total", "exhausted", "Units of work that gave up on the SQLite write lock."),
+    ("sqlite_write_lock_wait_seconds_total", "lock_wait_seconds", "Time spent waiting for the SQLite write lock."),
+):
+    metrics_registry.register(CallbackMetric(name, documentation, "counter", partial(_collect_retry_metric, key)))
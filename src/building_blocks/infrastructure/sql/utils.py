@@ -1,5 +1,29 @@
+from typing import Any, cast
 from uuid import uuid4
 
+from sqlalchemy import CursorResult, inspect, update
+from sqlalchemy.orm import Session
+
+from building_blocks.application.exceptions import ConcurrentModification
+from building_blocks.domain.entity import AggregateRoot
+from building_blocks.infrastructure.sql.db import Base
+
 
 def generate_uuid() -> str:
     return str(uuid4())
+
+
+def get_column_values(model: Base) -> dict[str, Any]:
+    return {column.key: getattr(model, column.key) for column in inspect(type(model)).column_attrs}
+
+
+def compare_and_swap_version(db: Session, model: Any, aggregate: AggregateRoot) -> None:
+    query = (
+        update(model)
+        .where(model.id == aggregate.id, model.version == aggregate.version)
+        .values(version=aggregate.version + 1)
+    )
+    result = cast(CursorResult, db.execute(query))
+    if result.rowcount == 0:
+        raise ConcurrentModification
+    aggregate.version += 1
@@ -0,0 +1,59 @@
+import json
+import os
+import sys
+from pathlib import Path
+from threading import Lock
+from typing import TextIO
+
+from building_blocks.application.tracing import Span, SpanExporter, tracer
+
+TRACING_OFF = "off"
+TRACING_CONSOLE = "console"
+TRACING_FILE = "file"
+
+DEFAULT_TRACING_FILE_PATH = "traces.jsonl"
+
+
+class ConsoleSpanExporter(SpanExporter):
+    def __init__(self, stream: TextIO = sys.stderr) -> None:
+        self._stream = stream
+        self._lock = Lock()
+
+    def export(self, span: Span) -> None:
+        line = json.dumps(span.to_dict(), default=str)
+        with self._lock:
+            self._stream.write(line + "\n")
+            self._stream.flush()
+
+
+class FileSpanExporter(SpanExporter):
+    """Appends finished spans to a JSON Lines file."""
+
+    def __init__(self, file_path: Path) -> None:
+        self.file_path = file_path
+        self._lock = Lock()
+
+    def export(self, span: Span) -> None:
+        line = json.dumps(span.to_dict(), default=str)
+        with self._lock, open(self.file_path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+
+def get_span_exporter(exporter: str, file_path: str = DEFAULT_TRACING_FILE_PATH) -> SpanExporter | None:
+    exporter = exporter.lower() or TRACING_OFF
+    if exporter == TRACING_OFF:
+        return None
+    if exporter == TRACING_CONSOLE:
+        return ConsoleSpanExporter()
+    if exporter == TRACING_FILE:
+        return FileSpanExporter(Path(file_path))
+    raise ValueError(
+        f"Invalid tracing exporter. Must be one of these: {TRACING_OFF}, {TRACING_CONSOLE}, {TRACING_FILE}"
+    )
+
+
+def configure_tracing_from_env() -> None:
+    exporter = get_span_exporter(
+        os.getenv("TRACING_EXPORTER", TRACING_OFF), os.getenv("TRACING_FILE_PATH", DEFAULT_TRACING_FILE_PATH)
+    )
+    tracer.configure(exporter)
@@ -0,0 +1,67 @@
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from building_blocks.application.instrumentation import (
+    RequestTimings,
+    RollingHistogram,
+    end_request_timings,
+    request_histogram,
+    start_request_timings,
+)
+from building_blocks.application.metrics import Histogram, metrics_registry
+from building_blocks.application.tracing import tracer
+
+UNMATCHED_ROUTE = "unmatched"
+
+request_duration = metrics_registry.register(
+    Histogram("http_request_duration_seconds", "HTTP request latency by method and route template.")
+)
+
+
+def format_server_timing(timings: RequestTimings, total_seconds: float) -> str:
+    entries = [f"total;dur={total_seconds * 1000:.2f}"]
+    for name, metric in timings.items():
+        entries.append(f'{name};dur={metric.seconds * 1000:.2f};desc="count={metric.count}"')
+    return ", ".join(entries)
+
+
+def get_route_path(scope: Scope) -> str:
+    route = scope.get("route")
+    return getattr(route, "path", UNMATCHED_ROUTE)
+
+
+class InstrumentationMiddleware:
+    """Reports per-request timings in `Server-Timing`, records latency per route and opens the request's root span."""
+
+    def __init__(self, app: ASGIApp, histogram: RollingHistogram = request_histogram) -> None:
+        self.app = app
+        self.histogram = histogram
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started_at = time.perf_counter()
+        timings, token = start_request_timings()
+
+        async def send_with_server_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", format_server_timing(timings, time.perf_counter() - started_at))
+            await send(message)
+
+        with tracer.span(f"{scope['method']} {scope['path']}", **{"http.method": scope["method"]}) as span:
+            try:
+                await self.app(scope, receive, send_with_server_timing)
+            finally:
+                end_request_timings(token)
+                duration = time.perf_counter() - started_at
+                route_path = get_route_path(scope)
+                self.histogram.observe(f"{scope['method']} {route_path}", duration)
+                request_duration.observe(duration, method=scope["method"], route=route_path)
+                if span is not None:
+                    span.name = f"{scope['method']} {route_path}"
+                    span.attributes["http.route"] = route_path
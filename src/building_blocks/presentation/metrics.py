@@ -0,0 +1,41 @@
+from collections.abc import Mapping
+from typing import Protocol
+
+from fastapi import APIRouter, Request
+from fastapi.responses import PlainTextResponse
+
+from building_blocks.application.cache import TTLCache
+from building_blocks.application.metrics import CallbackMetric, metrics_registry
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class MetricsContainer(Protocol):
+    caches: Mapping[str, TTLCache]
+
+
+def get_cache_metrics(caches: Mapping[str, TTLCache]) -> tuple[CallbackMetric, CallbackMetric]:
+    return (
+        CallbackMetric(
+            "cache_hits_total",
+            "Cache lookups that found a fresh entry.",
+            "counter",
+            lambda: [({"cache": name}, cache.hits) for name, cache in caches.items()],
+        ),
+        CallbackMetric(
+            "cache_misses_total",
+            "Cache lookups that found no entry or an expired one.",
+            "counter",
+            lambda: [({"cache": name}, cache.misses) for name, cache in caches.items()],
+        ),
+    )
+
+
+router = APIRouter()
+
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+def get_metrics(request: Request) -> PlainTextResponse:
+    container: MetricsContainer = request.app.state.container
+    content = metrics_registry.render(*get_cache_metrics(container.caches))
+    return PlainTextResponse(content, media_type=PROMETHEUS_CONTENT_TYPE)
@@ -0,0 +1,33 @@
+from typing import Annotated
+
+from fastapi import Header, Query
+
+from building_blocks.application.exceptions import InvalidData
+
+IdsQuery = Annotated[
+    str | None,
+    Query(description="Comma-separated list of ids; when given, other filters are ignored"),
+]
+
+
+def split_ids(ids: str) -> list[str]:
+    return [id_.strip() for id_ in ids.split(",") if id_.strip()]
+
+
+IfMatchHeader = Annotated[
+    str | None,
+    Header(description="ETag of the resource version the change is based on; stale versions are rejected with 409"),
+]
+
+
+def parse_etag(etag: str | None) -> int | None:
+    if etag is None or etag.strip() == "*":
+        return None
+    try:
+        return int(etag.strip().removeprefix("W/").strip('"'))
+    except ValueError as e:
+        raise InvalidData(f'Invalid ETag: "{etag}"') from e
+
+
+def format_etag(version: int) -> str:
+    return f'"{version}"'
@@ -0,0 +1,63 @@
+import csv
+import io
+import json
+from collections.abc import Iterator, Mapping
+from typing import Any
+
+from fastapi import UploadFile
+
+from building_blocks.application.exceptions import InvalidData
+
+JSON_LINES_SUFFIXES = (".jsonl", ".ndjson")
+
+
+def read_records(file: UploadFile) -> Iterator[dict[str, Any]]:
+    """Streams records from an uploaded CSV or JSON Lines file without loading it into memory.
+
+    The file is parsed once before the first record is yielded, so a malformed line rejects the upload
+    before any batch gets imported.
+    """
+    for _ in _parse_records(file):
+        pass
+    file.file.seek(0)
+    yield from _parse_records(file)
+
+
+def _parse_records(file: UploadFile) -> Iterator[dict[str, Any]]:
+    stream = io.TextIOWrapper(file.file, encoding="utf-8-sig")
+    try:
+        if (file.filename or "").lower().endswith(JSON_LINES_SUFFIXES):
+            for line in stream:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            for row in csv.DictReader(stream):
+                yield unflatten(row)
+    except (ValueError, csv.Error) as e:
+        raise InvalidData(f"Malformed file: {e}") from e
+    finally:
+        # the upload stays open, so it can be read again
+        stream.detach()
+
+
+def unflatten(row: Mapping[str | None, str | None]) -> dict[str, Any]:
+    """Nests dotted CSV headers, e.g. `company_info.address.city` or `contact_persons.0.first_name`."""
+    record: dict[str, Any] = {}
+    for key, value in row.items():
+        if key is None or value is None or value == "":
+            continue
+        *path, field = key.split(".")
+        node = record
+        for part in path:
+            node = node.setdefault(part, {})
+        node[field] = value
+    return _convert_indexed_dicts(record)
+
+
+def _convert_indexed_dicts(node: Any) -> Any:
+    if not isinstance(node, dict):
+        return node
+    converted = {key: _convert_indexed_dicts(value) for key, value in node.items()}
+    if converted and all(key.isdigit() for key in converted):
+        return [converted[key] for key in sorted(converted, key=int)]
+    return converted
@@ -1,11 +1,17 @@
 import os
+from collections.abc import Callable
 from enum import Enum
 
 from containers.container import ApplicationContainer
-from containers.file import FileApplicationContainer
-from containers.sql import SQLApplicationContainer
 
-PERSISTENCE_ENGINE = os.getenv("PERSISTENCE_ENGINE")
+
+# both are read when the container gets built, so settings loaded from .env after the imports still apply
+def get_persistence_engine() -> str:
+    return os.getenv("PERSISTENCE_ENGINE", "")
+
+
+def is_prewarm_on_startup_enabled() -> bool:
+    return os.getenv("PREWARM_ON_STARTUP", "false").lower() == "true"
 
 
 class PersistenceEngine(str, Enum):
@@ -13,17 +19,32 @@ class PersistenceEngine(str, Enum):
     SQL = "SQL"
 
 
-_container_factory = {
-    PersistenceEngine.FILE.value: FileApplicationContainer,
-    PersistenceEngine.SQL.value: SQLApplicationContainer,
+def _build_file_container() -> ApplicationContainer:
+    from containers.file import FileApplicationContainer
+
+    return FileApplicationContainer()
+
+
+def _build_sql_container() -> ApplicationContainer:
+    from containers.sql import SQLApplicationContainer
+
+    return SQLApplicationContainer()
+
+
+# containers are imported on build, so only the infrastructure of the selected engine gets loaded
+_container_factory: dict[str, Callable[[], ApplicationContainer]] = {
+    PersistenceEngine.FILE.value: _build_file_container,
+    PersistenceEngine.SQL.value: _build_sql_container,
 }
 
 
 class ContainerManager:
-    _factory: dict[str, ApplicationContainer] = _container_factory
+    _factory: dict[str, Callable[[], ApplicationContainer]] = _container_factory
 
     @classmethod
-    def build(cls, persistence_engine: str = PERSISTENCE_ENGINE or "") -> ApplicationContainer:
+    def build(cls, persistence_engine: str | None = None) -> ApplicationContainer:
+        if persistence_engine is None:
+            persistence_engine = get_persistence_engine()
         if persistence_engine not in cls._factory:
             raise ValueError(f"Invalid persistence engine. Must be one of these: {cls._factory.keys()}")
         return cls._factory[persistence_engine]()
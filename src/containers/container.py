@@ -1,12 +1,28 @@
+import logging
+import time
 from abc import ABC
+from collections.abc import Mapping
+from decimal import Decimal
 
+from authentication.infrastructure import config as auth_config
 from authentication.infrastructure.service.base import AuthenticationService
-from building_blocks.infrastructure.sql.vo_service import SQLValueObjectService
+from building_blocks.application.batching import CommandBatcher
+from building_blocks.application.cache import TTLCache
+from building_blocks.application.instrumentation import timed_use_case
+from building_blocks.infrastructure.vo_service import ValueObjectService
 from customer_management.application.acl import OpportunityService, SalesRepresentativeService
-from customer_management.application.command import CustomerCommandUseCase, CustomerUnitOfWork
+from customer_management.application.command import CustomerCommandUseCase, CustomerImportUseCase, CustomerUnitOfWork
 from customer_management.application.query import CustomerQueryUseCase
 from customer_management.application.query_service import CustomerQueryService
+from customer_overview.application.query import CustomerOverviewQueryUseCase
+from customer_overview.application.query_service import CustomerOverviewQueryService
 from sales.application.acl import CustomerService
+from sales.application.analytics.command import PipelineStatsCommandUseCase
+from sales.application.analytics.query import PipelineAnalyticsQueryUseCase
+from sales.application.analytics.query_service import PipelineAnalyticsQueryService
+from sales.application.forecast.command import ExchangeRateCommandUseCase, ExchangeRateUnitOfWork
+from sales.application.forecast.query import DEFAULT_STAGE_WEIGHTS, ForecastQueryUseCase
+from sales.application.forecast.query_service import ForecastQueryService
 from sales.application.lead.command import LeadCommandUseCase, LeadUnitOfWork
 from sales.application.lead.query import LeadQueryUseCase
 from sales.application.lead.query_service import LeadQueryService
@@ -20,6 +36,10 @@ from sales.application.sales_representative.command import (
 from sales.application.sales_representative.query import SalesRepresentativeQueryUseCase
 from sales.application.sales_representative.query_service import SalesRepresentativeQueryService
 
+CUSTOMER_STATUS_CACHE_TTL = 5.0
+
+logger = logging.getLogger(__name__)
+
 
 class ApplicationContainer(ABC):
     _auth_service: AuthenticationService
@@ -28,65 +48,141 @@ class ApplicationContainer(ABC):
     _sr_uow: SalesRepresentativeUnitOfWork
     _lead_uow: LeadUnitOfWork
     _opportunity_uow: OpportunityUnitOfWork
+    _exchange_rate_uow: ExchangeRateUnitOfWork
 
     _customer_service: CustomerService
     _sr_service: SalesRepresentativeService
     _opportunity_service: OpportunityService
 
+    _customer_status_cache: TTLCache[str, str]
+    _command_batcher: CommandBatcher
+
     _customer_qs: CustomerQueryService
     _sr_qs: SalesRepresentativeQueryService
     _lead_qs: LeadQueryService
     _opportunity_qs: OpportunityQueryService
+    _analytics_qs: PipelineAnalyticsQueryService
+    _forecast_qs: ForecastQueryService
+    _customer_overview_qs: CustomerOverviewQueryService
 
-    language_vo_service: SQLValueObjectService
-    country_vo_service: SQLValueObjectService
-    currency_vo_service: SQLValueObjectService
-    product_vo_service: SQLValueObjectService
+    _forecast_stage_weights: Mapping[str, Decimal] = DEFAULT_STAGE_WEIGHTS
+
+    language_vo_service: ValueObjectService
+    country_vo_service: ValueObjectService
+    currency_vo_service: ValueObjectService
+    product_vo_service: ValueObjectService
 
     @property
     def customer_command_use_case(self) -> CustomerCommandUseCase:
-        return CustomerCommandUseCase(
-            customer_uow=self._customer_uow,
-            sales_rep_service=self._sr_service,
-            opportunity_service=self._opportunity_service,
+        return timed_use_case(
+            CustomerCommandUseCase(
+                customer_uow=self._customer_uow,
+                sales_rep_service=self._sr_service,
+                opportunity_service=self._opportunity_service,
+                customer_status_cache=self._customer_status_cache,
+            )
+        )
+
+    @property
+    def customer_import_use_case(self) -> CustomerImportUseCase:
+        return timed_use_case(
+            CustomerImportUseCase(
+                customer_uow=self._customer_uow,
+                sales_rep_service=self._sr_service,
+                country_vo_service=self.country_vo_service,
+                language_vo_service=self.language_vo_service,
+            )
         )
 
     @property
     def customer_query_use_case(self) -> CustomerQueryUseCase:
-        return CustomerQueryUseCase(customer_query_service=self._customer_qs)
+        return timed_use_case(CustomerQueryUseCase(customer_query_service=self._customer_qs))
 
     @property
     def lead_command_use_case(self) -> LeadCommandUseCase:
-        return LeadCommandUseCase(
-            lead_uow=self._lead_uow,
-            salesman_uow=self._sr_uow,
-            customer_service=self._customer_service,
+        return timed_use_case(
+            LeadCommandUseCase(
+                lead_uow=self._lead_uow,
+                salesman_uow=self._sr_uow,
+                customer_service=self._customer_service,
+                command_batcher=self._command_batcher,
+            )
         )
 
     @property
     def lead_query_use_case(self) -> LeadQueryUseCase:
-        return LeadQueryUseCase(lead_query_service=self._lead_qs)
+        return timed_use_case(LeadQueryUseCase(lead_query_service=self._lead_qs))
 
     @property
     def opportunity_command_use_case(self) -> OpportunityCommandUseCase:
-        return OpportunityCommandUseCase(
-            opportunity_uow=self._opportunity_uow,
-            salesman_uow=self._sr_uow,
-            customer_service=self._customer_service,
+        return timed_use_case(
+            OpportunityCommandUseCase(
+                opportunity_uow=self._opportunity_uow,
+                salesman_uow=self._sr_uow,
+                customer_service=self._customer_service,
+                command_batcher=self._command_batcher,
+            )
         )
 
     @property
     def opportunity_query_use_case(self) -> OpportunityQueryUseCase:
-        return OpportunityQueryUseCase(opportunity_query_service=self._opportunity_qs)
+        return timed_use_case(OpportunityQueryUseCase(opportunity_query_service=self._opportunity_qs))
+
+    @property
+    def pipeline_analytics_query_use_case(self) -> PipelineAnalyticsQueryUseCase:
+        return timed_use_case(PipelineAnalyticsQueryUseCase(analytics_query_service=self._analytics_qs))
+
+    @property
+    def pipeline_stats_command_use_case(self) -> PipelineStatsCommandUseCase:
+        return timed_use_case(PipelineStatsCommandUseCase(opportunity_uow=self._opportunity_uow))
+
+    @property
+    def forecast_query_use_case(self) -> ForecastQueryUseCase:
+        return timed_use_case(
+            ForecastQueryUseCase(forecast_query_service=self._forecast_qs, stage_weights=self._forecast_stage_weights)
+        )
+
+    @property
+    def exchange_rate_command_use_case(self) -> ExchangeRateCommandUseCase:
+        return timed_use_case(ExchangeRateCommandUseCase(exchange_rate_uow=self._exchange_rate_uow))
+
+    @property
+    def customer_overview_query_use_case(self) -> CustomerOverviewQueryUseCase:
+        return timed_use_case(CustomerOverviewQueryUseCase(customer_overview_query_service=self._customer_overview_qs))
 
     @property
     def sr_command_use_case(self) -> SalesRepresentativeCommandUseCase:
-        return SalesRepresentativeCommandUseCase(sr_uow=self._sr_uow)
+        return timed_use_case(SalesRepresentativeCommandUseCase(sr_uow=self._sr_uow))
 
     @property
     def sr_query_use_case(self) -> SalesRepresentativeQueryUseCase:
-        return SalesRepresentativeQueryUseCase(sr_query_service=self._sr_qs)
+        return timed_use_case(SalesRepresentativeQueryUseCase(sr_query_service=self._sr_qs))
 
     @property
     def auth_service(self) -> AuthenticationService:
         return self._auth_service
+
+    @property
+    def caches(self) -> dict[str, TTLCache]:
+        return {"customer_status": self._customer_status_cache}
+
+    def warm_up(self) -> None:
+        """Loads the reference data once, so the first requests do not pay for opening connections or files."""
+        started_at = time.perf_counter()
+        for vo_service in (
+            self.language_vo_service,
+            self.country_vo_service,
+            self.currency_vo_service,
+            self.product_vo_service,
+        ):
+            vo_service.get_all()
+        logger.info("Container warmed up in %.1fms", (time.perf_counter() - started_at) * 1000)
+
+    def _create_auth_service(self) -> AuthenticationService:
+        # firebase_admin is only needed (and imported) when Firebase actually verifies the tokens
+        from firebase_admin import credentials
+
+        from authentication.infrastructure.service.firebase import FirebaseAuthenticationService
+
+        firebase_credentials = credentials.Certificate(auth_config.FIREBASE_SERVICE_KEY_PATH)
+        return FirebaseAuthenticationService(firebase_credentials)
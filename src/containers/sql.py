@@ -1,17 +1,22 @@
-from firebase_admin import credentials
-
-from authentication.infrastructure import config as auth_config
-from authentication.infrastructure.service.firebase import FirebaseAuthenticationService
+from building_blocks.application.batching import ImmediateCommandBatcher
+from building_blocks.application.cache import TTLCache
+from building_blocks.infrastructure.sql import config as sql_config
+from building_blocks.infrastructure.sql.batching import SQLGroupCommitBatcher
 from building_blocks.infrastructure.sql.db import get_db_session
 from building_blocks.infrastructure.sql.vo_service import SQLValueObjectService
-from containers.container import ApplicationContainer
+from containers.container import CUSTOMER_STATUS_CACHE_TTL, ApplicationContainer
 from customer_management.application.acl import OpportunityService, SalesRepresentativeService
 from customer_management.application.query_model import CountryReadModel, LanguageReadModel
 from customer_management.infrastructure.sql.customer.command import CustomerSQLUnitOfWork
 from customer_management.infrastructure.sql.customer.models import CountryModel, LanguageModel
 from customer_management.infrastructure.sql.customer.query_service import CustomerSQLQueryService
+from customer_overview.infrastructure.sql.query_service import CustomerOverviewSQLQueryService
 from sales.application.acl import CustomerService
 from sales.application.opportunity.query_model import CurrencyReadModel, ProductReadModel
+from sales.infrastructure.config import get_forecast_stage_weights
+from sales.infrastructure.sql.analytics.query_service import PipelineAnalyticsSQLQueryService
+from sales.infrastructure.sql.forecast.command import ExchangeRateSQLUnitOfWork
+from sales.infrastructure.sql.forecast.query_service import ForecastSQLQueryService
 from sales.infrastructure.sql.lead.command import LeadSQLUnitOfWork
 from sales.infrastructure.sql.lead.query_service import LeadSQLQueryService
 from sales.infrastructure.sql.opportunity.command import OpportunitySQLUnitOfWork
@@ -23,22 +28,38 @@ from sales.infrastructure.sql.sales_representative.query_service import SalesRep
 
 class SQLApplicationContainer(ApplicationContainer):
     def __init__(self) -> None:
-        firebase_credentials = credentials.Certificate(auth_config.FIREBASE_SERVICE_KEY_PATH)
-        self._auth_service = FirebaseAuthenticationService(firebase_credentials)
+        self._auth_service = self._create_auth_service()
+        self._forecast_stage_weights = get_forecast_stage_weights()
 
-        self._customer_uow = CustomerSQLUnitOfWork(get_db_session)
-        self._lead_uow = LeadSQLUnitOfWork(get_db_session)
-        self._opportunity_uow = OpportunitySQLUnitOfWork(get_db_session)
-        self._sr_uow = SalesRepresentativeSQLUnitOfWork(get_db_session)
+        self._customer_uow = CustomerSQLUnitOfWork(get_db_session, write_lock=True)
+        self._lead_uow = LeadSQLUnitOfWork(get_db_session, write_lock=True)
+        self._opportunity_uow = OpportunitySQLUnitOfWork(get_db_session, write_lock=True)
+        self._sr_uow = SalesRepresentativeSQLUnitOfWork(get_db_session, write_lock=True)
+        self._exchange_rate_uow = ExchangeRateSQLUnitOfWork(get_db_session, write_lock=True)
 
-        self._customer_service = CustomerService(customer_uow=self._customer_uow)
-        self._sr_service = SalesRepresentativeService(salesman_uow=self._sr_uow)
-        self._opportunity_service = OpportunityService(opportunity_uow=self._opportunity_uow)
+        # the ACL services only read, so their units of work do not take the SQLite write lock
+        self._customer_status_cache = TTLCache(ttl=CUSTOMER_STATUS_CACHE_TTL)
+        self._customer_service = CustomerService(
+            customer_uow=CustomerSQLUnitOfWork(get_db_session), status_cache=self._customer_status_cache
+        )
+        self._sr_service = SalesRepresentativeService(salesman_uow=SalesRepresentativeSQLUnitOfWork(get_db_session))
+        self._opportunity_service = OpportunityService(opportunity_uow=OpportunitySQLUnitOfWork(get_db_session))
+        if sql_config.GROUP_COMMIT_WINDOW > 0:
+            self._command_batcher = SQLGroupCommitBatcher(
+                get_db_session,
+                window=sql_config.GROUP_COMMIT_WINDOW,
+                max_batch_size=sql_config.GROUP_COMMIT_MAX_BATCH_SIZE,
+            )
+        else:
+            self._command_batcher = ImmediateCommandBatcher()
 
         self._customer_qs = CustomerSQLQueryService(get_db_session)
         self._lead_qs = LeadSQLQueryService(get_db_session)
         self._opportunity_qs = OpportunitySQLQueryService(get_db_session)
         self._sr_qs = SalesRepresentativeSQLQueryService(get_db_session)
+        self._analytics_qs = PipelineAnalyticsSQLQueryService(get_db_session)
+        self._forecast_qs = ForecastSQLQueryService(get_db_session)
+        self._customer_overview_qs = CustomerOverviewSQLQueryService(get_db_session)
 
         self.language_vo_service = SQLValueObjectService(
             session_factory=get_db_session, model=LanguageModel, read_model=LanguageReadModel
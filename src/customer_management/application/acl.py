@@ -1,13 +1,10 @@
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
 from types import TracebackType
-from typing import Protocol, Self, TypeVar
-
-SalesRepT = TypeVar("SalesRepT")
+from typing import Protocol, Self
 
 
 class SalesRepresentativeRepository(Protocol):
-    def get(self, representative_id: str) -> SalesRepT | None: ...
+    def exists(self, representative_id: str) -> bool: ...
 
 
 class SalesRepresentativeUnitOfWork(Protocol):
@@ -34,15 +31,11 @@ class ISalesRepresentativeService(ABC):
 class SalesRepresentativeService(ISalesRepresentativeService):
     def salesman_exists(self, salesman_id: str) -> bool:
         with self.salesman_uow as uow:
-            return bool(uow.repository.get(salesman_id))
-
-
-class Opportunity(Protocol):
-    stage_name: str
+            return uow.repository.exists(salesman_id)
 
 
 class OpportunityRepository(Protocol):
-    def get_all_by_customer(self, customer_id: str) -> Sequence[Opportunity]: ...
+    def has_open_opportunities(self, customer_id: str) -> bool: ...
 
 
 class OpportunityUnitOfWork(Protocol):
@@ -63,10 +56,10 @@ class IOpportunityService(ABC):
         self.opportunity_uow = opportunity_uow
 
     @abstractmethod
-    def get_opportunities_by_customer(self, customer_id: str) -> Sequence[Opportunity]: ...
+    def customer_has_open_opportunities(self, customer_id: str) -> bool: ...
 
 
 class OpportunityService(IOpportunityService):
-    def get_opportunities_by_customer(self, customer_id: str) -> Sequence[Opportunity]:
+    def customer_has_open_opportunities(self, customer_id: str) -> bool:
         with self.opportunity_uow as uow:
-            return uow.repository.get_all_by_customer(customer_id=customer_id)
+            return uow.repository.has_open_opportunities(customer_id=customer_id)
@@ -1,9 +1,24 @@
-from collections.abc import Iterable
+import time
+from collections.abc import Iterable, Mapping
+from itertools import batched
+from typing import Any
 from uuid import uuid4
 
-from building_blocks.application.command import BaseUnitOfWork
-from building_blocks.application.exceptions import ConflictingAction, ForbiddenAction, InvalidData, ObjectDoesNotExist
+from attrs import define, field
+
+from building_blocks.application.cache import TTLCache
+from building_blocks.application.command import BaseUnitOfWork, Versioned, ensure_version_matches
+from building_blocks.application.command_model import parse_command_model
+from building_blocks.application.exceptions import (
+    ConflictingAction,
+    ForbiddenAction,
+    InvalidData,
+    ObjectDoesNotExist,
+    get_error_detail,
+)
 from building_blocks.domain.exceptions import DuplicateEntry, InvalidEmailAddress, InvalidPhoneNumber, ValueNotAllowed
+from building_blocks.infrastructure.exceptions import ObjectAlreadyExists
+from building_blocks.infrastructure.vo_service import ValueObjectService
 from customer_management.application.acl import IOpportunityService, ISalesRepresentativeService
 from customer_management.application.command_model import (
     AddressDataCreateUpdateModel,
@@ -12,10 +27,18 @@ from customer_management.application.command_model import (
     ContactPersonCreateModel,
     ContactPersonUpdateModel,
     CustomerCreateModel,
+    CustomerImportModel,
     CustomerUpdateModel,
     LanguageCreateUpdateModel,
+    RelationManagerReassignmentModel,
+)
+from customer_management.application.query_model import (
+    ContactPersonReadModel,
+    CustomerImportErrorReadModel,
+    CustomerImportResultReadModel,
+    CustomerReadModel,
+    RelationManagerReassignmentReadModel,
 )
-from customer_management.application.query_model import ContactPersonReadModel, CustomerReadModel
 from customer_management.domain.entities.customer import Customer
 from customer_management.domain.exceptions import (
     CannotConvertArchivedCustomer,
@@ -38,21 +61,72 @@ from customer_management.domain.value_objects.country import Country
 from customer_management.domain.value_objects.industry import Industry
 from customer_management.domain.value_objects.language import Language
 
+IMPORT_BATCH_SIZE = 500
+
 
 class CustomerUnitOfWork(BaseUnitOfWork):
     repository: CustomerRepository
 
 
-class CustomerCommandUseCase:
+class CustomerFactoryMixin:
+    def _create_preferred_language(self, data: LanguageCreateUpdateModel) -> Language:
+        language = Language(code=data.code, name=data.name)
+        return language
+
+    def _create_single_contact_method(self, data: ContactMethodCreateUpdateModel) -> ContactMethod:
+        try:
+            contact_method = ContactMethod(
+                type=data.type,
+                value=data.value,
+                is_preferred=data.is_preferred,
+            )
+        except (InvalidPhoneNumber, InvalidEmailAddress) as e:
+            raise InvalidData(e.message) from e
+        return contact_method
+
+    def _create_contact_methods(self, data: Iterable[ContactMethodCreateUpdateModel]) -> Iterable[ContactMethod]:
+        contact_methods = tuple(self._create_single_contact_method(method) for method in data)
+        return contact_methods
+
+    def _create_company_info(self, company_data: CompanyInfoCreateUpdateModel) -> CompanyInfo:
+        address = self._create_address(company_data.address)
+        try:
+            industry = Industry(name=company_data.industry)
+            segment = CompanySegment(size=company_data.size, legal_form=company_data.legal_form)
+            company_info = CompanyInfo(
+                name=company_data.name,
+                industry=industry,
+                segment=segment,
+                address=address,
+            )
+        except ValueNotAllowed as e:
+            raise InvalidData(e.message) from e
+        return company_info
+
+    def _create_address(self, address_data: AddressDataCreateUpdateModel) -> Address:
+        country = Country(code=address_data.country.code, name=address_data.country.name)
+        address = Address(
+            country=country,
+            street=address_data.street,
+            street_no=address_data.street_no,
+            postal_code=address_data.postal_code,
+            city=address_data.city,
+        )
+        return address
+
+
+class CustomerCommandUseCase(CustomerFactoryMixin):
     def __init__(
         self,
         customer_uow: CustomerUnitOfWork,
         sales_rep_service: ISalesRepresentativeService,
         opportunity_service: IOpportunityService,
+        customer_status_cache: TTLCache[str, str],
     ) -> None:
         self.customer_uow = customer_uow
         self.sales_rep_service = sales_rep_service
         self.opportunity_service = opportunity_service
+        self.customer_status_cache = customer_status_cache
 
     def create(self, customer_data: CustomerCreateModel) -> CustomerReadModel:
         self._verify_that_salesman_exists(customer_data.relation_manager_id)
@@ -68,12 +142,19 @@ class CustomerCommandUseCase:
             uow.repository.create(customer)
         return CustomerReadModel.from_domain(customer)
 
-    def update(self, customer_id: str, editor_id: str, customer_data: CustomerUpdateModel) -> CustomerReadModel:
+    def update(
+        self,
+        customer_id: str,
+        editor_id: str,
+        customer_data: CustomerUpdateModel,
+        expected_version: int | None = None,
+    ) -> CustomerReadModel:
         if customer_data.relation_manager_id is not None:
             self._verify_that_salesman_exists(customer_data.relation_manager_id)
 
         with self.customer_uow as uow:
             customer = self._get_customer(uow=uow, customer_id=customer_id)
+            ensure_version_matches(aggregate=customer, expected_version=expected_version)
             try:
                 customer.update(
                     editor_id=editor_id,
@@ -100,6 +181,7 @@ class CustomerCommandUseCase:
             except NotEnoughContactPersons as e:
                 raise InvalidData(e.message) from e
             uow.repository.update(customer)
+        self.customer_status_cache.invalidate(customer_id)
 
     def archive(self, customer_id: str, requestor_id: str) -> None:
         self._enforce_archive_business_rules(customer_id=customer_id)
@@ -113,6 +195,19 @@ class CustomerCommandUseCase:
             except (OnlyRelationManagerCanChangeStatus,) as e:
                 raise ForbiddenAction(e.message) from e
             uow.repository.update(customer)
+        self.customer_status_cache.invalidate(customer_id)
+
+    def reassign_relation_manager(self, data: RelationManagerReassignmentModel) -> RelationManagerReassignmentReadModel:
+        if data.current_relation_manager_id == data.new_relation_manager_id:
+            raise InvalidData("New relation manager must be different from the current one")
+        self._verify_that_salesman_exists(data.new_relation_manager_id)
+
+        with self.customer_uow as uow:
+            reassigned_count = uow.repository.reassign_relation_manager(
+                current_relation_manager_id=data.current_relation_manager_id,
+                new_relation_manager_id=data.new_relation_manager_id,
+            )
+        return RelationManagerReassignmentReadModel(reassigned_count=reassigned_count)
 
     def create_contact_person(
         self, customer_id: str, editor_id: str, data: ContactPersonCreateModel
@@ -146,9 +241,11 @@ class CustomerCommandUseCase:
         contact_person_id: str,
         editor_id: str,
         data: ContactPersonUpdateModel,
-    ) -> ContactPersonReadModel:
+        expected_version: int | None = None,
+    ) -> Versioned[ContactPersonReadModel]:
         with self.customer_uow as uow:
             customer = self._get_customer(uow=uow, customer_id=customer_id)
+            ensure_version_matches(aggregate=customer, expected_version=expected_version)
             try:
                 language = self._create_preferred_language(data.preferred_language) if data.preferred_language else None
                 contact_methods = self._create_contact_methods(data.contact_methods) if data.contact_methods else None
@@ -169,7 +266,7 @@ class CustomerCommandUseCase:
                 raise ForbiddenAction(e.message) from e
             uow.repository.update(customer)
         contact_person = customer.get_contact_person(contact_person_id)
-        return ContactPersonReadModel.from_domain(contact_person)
+        return Versioned(result=ContactPersonReadModel.from_domain(contact_person), version=customer.version)
 
     def remove_contact_person(self, customer_id: str, editor_id: str, contact_person_id: str) -> None:
         with self.customer_uow as uow:
@@ -189,9 +286,9 @@ class CustomerCommandUseCase:
         return customer
 
     def _enforce_archive_business_rules(self, customer_id: str) -> None:
-        opportunities = self.opportunity_service.get_opportunities_by_customer(customer_id=customer_id)
+        has_open_opportunities = self.opportunity_service.customer_has_open_opportunities(customer_id=customer_id)
         try:
-            ensure_all_opportunities_are_closed(opportunities)
+            ensure_all_opportunities_are_closed(has_open_opportunities)
         except CustomerStillHasNotClosedOpportunities as e:
             raise InvalidData(e.message) from e
 
@@ -202,47 +299,148 @@ class CustomerCommandUseCase:
     def _create_company_info_if_provided(self, company_info: CompanyInfoCreateUpdateModel) -> CompanyInfo | None:
         return self._create_company_info(company_info) if company_info else None
 
-    def _create_preferred_language(self, data: LanguageCreateUpdateModel) -> Language:
-        language = Language(code=data.code, name=data.name)
-        return language
 
-    def _create_single_contact_method(self, data: ContactMethodCreateUpdateModel) -> ContactMethod:
+def get_codes_and_names(vo_service: ValueObjectService) -> set[tuple[str, str]]:
+    value_objects: Iterable[Any] = vo_service.get_all()
+    return {(value_object.code, value_object.name) for value_object in value_objects}
+
+
+@define
+class CustomerImportState:
+    countries: set[tuple[str, str]]
+    languages: set[tuple[str, str]]
+    salesmen: dict[str, bool] = field(factory=dict)
+
+
+class CustomerImportUseCase(CustomerFactoryMixin):
+    def __init__(
+        self,
+        customer_uow: CustomerUnitOfWork,
+        sales_rep_service: ISalesRepresentativeService,
+        country_vo_service: ValueObjectService,
+        language_vo_service: ValueObjectService,
+    ) -> None:
+        self.customer_uow = customer_uow
+        self.sales_rep_service = sales_rep_service
+        self.country_vo_service = country_vo_service
+        self.language_vo_service = language_vo_service
+
+    def import_customers(
+        self, records: Iterable[Mapping[str, Any]], batch_size: int = IMPORT_BATCH_SIZE
+    ) -> CustomerImportResultReadModel:
+        started_at = time.perf_counter()
+        state = CustomerImportState(
+            countries=get_codes_and_names(self.country_vo_service),
+            languages=get_codes_and_names(self.language_vo_service),
+        )
+
+        imported_count = 0
+        errors: list[CustomerImportErrorReadModel] = []
+        for batch in batched(enumerate(records, start=1), batch_size):
+            imported_customers, batch_errors = self._import_batch(batch=batch, state=state)
+            imported_count += len(imported_customers)
+            errors.extend(batch_errors)
+
+        elapsed_seconds = time.perf_counter() - started_at
+        return CustomerImportResultReadModel(
+            imported_count=imported_count,
+            errors=errors,
+            elapsed_seconds=round(elapsed_seconds, 3),
+            customers_per_second=round(imported_count / elapsed_seconds, 1) if elapsed_seconds else 0.0,
+        )
+
+    def _import_batch(
+        self, batch: Iterable[tuple[int, Mapping[str, Any]]], state: CustomerImportState
+    ) -> tuple[list[Customer], list[CustomerImportErrorReadModel]]:
+        customers: dict[int, Customer] = {}
+        errors: list[CustomerImportErrorReadModel] = []
+        contact_method_values: set[str] = set()
+        for row_number, record in batch:
+            try:
+                customers[row_number] = self._create_customer_from_record(
+                    record=record, state=state, contact_method_values=contact_method_values
+                )
+            except InvalidData as e:
+                errors.append(CustomerImportErrorReadModel(row=row_number, detail=get_error_detail(e)))
+
         try:
-            contact_method = ContactMethod(
-                type=data.type,
-                value=data.value,
-                is_preferred=data.is_preferred,
+            with self.customer_uow as uow:
+                used_values = uow.repository.get_used_contact_method_values(contact_method_values)
+                for row_number, customer in list(customers.items()):
+                    try:
+                        self._verify_that_contact_methods_are_unused(customer=customer, used_values=used_values)
+                    except InvalidData as e:
+                        errors.append(CustomerImportErrorReadModel(row=row_number, detail=get_error_detail(e)))
+                        del customers[row_number]
+                uow.repository.create_many(list(customers.values()))
+        except ObjectAlreadyExists as e:
+            # a concurrent write took one of the values after the check above, so the whole batch was rolled back
+            errors.extend(CustomerImportErrorReadModel(row=row_number, detail=e.message) for row_number in customers)
+            customers = {}
+        errors.sort(key=lambda error: error.row)
+        return list(customers.values()), errors
+
+    def _create_customer_from_record(
+        self, record: Mapping[str, Any], state: CustomerImportState, contact_method_values: set[str]
+    ) -> Customer:
+        data = parse_command_model(CustomerImportModel, record)
+        self._verify_that_salesman_exists(salesman_id=data.relation_manager_id, state=state)
+
+        company_info = self._create_company_info(data.company_info)
+        country = company_info.address.country
+        if (country.code, country.name) not in state.countries:
+            raise InvalidData("Invalid address country")
+        customer = Customer(
+            id=str(uuid4()),
+            company_info=company_info,
+            relation_manager_id=data.relation_manager_id,
+        )
+        for person in data.contact_persons:
+            self._add_contact_person(
+                customer=customer, data=person, state=state, contact_method_values=contact_method_values
             )
-        except (InvalidPhoneNumber, InvalidEmailAddress) as e:
-            raise InvalidData(e.message) from e
-        return contact_method
 
-    def _create_contact_methods(self, data: Iterable[ContactMethodCreateUpdateModel]) -> Iterable[ContactMethod]:
-        contact_methods = tuple(self._create_single_contact_method(method) for method in data)
-        return contact_methods
+        contact_method_values.update(
+            method.value for person in customer.contact_persons for method in person.contact_methods
+        )
+        return customer
 
-    def _create_company_info(self, company_data: CompanyInfoCreateUpdateModel) -> CompanyInfo:
-        address = self._create_address(company_data.address)
+    def _add_contact_person(
+        self,
+        customer: Customer,
+        data: ContactPersonCreateModel,
+        state: CustomerImportState,
+        contact_method_values: set[str],
+    ) -> None:
+        language = self._create_preferred_language(data.preferred_language)
+        if (language.code, language.name) not in state.languages:
+            raise InvalidData("Invalid language")
+        contact_methods = self._create_contact_methods(data.contact_methods)
+        customer_values = {method.value for person in customer.contact_persons for method in person.contact_methods}
+        for method in contact_methods:
+            if method.value in contact_method_values or method.value in customer_values:
+                raise InvalidData(f"Contact method {method.value} is already used by another contact person")
         try:
-            industry = Industry(name=company_data.industry)
-            segment = CompanySegment(size=company_data.size, legal_form=company_data.legal_form)
-            company_info = CompanyInfo(
-                name=company_data.name,
-                industry=industry,
-                segment=segment,
-                address=address,
+            customer.add_contact_person(
+                editor_id=customer.relation_manager_id,
+                contact_person_id=str(uuid4()),
+                first_name=data.first_name,
+                last_name=data.last_name,
+                job_title=data.job_title,
+                preferred_language=language,
+                contact_methods=contact_methods,
             )
-        except ValueNotAllowed as e:
+        except (NotEnoughPreferredContactMethods, DuplicateEntry) as e:
             raise InvalidData(e.message) from e
-        return company_info
 
-    def _create_address(self, address_data: AddressDataCreateUpdateModel) -> Address:
-        country = Country(code=address_data.country.code, name=address_data.country.name)
-        address = Address(
-            country=country,
-            street=address_data.street,
-            street_no=address_data.street_no,
-            postal_code=address_data.postal_code,
-            city=address_data.city,
-        )
-        return address
+    def _verify_that_contact_methods_are_unused(self, customer: Customer, used_values: set[str]) -> None:
+        for person in customer.contact_persons:
+            for method in person.contact_methods:
+                if method.value in used_values:
+                    raise InvalidData(f"Contact method {method.value} is already used by another contact person")
+
+    def _verify_that_salesman_exists(self, salesman_id: str, state: CustomerImportState) -> None:
+        if salesman_id not in state.salesmen:
+            state.salesmen[salesman_id] = self.sales_rep_service.salesman_exists(salesman_id)
+        if not state.salesmen[salesman_id]:
+            raise InvalidData(f"Relation manager with id={salesman_id} does not exist")
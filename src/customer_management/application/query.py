@@ -1,7 +1,7 @@
 from collections.abc import Iterable
 
 from building_blocks.application.exceptions import ObjectDoesNotExist
-from building_blocks.application.filters import FilterCondition, FilterConditionType
+from building_blocks.application.filters import FilterCondition, FilterConditionType, get_lookup_ids
 from customer_management.application.query_model import ContactPersonReadModel, CustomerReadModel
 from customer_management.application.query_service import CustomerQueryService
 
@@ -20,6 +20,10 @@ class CustomerQueryUseCase:
         customers = self.customer_query_service.get_all()
         return customers
 
+    def get_by_ids(self, ids: Iterable[str]) -> Iterable[CustomerReadModel]:
+        customers = self.customer_query_service.get_by_ids(get_lookup_ids(ids))
+        return customers
+
     def get_filtered(
         self,
         relation_manager_id: str | None = None,
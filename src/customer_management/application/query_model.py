@@ -1,8 +1,8 @@
 from typing import Self
 
-from faker import Faker
-from pydantic import Field
+from pydantic import BaseModel, Field
 
+from building_blocks.application.examples import lazy_examples
 from building_blocks.application.nested_model import NestedModel
 from building_blocks.application.query_model import BaseReadModel
 from customer_management.domain.entities.contact_person import ContactPerson
@@ -16,12 +16,10 @@ from customer_management.domain.value_objects.customer_status import CustomerSta
 from customer_management.domain.value_objects.industry import ALLOWED_INDUSTRY_NAMES
 from customer_management.domain.value_objects.language import Language
 
-faker = Faker(locale="pl_PL")
-
 
 class CountryReadModel(BaseReadModel[Country], NestedModel):
-    code: str = Field(examples=[faker.country_code()])
-    name: str = Field(examples=[faker.country()])
+    code: str = Field(json_schema_extra=lazy_examples(lambda faker: [faker.country_code()]))
+    name: str = Field(json_schema_extra=lazy_examples(lambda faker: [faker.country()]))
 
     @classmethod
     def from_domain(cls, entity: Country) -> Self:
@@ -32,11 +30,11 @@ class CountryReadModel(BaseReadModel[Country], NestedModel):
 
 
 class CompanyAddressReadModel(BaseReadModel[Address], NestedModel):
-    country: str = Field(examples=[faker.country()])
-    street: str = Field(examples=[faker.street_name()])
-    street_no: str = Field(examples=[faker.building_number()])
-    postal_code: str = Field(examples=[faker.postalcode()])
-    city: str = Field(examples=[faker.city()])
+    country: str = Field(json_schema_extra=lazy_examples(lambda faker: [faker.country()]))
+    street: str = Field(json_schema_extra=lazy_examples(lambda faker: [faker.street_name()]))
+    street_no: str = Field(json_schema_extra=lazy_examples(lambda faker: [faker.building_number()]))
+    postal_code: str = Field(json_schema_extra=lazy_examples(lambda faker: [faker.postalcode()]))
+    city: str = Field(json_schema_extra=lazy_examples(lambda faker: [faker.city()]))
 
     @classmethod
     def from_domain(cls, entity: Address) -> Self:
@@ -50,11 +48,13 @@ class CompanyAddressReadModel(BaseReadModel[Address], NestedModel):
 
 
 class CompanyInfoReadModel(BaseReadModel[CompanyInfo], NestedModel):
-    name: str = Field(examples=[faker.company()])
+    name: str = Field(json_schema_extra=lazy_examples(lambda faker: [faker.company()]))
     industry: str = Field(examples=ALLOWED_INDUSTRY_NAMES)
     size: str = Field(examples=ALLOWED_COMPANY_SIZES)
     legal_form: str = Field(examples=ALLOWED_LEGAL_FORMS)
-    address: CompanyAddressReadModel = Field(examples=[CompanyAddressReadModel.get_examples()])
+    address: CompanyAddressReadModel = Field(
+        json_schema_extra=lazy_examples(lambda faker: [CompanyAddressReadModel.get_examples()])
+    )
 
     @classmethod
     def from_domain(cls, entity: CompanyInfo) -> Self:
@@ -68,10 +68,13 @@ class CompanyInfoReadModel(BaseReadModel[CompanyInfo], NestedModel):
 
 
 class CustomerReadModel(BaseReadModel[Customer]):
-    id: str = Field(examples=[faker.uuid4()])
-    relation_manager_id: str = Field(examples=[faker.uuid4()])
+    id: str = Field(json_schema_extra=lazy_examples(lambda faker: [faker.uuid4()]))
+    relation_manager_id: str = Field(json_schema_extra=lazy_examples(lambda faker: [faker.uuid4()]))
     status: str = Field(examples=[status.value for status in CustomerStatusName])
-    company_info: CompanyInfoReadModel = Field(examples=[CompanyInfoReadModel.get_examples()])
+    company_info: CompanyInfoReadModel = Field(
+        json_schema_extra=lazy_examples(lambda faker: [CompanyInfoReadModel.get_examples()])
+    )
+    version: int = Field(examples=[1])
 
     @classmethod
     def from_domain(cls, entity: Customer) -> Self:
@@ -80,13 +83,14 @@ class CustomerReadModel(BaseReadModel[Customer]):
             relation_manager_id=entity.relation_manager_id,
             status=entity.status,
             company_info=CompanyInfoReadModel.from_domain(entity.company_info),
+            version=entity.version,
         )
 
 
 class ContactMethodReadModel(BaseReadModel[ContactMethod], NestedModel):
     type: str = Field(examples=ALLOWED_CONTACT_TYPES)
-    value: str = Field(examples=[faker.email(), faker.phone_number()])
-    is_preferred: bool = Field(examples=[faker.boolean()])
+    value: str = Field(json_schema_extra=lazy_examples(lambda faker: [faker.email(), faker.phone_number()]))
+    is_preferred: bool = Field(json_schema_extra=lazy_examples(lambda faker: [faker.boolean()]))
 
     @classmethod
     def from_domain(cls, entity: ContactMethod) -> Self:
@@ -103,12 +107,16 @@ class LanguageReadModel(BaseReadModel[Language], NestedModel):
 
 
 class ContactPersonReadModel(BaseReadModel[ContactPerson]):
-    id: str = Field(examples=[faker.uuid4()])
-    first_name: str = Field(examples=[faker.first_name()])
-    last_name: str = Field(examples=[faker.last_name()])
-    job_title: str = Field(examples=[faker.job()])
-    preferred_language: LanguageReadModel = Field(examples=[LanguageReadModel.get_examples()])
-    contact_methods: list[ContactMethodReadModel] = Field(examples=[[ContactMethodReadModel.get_examples()]])
+    id: str = Field(json_schema_extra=lazy_examples(lambda faker: [faker.uuid4()]))
+    first_name: str = Field(json_schema_extra=lazy_examples(lambda faker: [faker.first_name()]))
+    last_name: str = Field(json_schema_extra=lazy_examples(lambda faker: [faker.last_name()]))
+    job_title: str = Field(json_schema_extra=lazy_examples(lambda faker: [faker.job()]))
+    preferred_language: LanguageReadModel = Field(
+        json_schema_extra=lazy_examples(lambda faker: [LanguageReadModel.get_examples()])
+    )
+    contact_methods: list[ContactMethodReadModel] = Field(
+        json_schema_extra=lazy_examples(lambda faker: [[ContactMethodReadModel.get_examples()]])
+    )
 
     @classmethod
     def from_domain(cls, entity: ContactPerson) -> Self:
@@ -120,3 +128,19 @@ class ContactPersonReadModel(BaseReadModel[ContactPerson]):
             preferred_language=LanguageReadModel.from_domain(entity.preferred_language),
             contact_methods=[ContactMethodReadModel.from_domain(method) for method in entity.contact_methods],
         )
+
+
+class CustomerImportErrorReadModel(BaseModel):
+    row: int
+    detail: str
+
+
+class CustomerImportResultReadModel(BaseModel):
+    imported_count: int
+    errors: list[CustomerImportErrorReadModel]
+    elapsed_seconds: float
+    customers_per_second: float
+
+
+class RelationManagerReassignmentReadModel(BaseModel):
+    reassigned_count: int
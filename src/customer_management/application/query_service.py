@@ -12,6 +12,9 @@ class CustomerQueryService(ABC):
     @abstractmethod
     def get_all(self) -> Sequence[CustomerReadModel]: ...
 
+    @abstractmethod
+    def get_by_ids(self, ids: Sequence[str]) -> Sequence[CustomerReadModel]: ...
+
     @abstractmethod
     def get_filtered(self, filters: Iterable[FilterCondition]) -> Sequence[CustomerReadModel]: ...
 
@@ -37,6 +37,7 @@ def get_unique_contact_person_fields(contact_person: ContactPerson) -> tuple:
 @define(eq=False, kw_only=True)
 class Customer(AggregateRoot):
     id: str
+    version: int = 1
     company_info: CompanyInfo
     _relation_manager_id: str = field(alias="relation_manager_id")
     _status: CustomerStatus = field(init=False)
@@ -51,8 +52,9 @@ class Customer(AggregateRoot):
         company_info: CompanyInfo,
         status: str,
         contact_persons: ContactPersons,
+        version: int = 1,
     ) -> Self:
-        customer = cls(id=id, relation_manager_id=relation_manager_id, company_info=company_info)
+        customer = cls(id=id, relation_manager_id=relation_manager_id, company_info=company_info, version=version)
         status_object = get_customer_status_type_by_name(status)(customer)
         customer._status = status_object
         customer._contact_persons = contact_persons
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Mapping
 
 from customer_management.domain.entities.customer import Customer
 
@@ -7,8 +8,26 @@ class CustomerRepository(ABC):
     @abstractmethod
     def get(self, customer_id: str) -> Customer | None: ...
 
+    @abstractmethod
+    def exists(self, customer_id: str) -> bool: ...
+
+    @abstractmethod
+    def get_status(self, customer_id: str) -> str | None: ...
+
+    @abstractmethod
+    def get_statuses(self, customer_ids: Iterable[str]) -> Mapping[str, str]: ...
+
+    @abstractmethod
+    def get_used_contact_method_values(self, values: Iterable[str]) -> set[str]: ...
+
     @abstractmethod
     def create(self, customer: Customer) -> None: ...
 
+    @abstractmethod
+    def create_many(self, customers: Iterable[Customer]) -> None: ...
+
     @abstractmethod
     def update(self, customer: Customer) -> None: ...
+
+    @abstractmethod
+    def reassign_relation_manager(self, current_relation_manager_id: str, new_relation_manager_id: str) -> int: ...
@@ -34,6 +34,11 @@ class CustomerFileQueryService(CustomerQueryService):
             customers = [CustomerReadModel.from_domain(db.get(id)) for id in all_ids]
         return tuple(customers)
 
+    def get_by_ids(self, ids: Sequence[str]) -> Sequence[CustomerReadModel]:
+        with get_read_db(self._file_path) as db:
+            customers = [CustomerReadModel.from_domain(db[id]) for id in ids if id in db]
+        return tuple(customers)
+
     def get_filtered(self, filters: Iterable[FilterCondition]) -> Sequence[CustomerReadModel]:
         with get_read_db(self._file_path) as db:
             all_ids = db.keys()
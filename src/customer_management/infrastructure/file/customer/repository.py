@@ -1,5 +1,8 @@
+from collections.abc import Iterable, Mapping
+
 from building_blocks.infrastructure.exceptions import ObjectAlreadyExists
 from building_blocks.infrastructure.file.command import FileLikeDB
+from building_blocks.infrastructure.file.utils import compare_and_swap_version
 from customer_management.domain.entities.customer import Customer
 from customer_management.domain.repositories.customer import CustomerRepository
 
@@ -12,10 +15,49 @@ class CustomerFileRepository(CustomerRepository):
         customer = self.db.get(customer_id)
         return customer
 
+    def exists(self, customer_id: str) -> bool:
+        return customer_id in self.db
+
+    def get_status(self, customer_id: str) -> str | None:
+        if customer_id not in self.db:
+            return None
+        return self.db[customer_id].status
+
+    def get_statuses(self, customer_ids: Iterable[str]) -> Mapping[str, str]:
+        statuses = {customer_id: self.db[customer_id].status for customer_id in customer_ids if customer_id in self.db}
+        return statuses
+
+    def get_used_contact_method_values(self, values: Iterable[str]) -> set[str]:
+        wanted_values = set(values)
+        return {
+            method.value
+            for customer in self.db.values()
+            for person in customer.contact_persons
+            for method in person.contact_methods
+            if method.value in wanted_values
+        }
+
     def create(self, customer: Customer) -> None:
         if customer.id in self.db:
             raise ObjectAlreadyExists(f"Customer with id={customer.id} already exists")
         self.db[customer.id] = customer
 
+    def create_many(self, customers: Iterable[Customer]) -> None:
+        customers_by_id = {customer.id: customer for customer in customers}
+        if any(customer_id in self.db for customer_id in customers_by_id):
+            raise ObjectAlreadyExists("One of the given customers already exists")
+        self.db.update(customers_by_id)
+
     def update(self, customer: Customer) -> None:
+        compare_and_swap_version(db=self.db, aggregate=customer)
         self.db[customer.id] = customer
+
+    def reassign_relation_manager(self, current_relation_manager_id: str, new_relation_manager_id: str) -> int:
+        customers = [
+            customer for customer in self.db.values() if customer.relation_manager_id == current_relation_manager_id
+        ]
+        for customer in customers:
+            customer.update(editor_id=current_relation_manager_id, relation_manager_id=new_relation_manager_id)
+            customer.version += 1
+            self.db[customer.id] = customer
+        return len(customers)
@@ -204,6 +204,7 @@ class CustomerModel(Base[Customer]):
     relation_manager_id: Mapped[str] = mapped_column(nullable=False, index=True)
 
     status_name: Mapped[str] = mapped_column(nullable=False)
+    version: Mapped[int] = mapped_column(nullable=False, default=1, server_default="1")
 
     company_data: Mapped["CompanyDataModel"] = relationship(back_populates="customer")
     contact_persons: Mapped[list["ContactPersonModel"]] = relationship(backref="customer")
@@ -225,6 +226,7 @@ class CustomerModel(Base[Customer]):
             status=self.status_name,
             company_info=self.company_data.to_domain(),
             contact_persons=contact_persons,
+            version=self.version,
         )
 
     @classmethod
@@ -233,4 +235,5 @@ class CustomerModel(Base[Customer]):
             id=entity.id,
             relation_manager_id=entity.relation_manager_id,
             status_name=entity.status,
+            version=entity.version,
         )
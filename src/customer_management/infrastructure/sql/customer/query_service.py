@@ -1,6 +1,7 @@
 from collections.abc import Iterable, Sequence
 
 from sqlalchemy import select
+from sqlalchemy.orm import joinedload, selectinload
 
 from building_blocks.application.filters import FilterCondition
 from building_blocks.infrastructure.sql.db import SessionFactory
@@ -8,7 +9,12 @@ from building_blocks.infrastructure.sql.filters import SQLFilterService
 from customer_management.application.query_model import ContactPersonReadModel, CustomerReadModel
 from customer_management.application.query_service import CustomerQueryService
 from customer_management.domain.entities.customer import Customer
-from customer_management.infrastructure.sql.customer.models import ContactPersonModel, CustomerModel
+from customer_management.infrastructure.sql.customer.models import (
+    AddressModel,
+    CompanyDataModel,
+    ContactPersonModel,
+    CustomerModel,
+)
 
 
 class CustomerSQLQueryService(CustomerQueryService):
@@ -38,6 +44,24 @@ class CustomerSQLQueryService(CustomerQueryService):
             customers = tuple(customer.to_domain() for customer in db.scalars(query))
         return tuple(CustomerReadModel.from_domain(customer) for customer in customers)
 
+    def get_by_ids(self, ids: Sequence[str]) -> Sequence[CustomerReadModel]:
+        query = (
+            select(CustomerModel)
+            .where(CustomerModel.id.in_(ids))
+            .options(
+                joinedload(CustomerModel.company_data)
+                .joinedload(CompanyDataModel.address)
+                .joinedload(AddressModel.country),
+                selectinload(CustomerModel.contact_persons).options(
+                    joinedload(ContactPersonModel.language),
+                    selectinload(ContactPersonModel.contact_methods),
+                ),
+            )
+        )
+        with self._session_factory() as db:
+            customers = tuple(customer.to_domain() for customer in db.scalars(query))
+        return tuple(CustomerReadModel.from_domain(customer) for customer in customers)
+
     def get_filtered(self, filters: Iterable[FilterCondition]) -> Sequence[CustomerReadModel]:
         base_query = select(CustomerModel)
         query = self._filter_service.get_query_with_filters(
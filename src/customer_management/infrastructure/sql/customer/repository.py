@@ -1,12 +1,16 @@
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
+from typing import Any, cast
 
 from attrs import define
-from sqlalchemy import select
+from sqlalchemy import CursorResult, insert, literal, select, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from building_blocks.application.exceptions import InvalidData
+from building_blocks.application.tracing import traced
 from building_blocks.infrastructure.exceptions import ObjectAlreadyExists, ServerError
+from building_blocks.infrastructure.sql.db import Base
+from building_blocks.infrastructure.sql.utils import compare_and_swap_version, generate_uuid, get_column_values
 from customer_management.domain.entities.contact_person.contact_person import ContactMethods
 from customer_management.domain.entities.customer.customer import ContactPersonsReadOnly, Customer
 from customer_management.domain.repositories.customer import CustomerRepository
@@ -40,6 +44,23 @@ class CustomerSQLRepository(CustomerRepository):
             return None
         return customer.to_domain()
 
+    def exists(self, customer_id: str) -> bool:
+        query = select(literal(1)).where(CustomerModel.id == customer_id)
+        return self.db.scalar(query) is not None
+
+    def get_status(self, customer_id: str) -> str | None:
+        query = select(CustomerModel.status_name).where(CustomerModel.id == customer_id)
+        return self.db.scalar(query)
+
+    def get_statuses(self, customer_ids: Iterable[str]) -> Mapping[str, str]:
+        query = select(CustomerModel.id, CustomerModel.status_name).where(CustomerModel.id.in_(customer_ids))
+        statuses = self.db.execute(query).tuples().all()
+        return dict(statuses)
+
+    def get_used_contact_method_values(self, values: Iterable[str]) -> set[str]:
+        query = select(ContactMethodModel.value).where(ContactMethodModel.value.in_(list(values)))
+        return set(self.db.scalars(query).all())
+
     def create(self, customer: Customer) -> None:
         address_in_db = self._create_address(address=customer.company_info.address)
         self.db.add(address_in_db)
@@ -57,13 +78,69 @@ class CustomerSQLRepository(CustomerRepository):
         except IntegrityError as e:
             raise ObjectAlreadyExists(f"Customer with id={customer.id} already exists") from e
 
+    def create_many(self, customers: Iterable[Customer]) -> None:
+        country_ids = self._get_country_ids()
+        language_ids = self._get_language_ids()
+        rows: dict[type[Base], list[dict[str, Any]]] = {
+            AddressModel: [],
+            CustomerModel: [],
+            CompanyDataModel: [],
+            ContactPersonModel: [],
+            ContactMethodModel: [],
+        }
+        for customer in customers:
+            address = customer.company_info.address
+            country_id = country_ids.get((address.country.code, address.country.name))
+            if country_id is None:
+                raise InvalidData("Invalid address country")
+            address_in_db = AddressModel.from_domain(entity=address, country_id=country_id)
+            address_in_db.id = generate_uuid()
+            company_data_in_db = self._create_company_data(
+                company_data=customer.company_info, address_id=address_in_db.id, customer_id=customer.id
+            )
+            company_data_in_db.id = generate_uuid()
+            rows[AddressModel].append(get_column_values(address_in_db))
+            rows[CustomerModel].append(get_column_values(CustomerModel.from_domain(customer)))
+            rows[CompanyDataModel].append(get_column_values(company_data_in_db))
+
+            for person in customer.contact_persons:
+                language = person.preferred_language
+                language_id = language_ids.get((language.code, language.name))
+                if language_id is None:
+                    raise InvalidData("Invalid language")
+                person_in_db = ContactPersonModel.from_domain(
+                    entity=person, language_id=language_id, customer_id=customer.id
+                )
+                rows[ContactPersonModel].append(get_column_values(person_in_db))
+                rows[ContactMethodModel].extend(
+                    get_column_values(method)
+                    for method in self._create_contact_methods(person.contact_methods, person.id)
+                )
+
+        try:
+            for model, model_rows in rows.items():
+                if model_rows:
+                    self.db.execute(insert(model), model_rows)
+        except IntegrityError as e:
+            raise ObjectAlreadyExists("One of the given customers already exists") from e
+
     def update(self, customer: Customer) -> None:
+        compare_and_swap_version(db=self.db, model=CustomerModel, aggregate=customer)
         updated_customer = CustomerModel.from_domain(entity=customer)
         self.db.merge(updated_customer)
 
         self._update_company_data(company_data=customer.company_info, customer_id=customer.id)
         self._update_contact_persons(contact_persons=customer.contact_persons, customer_id=customer.id)
 
+    def reassign_relation_manager(self, current_relation_manager_id: str, new_relation_manager_id: str) -> int:
+        query = (
+            update(CustomerModel)
+            .where(CustomerModel.relation_manager_id == current_relation_manager_id)
+            .values(relation_manager_id=new_relation_manager_id, version=CustomerModel.version + 1)
+        )
+        result = cast(CursorResult, self.db.execute(query))
+        return result.rowcount
+
     def _update_company_data(self, company_data: CompanyInfo, customer_id: str) -> None:
         existing_company_data = self._get_company_data_by_customer(customer_id)
 
@@ -77,6 +154,7 @@ class CustomerSQLRepository(CustomerRepository):
         updated_company_data.id = existing_company_data.id
         self.db.merge(updated_company_data)
 
+    @traced("CustomerSQLRepository._update_contact_persons")
     def _update_contact_persons(self, contact_persons: ContactPersonsReadOnly, customer_id: str) -> None:
         new_contact_persons = self._create_contact_persons_and_methods(
             contact_persons=contact_persons, customer_id=customer_id
@@ -152,6 +230,14 @@ class CustomerSQLRepository(CustomerRepository):
             raise InvalidData("Invalid address country")
         return country_id
 
+    def _get_country_ids(self) -> dict[tuple[str, str], str]:
+        query = select(CountryModel.code, CountryModel.name, CountryModel.id)
+        return {(code, name): country_id for code, name, country_id in self.db.execute(query)}
+
+    def _get_language_ids(self) -> dict[tuple[str, str], str]:
+        query = select(LanguageModel.code, LanguageModel.name, LanguageModel.id)
+        return {(code, name): language_id for code, name, language_id in self.db.execute(query)}
+
     def _get_contact_persons_by_customer(self, customer_id: str) -> Iterable[ContactPersonModel]:
         query = select(ContactPersonModel).where(ContactPersonModel.customer_id == customer_id)
         persons = self.db.scalars(query).all()
@@ -1,21 +1,29 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Request, status as status_code
+from fastapi import APIRouter, Depends, HTTPException, Path, Request, Response, UploadFile, status as status_code
 
 from authentication.infrastructure.service.base import UserReadModel
-from authentication.presentation.rest.deps import get_current_user
+from authentication.presentation.rest.deps import get_current_user, is_admin
 from building_blocks.application.exceptions import ConflictingAction, ForbiddenAction, InvalidData, ObjectDoesNotExist
 from building_blocks.infrastructure.exceptions import ServerError
+from building_blocks.presentation.params import IdsQuery, IfMatchHeader, format_etag, parse_etag, split_ids
 from building_blocks.presentation.responses import BasicErrorResponse, UnprocessableEntityResponse
-from customer_management.application.command import CustomerCommandUseCase
+from building_blocks.presentation.uploads import read_records
+from customer_management.application.command import CustomerCommandUseCase, CustomerImportUseCase
 from customer_management.application.command_model import (
     ContactPersonCreateModel,
     ContactPersonUpdateModel,
     CustomerCreateModel,
     CustomerUpdateModel,
+    RelationManagerReassignmentModel,
 )
 from customer_management.application.query import CustomerQueryUseCase
-from customer_management.application.query_model import ContactPersonReadModel, CustomerReadModel
+from customer_management.application.query_model import (
+    ContactPersonReadModel,
+    CustomerImportResultReadModel,
+    CustomerReadModel,
+    RelationManagerReassignmentReadModel,
+)
 from customer_management.domain.value_objects.company_segment import CompanySize, LegalForm
 from customer_management.domain.value_objects.customer_status import CustomerStatusName
 from customer_management.domain.value_objects.industry import IndustryName
@@ -34,9 +42,15 @@ def get_customer_command_use_case(request: Request) -> CustomerCommandUseCase:
     return container.customer_command_use_case
 
 
+def get_customer_import_use_case(request: Request) -> CustomerImportUseCase:
+    container = get_container(request)
+    return container.customer_import_use_case
+
+
 @router.get(
     "/",
     response_model=list[CustomerReadModel],
+    responses={status_code.HTTP_422_UNPROCESSABLE_ENTITY: {"model": UnprocessableEntityResponse}},
 )
 def get_customers(
     customer_query_use_case: Annotated[CustomerQueryUseCase, Depends(get_customer_query_use_case)],
@@ -46,7 +60,14 @@ def get_customers(
     industry: IndustryName | None = None,
     company_size: CompanySize | None = None,
     legal_form: LegalForm | None = None,
+    ids: IdsQuery = None,
 ) -> None:
+    if ids is not None:
+        try:
+            customers = customer_query_use_case.get_by_ids(split_ids(ids))
+        except InvalidData as e:
+            raise HTTPException(status_code=status_code.HTTP_422_UNPROCESSABLE_ENTITY, detail=e.message) from e
+        return customers
     customers = customer_query_use_case.get_filtered(
         relation_manager_id=relation_manager_id,
         status=status,
@@ -74,12 +95,55 @@ def create_customer(
     return customer
 
 
+@router.post(
+    "/import",
+    response_model=CustomerImportResultReadModel,
+    dependencies=[Depends(is_admin)],
+    responses={
+        status_code.HTTP_403_FORBIDDEN: {"model": BasicErrorResponse},
+        status_code.HTTP_422_UNPROCESSABLE_ENTITY: {"model": UnprocessableEntityResponse},
+    },
+)
+def import_customers(
+    customer_import_use_case: Annotated[CustomerImportUseCase, Depends(get_customer_import_use_case)],
+    file: UploadFile,
+) -> None:
+    """For admins only. Accepts CSV with dotted headers (e.g. `contact_persons.0.first_name`) or JSON Lines."""
+    try:
+        result = customer_import_use_case.import_customers(records=read_records(file))
+    except InvalidData as e:
+        raise HTTPException(status_code=status_code.HTTP_422_UNPROCESSABLE_ENTITY, detail=e.message) from e
+    return result
+
+
+@router.post(
+    "/reassign",
+    response_model=RelationManagerReassignmentReadModel,
+    dependencies=[Depends(is_admin)],
+    responses={
+        status_code.HTTP_403_FORBIDDEN: {"model": BasicErrorResponse},
+        status_code.HTTP_422_UNPROCESSABLE_ENTITY: {"model": UnprocessableEntityResponse},
+    },
+)
+def reassign_relation_manager(
+    customer_command_use_case: Annotated[CustomerCommandUseCase, Depends(get_customer_command_use_case)],
+    data: RelationManagerReassignmentModel,
+) -> None:
+    """For admins only."""
+    try:
+        result = customer_command_use_case.reassign_relation_manager(data)
+    except InvalidData as e:
+        raise HTTPException(status_code=status_code.HTTP_422_UNPROCESSABLE_ENTITY, detail=e.message) from e
+    return result
+
+
 @router.put(
     "/{customer_id}",
     response_model=CustomerReadModel,
     responses={
         status_code.HTTP_403_FORBIDDEN: {"model": BasicErrorResponse},
         status_code.HTTP_404_NOT_FOUND: {"model": BasicErrorResponse},
+        status_code.HTTP_409_CONFLICT: {"model": BasicErrorResponse},
         status_code.HTTP_422_UNPROCESSABLE_ENTITY: {"model": UnprocessableEntityResponse},
     },
 )
@@ -88,10 +152,15 @@ def update_customer(
     data: CustomerUpdateModel,
     customer_id: Annotated[str, Path],
     current_user: Annotated[UserReadModel, Depends(get_current_user)],
+    response: Response,
+    if_match: IfMatchHeader = None,
 ) -> None:
     try:
         customer = customer_command_use_case.update(
-            customer_id=customer_id, editor_id=current_user.salesman_id, customer_data=data
+            customer_id=customer_id,
+            editor_id=current_user.salesman_id,
+            customer_data=data,
+            expected_version=parse_etag(if_match),
         )
     except ForbiddenAction as e:
         raise HTTPException(status_code=status_code.HTTP_403_FORBIDDEN, detail=e.message) from e
@@ -99,8 +168,11 @@ def update_customer(
         raise HTTPException(status_code=status_code.HTTP_422_UNPROCESSABLE_ENTITY, detail=e.message) from e
     except ObjectDoesNotExist as e:
         raise HTTPException(status_code=status_code.HTTP_404_NOT_FOUND, detail=e.message) from e
+    except ConflictingAction as e:
+        raise HTTPException(status_code=status_code.HTTP_409_CONFLICT, detail=e.message) from e
     except ServerError as e:
         raise HTTPException(status_code=status_code.HTTP_500_INTERNAL_SERVER_ERROR, detail=e.message) from e
+    response.headers["ETag"] = format_etag(customer.version)
     return customer
 
 
@@ -114,11 +186,13 @@ def update_customer(
 def get_single_customer(
     customer_query_use_case: Annotated[CustomerQueryUseCase, Depends(get_customer_query_use_case)],
     customer_id: Annotated[str, Path],
+    response: Response,
 ) -> None:
     try:
         customer = customer_query_use_case.get(customer_id)
     except ObjectDoesNotExist as e:
         raise HTTPException(status_code=status_code.HTTP_404_NOT_FOUND, detail=e.message) from e
+    response.headers["ETag"] = format_etag(customer.version)
     return customer
 
 
@@ -200,6 +274,7 @@ def get_customers_contact_persons(
     responses={
         status_code.HTTP_403_FORBIDDEN: {"model": BasicErrorResponse},
         status_code.HTTP_404_NOT_FOUND: {"model": BasicErrorResponse},
+        status_code.HTTP_409_CONFLICT: {"model": BasicErrorResponse},
         status_code.HTTP_422_UNPROCESSABLE_ENTITY: {"model": UnprocessableEntityResponse},
     },
 )
@@ -219,6 +294,8 @@ def create_customers_contact_person(
         raise HTTPException(status_code=status_code.HTTP_422_UNPROCESSABLE_ENTITY, detail=e.message) from e
     except ForbiddenAction as e:
         raise HTTPException(status_code=status_code.HTTP_403_FORBIDDEN, detail=e.message) from e
+    except ConflictingAction as e:
+        raise HTTPException(status_code=status_code.HTTP_409_CONFLICT, detail=e.message) from e
     return contact_person
 
 
@@ -228,6 +305,7 @@ def create_customers_contact_person(
     responses={
         status_code.HTTP_403_FORBIDDEN: {"model": BasicErrorResponse},
         status_code.HTTP_404_NOT_FOUND: {"model": BasicErrorResponse},
+        status_code.HTTP_409_CONFLICT: {"model": BasicErrorResponse},
         status_code.HTTP_422_UNPROCESSABLE_ENTITY: {"model": UnprocessableEntityResponse},
     },
 )
@@ -237,10 +315,16 @@ def update_customers_contact_person(
     customer_id: Annotated[str, Path],
     contact_person_id: Annotated[str, Path],
     current_user: Annotated[UserReadModel, Depends(get_current_user)],
+    response: Response,
+    if_match: IfMatchHeader = None,
 ) -> None:
     try:
         contact_person = customer_command_use_case.update_contact_person(
-            customer_id=customer_id, contact_person_id=contact_person_id, editor_id=current_user.salesman_id, data=data
+            customer_id=customer_id,
+            contact_person_id=contact_person_id,
+            editor_id=current_user.salesman_id,
+            data=data,
+            expected_version=parse_etag(if_match),
         )
     except ObjectDoesNotExist as e:
         raise HTTPException(status_code=status_code.HTTP_404_NOT_FOUND, detail=e.message) from e
@@ -248,7 +332,10 @@ def update_customers_contact_person(
         raise HTTPException(status_code=status_code.HTTP_422_UNPROCESSABLE_ENTITY, detail=e.message) from e
     except ForbiddenAction as e:
         raise HTTPException(status_code=status_code.HTTP_403_FORBIDDEN, detail=e.message) from e
-    return contact_person
+    except ConflictingAction as e:
+        raise HTTPException(status_code=status_code.HTTP_409_CONFLICT, detail=e.message) from e
+    response.headers["ETag"] = format_etag(contact_person.version)
+    return contact_person.result
 
 
 @router.delete(
@@ -257,6 +344,7 @@ def update_customers_contact_person(
     responses={
         status_code.HTTP_403_FORBIDDEN: {"model": BasicErrorResponse},
         status_code.HTTP_404_NOT_FOUND: {"model": BasicErrorResponse},
+        status_code.HTTP_409_CONFLICT: {"model": BasicErrorResponse},
     },
 )
 def remove_customers_contact_person(
@@ -273,3 +361,5 @@ def remove_customers_contact_person(
         raise HTTPException(status_code=status_code.HTTP_403_FORBIDDEN, detail=e.message) from e
     except ObjectDoesNotExist as e:
         raise HTTPException(status_code=status_code.HTTP_404_NOT_FOUND, detail=e.message) from e
+    except ConflictingAction as e:
+        raise HTTPException(status_code=status_code.HTTP_409_CONFLICT, detail=e.message) from e
@@ -0,0 +1,14 @@
+from building_blocks.application.exceptions import ObjectDoesNotExist
+from customer_overview.application.query_model import CustomerOverviewReadModel
+from customer_overview.application.query_service import CustomerOverviewQueryService
+
+
+class CustomerOverviewQueryUseCase:
+    def __init__(self, customer_overview_query_service: CustomerOverviewQueryService) -> None:
+        self.customer_overview_query_service = customer_overview_query_service
+
+    def get(self, customer_id: str) -> CustomerOverviewReadModel:
+        overview = self.customer_overview_query_service.get(customer_id)
+        if overview is None:
+            raise ObjectDoesNotExist(customer_id)
+        return overview
@@ -0,0 +1,57 @@
+from collections import defaultdict
+from collections.abc import Sequence
+from decimal import Decimal
+from typing import Self
+
+from pydantic import BaseModel
+
+from customer_management.application.query_model import ContactPersonReadModel, CustomerReadModel
+from customer_management.domain.entities.customer import Customer
+from sales.application.lead.query_model import LeadReadModel
+from sales.application.notes.query_model import NoteReadModel
+from sales.application.opportunity.query_model import MoneyReadModel, OpportunityReadModel
+from sales.domain.entities.lead import Lead
+from sales.domain.entities.opportunity import Opportunity
+from sales.domain.value_objects.money.currency import Currency
+from sales.domain.value_objects.money.money import Money
+
+LATEST_NOTES_LIMIT = 3
+
+
+class OpportunityOverviewReadModel(OpportunityReadModel):
+    offer_totals: list[MoneyReadModel]
+    latest_notes: list[NoteReadModel]
+
+    @classmethod
+    def from_domain(cls, entity: Opportunity) -> Self:
+        totals: defaultdict[Currency, Decimal] = defaultdict(Decimal)
+        for offer_item in entity.offer:
+            totals[offer_item.value.currency] += offer_item.value.amount
+        offer_totals = [
+            MoneyReadModel.from_domain(Money(currency=currency, amount=amount))
+            for currency, amount in sorted(totals.items(), key=lambda total: total[0].iso_code)
+        ]
+        notes = sorted(entity.notes_history, key=lambda note: note.created_at, reverse=True)
+        latest_notes = [NoteReadModel.from_domain(note) for note in notes[:LATEST_NOTES_LIMIT]]
+        return cls(
+            **OpportunityReadModel.from_domain(entity).model_dump(),
+            offer_totals=offer_totals,
+            latest_notes=latest_notes,
+        )
+
+
+class CustomerOverviewReadModel(BaseModel):
+    customer: CustomerReadModel
+    contact_persons: list[ContactPersonReadModel]
+    lead: LeadReadModel | None
+    opportunities: list[OpportunityOverviewReadModel]
+
+    @classmethod
+    def from_domain(cls, customer: Customer, leads: Sequence[Lead], opportunities: Sequence[Opportunity]) -> Self:
+        lead = LeadReadModel.from_domain(leads[0]) if leads else None
+        return cls(
+            customer=CustomerReadModel.from_domain(customer),
+            contact_persons=[ContactPersonReadModel.from_domain(person) for person in customer.contact_persons],
+            lead=lead,
+            opportunities=[OpportunityOverviewReadModel.from_domain(opportunity) for opportunity in opportunities],
+        )
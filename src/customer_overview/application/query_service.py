@@ -0,0 +1,8 @@
+from abc import ABC, abstractmethod
+
+from customer_overview.application.query_model import CustomerOverviewReadModel
+
+
+class CustomerOverviewQueryService(ABC):
+    @abstractmethod
+    def get(self, customer_id: str) -> CustomerOverviewReadModel | None: ...
@@ -0,0 +1,26 @@
+from pathlib import Path
+
+from building_blocks.infrastructure.file.io import get_read_db
+from customer_overview.application.query_model import CustomerOverviewReadModel
+from customer_overview.application.query_service import CustomerOverviewQueryService
+
+
+class CustomerOverviewFileQueryService(CustomerOverviewQueryService):
+    def __init__(self, customers_file_path: Path, leads_file_path: Path, opportunities_file_path: Path) -> None:
+        self._customers_file_path = customers_file_path
+        self._leads_file_path = leads_file_path
+        self._opportunities_file_path = opportunities_file_path
+
+    def get(self, customer_id: str) -> CustomerOverviewReadModel | None:
+        with get_read_db(self._customers_file_path) as db:
+            customer = db.get(customer_id)
+        if customer is None:
+            return None
+        with get_read_db(self._leads_file_path) as db:
+            leads = tuple(lead for lead in db.values() if lead.customer_id == customer_id)
+        with get_read_db(self._opportunities_file_path) as db:
+            opportunities = sorted(
+                (opportunity for opportunity in db.values() if opportunity.customer_id == customer_id),
+                key=lambda opportunity: opportunity.created_at,
+            )
+        return CustomerOverviewReadModel.from_domain(customer=customer, leads=leads, opportunities=opportunities)
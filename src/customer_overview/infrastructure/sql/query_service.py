@@ -0,0 +1,60 @@
+from sqlalchemy import select
+from sqlalchemy.orm import joinedload, selectinload
+
+from building_blocks.infrastructure.sql.db import SessionFactory
+from customer_management.infrastructure.sql.customer.models import (
+    AddressModel,
+    CompanyDataModel,
+    ContactPersonModel,
+    CustomerModel,
+)
+from customer_overview.application.query_model import CustomerOverviewReadModel
+from customer_overview.application.query_service import CustomerOverviewQueryService
+from sales.infrastructure.sql.lead.models import LeadModel
+from sales.infrastructure.sql.opportunity.models import OfferItemModel, OpportunityModel
+
+
+class CustomerOverviewSQLQueryService(CustomerOverviewQueryService):
+    def __init__(self, session_factory: SessionFactory) -> None:
+        self._session_factory = session_factory
+
+    def get(self, customer_id: str) -> CustomerOverviewReadModel | None:
+        customer_query = (
+            select(CustomerModel)
+            .where(CustomerModel.id == customer_id)
+            .options(
+                joinedload(CustomerModel.company_data)
+                .joinedload(CompanyDataModel.address)
+                .joinedload(AddressModel.country),
+                selectinload(CustomerModel.contact_persons).options(
+                    joinedload(ContactPersonModel.language),
+                    selectinload(ContactPersonModel.contact_methods),
+                ),
+            )
+        )
+        leads_query = (
+            select(LeadModel)
+            .where(LeadModel.customer_id == customer_id)
+            .options(selectinload(LeadModel.notes), selectinload(LeadModel.assignments))
+        )
+        opportunities_query = (
+            select(OpportunityModel)
+            .where(OpportunityModel.customer_id == customer_id)
+            .order_by(OpportunityModel.created_at)
+            .options(
+                selectinload(OpportunityModel.notes),
+                selectinload(OpportunityModel.offer_items).options(
+                    joinedload(OfferItemModel.product),
+                    joinedload(OfferItemModel.currency),
+                ),
+            )
+        )
+        with self._session_factory() as db:
+            customer = db.scalar(customer_query)
+            if customer is None:
+                return None
+            leads = tuple(lead.to_domain() for lead in db.scalars(leads_query))
+            opportunities = tuple(opportunity.to_domain() for opportunity in db.scalars(opportunities_query))
+            return CustomerOverviewReadModel.from_domain(
+                customer=customer.to_domain(), leads=leads, opportunities=opportunities
+            )
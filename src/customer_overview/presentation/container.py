@@ -0,0 +1,16 @@
+from typing import Protocol
+
+from fastapi import Request
+
+from authentication.infrastructure.service.base import AuthenticationService
+from customer_overview.application.query import CustomerOverviewQueryUseCase
+
+
+class CustomerOverviewApplicationContainer(Protocol):
+    customer_overview_query_use_case: CustomerOverviewQueryUseCase
+
+    auth_service: AuthenticationService
+
+
+def get_container(request: Request) -> CustomerOverviewApplicationContainer:
+    return request.app.state.container
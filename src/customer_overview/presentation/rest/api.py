@@ -0,0 +1,42 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Path, Request, status
+
+from authentication.presentation.rest.deps import get_current_user
+from building_blocks.application.exceptions import ObjectDoesNotExist
+from building_blocks.presentation.responses import BasicErrorResponse
+from customer_overview.application.query import CustomerOverviewQueryUseCase
+from customer_overview.application.query_model import CustomerOverviewReadModel
+from customer_overview.presentation.container import get_container
+
+router = APIRouter(
+    prefix="/customers",
+    tags=["customers"],
+    dependencies=[Depends(get_current_user)],
+    responses={status.HTTP_401_UNAUTHORIZED: {"model": BasicErrorResponse}},
+)
+
+
+def get_customer_overview_query_use_case(request: Request) -> CustomerOverviewQueryUseCase:
+    container = get_container(request)
+    return container.customer_overview_query_use_case
+
+
+@router.get(
+    "/{customer_id}/overview",
+    response_model=CustomerOverviewReadModel,
+    responses={
+        status.HTTP_404_NOT_FOUND: {"model": BasicErrorResponse},
+    },
+)
+def get_customer_overview(
+    customer_overview_query_use_case: Annotated[
+        CustomerOverviewQueryUseCase, Depends(get_customer_overview_query_use_case)
+    ],
+    customer_id: Annotated[str, Path],
+) -> None:
+    try:
+        overview = customer_overview_query_use_case.get(customer_id)
+    except ObjectDoesNotExist as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message) from e
+    return overview
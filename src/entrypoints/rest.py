@@ -1,10 +1,17 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from dotenv import load_dotenv
 from fastapi import FastAPI
 
 from authentication.presentation.rest.api import router as auth_router
-from containers.config import ContainerManager
+from building_blocks.infrastructure.tracing import configure_tracing_from_env
+from building_blocks.presentation.instrumentation import InstrumentationMiddleware
+from building_blocks.presentation.metrics import router as metrics_router
+from containers.config import ContainerManager, is_prewarm_on_startup_enabled
 from containers.container import ApplicationContainer
 from customer_management.presentation.rest.api import router as customer_management_router
+from customer_overview.presentation.rest.api import router as customer_overview_router
 from sales.presentation.rest.api import router as sales_router
 
 
@@ -12,13 +19,30 @@ def bind_container(instance: FastAPI, container: ApplicationContainer) -> None:
     instance.state.container = container
 
 
+def warm_up(instance: FastAPI, container: ApplicationContainer) -> None:
+    container.warm_up()
+    instance.openapi()
+
+
+@asynccontextmanager
+async def lifespan(instance: FastAPI) -> AsyncIterator[None]:
+    # the container (and with it Firebase and the persistence engine) is set up once the server starts,
+    # not when the module is imported
+    container = ContainerManager.build()
+    bind_container(instance, container)
+    if is_prewarm_on_startup_enabled():
+        warm_up(instance, container)
+    yield
+
+
 load_dotenv()
+configure_tracing_from_env()
 
-app = FastAPI(title="CRM DDD PoC")
+app = FastAPI(title="CRM DDD PoC", lifespan=lifespan)
+app.add_middleware(InstrumentationMiddleware)
 
 app.include_router(auth_router)
 app.include_router(customer_management_router)
 app.include_router(sales_router)
-
-app_container = ContainerManager.build()
-bind_container(app, app_container)
+app.include_router(customer_overview_router)
+app.include_router(metrics_router)
@@ -1,16 +1,18 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Mapping
 from types import TracebackType
 from typing import Protocol, Self
 
+from building_blocks.application.cache import TTLCache
 from building_blocks.application.exceptions import ObjectDoesNotExist
 
 
-class Customer(Protocol):
-    status: str
+class CustomerRepository(Protocol):
+    def exists(self, customer_id: str) -> bool: ...
 
+    def get_status(self, customer_id: str) -> str | None: ...
 
-class CustomerRepository(Protocol):
-    def get(self, customer_id: str) -> Customer | None: ...
+    def get_statuses(self, customer_ids: Iterable[str]) -> Mapping[str, str]: ...
 
 
 class CustomerUnitOfWork(Protocol):
@@ -27,8 +29,9 @@ class CustomerUnitOfWork(Protocol):
 
 
 class ICustomerService(ABC):
-    def __init__(self, customer_uow: CustomerUnitOfWork) -> None:
+    def __init__(self, customer_uow: CustomerUnitOfWork, status_cache: TTLCache[str, str]) -> None:
         self.customer_uow = customer_uow
+        self.status_cache = status_cache
 
     @abstractmethod
     def customer_exists(self, customer_id: str) -> bool: ...
@@ -36,15 +39,28 @@ class ICustomerService(ABC):
     @abstractmethod
     def get_customer_status(self, customer_id: str) -> str: ...
 
+    @abstractmethod
+    def get_customer_statuses(self, customer_ids: Iterable[str]) -> Mapping[str, str]: ...
+
 
 class CustomerService(ICustomerService):
     def customer_exists(self, customer_id: str) -> bool:
+        if self.status_cache.get(customer_id) is not None:
+            return True
         with self.customer_uow as uow:
-            return bool(uow.repository.get(customer_id))
+            return uow.repository.exists(customer_id)
 
     def get_customer_status(self, customer_id: str) -> str:
+        status = self.status_cache.get(customer_id)
+        if status is not None:
+            return status
         with self.customer_uow as uow:
-            customer = uow.repository.get(customer_id)
-        if customer is None:
+            status = uow.repository.get_status(customer_id)
+        if status is None:
             raise ObjectDoesNotExist(customer_id)
-        return customer.status
+        self.status_cache.set(customer_id, status)
+        return status
+
+    def get_customer_statuses(self, customer_ids: Iterable[str]) -> Mapping[str, str]:
+        with self.customer_uow as uow:
+            return uow.repository.get_statuses(customer_ids)
@@ -0,0 +1,10 @@
+from sales.application.opportunity.command import OpportunityUnitOfWork
+
+
+class PipelineStatsCommandUseCase:
+    def __init__(self, opportunity_uow: OpportunityUnitOfWork) -> None:
+        self.opportunity_uow = opportunity_uow
+
+    def rebuild(self) -> None:
+        with self.opportunity_uow as uow:
+            uow.pipeline_stats.rebuild()
@@ -0,0 +1,40 @@
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from decimal import Decimal
+
+from sales.domain.entities.opportunity import Opportunity
+
+PipelineStatsKey = tuple[str, str, str]
+PipelineStatsDelta = dict[PipelineStatsKey, tuple[Decimal, int]]
+
+
+class PipelineStatsRepository(ABC):
+    @abstractmethod
+    def increment(self, owner_id: str, stage: str, currency: str, amount: Decimal, items_count: int) -> None: ...
+
+    @abstractmethod
+    def rebuild(self) -> None: ...
+
+    def apply(self, delta: PipelineStatsDelta) -> None:
+        for (owner_id, stage, currency), (amount, items_count) in delta.items():
+            self.increment(owner_id=owner_id, stage=stage, currency=currency, amount=amount, items_count=items_count)
+
+
+def get_pipeline_contribution(opportunity: Opportunity) -> PipelineStatsDelta:
+    amounts: defaultdict[PipelineStatsKey, Decimal] = defaultdict(Decimal)
+    counts: defaultdict[PipelineStatsKey, int] = defaultdict(int)
+    for offer_item in opportunity.offer:
+        key = (opportunity.owner_id, opportunity.stage_name, offer_item.value.currency.iso_code)
+        amounts[key] += offer_item.value.amount
+        counts[key] += 1
+    return {key: (amounts[key], counts[key]) for key in amounts}
+
+
+def get_pipeline_stats_delta(before: PipelineStatsDelta, after: PipelineStatsDelta) -> PipelineStatsDelta:
+    delta = {}
+    for key in before.keys() | after.keys():
+        amount_before, count_before = before.get(key, (Decimal(), 0))
+        amount_after, count_after = after.get(key, (Decimal(), 0))
+        if amount_before != amount_after or count_before != count_after:
+            delta[key] = (amount_after - amount_before, count_after - count_before)
+    return delta
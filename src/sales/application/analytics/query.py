@@ -0,0 +1,14 @@
+from collections.abc import Iterable
+
+from sales.application.analytics.query_model import PipelineDimension, PipelineStatsReadModel
+from sales.application.analytics.query_service import PipelineAnalyticsQueryService
+
+
+class PipelineAnalyticsQueryUseCase:
+    def __init__(self, analytics_query_service: PipelineAnalyticsQueryService) -> None:
+        self.analytics_query_service = analytics_query_service
+
+    def get_pipeline_stats(self, group_by: Iterable[PipelineDimension] = ()) -> Iterable[PipelineStatsReadModel]:
+        dimensions = tuple(dict.fromkeys(group_by))
+        stats = self.analytics_query_service.get_pipeline_stats(dimensions)
+        return stats
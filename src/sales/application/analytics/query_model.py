@@ -0,0 +1,22 @@
+from decimal import Decimal
+from typing import Literal, get_args
+
+from pydantic import BaseModel, Field
+
+from building_blocks.application.examples import lazy_examples
+from sales.domain.value_objects.opportunity_stage import ALLOWED_OPPORTUNITY_STAGES
+from sales.domain.value_objects.priority import ALLOWED_PRIORITY_LEVELS
+
+PipelineDimension = Literal["stage", "priority", "owner", "currency"]
+ALLOWED_PIPELINE_DIMENSIONS = get_args(PipelineDimension)
+
+
+class PipelineStatsReadModel(BaseModel):
+    stage: str | None = Field(default=None, examples=ALLOWED_OPPORTUNITY_STAGES)
+    priority: str | None = Field(default=None, examples=ALLOWED_PRIORITY_LEVELS)
+    owner_id: str | None = Field(default=None, json_schema_extra=lazy_examples(lambda faker: [faker.uuid4()]))
+    currency: str | None = Field(default=None, json_schema_extra=lazy_examples(lambda faker: [faker.currency_code()]))
+    total_amount: Decimal = Field(
+        json_schema_extra=lazy_examples(lambda faker: [faker.pydecimal(left_digits=6, right_digits=2, positive=True)])
+    )
+    items_count: int = Field(json_schema_extra=lazy_examples(lambda faker: [faker.pyint(min_value=1)]))
@@ -0,0 +1,9 @@
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+
+from sales.application.analytics.query_model import PipelineDimension, PipelineStatsReadModel
+
+
+class PipelineAnalyticsQueryService(ABC):
+    @abstractmethod
+    def get_pipeline_stats(self, group_by: Sequence[PipelineDimension]) -> Sequence[PipelineStatsReadModel]: ...
@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Sequence
+
+from building_blocks.application.command import BaseUnitOfWork
+from sales.application.forecast.command_model import ExchangeRateCreateUpdateModel
+from sales.application.forecast.query_model import ExchangeRateReadModel
+
+
+class ExchangeRateRepository(ABC):
+    @abstractmethod
+    def replace_all(self, rates: Sequence[ExchangeRateReadModel]) -> None: ...
+
+
+class ExchangeRateUnitOfWork(BaseUnitOfWork):
+    repository: ExchangeRateRepository
+
+
+class ExchangeRateCommandUseCase:
+    def __init__(self, exchange_rate_uow: ExchangeRateUnitOfWork) -> None:
+        self.exchange_rate_uow = exchange_rate_uow
+
+    def set_rates(self, data: Iterable[ExchangeRateCreateUpdateModel]) -> Sequence[ExchangeRateReadModel]:
+        rates_by_iso_code = {item.iso_code.upper(): item.rate for item in data}
+        rates = tuple(ExchangeRateReadModel(iso_code=code, rate=rate) for code, rate in rates_by_iso_code.items())
+        with self.exchange_rate_uow as uow:
+            uow.repository.replace_all(rates)
+        return rates
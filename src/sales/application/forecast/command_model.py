@@ -0,0 +1,17 @@
+from decimal import Decimal
+
+from pydantic import Field
+
+from building_blocks.application.command_model import BaseCommandModel
+from building_blocks.application.examples import lazy_examples
+
+
+class ExchangeRateCreateUpdateModel(BaseCommandModel):
+    iso_code: str = Field(
+        min_length=3, max_length=3, json_schema_extra=lazy_examples(lambda faker: [faker.currency_code()])
+    )
+    rate: Decimal = Field(
+        description="Value of one unit of the currency in the base currency, whose rate is 1.",
+        gt=0,
+        json_schema_extra=lazy_examples(lambda faker: [faker.pydecimal(left_digits=1, right_digits=4, positive=True)]),
+    )
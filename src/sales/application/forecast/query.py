@@ -0,0 +1,64 @@
+from collections import defaultdict
+from collections.abc import Iterable, Mapping
+from decimal import Decimal
+
+from building_blocks.application.exceptions import InvalidData
+from sales.application.forecast.query_model import ExchangeRateReadModel, ForecastReadModel
+from sales.application.forecast.query_service import ForecastQueryService
+from sales.domain.value_objects.money.money import CENT
+
+DEFAULT_STAGE_WEIGHTS: Mapping[str, Decimal] = {
+    "qualification": Decimal("0.1"),
+    "proposal": Decimal("0.3"),
+    "negotiation": Decimal("0.6"),
+    "closed-won": Decimal("1"),
+    "closed-lost": Decimal("0"),
+}
+
+
+class ForecastQueryUseCase:
+    def __init__(
+        self,
+        forecast_query_service: ForecastQueryService,
+        stage_weights: Mapping[str, Decimal] = DEFAULT_STAGE_WEIGHTS,
+    ) -> None:
+        self.forecast_query_service = forecast_query_service
+        self.stage_weights = stage_weights
+
+    def get_exchange_rates(self) -> Iterable[ExchangeRateReadModel]:
+        rates = self.forecast_query_service.get_exchange_rates()
+        return rates
+
+    def get_forecast(self, currency: str) -> Iterable[ForecastReadModel]:
+        reporting_currency = currency.upper()
+        rates = {rate.iso_code: rate.rate for rate in self.forecast_query_service.get_exchange_rates()}
+        pipeline_amounts: defaultdict[tuple[str, str], Decimal] = defaultdict(Decimal)
+        weighted_amounts: defaultdict[tuple[str, str], Decimal] = defaultdict(Decimal)
+
+        for value in self.forecast_query_service.get_monthly_pipeline_values():
+            amount = value.amount * self._get_conversion_factor(value.currency, reporting_currency, rates)
+            key = (value.owner_id, value.month)
+            pipeline_amounts[key] += amount
+            weighted_amounts[key] += amount * self.stage_weights.get(value.stage, Decimal())
+
+        forecast = (
+            ForecastReadModel(
+                owner_id=owner_id,
+                month=month,
+                currency=reporting_currency,
+                pipeline_amount=pipeline_amounts[(owner_id, month)].quantize(CENT),
+                weighted_amount=weighted_amounts[(owner_id, month)].quantize(CENT),
+            )
+            for owner_id, month in sorted(pipeline_amounts)
+        )
+        return tuple(forecast)
+
+    def _get_conversion_factor(self, source: str, target: str, rates: Mapping[str, Decimal]) -> Decimal:
+        # a rate is the value of one unit of the currency in the base currency (the one with rate 1),
+        # so an amount goes through the base currency: amount * rates[source] / rates[target]
+        if source == target:
+            return Decimal(1)
+        for iso_code in (source, target):
+            if iso_code not in rates:
+                raise InvalidData(f"No exchange rate defined for currency {iso_code}")
+        return rates[source] / rates[target]
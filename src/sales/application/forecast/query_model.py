@@ -0,0 +1,36 @@
+from decimal import Decimal
+
+from pydantic import BaseModel, Field
+
+from building_blocks.application.examples import lazy_examples
+from sales.domain.value_objects.opportunity_stage import ALLOWED_OPPORTUNITY_STAGES
+
+
+class ExchangeRateReadModel(BaseModel):
+    iso_code: str = Field(json_schema_extra=lazy_examples(lambda faker: [faker.currency_code()]))
+    rate: Decimal = Field(
+        description="Value of one unit of the currency in the base currency, whose rate is 1.",
+        json_schema_extra=lazy_examples(lambda faker: [faker.pydecimal(left_digits=1, right_digits=4, positive=True)]),
+    )
+
+
+class MonthlyPipelineValueReadModel(BaseModel):
+    owner_id: str = Field(json_schema_extra=lazy_examples(lambda faker: [faker.uuid4()]))
+    month: str = Field(json_schema_extra=lazy_examples(lambda faker: [faker.date(pattern="%Y-%m")]))
+    stage: str = Field(examples=ALLOWED_OPPORTUNITY_STAGES)
+    currency: str = Field(json_schema_extra=lazy_examples(lambda faker: [faker.currency_code()]))
+    amount: Decimal = Field(
+        json_schema_extra=lazy_examples(lambda faker: [faker.pydecimal(left_digits=6, right_digits=2, positive=True)])
+    )
+
+
+class ForecastReadModel(BaseModel):
+    owner_id: str = Field(json_schema_extra=lazy_examples(lambda faker: [faker.uuid4()]))
+    month: str = Field(json_schema_extra=lazy_examples(lambda faker: [faker.date(pattern="%Y-%m")]))
+    currency: str = Field(json_schema_extra=lazy_examples(lambda faker: [faker.currency_code()]))
+    pipeline_amount: Decimal = Field(
+        json_schema_extra=lazy_examples(lambda faker: [faker.pydecimal(left_digits=6, right_digits=2, positive=True)])
+    )
+    weighted_amount: Decimal = Field(
+        json_schema_extra=lazy_examples(lambda faker: [faker.pydecimal(left_digits=6, right_digits=2, positive=True)])
+    )
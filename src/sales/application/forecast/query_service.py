@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+
+from sales.application.forecast.query_model import ExchangeRateReadModel, MonthlyPipelineValueReadModel
+
+
+class ForecastQueryService(ABC):
+    @abstractmethod
+    def get_monthly_pipeline_values(self) -> Sequence[MonthlyPipelineValueReadModel]: ...
+
+    @abstractmethod
+    def get_exchange_rates(self) -> Sequence[ExchangeRateReadModel]: ...
@@ -1,16 +1,37 @@
+from collections.abc import Iterable, Mapping
+from functools import partial
+from itertools import batched
+from typing import Any
 from uuid import uuid4
 
-from building_blocks.application.command import BaseUnitOfWork
-from building_blocks.application.exceptions import ConflictingAction, ForbiddenAction, InvalidData, ObjectDoesNotExist
+from building_blocks.application.batching import CommandBatcher, ImmediateCommandBatcher
+from building_blocks.application.command import BaseUnitOfWork, ensure_version_matches
+from building_blocks.application.command_model import parse_command_model
+from building_blocks.application.exceptions import (
+    ConflictingAction,
+    ForbiddenAction,
+    InvalidData,
+    ObjectDoesNotExist,
+    get_error_detail,
+)
 from building_blocks.domain.exceptions import InvalidEmailAddress, InvalidPhoneNumber, ValueNotAllowed
+from building_blocks.infrastructure.exceptions import ObjectAlreadyExists
 from sales.application.acl import ICustomerService
 from sales.application.lead.command_model import (
     AssignmentUpdateModel,
     ContactDataCreateUpdateModel,
     LeadCreateModel,
+    LeadImportRowModel,
+    LeadsReassignmentModel,
     LeadUpdateModel,
 )
-from sales.application.lead.query_model import AssignmentReadModel, LeadReadModel
+from sales.application.lead.query_model import (
+    AssignmentReadModel,
+    LeadImportErrorReadModel,
+    LeadImportResultReadModel,
+    LeadReadModel,
+    LeadsReassignmentReadModel,
+)
 from sales.application.notes.command_model import NoteCreateModel
 from sales.application.notes.query_model import NoteReadModel
 from sales.application.sales_representative.command import SalesRepresentativeUnitOfWork
@@ -26,10 +47,12 @@ from sales.domain.exceptions import (
     UnauthorizedLeadOwnerChange,
 )
 from sales.domain.repositories.lead import LeadRepository
-from sales.domain.service.lead import ensure_customer_has_initial_status, ensure_one_lead_per_customer
+from sales.domain.service.lead import create_leads_reassignment, ensure_customer_has_initial_status
 from sales.domain.value_objects.acquisition_source import AcquisitionSource
 from sales.domain.value_objects.contact_data import ContactData
 
+IMPORT_BATCH_SIZE = 500
+
 
 class LeadUnitOfWork(BaseUnitOfWork):
     repository: LeadRepository
@@ -41,33 +64,54 @@ class LeadCommandUseCase(CustomerExistsMixin, SalesRepresentativeExistsMixin):
         lead_uow: LeadUnitOfWork,
         salesman_uow: SalesRepresentativeUnitOfWork,
         customer_service: ICustomerService,
+        command_batcher: CommandBatcher | None = None,
     ) -> None:
         self.lead_uow = lead_uow
         self.salesman_uow = salesman_uow
         self.customer_service = customer_service
+        self.command_batcher = command_batcher or ImmediateCommandBatcher()
 
     def create(self, lead_data: LeadCreateModel, creator_id: str) -> LeadReadModel:
-        self._verify_that_salesman_exists(creator_id)
-        self._verify_that_customer_exists(lead_data.customer_id)
-        self._enforce_lead_creation_business_rules(lead_data.customer_id)
-
-        lead_id = str(uuid4())
-        source = self._create_source(lead_data.source)
-        contact_data = self._create_contact_data(lead_data.contact_data)
-        lead = Lead.make(
-            id=lead_id,
-            customer_id=lead_data.customer_id,
-            created_by_salesman_id=creator_id,
-            contact_data=contact_data,
-            source=source,
-        )
         with self.lead_uow as uow:
-            uow.repository.create(lead)
+            self._verify_that_salesman_exists(creator_id)
+            self._verify_that_customer_exists(lead_data.customer_id)
+            self._enforce_lead_creation_business_rules(lead_data.customer_id)
+
+            lead_id = str(uuid4())
+            source = self._create_source(lead_data.source)
+            contact_data = self._create_contact_data(lead_data.contact_data)
+            lead = Lead.make(
+                id=lead_id,
+                customer_id=lead_data.customer_id,
+                created_by_salesman_id=creator_id,
+                contact_data=contact_data,
+                source=source,
+            )
+            try:
+                uow.repository.create(lead)
+            except CanCreateOnlyOneLeadPerCustomer as e:
+                raise InvalidData(e.message) from e
         return LeadReadModel.from_domain(lead)
 
-    def update(self, lead_id: str, editor_id: str, lead_data: LeadUpdateModel) -> LeadReadModel:
+    def import_leads(
+        self, rows: Iterable[Mapping[str, Any]], creator_id: str, batch_size: int = IMPORT_BATCH_SIZE
+    ) -> LeadImportResultReadModel:
+        self._verify_that_salesman_exists(creator_id)
+
+        imported_count = 0
+        errors: list[LeadImportErrorReadModel] = []
+        for batch in batched(enumerate(rows, start=1), batch_size):
+            imported_leads, batch_errors = self._import_batch(batch=batch, creator_id=creator_id)
+            imported_count += len(imported_leads)
+            errors.extend(batch_errors)
+        return LeadImportResultReadModel(imported_count=imported_count, errors=errors)
+
+    def update(
+        self, lead_id: str, editor_id: str, lead_data: LeadUpdateModel, expected_version: int | None = None
+    ) -> LeadReadModel:
         with self.lead_uow as uow:
             lead = self._get_lead(uow=uow, lead_id=lead_id)
+            ensure_version_matches(aggregate=lead, expected_version=expected_version)
             try:
                 lead.update(
                     editor_id=editor_id,
@@ -80,6 +124,20 @@ class LeadCommandUseCase(CustomerExistsMixin, SalesRepresentativeExistsMixin):
         return LeadReadModel.from_domain(lead)
 
     def update_note(self, lead_id: str, editor_id: str, note_data: NoteCreateModel) -> NoteReadModel:
+        return self.command_batcher.submit(
+            partial(self._update_note, lead_id=lead_id, editor_id=editor_id, note_data=note_data)
+        )
+
+    def update_assignment(
+        self, lead_id: str, requestor_id: str, assignment_data: AssignmentUpdateModel
+    ) -> AssignmentReadModel:
+        return self.command_batcher.submit(
+            partial(
+                self._update_assignment, lead_id=lead_id, requestor_id=requestor_id, assignment_data=assignment_data
+            )
+        )
+
+    def _update_note(self, lead_id: str, editor_id: str, note_data: NoteCreateModel) -> NoteReadModel:
         with self.lead_uow as uow:
             lead = self._get_lead(uow=uow, lead_id=lead_id)
             try:
@@ -89,13 +147,13 @@ class LeadCommandUseCase(CustomerExistsMixin, SalesRepresentativeExistsMixin):
             uow.repository.update(lead)
         return NoteReadModel.from_domain(lead.note)
 
-    def update_assignment(
+    def _update_assignment(
         self, lead_id: str, requestor_id: str, assignment_data: AssignmentUpdateModel
     ) -> AssignmentReadModel:
         new_salesman_id = assignment_data.new_salesman_id
-        self._verify_that_salesman_exists(new_salesman_id)
 
         with self.lead_uow as uow:
+            self._verify_that_salesman_exists(new_salesman_id)
             lead = self._get_lead(uow=uow, lead_id=lead_id)
             try:
                 lead.assign_salesman(
@@ -109,20 +167,97 @@ class LeadCommandUseCase(CustomerExistsMixin, SalesRepresentativeExistsMixin):
             uow.repository.update(lead)
         return AssignmentReadModel.from_domain(lead.most_recent_assignment)
 
+    def reassign_leads(self, data: LeadsReassignmentModel, requestor_id: str) -> LeadsReassignmentReadModel:
+        self._verify_that_salesman_exists(data.new_salesman_id)
+        try:
+            assignment = create_leads_reassignment(
+                current_salesman_id=data.current_salesman_id,
+                new_salesman_id=data.new_salesman_id,
+                requestor_id=requestor_id,
+            )
+        except LeadAlreadyAssignedToSalesman as e:
+            raise ConflictingAction(e.message) from e
+
+        with self.lead_uow as uow:
+            reassigned_count = uow.repository.reassign_leads(assignment)
+        return LeadsReassignmentReadModel(reassigned_count=reassigned_count)
+
     def _get_lead(self, uow: LeadUnitOfWork, lead_id: str) -> Lead:
         lead = uow.repository.get(lead_id)
         if lead is None:
             raise ObjectDoesNotExist(lead_id)
         return lead
 
-    def _enforce_lead_creation_business_rules(self, customer_id: str) -> None:
+    def _import_batch(
+        self, batch: Iterable[tuple[int, Mapping[str, Any]]], creator_id: str
+    ) -> tuple[list[Lead], list[LeadImportErrorReadModel]]:
+        leads: dict[int, Lead] = {}
+        errors: list[LeadImportErrorReadModel] = []
+        for row_number, row in batch:
+            try:
+                leads[row_number] = self._create_lead_from_row(row=row, creator_id=creator_id)
+            except InvalidData as e:
+                errors.append(LeadImportErrorReadModel(row=row_number, detail=get_error_detail(e)))
+
+        customer_ids = {lead.customer_id for lead in leads.values()}
+        statuses = self.customer_service.get_customer_statuses(customer_ids)
+        to_create: dict[int, Lead] = {}
         try:
             with self.lead_uow as uow:
-                ensure_one_lead_per_customer(lead_repo=uow.repository, customer_id=customer_id)
-            ensure_customer_has_initial_status(self.customer_service.get_customer_status(customer_id=customer_id))
+                customers_with_lead = uow.repository.get_customers_with_lead(customer_ids)
+                for row_number, lead in leads.items():
+                    try:
+                        self._enforce_lead_import_business_rules(
+                            customer_id=lead.customer_id, statuses=statuses, customers_with_lead=customers_with_lead
+                        )
+                    except InvalidData as e:
+                        errors.append(LeadImportErrorReadModel(row=row_number, detail=get_error_detail(e)))
+                        continue
+                    customers_with_lead.add(lead.customer_id)
+                    to_create[row_number] = lead
+                uow.repository.create_many(to_create.values())
+        except (CanCreateOnlyOneLeadPerCustomer, ObjectAlreadyExists) as e:
+            # a concurrent write took the customer (or id) after the check above, so the whole batch was rolled back
+            errors.extend(LeadImportErrorReadModel(row=row_number, detail=e.message) for row_number in to_create)
+            to_create = {}
+        errors.sort(key=lambda error: error.row)
+        return list(to_create.values()), errors
+
+    def _create_lead_from_row(self, row: Mapping[str, Any], creator_id: str) -> Lead:
+        row_data = parse_command_model(LeadImportRowModel, row)
+        contact_data = ContactDataCreateUpdateModel(
+            first_name=row_data.first_name,
+            last_name=row_data.last_name,
+            phone=row_data.phone or None,
+            email=row_data.email or None,
+        )
+        lead = Lead.make(
+            id=str(uuid4()),
+            customer_id=row_data.customer_id,
+            created_by_salesman_id=creator_id,
+            contact_data=self._create_contact_data(contact_data),
+            source=self._create_source(row_data.source),
+        )
+        return lead
+
+    def _enforce_lead_import_business_rules(
+        self, customer_id: str, statuses: Mapping[str, str], customers_with_lead: set[str]
+    ) -> None:
+        if customer_id not in statuses:
+            raise InvalidData(f"Customer with id={customer_id} does not exist")
+        try:
+            if customer_id in customers_with_lead:
+                raise CanCreateOnlyOneLeadPerCustomer
+            ensure_customer_has_initial_status(statuses[customer_id])
         except (CanCreateOnlyOneLeadPerCustomer, LeadCanBeCreatedOnlyForInitialCustomer) as e:
             raise InvalidData(e.message) from e
 
+    def _enforce_lead_creation_business_rules(self, customer_id: str) -> None:
+        try:
+            ensure_customer_has_initial_status(self.customer_service.get_customer_status(customer_id=customer_id))
+        except LeadCanBeCreatedOnlyForInitialCustomer as e:
+            raise InvalidData(e.message) from e
+
     def _create_source_if_provided(self, source_name: str | None) -> AcquisitionSource | None:
         return self._create_source(source_name) if source_name else None
 
@@ -1,32 +1,46 @@
-from faker import Faker
 from pydantic import Field
 
 from building_blocks.application.command_model import BaseCommandModel
+from building_blocks.application.examples import lazy_examples
 from building_blocks.application.nested_model import NestedModel
 from sales.domain.value_objects.acquisition_source import ALLOWED_SOURCE_NAMES
 
-faker = Faker(locale="pl_PL")
-
 
 class ContactDataCreateUpdateModel(BaseCommandModel, NestedModel):
-    first_name: str = Field(examples=[faker.first_name()])
-    last_name: str = Field(examples=[faker.last_name()])
-    phone: str | None = Field(default=None, examples=[faker.phone_number()])
-    email: str | None = Field(default=None, examples=[faker.email()])
+    first_name: str = Field(json_schema_extra=lazy_examples(lambda faker: [faker.first_name()]))
+    last_name: str = Field(json_schema_extra=lazy_examples(lambda faker: [faker.last_name()]))
+    phone: str | None = Field(default=None, json_schema_extra=lazy_examples(lambda faker: [faker.phone_number()]))
+    email: str | None = Field(default=None, json_schema_extra=lazy_examples(lambda faker: [faker.email()]))
 
 
 class LeadCreateModel(BaseCommandModel):
-    customer_id: str = Field(examples=[faker.uuid4()])
+    customer_id: str = Field(json_schema_extra=lazy_examples(lambda faker: [faker.uuid4()]))
     source: str = Field(examples=ALLOWED_SOURCE_NAMES)
-    contact_data: ContactDataCreateUpdateModel = Field(examples=[ContactDataCreateUpdateModel.get_examples()])
+    contact_data: ContactDataCreateUpdateModel = Field(
+        json_schema_extra=lazy_examples(lambda faker: [ContactDataCreateUpdateModel.get_examples()])
+    )
 
 
 class LeadUpdateModel(BaseCommandModel):
     source: str | None = Field(default=None, examples=ALLOWED_SOURCE_NAMES)
     contact_data: ContactDataCreateUpdateModel | None = Field(
-        default=None, examples=[ContactDataCreateUpdateModel.get_examples()]
+        default=None, json_schema_extra=lazy_examples(lambda faker: [ContactDataCreateUpdateModel.get_examples()])
     )
 
 
+class LeadImportRowModel(BaseCommandModel):
+    customer_id: str = Field(json_schema_extra=lazy_examples(lambda faker: [faker.uuid4()]))
+    source: str = Field(examples=ALLOWED_SOURCE_NAMES)
+    first_name: str = Field(json_schema_extra=lazy_examples(lambda faker: [faker.first_name()]))
+    last_name: str = Field(json_schema_extra=lazy_examples(lambda faker: [faker.last_name()]))
+    phone: str | None = Field(default=None, json_schema_extra=lazy_examples(lambda faker: [faker.phone_number()]))
+    email: str | None = Field(default=None, json_schema_extra=lazy_examples(lambda faker: [faker.email()]))
+
+
 class AssignmentUpdateModel(BaseCommandModel):
     new_salesman_id: str
+
+
+class LeadsReassignmentModel(BaseCommandModel):
+    current_salesman_id: str = Field(json_schema_extra=lazy_examples(lambda faker: [faker.uuid4()]))
+    new_salesman_id: str = Field(json_schema_extra=lazy_examples(lambda faker: [faker.uuid4()]))
@@ -1,7 +1,7 @@
 from collections.abc import Iterable
 
 from building_blocks.application.exceptions import ObjectDoesNotExist
-from building_blocks.application.filters import FilterCondition, FilterConditionType
+from building_blocks.application.filters import FilterCondition, FilterConditionType, get_lookup_ids
 from sales.application.lead.query_model import AssignmentReadModel, LeadReadModel
 from sales.application.lead.query_service import LeadQueryService
 from sales.application.notes.query_model import NoteReadModel
@@ -21,6 +21,10 @@ class LeadQueryUseCase:
         leads = self.lead_query_service.get_all()
         return leads
 
+    def get_by_ids(self, ids: Iterable[str]) -> Iterable[LeadReadModel]:
+        leads = self.lead_query_service.get_by_ids(get_lookup_ids(ids))
+        return leads
+
     def get_filtered(
         self,
         customer_id: str | None = None,
@@ -1,9 +1,9 @@
 import datetime as dt
 from typing import Self
 
-from faker import Faker
-from pydantic import Field
+from pydantic import BaseModel, Field
 
+from building_blocks.application.examples import lazy_examples
 from building_blocks.application.nested_model import NestedModel
 from building_blocks.application.query_model import BaseReadModel
 from sales.domain.entities.lead import Lead
@@ -11,14 +11,12 @@ from sales.domain.value_objects.acquisition_source import ALLOWED_SOURCE_NAMES
 from sales.domain.value_objects.contact_data import ContactData
 from sales.domain.value_objects.lead_assignment_entry import LeadAssignmentEntry
 
-faker = Faker(locale="pl_PL")
-
 
 class ContactDataReadModel(BaseReadModel[ContactData], NestedModel):
-    first_name: str = Field(examples=[faker.first_name()])
-    last_name: str = Field(examples=[faker.last_name()])
-    phone: str | None = Field(default=None, examples=[faker.phone_number()])
-    email: str | None = Field(default=None, examples=[faker.email()])
+    first_name: str = Field(json_schema_extra=lazy_examples(lambda faker: [faker.first_name()]))
+    last_name: str = Field(json_schema_extra=lazy_examples(lambda faker: [faker.last_name()]))
+    phone: str | None = Field(default=None, json_schema_extra=lazy_examples(lambda faker: [faker.phone_number()]))
+    email: str | None = Field(default=None, json_schema_extra=lazy_examples(lambda faker: [faker.email()]))
 
     @classmethod
     def from_domain(cls, entity: ContactData) -> Self:
@@ -31,13 +29,16 @@ class ContactDataReadModel(BaseReadModel[ContactData], NestedModel):
 
 
 class LeadReadModel(BaseReadModel[Lead]):
-    id: str = Field(examples=[faker.uuid4()])
-    customer_id: str = Field(examples=[faker.uuid4()])
-    created_by_salesman_id: str = Field(examples=[faker.uuid4()])
-    assigned_salesman_id: str | None = Field(examples=[faker.uuid4()])
+    id: str = Field(json_schema_extra=lazy_examples(lambda faker: [faker.uuid4()]))
+    customer_id: str = Field(json_schema_extra=lazy_examples(lambda faker: [faker.uuid4()]))
+    created_by_salesman_id: str = Field(json_schema_extra=lazy_examples(lambda faker: [faker.uuid4()]))
+    assigned_salesman_id: str | None = Field(json_schema_extra=lazy_examples(lambda faker: [faker.uuid4()]))
     created_at: dt.datetime
     source: str = Field(examples=ALLOWED_SOURCE_NAMES)
-    contact_data: ContactDataReadModel = Field(examples=[ContactDataReadModel.get_examples()])
+    contact_data: ContactDataReadModel = Field(
+        json_schema_extra=lazy_examples(lambda faker: [ContactDataReadModel.get_examples()])
+    )
+    version: int = Field(examples=[1])
 
     @classmethod
     def from_domain(cls, entity: Lead) -> Self:
@@ -49,13 +50,14 @@ class LeadReadModel(BaseReadModel[Lead]):
             assigned_salesman_id=entity.assigned_salesman_id,
             source=entity.source.name,
             contact_data=ContactDataReadModel.from_domain(entity.contact_data),
+            version=entity.version,
         )
 
 
 class AssignmentReadModel(BaseReadModel[LeadAssignmentEntry]):
-    previous_owner_id: str | None = Field(default=None, examples=[faker.uuid4()])
-    new_owner_id: str = Field(examples=[faker.uuid4()])
-    assigned_by_id: str = Field(examples=[faker.uuid4()])
+    previous_owner_id: str | None = Field(default=None, json_schema_extra=lazy_examples(lambda faker: [faker.uuid4()]))
+    new_owner_id: str = Field(json_schema_extra=lazy_examples(lambda faker: [faker.uuid4()]))
+    assigned_by_id: str = Field(json_schema_extra=lazy_examples(lambda faker: [faker.uuid4()]))
     assigned_at: dt.datetime
 
     @classmethod
@@ -66,3 +68,17 @@ class AssignmentReadModel(BaseReadModel[LeadAssignmentEntry]):
             assigned_by_id=entity.assigned_by_id,
             assigned_at=entity.assigned_at,
         )
+
+
+class LeadImportErrorReadModel(BaseModel):
+    row: int
+    detail: str
+
+
+class LeadImportResultReadModel(BaseModel):
+    imported_count: int
+    errors: list[LeadImportErrorReadModel]
+
+
+class LeadsReassignmentReadModel(BaseModel):
+    reassigned_count: int
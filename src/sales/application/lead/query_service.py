@@ -14,6 +14,9 @@ class LeadQueryService(ABC):
     @abstractmethod
     def get_all(self) -> Sequence[LeadReadModel]: ...
 
+    @abstractmethod
+    def get_by_ids(self, ids: Sequence[str]) -> Sequence[LeadReadModel]: ...
+
     @abstractmethod
     def get_filtered(self, filters: Iterable[FilterCondition]) -> Sequence[LeadReadModel]: ...
 
@@ -1,10 +1,8 @@
-from faker import Faker
 from pydantic import Field
 
 from building_blocks.application.command_model import BaseCommandModel
-
-faker = Faker(locale="pl_PL")
+from building_blocks.application.examples import lazy_examples
 
 
 class NoteCreateModel(BaseCommandModel):
-    content: str = Field(examples=[faker.text(max_nb_chars=30)])
+    content: str = Field(json_schema_extra=lazy_examples(lambda faker: [faker.text(max_nb_chars=30)]))
@@ -1,12 +1,20 @@
 from collections.abc import Iterable
+from functools import partial
 from typing import Any, TypeVar
 from uuid import uuid4
 
-from building_blocks.application.command import BaseUnitOfWork
+from building_blocks.application.batching import CommandBatcher, ImmediateCommandBatcher
+from building_blocks.application.command import BaseUnitOfWork, Versioned, ensure_version_matches
 from building_blocks.application.exceptions import ForbiddenAction, InvalidData, ObjectDoesNotExist
 from building_blocks.domain.exceptions import ValueNotAllowed
 from building_blocks.domain.value_object import ValueObject
 from sales.application.acl import ICustomerService
+from sales.application.analytics.pipeline_stats import (
+    PipelineStatsDelta,
+    PipelineStatsRepository,
+    get_pipeline_contribution,
+    get_pipeline_stats_delta,
+)
 from sales.application.notes.command_model import NoteCreateModel
 from sales.application.notes.query_model import NoteReadModel
 from sales.application.opportunity.command_model import (
@@ -40,6 +48,7 @@ ValueObjectT = TypeVar("ValueObjectT", bound=ValueObject)
 
 class OpportunityUnitOfWork(BaseUnitOfWork):
     repository: OpportunityRepository
+    pipeline_stats: PipelineStatsRepository
 
 
 class OpportunityCommandUseCase(CustomerExistsMixin, SalesRepresentativeExistsMixin):
@@ -48,37 +57,48 @@ class OpportunityCommandUseCase(CustomerExistsMixin, SalesRepresentativeExistsMi
         opportunity_uow: OpportunityUnitOfWork,
         salesman_uow: SalesRepresentativeUnitOfWork,
         customer_service: ICustomerService,
+        command_batcher: CommandBatcher | None = None,
     ) -> None:
         self.opportunity_uow = opportunity_uow
         self.salesman_uow = salesman_uow
         self.customer_service = customer_service
+        self.command_batcher = command_batcher or ImmediateCommandBatcher()
 
     def create(self, data: OpportunityCreateModel, creator_id: str) -> OpportunityReadModel:
-        self._verify_that_salesman_exists(creator_id)
-        self._verify_that_customer_exists(data.customer_id)
-        self._enforce_opportunity_creation_business_rules(data.customer_id)
-
-        opportunity_id = str(uuid4())
-        source = self._create_source(data.source)
-        stage = self._create_stage()
-        priority = self._create_priority(data.priority)
-        offer = self._create_offer(data.offer)
-        opportunity = Opportunity.make(
-            id=opportunity_id,
-            created_by_id=creator_id,
-            customer_id=data.customer_id,
-            source=source,
-            stage=stage,
-            priority=priority,
-            offer=offer,
-        )
         with self.opportunity_uow as uow:
+            self._verify_that_salesman_exists(creator_id)
+            self._verify_that_customer_exists(data.customer_id)
+            self._enforce_opportunity_creation_business_rules(data.customer_id)
+
+            opportunity_id = str(uuid4())
+            source = self._create_source(data.source)
+            stage = self._create_stage()
+            priority = self._create_priority(data.priority)
+            offer = self._create_offer(data.offer)
+            opportunity = Opportunity.make(
+                id=opportunity_id,
+                created_by_id=creator_id,
+                customer_id=data.customer_id,
+                source=source,
+                stage=stage,
+                priority=priority,
+                offer=offer,
+            )
             uow.repository.create(opportunity)
+            uow.pipeline_stats.apply(get_pipeline_contribution(opportunity))
         return OpportunityReadModel.from_domain(opportunity)
 
-    def update(self, opportunity_id: str, editor_id: str, data: OpportunityUpdateModel) -> OpportunityReadModel:
+    def update(
+        self,
+        opportunity_id: str,
+        editor_id: str,
+        data: OpportunityUpdateModel,
+        expected_version: int | None = None,
+    ) -> OpportunityReadModel:
         with self.opportunity_uow as uow:
             opportunity = self._get_opportunity(uow=uow, opportunity_id=opportunity_id)
+            ensure_version_matches(aggregate=opportunity, expected_version=expected_version)
+            contribution_before = get_pipeline_contribution(opportunity)
             try:
                 opportunity.update(
                     editor_id=editor_id,
@@ -89,6 +109,7 @@ class OpportunityCommandUseCase(CustomerExistsMixin, SalesRepresentativeExistsMi
             except OnlyOwnerCanModifyOpportunityData as e:
                 raise ForbiddenAction(e.message) from e
             uow.repository.update(opportunity)
+            self._update_pipeline_stats(uow=uow, opportunity=opportunity, contribution_before=contribution_before)
         return OpportunityReadModel.from_domain(opportunity)
 
     def update_offer(
@@ -96,18 +117,28 @@ class OpportunityCommandUseCase(CustomerExistsMixin, SalesRepresentativeExistsMi
         opportunity_id: str,
         editor_id: str,
         data: Iterable[OfferItemCreateUpdateModel],
-    ) -> Iterable[OfferItemCreateUpdateModel]:
+        expected_version: int | None = None,
+    ) -> Versioned[tuple[OfferItemReadModel, ...]]:
         with self.opportunity_uow as uow:
             opportunity = self._get_opportunity(uow=uow, opportunity_id=opportunity_id)
+            ensure_version_matches(aggregate=opportunity, expected_version=expected_version)
+            contribution_before = get_pipeline_contribution(opportunity)
             new_offer = self._create_offer(data)
             try:
                 opportunity.modify_offer(new_offer=new_offer, editor_id=editor_id)
             except OnlyOwnerCanModifyOffer as e:
                 raise ForbiddenAction(e.message) from e
             uow.repository.update(opportunity)
-        return tuple(OfferItemReadModel.from_domain(item) for item in new_offer)
+            self._update_pipeline_stats(uow=uow, opportunity=opportunity, contribution_before=contribution_before)
+        offer = tuple(OfferItemReadModel.from_domain(item) for item in new_offer)
+        return Versioned(result=offer, version=opportunity.version)
 
     def update_note(self, opportunity_id: str, editor_id: str, note_data: NoteCreateModel) -> NoteReadModel:
+        return self.command_batcher.submit(
+            partial(self._update_note, opportunity_id=opportunity_id, editor_id=editor_id, note_data=note_data)
+        )
+
+    def _update_note(self, opportunity_id: str, editor_id: str, note_data: NoteCreateModel) -> NoteReadModel:
         with self.opportunity_uow as uow:
             opportunity = self._get_opportunity(uow=uow, opportunity_id=opportunity_id)
             try:
@@ -123,6 +154,12 @@ class OpportunityCommandUseCase(CustomerExistsMixin, SalesRepresentativeExistsMi
             raise ObjectDoesNotExist(opportunity_id)
         return opportunity
 
+    def _update_pipeline_stats(
+        self, uow: OpportunityUnitOfWork, opportunity: Opportunity, contribution_before: PipelineStatsDelta
+    ) -> None:
+        delta = get_pipeline_stats_delta(before=contribution_before, after=get_pipeline_contribution(opportunity))
+        uow.pipeline_stats.apply(delta)
+
     def _enforce_opportunity_creation_business_rules(self, customer_id: str) -> None:
         try:
             ensure_customer_has_converted_status(self.customer_service.get_customer_status(customer_id=customer_id))
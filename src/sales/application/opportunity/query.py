@@ -1,7 +1,7 @@
 from collections.abc import Iterable
 
 from building_blocks.application.exceptions import ObjectDoesNotExist
-from building_blocks.application.filters import FilterCondition, FilterConditionType
+from building_blocks.application.filters import FilterCondition, FilterConditionType, get_lookup_ids
 from sales.application.notes.query_model import NoteReadModel
 from sales.application.opportunity.query_model import OfferItemReadModel, OpportunityReadModel
 from sales.application.opportunity.query_service import OpportunityQueryService
@@ -21,6 +21,10 @@ class OpportunityQueryUseCase:
         opportunites = self.opportunity_query_service.get_all()
         return opportunites
 
+    def get_by_ids(self, ids: Iterable[str]) -> Iterable[OpportunityReadModel]:
+        opportunities = self.opportunity_query_service.get_by_ids(get_lookup_ids(ids))
+        return opportunities
+
     def get_filtered(
         self,
         stage: str | None = None,
@@ -2,9 +2,9 @@ import datetime as dt
 from decimal import Decimal
 from typing import Self
 
-from faker import Faker
 from pydantic import Field
 
+from building_blocks.application.examples import lazy_examples
 from building_blocks.application.nested_model import NestedModel
 from building_blocks.application.query_model import BaseReadModel
 from sales.domain.entities.opportunity import Opportunity
@@ -16,11 +16,9 @@ from sales.domain.value_objects.opportunity_stage import ALLOWED_OPPORTUNITY_STA
 from sales.domain.value_objects.priority import ALLOWED_PRIORITY_LEVELS
 from sales.domain.value_objects.product import Product
 
-faker = Faker(locale="pl_PL")
-
 
 class ProductReadModel(BaseReadModel[Product], NestedModel):
-    name: str = Field(examples=[faker.catch_phrase()])
+    name: str = Field(json_schema_extra=lazy_examples(lambda faker: [faker.catch_phrase()]))
 
     @classmethod
     def from_domain(cls, entity: Product) -> Self:
@@ -28,8 +26,8 @@ class ProductReadModel(BaseReadModel[Product], NestedModel):
 
 
 class CurrencyReadModel(BaseReadModel[Currency], NestedModel):
-    name: str = Field(examples=[faker.currency_name()])
-    iso_code: str = Field(examples=[faker.currency_code()])
+    name: str = Field(json_schema_extra=lazy_examples(lambda faker: [faker.currency_name()]))
+    iso_code: str = Field(json_schema_extra=lazy_examples(lambda faker: [faker.currency_code()]))
 
     @classmethod
     def from_domain(cls, entity: Currency) -> Self:
@@ -37,8 +35,12 @@ class CurrencyReadModel(BaseReadModel[Currency], NestedModel):
 
 
 class MoneyReadModel(BaseReadModel[Money], NestedModel):
-    currency: CurrencyReadModel = Field(examples=[CurrencyReadModel.get_examples()])
-    amount: Decimal = Field(examples=[faker.pydecimal(left_digits=3, right_digits=2, positive=True)])
+    currency: CurrencyReadModel = Field(
+        json_schema_extra=lazy_examples(lambda faker: [CurrencyReadModel.get_examples()])
+    )
+    amount: Decimal = Field(
+        json_schema_extra=lazy_examples(lambda faker: [faker.pydecimal(left_digits=3, right_digits=2, positive=True)])
+    )
 
     @classmethod
     def from_domain(cls, entity: Money) -> Self:
@@ -49,8 +51,8 @@ class MoneyReadModel(BaseReadModel[Money], NestedModel):
 
 
 class OfferItemReadModel(BaseReadModel[OfferItem], NestedModel):
-    product: ProductReadModel = Field(examples=[ProductReadModel.get_examples()])
-    value: MoneyReadModel = Field(examples=[MoneyReadModel.get_examples()])
+    product: ProductReadModel = Field(json_schema_extra=lazy_examples(lambda faker: [ProductReadModel.get_examples()]))
+    value: MoneyReadModel = Field(json_schema_extra=lazy_examples(lambda faker: [MoneyReadModel.get_examples()]))
 
     @classmethod
     def from_domain(cls, entity: OfferItem) -> Self:
@@ -61,14 +63,15 @@ class OfferItemReadModel(BaseReadModel[OfferItem], NestedModel):
 
 
 class OpportunityReadModel(BaseReadModel[Opportunity]):
-    id: str = Field(examples=[faker.uuid4()])
+    id: str = Field(json_schema_extra=lazy_examples(lambda faker: [faker.uuid4()]))
     source: str = Field(examples=ALLOWED_SOURCE_NAMES)
     stage: str = Field(examples=ALLOWED_OPPORTUNITY_STAGES)
     priority: str = Field(examples=ALLOWED_PRIORITY_LEVELS)
-    created_by_id: str = Field(examples=[faker.uuid4()])
-    customer_id: str = Field(examples=[faker.uuid4()])
-    owner_id: str = Field(examples=[faker.uuid4()])
-    created_at: dt.datetime = Field(examples=[faker.date_time_this_year()])
+    created_by_id: str = Field(json_schema_extra=lazy_examples(lambda faker: [faker.uuid4()]))
+    customer_id: str = Field(json_schema_extra=lazy_examples(lambda faker: [faker.uuid4()]))
+    owner_id: str = Field(json_schema_extra=lazy_examples(lambda faker: [faker.uuid4()]))
+    created_at: dt.datetime = Field(json_schema_extra=lazy_examples(lambda faker: [faker.date_time_this_year()]))
+    version: int = Field(examples=[1])
 
     @classmethod
     def from_domain(cls, entity: Opportunity) -> Self:
@@ -81,4 +84,5 @@ class OpportunityReadModel(BaseReadModel[Opportunity]):
             customer_id=entity.customer_id,
             owner_id=entity.owner_id,
             created_at=entity.created_at,
+            version=entity.version,
         )
@@ -13,6 +13,9 @@ class OpportunityQueryService(ABC):
     @abstractmethod
     def get_all(self) -> Sequence[OpportunityReadModel]: ...
 
+    @abstractmethod
+    def get_by_ids(self, ids: Sequence[str]) -> Sequence[OpportunityReadModel]: ...
+
     @abstractmethod
     def get_filtered(self, filters: Iterable[FilterCondition]) -> Sequence[OpportunityReadModel]: ...
 
@@ -1,16 +1,14 @@
-from faker import Faker
 from pydantic import Field
 
 from building_blocks.application.command_model import BaseCommandModel
-
-faker = Faker(locale="pl_PL")
+from building_blocks.application.examples import lazy_examples
 
 
 class SalesRepresentativeCreateModel(BaseCommandModel):
-    first_name: str = Field(examples=[faker.first_name()])
-    last_name: str = Field(examples=[faker.last_name()])
+    first_name: str = Field(json_schema_extra=lazy_examples(lambda faker: [faker.first_name()]))
+    last_name: str = Field(json_schema_extra=lazy_examples(lambda faker: [faker.last_name()]))
 
 
 class SalesRepresentativeUpdateModel(BaseCommandModel):
-    first_name: str | None = Field(default=None, examples=[faker.first_name()])
-    last_name: str | None = Field(default=None, examples=[faker.last_name()])
+    first_name: str | None = Field(default=None, json_schema_extra=lazy_examples(lambda faker: [faker.first_name()]))
+    last_name: str | None = Field(default=None, json_schema_extra=lazy_examples(lambda faker: [faker.last_name()]))
@@ -1,6 +1,7 @@
 from collections.abc import Iterable
 
 from building_blocks.application.exceptions import ObjectDoesNotExist
+from building_blocks.application.filters import get_lookup_ids
 from sales.application.sales_representative.query_model import SalesRepresentativeReadModel
 from sales.application.sales_representative.query_service import SalesRepresentativeQueryService
 
@@ -18,3 +19,7 @@ class SalesRepresentativeQueryUseCase:
     def get_all(self) -> Iterable[SalesRepresentativeReadModel]:
         representatives = self.sr_query_service.get_all()
         return representatives
+
+    def get_by_ids(self, ids: Iterable[str]) -> Iterable[SalesRepresentativeReadModel]:
+        representatives = self.sr_query_service.get_by_ids(get_lookup_ids(ids))
+        return representatives
@@ -10,3 +10,6 @@ class SalesRepresentativeQueryService(ABC):
 
     @abstractmethod
     def get_all(self) -> Sequence[SalesRepresentativeReadModel]: ...
+
+    @abstractmethod
+    def get_by_ids(self, ids: Sequence[str]) -> Sequence[SalesRepresentativeReadModel]: ...
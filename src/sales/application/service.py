@@ -16,6 +16,6 @@ class SalesRepresentativeExistsMixin:
 
     def _verify_that_salesman_exists(self, salesman_id: str) -> None:
         with self.salesman_uow as uow:
-            salesman = uow.repository.get(representative_id=salesman_id)
-        if salesman is None:
+            salesman_exists = uow.repository.exists(representative_id=salesman_id)
+        if not salesman_exists:
             raise InvalidData(f"Sales representative with id={salesman_id} does not exist")
@@ -17,6 +17,7 @@ from sales.domain.value_objects.note import Note
 @define(eq=False, kw_only=True)
 class Lead(AggregateRoot):
     id: str
+    version: int = 1
     contact_data: ContactData
     source: AcquisitionSource
     _customer_id: str = field(alias="customer_id")
@@ -60,6 +61,7 @@ class Lead(AggregateRoot):
         source: AcquisitionSource,
         assignments: LeadAssignments,
         notes: Notes,
+        version: int = 1,
     ) -> Self:
         lead = cls(
             id=id,
@@ -67,6 +69,7 @@ class Lead(AggregateRoot):
             source=source,
             customer_id=customer_id,
             created_by_salesman_id=created_by_salesman_id,
+            version=version,
         )
         lead._created_at = created_at
         lead._notes = notes
@@ -126,6 +129,13 @@ class Lead(AggregateRoot):
         self._assignments.change_assigned_salesman(new_salesman_id=new_salesman_id, requestor_id=requestor_id)
         return self
 
+    def apply_reassignment(self, reassignment: LeadAssignmentEntry) -> Self:
+        # bulk reassignments are authorized for all leads of the previous owner at once, so only ownership is checked
+        if self.assigned_salesman_id != reassignment.previous_owner_id:
+            raise UnauthorizedLeadOwnerChange
+        self._assignments.add(reassignment)
+        return self
+
     def change_note(self, new_content: str, editor_id: str) -> Self:
         if not self.has_assigned_salesman or (
             self.has_assigned_salesman and not editor_id == self.assigned_salesman_id
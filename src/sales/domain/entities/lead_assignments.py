@@ -42,6 +42,9 @@ class LeadAssignments(EntityWithoutId):
         )
         self._history = (*self._history, assignment)
 
+    def add(self, assignment: LeadAssignmentEntry) -> None:
+        self._history = (*self._history, assignment)
+
     def _create_lead_assignment(
         self, previous_salesman_id: str | None, new_salesman_id: str, requestor_id: str
     ) -> LeadAssignmentEntry:
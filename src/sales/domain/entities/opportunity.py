@@ -20,6 +20,7 @@ Offer = Iterable[OfferItem]
 @define(eq=False, kw_only=True)
 class Opportunity(AggregateRoot):
     id: str
+    version: int = 1
     source: AcquisitionSource
     stage: OpportunityStage
     priority: Priority
@@ -70,6 +71,7 @@ class Opportunity(AggregateRoot):
         priority: Priority,
         offer: Offer,
         notes: Notes,
+        version: int = 1,
     ) -> Self:
         opportunity = cls(
             id=id,
@@ -80,6 +82,7 @@ class Opportunity(AggregateRoot):
             stage=stage,
             priority=priority,
             offer=offer,
+            version=version,
         )
         opportunity._notes = notes
         opportunity._created_at = created_at
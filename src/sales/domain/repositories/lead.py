@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 
 from sales.domain.entities.lead import Lead
+from sales.domain.value_objects.lead_assignment_entry import LeadAssignmentEntry
 
 
 class LeadRepository(ABC):
@@ -10,8 +12,17 @@ class LeadRepository(ABC):
     @abstractmethod
     def get_by_customer(self, customer_id: str) -> Lead | None: ...
 
+    @abstractmethod
+    def get_customers_with_lead(self, customer_ids: Iterable[str]) -> set[str]: ...
+
     @abstractmethod
     def create(self, lead: Lead) -> None: ...
 
+    @abstractmethod
+    def create_many(self, leads: Iterable[Lead]) -> None: ...
+
     @abstractmethod
     def update(self, lead: Lead) -> None: ...
+
+    @abstractmethod
+    def reassign_leads(self, assignment: LeadAssignmentEntry) -> int: ...
@@ -11,6 +11,9 @@ class OpportunityRepository(ABC):
     @abstractmethod
     def get_all_by_customer(self, customer_id: str) -> Sequence[Opportunity]: ...
 
+    @abstractmethod
+    def has_open_opportunities(self, customer_id: str) -> bool: ...
+
     @abstractmethod
     def create(self, opportunity: Opportunity) -> None: ...
 
@@ -7,6 +7,9 @@ class SalesRepresentativeRepository(ABC):
     @abstractmethod
     def get(self, representative_id: str) -> SalesRepresentative | None: ...
 
+    @abstractmethod
+    def exists(self, representative_id: str) -> bool: ...
+
     @abstractmethod
     def create(self, representative: SalesRepresentative) -> None: ...
 
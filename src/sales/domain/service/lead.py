@@ -1,13 +1,20 @@
-from sales.domain.exceptions import CanCreateOnlyOneLeadPerCustomer, LeadCanBeCreatedOnlyForInitialCustomer
-from sales.domain.repositories.lead import LeadRepository
+from building_blocks.domain.utils.date import get_current_timestamp
+from sales.domain.exceptions import LeadAlreadyAssignedToSalesman, LeadCanBeCreatedOnlyForInitialCustomer
 from sales.domain.service.shared import SalesCustomerStatusName
-
-
-def ensure_one_lead_per_customer(lead_repo: LeadRepository, customer_id: str) -> None:
-    if lead_repo.get_by_customer(customer_id) is not None:
-        raise CanCreateOnlyOneLeadPerCustomer
+from sales.domain.value_objects.lead_assignment_entry import LeadAssignmentEntry
 
 
 def ensure_customer_has_initial_status(status: str) -> None:
     if status != SalesCustomerStatusName.INITIAL:
         raise LeadCanBeCreatedOnlyForInitialCustomer
+
+
+def create_leads_reassignment(current_salesman_id: str, new_salesman_id: str, requestor_id: str) -> LeadAssignmentEntry:
+    if current_salesman_id == new_salesman_id:
+        raise LeadAlreadyAssignedToSalesman
+    return LeadAssignmentEntry(
+        previous_owner_id=current_salesman_id,
+        new_owner_id=new_salesman_id,
+        assigned_by_id=requestor_id,
+        assigned_at=get_current_timestamp(),
+    )
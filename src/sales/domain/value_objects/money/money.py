@@ -7,6 +7,8 @@ from building_blocks.domain.value_object import ValueObject
 from sales.domain.exceptions import AmountMustBeGreaterThanZero
 from sales.domain.value_objects.money.currency import Currency
 
+CENT = Decimal("0.01")
+
 
 @define(frozen=True, kw_only=True)
 class Money(ValueObject):
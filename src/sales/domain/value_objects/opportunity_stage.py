@@ -8,6 +8,7 @@ from building_blocks.domain.value_object import ValueObject
 OpportunityStageName = Literal["qualification", "proposal", "negotiation", "closed-won", "closed-lost"]
 INITIAL_STAGE = "qualification"
 ALLOWED_OPPORTUNITY_STAGES = get_args(OpportunityStageName)
+CLOSED_STAGES = ("closed-won", "closed-lost")
 
 
 @define(frozen=True, kw_only=True)
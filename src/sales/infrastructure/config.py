@@ -0,0 +1,19 @@
+import os
+from collections.abc import Mapping
+from decimal import Decimal, InvalidOperation
+
+from sales.application.forecast.query import DEFAULT_STAGE_WEIGHTS
+
+
+def get_forecast_stage_weights() -> Mapping[str, Decimal]:
+    """Reads FORECAST_STAGE_WEIGHTS, e.g. `qualification=0.2,proposal=0.5`, on top of the default weights."""
+    weights = dict(DEFAULT_STAGE_WEIGHTS)
+    for entry in os.getenv("FORECAST_STAGE_WEIGHTS", "").split(","):
+        if not entry.strip():
+            continue
+        stage, _, weight = entry.partition("=")
+        try:
+            weights[stage.strip()] = Decimal(weight.strip())
+        except InvalidOperation as e:
+            raise ValueError(f'Invalid forecast stage weight "{entry}", expected "<stage>=<weight>"') from e
+    return weights
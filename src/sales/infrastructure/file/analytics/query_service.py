@@ -0,0 +1,66 @@
+from collections import defaultdict
+from collections.abc import Callable, Sequence
+from decimal import Decimal
+from pathlib import Path
+
+from building_blocks.infrastructure.file.io import get_read_db
+from sales.application.analytics.query_model import PipelineDimension, PipelineStatsReadModel
+from sales.application.analytics.query_service import PipelineAnalyticsQueryService
+from sales.domain.entities.opportunity import Opportunity
+from sales.domain.value_objects.money.money import CENT
+from sales.domain.value_objects.offer_item import OfferItem
+
+DimensionGetter = Callable[[Opportunity, OfferItem], str]
+
+DIMENSION_FIELDS: dict[PipelineDimension, str] = {
+    "stage": "stage",
+    "priority": "priority",
+    "owner": "owner_id",
+    "currency": "currency",
+}
+
+OFFER_ITEM_GETTERS: dict[PipelineDimension, DimensionGetter] = {
+    "stage": lambda opportunity, _: opportunity.stage.name,
+    "priority": lambda opportunity, _: opportunity.priority.level,
+    "owner": lambda opportunity, _: opportunity.owner_id,
+    "currency": lambda _, offer_item: offer_item.value.currency.iso_code,
+}
+
+MATERIALIZED_DIMENSIONS: tuple[PipelineDimension, ...] = ("stage", "owner", "currency")
+
+
+class PipelineAnalyticsFileQueryService(PipelineAnalyticsQueryService):
+    def __init__(self, opportunities_file_path: Path, pipeline_stats_file_path: Path) -> None:
+        self._file_path = opportunities_file_path
+        self._pipeline_stats_file_path = pipeline_stats_file_path
+
+    def get_pipeline_stats(self, group_by: Sequence[PipelineDimension]) -> Sequence[PipelineStatsReadModel]:
+        fields = [DIMENSION_FIELDS[dimension] for dimension in group_by]
+        if all(dimension in MATERIALIZED_DIMENSIONS for dimension in group_by):
+            with get_read_db(self._pipeline_stats_file_path) as db:
+                entries = [
+                    (tuple(getattr(entry, field) for field in fields), entry.total_amount, entry.items_count)
+                    for entry in db.values()
+                ]
+        else:
+            getters = [OFFER_ITEM_GETTERS[dimension] for dimension in group_by]
+            with get_read_db(self._file_path) as db:
+                entries = [
+                    (tuple(getter(opportunity, offer_item) for getter in getters), offer_item.value.amount, 1)
+                    for opportunity in db.values()
+                    for offer_item in opportunity.offer
+                ]
+
+        totals: defaultdict[tuple[str, ...], Decimal] = defaultdict(Decimal)
+        counts: defaultdict[tuple[str, ...], int] = defaultdict(int)
+        for key, amount, items_count in entries:
+            totals[key] += amount
+            counts[key] += items_count
+
+        stats = (
+            PipelineStatsReadModel(
+                **dict(zip(fields, key)), total_amount=totals[key].quantize(CENT), items_count=counts[key]
+            )
+            for key in sorted(totals)
+        )
+        return tuple(stats)
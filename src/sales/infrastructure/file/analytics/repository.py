@@ -0,0 +1,36 @@
+from decimal import Decimal
+
+from building_blocks.infrastructure.file.command import FileLikeDB
+from sales.application.analytics.pipeline_stats import PipelineStatsRepository, get_pipeline_contribution
+from sales.application.analytics.query_model import PipelineStatsReadModel
+
+
+def get_pipeline_stats_key(owner_id: str, stage: str, currency: str) -> str:
+    return f"{owner_id}:{stage}:{currency}"
+
+
+class PipelineStatsFileRepository(PipelineStatsRepository):
+    def __init__(self, db: FileLikeDB, opportunities_db: FileLikeDB) -> None:
+        self.db = db
+        self.opportunities_db = opportunities_db
+
+    def increment(self, owner_id: str, stage: str, currency: str, amount: Decimal, items_count: int) -> None:
+        key = get_pipeline_stats_key(owner_id=owner_id, stage=stage, currency=currency)
+        entry: PipelineStatsReadModel | None = self.db.get(key)
+        total_amount = amount + (entry.total_amount if entry else Decimal())
+        total_count = items_count + (entry.items_count if entry else 0)
+        if total_count <= 0:
+            self.db.pop(key, None)
+            return
+        self.db[key] = PipelineStatsReadModel(
+            owner_id=owner_id,
+            stage=stage,
+            currency=currency,
+            total_amount=total_amount,
+            items_count=total_count,
+        )
+
+    def rebuild(self) -> None:
+        self.db.clear()
+        for opportunity in self.opportunities_db.values():
+            self.apply(get_pipeline_contribution(opportunity))
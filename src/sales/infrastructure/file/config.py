@@ -3,6 +3,9 @@ from building_blocks.infrastructure.file.config import ROOT_FILES_PATH
 LEAD_PATH = ROOT_FILES_PATH / "leads"
 SALES_REPR_PATH = ROOT_FILES_PATH / "sales-representatives"
 OPPORTUNITIES_PATH = ROOT_FILES_PATH / "opportunities"
+PIPELINE_STATS_PATH = ROOT_FILES_PATH / "pipeline-stats"
+OPEN_OPPORTUNITIES_PATH = ROOT_FILES_PATH / "open-opportunities"
 
 PRODUCTS_PATH = ROOT_FILES_PATH / "products"
 CURRENCIES_PATH = ROOT_FILES_PATH / "currencies"
+EXCHANGE_RATES_PATH = ROOT_FILES_PATH / "exchange-rates"
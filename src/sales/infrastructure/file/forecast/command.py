@@ -0,0 +1,7 @@
+from building_blocks.infrastructure.file.command import BaseFileUnitOfWork
+from sales.application.forecast.command import ExchangeRateUnitOfWork
+from sales.infrastructure.file.forecast.repository import ExchangeRateFileRepository
+
+
+class ExchangeRateFileUnitOfWork(BaseFileUnitOfWork, ExchangeRateUnitOfWork):
+    RepositoryType = ExchangeRateFileRepository
@@ -0,0 +1,33 @@
+from collections import defaultdict
+from collections.abc import Sequence
+from decimal import Decimal
+from pathlib import Path
+
+from building_blocks.infrastructure.file.io import get_read_db
+from sales.application.forecast.query_model import ExchangeRateReadModel, MonthlyPipelineValueReadModel
+from sales.application.forecast.query_service import ForecastQueryService
+
+
+class ForecastFileQueryService(ForecastQueryService):
+    def __init__(self, opportunities_file_path: Path, exchange_rates_file_path: Path) -> None:
+        self._file_path = opportunities_file_path
+        self._exchange_rates_file_path = exchange_rates_file_path
+
+    def get_monthly_pipeline_values(self) -> Sequence[MonthlyPipelineValueReadModel]:
+        amounts: defaultdict[tuple[str, str, str, str], Decimal] = defaultdict(Decimal)
+        with get_read_db(self._file_path) as db:
+            for opportunity in db.values():
+                month = opportunity.created_at.strftime("%Y-%m")
+                for offer_item in opportunity.offer:
+                    key = (opportunity.owner_id, month, opportunity.stage_name, offer_item.value.currency.iso_code)
+                    amounts[key] += offer_item.value.amount
+        values = (
+            MonthlyPipelineValueReadModel(owner_id=owner_id, month=month, stage=stage, currency=currency, amount=amount)
+            for (owner_id, month, stage, currency), amount in amounts.items()
+        )
+        return tuple(values)
+
+    def get_exchange_rates(self) -> Sequence[ExchangeRateReadModel]:
+        with get_read_db(self._exchange_rates_file_path) as db:
+            rates = tuple(db[iso_code] for iso_code in sorted(db.keys()))
+        return rates
@@ -0,0 +1,14 @@
+from collections.abc import Sequence
+
+from building_blocks.infrastructure.file.command import FileLikeDB
+from sales.application.forecast.command import ExchangeRateRepository
+from sales.application.forecast.query_model import ExchangeRateReadModel
+
+
+class ExchangeRateFileRepository(ExchangeRateRepository):
+    def __init__(self, db: FileLikeDB) -> None:
+        self.db = db
+
+    def replace_all(self, rates: Sequence[ExchangeRateReadModel]) -> None:
+        self.db.clear()
+        self.db.update({rate.iso_code: rate for rate in rates})
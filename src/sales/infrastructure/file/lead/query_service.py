@@ -37,6 +37,11 @@ class LeadFileQueryService(LeadQueryService):
             leads = [LeadReadModel.from_domain(db.get(id)) for id in all_ids]
         return tuple(leads)
 
+    def get_by_ids(self, ids: Sequence[str]) -> Sequence[LeadReadModel]:
+        with get_read_db(self._file_path) as db:
+            leads = [LeadReadModel.from_domain(db[id]) for id in ids if id in db]
+        return tuple(leads)
+
     def get_filtered(self, filters: Iterable[FilterCondition]) -> Sequence[LeadReadModel]:
         with get_read_db(self._file_path) as db:
             all_ids = db.keys()
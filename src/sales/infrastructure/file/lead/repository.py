@@ -1,27 +1,66 @@
+from collections.abc import Iterable
+
 from building_blocks.infrastructure.exceptions import ObjectAlreadyExists
 from building_blocks.infrastructure.file.command import FileLikeDB
+from building_blocks.infrastructure.file.utils import compare_and_swap_version
 from sales.domain.entities.lead import Lead
+from sales.domain.exceptions import CanCreateOnlyOneLeadPerCustomer
 from sales.domain.repositories.lead import LeadRepository
+from sales.domain.value_objects.lead_assignment_entry import LeadAssignmentEntry
 
 
 class LeadFileRepository(LeadRepository):
     def __init__(self, db: FileLikeDB) -> None:
         self.db = db
+        self._customer_index: dict[str, str] | None = None
+
+    @property
+    def customer_index(self) -> dict[str, str]:
+        if self._customer_index is None:
+            self._customer_index = {lead.customer_id: lead.id for lead in self.db.values()}
+        return self._customer_index
 
     def get(self, lead_id: str) -> Lead | None:
         lead = self.db.get(lead_id)
         return lead
 
     def get_by_customer(self, customer_id: str) -> Lead | None:
-        for lead in self.db.values():
-            if lead.customer_id == customer_id:
-                return lead
-        return None
+        lead_id = self.customer_index.get(customer_id)
+        if lead_id is None:
+            return None
+        return self.db.get(lead_id)
+
+    def get_customers_with_lead(self, customer_ids: Iterable[str]) -> set[str]:
+        return {customer_id for customer_id in customer_ids if customer_id in self.customer_index}
 
     def create(self, lead: Lead) -> None:
         if lead.id in self.db:
             raise ObjectAlreadyExists(f"Lead with id={lead.id} already exists")
+        if lead.customer_id in self.customer_index:
+            raise CanCreateOnlyOneLeadPerCustomer
         self.db[lead.id] = lead
+        self.customer_index[lead.customer_id] = lead.id
+
+    def create_many(self, leads: Iterable[Lead]) -> None:
+        leads_by_id = {lead.id: lead for lead in leads}
+        if any(lead_id in self.db for lead_id in leads_by_id):
+            raise ObjectAlreadyExists("One of the given leads already exists")
+        leads_by_customer = {lead.customer_id: lead.id for lead in leads_by_id.values()}
+        if len(leads_by_customer) < len(leads_by_id) or any(
+            customer_id in self.customer_index for customer_id in leads_by_customer
+        ):
+            raise CanCreateOnlyOneLeadPerCustomer
+        self.db.update(leads_by_id)
+        self.customer_index.update(leads_by_customer)
 
     def update(self, lead: Lead) -> None:
+        compare_and_swap_version(db=self.db, aggregate=lead)
         self.db[lead.id] = lead
+
+    def reassign_leads(self, assignment: LeadAssignmentEntry) -> int:
+        leads = [lead for lead in self.db.values() if lead.assigned_salesman_id == assignment.previous_owner_id]
+        for lead in leads:
+            lead.apply_reassignment(assignment)
+            lead.version += 1
+            self.db[lead.id] = lead
+        return len(leads)
@@ -1,7 +1,118 @@
-from building_blocks.infrastructure.file.command import BaseFileUnitOfWork
+import dbm
+from contextlib import ExitStack
+from pathlib import Path
+
+from building_blocks.application.command import BaseUnitOfWork
+from building_blocks.application.tracing import traced_calls
+from building_blocks.infrastructure.exceptions import NoActiveTransaction, TransactionAlreadyActive
+from building_blocks.infrastructure.file.command import BaseFileUnitOfWork, FileLikeDB
+from building_blocks.infrastructure.file.io import get_read_db, get_write_db
 from sales.application.opportunity.command import OpportunityUnitOfWork
-from sales.infrastructure.file.opportunity.repository import OpportunityFileRepository
+from sales.infrastructure.file.analytics.repository import PipelineStatsFileRepository
+from sales.infrastructure.file.opportunity.repository import OpenOpportunitiesFileRepository, OpportunityFileRepository
 
 
 class OpportunityFileUnitOfWork(BaseFileUnitOfWork, OpportunityUnitOfWork):
     RepositoryType = OpportunityFileRepository
+
+    def __init__(self, file_path: Path, pipeline_stats_file_path: Path, open_opportunities_file_path: Path) -> None:
+        super().__init__(file_path)
+        self.pipeline_stats: PipelineStatsFileRepository | None = None
+        self.pipeline_stats_db_path = pipeline_stats_file_path
+        self._pipeline_stats_db: FileLikeDB | None = None
+        self._pipeline_stats_snapshot: dict | None = None
+        self.open_opportunities_db_path = open_opportunities_file_path
+        self._open_opportunities_db: FileLikeDB | None = None
+        self._open_opportunities_snapshot: dict | None = None
+
+    def begin(self) -> None:
+        super().begin()
+        self._pipeline_stats_db = get_write_db(self.pipeline_stats_db_path)
+        self._pipeline_stats_snapshot = dict(self._pipeline_stats_db)
+        self.pipeline_stats = traced_calls(
+            PipelineStatsFileRepository(self._pipeline_stats_db, opportunities_db=self._db)
+        )
+        # the index lives in its own shelf, so it is not rebuilt from all opportunities on every transaction
+        self._open_opportunities_db = get_write_db(self.open_opportunities_db_path)
+        self._open_opportunities_snapshot = dict(self._open_opportunities_db)
+        self.repository = traced_calls(
+            OpportunityFileRepository(self._db, open_opportunities_db=self._open_opportunities_db)
+        )
+
+    def commit(self) -> None:
+        super().commit()
+        if self._pipeline_stats_db is None or self._open_opportunities_db is None:
+            raise NoActiveTransaction("No active transaction to commit")
+        self._pipeline_stats_db.sync()
+        self._open_opportunities_db.sync()
+        self._close_pipeline_stats_db()
+        self._close_open_opportunities_db()
+
+    def rollback(self) -> None:
+        super().rollback()
+        if self._pipeline_stats_db is None or self._pipeline_stats_snapshot is None:
+            raise NoActiveTransaction("No active transaction to rollback")
+        if self._open_opportunities_db is None or self._open_opportunities_snapshot is None:
+            raise NoActiveTransaction("No active transaction to rollback")
+        self._pipeline_stats_db.clear()
+        self._pipeline_stats_db.update(self._pipeline_stats_snapshot)
+        self._open_opportunities_db.clear()
+        self._open_opportunities_db.update(self._open_opportunities_snapshot)
+        self._close_pipeline_stats_db()
+        self._close_open_opportunities_db()
+
+    def _close_pipeline_stats_db(self) -> None:
+        if self._pipeline_stats_db is not None:
+            self._pipeline_stats_db.close()
+        self._pipeline_stats_db = None
+        self._pipeline_stats_snapshot = None
+        self.pipeline_stats = None
+
+    def _close_open_opportunities_db(self) -> None:
+        if self._open_opportunities_db is not None:
+            self._open_opportunities_db.close()
+        self._open_opportunities_db = None
+        self._open_opportunities_snapshot = None
+
+
+class OpenOpportunitiesFileUnitOfWork(BaseUnitOfWork):
+    """Answers the open opportunities probe from the index shelf alone, opened read-only."""
+
+    def __init__(self, opportunity_uow: OpportunityFileUnitOfWork) -> None:
+        self.opportunity_uow = opportunity_uow
+        self.repository: OpenOpportunitiesFileRepository | None = None
+        self._exit_stack: ExitStack | None = None
+
+    def begin(self) -> None:
+        if self._exit_stack is not None:
+            raise TransactionAlreadyActive
+        exit_stack = ExitStack()
+        repository = self._open_repository(exit_stack)
+        if repository is None or not repository.is_index_built:
+            exit_stack.close()
+            # the index is missing only until the first write, so the write unit of work builds it once
+            with self.opportunity_uow as uow:
+                uow.repository.rebuild_open_opportunities_index()
+            repository = self._open_repository(exit_stack)
+        self._exit_stack = exit_stack
+        self.repository = traced_calls(repository)
+
+    def commit(self) -> None:
+        self._close("No active transaction to commit")
+
+    def rollback(self) -> None:
+        self._close("No active transaction to rollback")
+
+    def _open_repository(self, exit_stack: ExitStack) -> OpenOpportunitiesFileRepository | None:
+        try:
+            db = exit_stack.enter_context(get_read_db(self.opportunity_uow.open_opportunities_db_path))
+        except dbm.error:
+            return None
+        return OpenOpportunitiesFileRepository(db)
+
+    def _close(self, error_message: str) -> None:
+        if self._exit_stack is None:
+            raise NoActiveTransaction(error_message)
+        self._exit_stack.close()
+        self._exit_stack = None
+        self.repository = None
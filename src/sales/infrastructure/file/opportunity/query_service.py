@@ -34,6 +34,11 @@ class OpportunityFileQueryService(OpportunityQueryService):
             opportunities = [OpportunityReadModel.from_domain(db.get(id)) for id in all_ids]
         return tuple(opportunities)
 
+    def get_by_ids(self, ids: Sequence[str]) -> Sequence[OpportunityReadModel]:
+        with get_read_db(self._file_path) as db:
+            opportunities = [OpportunityReadModel.from_domain(db[id]) for id in ids if id in db]
+        return tuple(opportunities)
+
     def get_filtered(self, filters: Iterable[FilterCondition]) -> Sequence[OpportunityReadModel]:
         with get_read_db(self._file_path) as db:
             all_ids = db.keys()
@@ -1,14 +1,35 @@
-from collections.abc import Sequence
+from collections.abc import Mapping, MutableMapping, Sequence
 
 from building_blocks.infrastructure.exceptions import ObjectAlreadyExists
 from building_blocks.infrastructure.file.command import FileLikeDB
+from building_blocks.infrastructure.file.utils import compare_and_swap_version
 from sales.domain.entities.opportunity import Opportunity
 from sales.domain.repositories.opportunity import OpportunityRepository
+from sales.domain.value_objects.opportunity_stage import CLOSED_STAGES
+
+OpenOpportunitiesIndex = MutableMapping[str, set[str]]
+
+INDEX_BUILT_KEY = "__index_built__"
 
 
 class OpportunityFileRepository(OpportunityRepository):
-    def __init__(self, db: FileLikeDB) -> None:
+    def __init__(self, db: FileLikeDB, open_opportunities_db: OpenOpportunitiesIndex | None = None) -> None:
         self.db = db
+        self.open_opportunities_db: OpenOpportunitiesIndex = (
+            {} if open_opportunities_db is None else open_opportunities_db
+        )
+
+    @property
+    def open_opportunities_index(self) -> OpenOpportunitiesIndex:
+        if INDEX_BUILT_KEY not in self.open_opportunities_db:
+            self.rebuild_open_opportunities_index()
+        return self.open_opportunities_db
+
+    def rebuild_open_opportunities_index(self) -> None:
+        self.open_opportunities_db.clear()
+        for opportunity in self.db.values():
+            self._index_opportunity(opportunity, index=self.open_opportunities_db)
+        self.open_opportunities_db[INDEX_BUILT_KEY] = set()
 
     def get(self, opportunity_id: str) -> Opportunity | None:
         opportunity = self.db.get(opportunity_id)
@@ -18,10 +39,36 @@ class OpportunityFileRepository(OpportunityRepository):
         opportunities = tuple(opportunity for opportunity in self.db.values() if opportunity.customer_id == customer_id)
         return opportunities
 
+    def has_open_opportunities(self, customer_id: str) -> bool:
+        return bool(self.open_opportunities_index.get(customer_id))
+
     def create(self, opportunity: Opportunity) -> None:
         if opportunity.id in self.db:
             raise ObjectAlreadyExists(f"Opportunity with id={opportunity.id} already exists")
         self.db[opportunity.id] = opportunity
+        self._index_opportunity(opportunity, index=self.open_opportunities_index)
 
     def update(self, opportunity: Opportunity) -> None:
+        compare_and_swap_version(db=self.db, aggregate=opportunity)
         self.db[opportunity.id] = opportunity
+        self._index_opportunity(opportunity, index=self.open_opportunities_index)
+
+    def _index_opportunity(self, opportunity: Opportunity, index: OpenOpportunitiesIndex) -> None:
+        open_opportunities = set(index.get(opportunity.customer_id, ()))
+        if opportunity.stage_name in CLOSED_STAGES:
+            open_opportunities.discard(opportunity.id)
+        else:
+            open_opportunities.add(opportunity.id)
+        index[opportunity.customer_id] = open_opportunities
+
+
+class OpenOpportunitiesFileRepository:
+    def __init__(self, open_opportunities_db: Mapping[str, set[str]]) -> None:
+        self.open_opportunities_db = open_opportunities_db
+
+    @property
+    def is_index_built(self) -> bool:
+        return INDEX_BUILT_KEY in self.open_opportunities_db
+
+    def has_open_opportunities(self, customer_id: str) -> bool:
+        return bool(self.open_opportunities_db.get(customer_id))
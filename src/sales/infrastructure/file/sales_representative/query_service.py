@@ -30,3 +30,8 @@ class SalesRepresentativeFileQueryService(SalesRepresentativeQueryService):
             all_ids = db.keys()
             representatives = [SalesRepresentativeReadModel.from_domain(db.get(id)) for id in all_ids]
         return tuple(representatives)
+
+    def get_by_ids(self, ids: Sequence[str]) -> Sequence[SalesRepresentativeReadModel]:
+        with get_read_db(self._file_path) as db:
+            representatives = [SalesRepresentativeReadModel.from_domain(db[id]) for id in ids if id in db]
+        return tuple(representatives)
@@ -12,6 +12,9 @@ class SalesRepresentativeFileRepository(SalesRepresentativeRepository):
         representative = self.db.get(representative_id)
         return representative
 
+    def exists(self, representative_id: str) -> bool:
+        return representative_id in self.db
+
     def create(self, representative: SalesRepresentative) -> None:
         if representative.id in self.db:
             raise ObjectAlreadyExists(f"Sales representative with id={representative.id} already exists")
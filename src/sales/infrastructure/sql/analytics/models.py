@@ -0,0 +1,16 @@
+from decimal import Decimal
+
+from sqlalchemy.orm import Mapped, mapped_column
+
+from building_blocks.infrastructure.sql.db import Base
+
+
+class PipelineStatsModel(Base):
+    __tablename__ = "pipeline_stats"
+
+    owner_id: Mapped[str] = mapped_column(primary_key=True)
+    stage_name: Mapped[str] = mapped_column(primary_key=True)
+    currency_iso_code: Mapped[str] = mapped_column(primary_key=True)
+
+    total_amount: Mapped[Decimal] = mapped_column(nullable=False)
+    items_count: Mapped[int] = mapped_column(nullable=False)
@@ -0,0 +1,81 @@
+from collections.abc import Sequence
+from decimal import Decimal
+
+from sqlalchemy import Select, func, select
+from sqlalchemy.orm import InstrumentedAttribute
+
+from building_blocks.infrastructure.sql.db import SessionFactory
+from sales.application.analytics.query_model import PipelineDimension, PipelineStatsReadModel
+from sales.application.analytics.query_service import PipelineAnalyticsQueryService
+from sales.domain.value_objects.money.money import CENT
+from sales.infrastructure.sql.analytics.models import PipelineStatsModel
+from sales.infrastructure.sql.opportunity.models import CurrencyModel, OfferItemModel, OpportunityModel
+
+DIMENSION_FIELDS: dict[PipelineDimension, str] = {
+    "stage": "stage",
+    "priority": "priority",
+    "owner": "owner_id",
+    "currency": "currency",
+}
+
+OFFER_ITEM_COLUMNS: dict[PipelineDimension, InstrumentedAttribute[str]] = {
+    "stage": OpportunityModel.stage_name,
+    "priority": OpportunityModel.priority_level,
+    "owner": OpportunityModel.owner_id,
+    "currency": CurrencyModel.iso_code,
+}
+
+PIPELINE_STATS_COLUMNS: dict[PipelineDimension, InstrumentedAttribute[str]] = {
+    "stage": PipelineStatsModel.stage_name,
+    "owner": PipelineStatsModel.owner_id,
+    "currency": PipelineStatsModel.currency_iso_code,
+}
+
+
+class PipelineAnalyticsSQLQueryService(PipelineAnalyticsQueryService):
+    def __init__(self, session_factory: SessionFactory) -> None:
+        self._session_factory = session_factory
+
+    def get_pipeline_stats(self, group_by: Sequence[PipelineDimension]) -> Sequence[PipelineStatsReadModel]:
+        if all(dimension in PIPELINE_STATS_COLUMNS for dimension in group_by):
+            query = self._get_materialized_stats_query(group_by)
+        else:
+            query = self._get_offer_items_stats_query(group_by)
+
+        with self._session_factory() as db:
+            rows = db.execute(query).all()
+
+        fields = [DIMENSION_FIELDS[dimension] for dimension in group_by]
+        stats = []
+        for *values, total_amount, items_count in rows:
+            if not items_count:
+                continue
+            stats.append(
+                PipelineStatsReadModel(
+                    **dict(zip(fields, values)),
+                    total_amount=Decimal(str(total_amount)).quantize(CENT),
+                    items_count=items_count,
+                )
+            )
+        return tuple(stats)
+
+    def _get_materialized_stats_query(self, group_by: Sequence[PipelineDimension]) -> Select:
+        columns = [PIPELINE_STATS_COLUMNS[dimension] for dimension in group_by]
+        query = (
+            select(*columns, func.sum(PipelineStatsModel.total_amount), func.sum(PipelineStatsModel.items_count))
+            .group_by(*columns)
+            .order_by(*columns)
+        )
+        return query
+
+    def _get_offer_items_stats_query(self, group_by: Sequence[PipelineDimension]) -> Select:
+        columns = [OFFER_ITEM_COLUMNS[dimension] for dimension in group_by]
+        query = (
+            select(*columns, func.sum(OfferItemModel.amount), func.count())
+            .select_from(OfferItemModel)
+            .join(OpportunityModel, OpportunityModel.id == OfferItemModel.opportunity_id)
+        )
+        if "currency" in group_by:
+            query = query.join(CurrencyModel, CurrencyModel.id == OfferItemModel.currency_id)
+        query = query.group_by(*columns).order_by(*columns)
+        return query
@@ -0,0 +1,52 @@
+from decimal import Decimal
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from sales.application.analytics.pipeline_stats import PipelineStatsRepository
+from sales.infrastructure.sql.analytics.models import PipelineStatsModel
+from sales.infrastructure.sql.opportunity.models import CurrencyModel, OfferItemModel, OpportunityModel
+
+
+class PipelineStatsSQLRepository(PipelineStatsRepository):
+    def __init__(self, db: Session) -> None:
+        self.db = db
+
+    def increment(self, owner_id: str, stage: str, currency: str, amount: Decimal, items_count: int) -> None:
+        entry = self.db.get(PipelineStatsModel, (owner_id, stage, currency))
+        if entry is None and items_count > 0:
+            entry = PipelineStatsModel(
+                owner_id=owner_id,
+                stage_name=stage,
+                currency_iso_code=currency,
+                total_amount=amount,
+                items_count=items_count,
+            )
+            self.db.add(entry)
+        elif entry is not None and entry.items_count + items_count > 0:
+            entry.total_amount += amount
+            entry.items_count += items_count
+        elif entry is not None:
+            self.db.delete(entry)
+        self.db.flush()
+
+    def rebuild(self) -> None:
+        aggregate = (
+            select(
+                OpportunityModel.owner_id,
+                OpportunityModel.stage_name,
+                CurrencyModel.iso_code,
+                func.sum(OfferItemModel.amount),
+                func.count(),
+            )
+            .select_from(OfferItemModel)
+            .join(OpportunityModel, OpportunityModel.id == OfferItemModel.opportunity_id)
+            .join(CurrencyModel, CurrencyModel.id == OfferItemModel.currency_id)
+            .group_by(OpportunityModel.owner_id, OpportunityModel.stage_name, CurrencyModel.iso_code)
+        )
+        self.db.execute(delete(PipelineStatsModel))
+        self.db.execute(
+            insert(PipelineStatsModel).from_select(
+                ["owner_id", "stage_name", "currency_iso_code", "total_amount", "items_count"], aggregate
+            )
+        )
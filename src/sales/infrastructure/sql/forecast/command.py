@@ -0,0 +1,7 @@
+from building_blocks.infrastructure.sql.command import BaseSQLUnitOfWork
+from sales.application.forecast.command import ExchangeRateUnitOfWork
+from sales.infrastructure.sql.forecast.repository import ExchangeRateSQLRepository
+
+
+class ExchangeRateSQLUnitOfWork(BaseSQLUnitOfWork, ExchangeRateUnitOfWork):
+    RepositoryType = ExchangeRateSQLRepository
@@ -0,0 +1,13 @@
+from decimal import Decimal
+
+from sqlalchemy import String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from building_blocks.infrastructure.sql.db import Base
+
+
+class ExchangeRateModel(Base):
+    __tablename__ = "exchange_rate"
+
+    iso_code: Mapped[str] = mapped_column(String(3), primary_key=True)
+    rate: Mapped[Decimal] = mapped_column(nullable=False)
@@ -0,0 +1,46 @@
+from collections.abc import Sequence
+from decimal import Decimal
+
+from sqlalchemy import extract, func, select
+
+from building_blocks.infrastructure.sql.db import SessionFactory
+from sales.application.forecast.query_model import ExchangeRateReadModel, MonthlyPipelineValueReadModel
+from sales.application.forecast.query_service import ForecastQueryService
+from sales.infrastructure.sql.forecast.models import ExchangeRateModel
+from sales.infrastructure.sql.opportunity.models import CurrencyModel, OfferItemModel, OpportunityModel
+
+
+class ForecastSQLQueryService(ForecastQueryService):
+    def __init__(self, session_factory: SessionFactory) -> None:
+        self._session_factory = session_factory
+
+    def get_monthly_pipeline_values(self) -> Sequence[MonthlyPipelineValueReadModel]:
+        year = extract("year", OpportunityModel.created_at)
+        month = extract("month", OpportunityModel.created_at)
+        group_by = (OpportunityModel.owner_id, year, month, OpportunityModel.stage_name, CurrencyModel.iso_code)
+        query = (
+            select(*group_by, func.sum(OfferItemModel.amount))
+            .select_from(OfferItemModel)
+            .join(OpportunityModel, OpportunityModel.id == OfferItemModel.opportunity_id)
+            .join(CurrencyModel, CurrencyModel.id == OfferItemModel.currency_id)
+            .group_by(*group_by)
+        )
+        with self._session_factory() as db:
+            rows = db.execute(query).all()
+        values = (
+            MonthlyPipelineValueReadModel(
+                owner_id=owner_id,
+                month=f"{year:04d}-{month:02d}",
+                stage=stage,
+                currency=currency,
+                amount=Decimal(str(amount)),
+            )
+            for owner_id, year, month, stage, currency, amount in rows
+        )
+        return tuple(values)
+
+    def get_exchange_rates(self) -> Sequence[ExchangeRateReadModel]:
+        query = select(ExchangeRateModel).order_by(ExchangeRateModel.iso_code)
+        with self._session_factory() as db:
+            rates = tuple(ExchangeRateReadModel(iso_code=rate.iso_code, rate=rate.rate) for rate in db.scalars(query))
+        return rates
@@ -0,0 +1,18 @@
+from collections.abc import Sequence
+
+from sqlalchemy import delete
+from sqlalchemy.orm import Session
+
+from sales.application.forecast.command import ExchangeRateRepository
+from sales.application.forecast.query_model import ExchangeRateReadModel
+from sales.infrastructure.sql.forecast.models import ExchangeRateModel
+
+
+class ExchangeRateSQLRepository(ExchangeRateRepository):
+    def __init__(self, db: Session) -> None:
+        self.db = db
+
+    def replace_all(self, rates: Sequence[ExchangeRateReadModel]) -> None:
+        self.db.execute(delete(ExchangeRateModel))
+        self.db.add_all(ExchangeRateModel(iso_code=rate.iso_code, rate=rate.rate) for rate in rates)
+        self.db.flush()
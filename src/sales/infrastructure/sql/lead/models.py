@@ -69,7 +69,7 @@ class LeadModel(Base[Lead]):
     __tablename__ = "lead"
 
     id: Mapped[str] = mapped_column(primary_key=True, index=True)
-    customer_id: Mapped[str] = mapped_column(nullable=False, index=True)
+    customer_id: Mapped[str] = mapped_column(nullable=False, index=True, unique=True)
     created_by_id: Mapped[str] = mapped_column(nullable=False, index=True)
 
     created_at: Mapped[dt.datetime] = mapped_column(nullable=False)
@@ -78,6 +78,7 @@ class LeadModel(Base[Lead]):
     contact_data_last_name: Mapped[str] = mapped_column(nullable=False)
     contact_data_phone: Mapped[Optional[str]]
     contact_data_email: Mapped[Optional[str]]
+    version: Mapped[int] = mapped_column(nullable=False, default=1, server_default="1")
 
     notes: Mapped[list["LeadNoteModel"]] = relationship(back_populates="lead")
     assignments: Mapped[list["LeadAssignmentEntryModel"]] = relationship(back_populates="lead")
@@ -129,6 +130,7 @@ class LeadModel(Base[Lead]):
             source=source,
             assignments=assignments,
             notes=notes,
+            version=self.version,
         )
 
     @classmethod
@@ -143,4 +145,5 @@ class LeadModel(Base[Lead]):
             contact_data_last_name=entity.contact_data.last_name,
             contact_data_phone=entity.contact_data.phone,
             contact_data_email=entity.contact_data.email,
+            version=entity.version,
         )
@@ -1,6 +1,7 @@
 from collections.abc import Iterable, Sequence
 
 from sqlalchemy import select
+from sqlalchemy.orm import selectinload
 
 from building_blocks.application.filters import FilterCondition
 from building_blocks.infrastructure.sql.db import SessionFactory
@@ -42,6 +43,16 @@ class LeadSQLQueryService(LeadQueryService):
             leads = tuple(lead.to_domain() for lead in db.scalars(query))
         return tuple(LeadReadModel.from_domain(lead) for lead in leads)
 
+    def get_by_ids(self, ids: Sequence[str]) -> Sequence[LeadReadModel]:
+        query = (
+            select(LeadModel)
+            .where(LeadModel.id.in_(ids))
+            .options(selectinload(LeadModel.notes), selectinload(LeadModel.assignments))
+        )
+        with self._session_factory() as db:
+            leads = tuple(lead.to_domain() for lead in db.scalars(query))
+        return tuple(LeadReadModel.from_domain(lead) for lead in leads)
+
     def get_filtered(self, filters: Iterable[FilterCondition]) -> Sequence[LeadReadModel]:
         base_query = select(LeadModel)
         query = self._filter_service.get_query_with_filters(
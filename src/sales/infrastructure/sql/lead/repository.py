@@ -1,18 +1,25 @@
 from collections.abc import Iterable
-from typing import Callable
+from typing import Callable, cast
 
-from sqlalchemy import select
+from sqlalchemy import CursorResult, insert, literal, select, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from building_blocks.infrastructure.exceptions import ObjectAlreadyExists
+from building_blocks.infrastructure.sql.utils import compare_and_swap_version, get_column_values
 from sales.domain.entities.lead import Lead
 from sales.domain.entities.lead_assignments import AssignmentHistory
 from sales.domain.entities.notes import NotesHistory
+from sales.domain.exceptions import CanCreateOnlyOneLeadPerCustomer
 from sales.domain.repositories.lead import LeadRepository
+from sales.domain.value_objects.lead_assignment_entry import LeadAssignmentEntry
 from sales.infrastructure.sql.lead.models import LeadAssignmentEntryModel, LeadModel, LeadNoteModel
 
 
+def is_customer_id_violation(error: IntegrityError) -> bool:
+    return LeadModel.customer_id.key in str(error.orig)
+
+
 def create_comparable_note_entry(note: LeadNoteModel) -> Iterable:
     return (note.lead_id, note.created_by_id, note.content)
 
@@ -41,21 +48,59 @@ class LeadSQLRepository(LeadRepository):
             return None
         return lead.to_domain()
 
+    def get_customers_with_lead(self, customer_ids: Iterable[str]) -> set[str]:
+        query = select(LeadModel.customer_id).where(LeadModel.customer_id.in_(customer_ids))
+        return set(self.db.scalars(query).all())
+
     def create(self, lead: Lead) -> None:
         lead_in_db = LeadModel.from_domain(lead)
         try:
             self.db.add(lead_in_db)
             self.db.flush()
         except IntegrityError as e:
+            if is_customer_id_violation(e):
+                raise CanCreateOnlyOneLeadPerCustomer from e
             raise ObjectAlreadyExists(f"Lead with id={lead.id} already exists") from e
 
+    def create_many(self, leads: Iterable[Lead]) -> None:
+        rows = [get_column_values(LeadModel.from_domain(lead)) for lead in leads]
+        if not rows:
+            return
+        try:
+            self.db.execute(insert(LeadModel), rows)
+        except IntegrityError as e:
+            if is_customer_id_violation(e):
+                raise CanCreateOnlyOneLeadPerCustomer from e
+            raise ObjectAlreadyExists("One of the given leads already exists") from e
+
     def update(self, lead: Lead) -> None:
+        compare_and_swap_version(db=self.db, model=LeadModel, aggregate=lead)
         updated_lead = LeadModel.from_domain(lead)
         self.db.merge(updated_lead)
 
         self._update_lead_assignments_if_changed(assignment_history=lead.assignment_history, lead_id=lead.id)
         self._update_notes_if_changed(notes_history=lead.notes_history, lead_id=lead.id)
 
+    def reassign_leads(self, assignment: LeadAssignmentEntry) -> int:
+        # Lead.apply_reassignment done in bulk: the entry is appended to every lead the previous owner holds
+        owned_leads = select(
+            LeadModel.id,
+            literal(assignment.previous_owner_id),
+            literal(assignment.new_owner_id),
+            literal(assignment.assigned_by_id),
+            literal(assignment.assigned_at),
+        ).where(LeadModel.assigned_salesman_id == assignment.previous_owner_id)
+        self.db.execute(
+            update(LeadModel)
+            .where(LeadModel.id.in_(owned_leads.with_only_columns(LeadModel.id)))
+            .values(version=LeadModel.version + 1)
+        )
+        query = insert(LeadAssignmentEntryModel).from_select(
+            ["lead_id", "previous_owner_id", "new_owner_id", "assigned_by_id", "assigned_at"], owned_leads
+        )
+        result = cast(CursorResult, self.db.execute(query))
+        return result.rowcount
+
     def _update_if_changed[
         EntityModelT
     ](
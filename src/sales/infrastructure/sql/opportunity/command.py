@@ -1,7 +1,20 @@
-from building_blocks.infrastructure.sql.command import BaseSQLUnitOfWork
+from sqlalchemy.orm import Session
+
+from building_blocks.application.tracing import traced_calls
+from building_blocks.infrastructure.sql.command import BaseSQLUnitOfWork, ContextLocal
 from sales.application.opportunity.command import OpportunityUnitOfWork
+from sales.infrastructure.sql.analytics.repository import PipelineStatsSQLRepository
 from sales.infrastructure.sql.opportunity.repository import OpportunitySQLRepository
 
 
 class OpportunitySQLUnitOfWork(BaseSQLUnitOfWork, OpportunityUnitOfWork):
     RepositoryType = OpportunitySQLRepository
+    pipeline_stats = ContextLocal[PipelineStatsSQLRepository]()
+
+    def _create_repositories(self, session: Session) -> None:
+        super()._create_repositories(session)
+        self.pipeline_stats = traced_calls(PipelineStatsSQLRepository(session))
+
+    def _end_session(self) -> None:
+        super()._end_session()
+        self.pipeline_stats = None
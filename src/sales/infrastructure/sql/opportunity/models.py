@@ -3,7 +3,7 @@ from decimal import Decimal
 from types import SimpleNamespace
 from typing import Any, Self
 
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index, String
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -107,6 +107,7 @@ class OpportunityNoteModel(BaseNoteModel):
 
 class OpportunityModel(Base[Opportunity]):
     __tablename__ = "opportunity"
+    __table_args__ = (Index("ix_opportunity_customer_id_stage_name", "customer_id", "stage_name"),)
 
     id: Mapped[str] = mapped_column(primary_key=True, index=True)
     created_by_id: Mapped[str] = mapped_column(nullable=False)
@@ -117,6 +118,7 @@ class OpportunityModel(Base[Opportunity]):
     source_name: Mapped[str] = mapped_column(nullable=False)
     stage_name: Mapped[str] = mapped_column(nullable=False)
     priority_level: Mapped[str] = mapped_column(nullable=False)
+    version: Mapped[int] = mapped_column(nullable=False, default=1, server_default="1")
 
     notes: Mapped[list["OpportunityNoteModel"]] = relationship(back_populates="opportunity")
     offer_items: Mapped[list["OfferItemModel"]] = relationship(
@@ -149,6 +151,7 @@ class OpportunityModel(Base[Opportunity]):
             priority=priority,
             offer=offer,
             notes=notes,
+            version=self.version,
         )
 
     @classmethod
@@ -162,4 +165,5 @@ class OpportunityModel(Base[Opportunity]):
             source_name=entity.source.name,
             stage_name=entity.stage.name,
             priority_level=entity.priority.level,
+            version=entity.version,
         )
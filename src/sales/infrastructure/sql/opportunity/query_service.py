@@ -1,6 +1,7 @@
 from collections.abc import Iterable, Sequence
 
 from sqlalchemy import select
+from sqlalchemy.orm import joinedload, selectinload
 
 from building_blocks.application.filters import FilterCondition
 from building_blocks.infrastructure.sql.db import SessionFactory
@@ -42,6 +43,22 @@ class OpportunitySQLQueryService(OpportunityQueryService):
             opportunities = tuple(opportunity.to_domain() for opportunity in db.scalars(query))
         return tuple(OpportunityReadModel.from_domain(opportunity) for opportunity in opportunities)
 
+    def get_by_ids(self, ids: Sequence[str]) -> Sequence[OpportunityReadModel]:
+        query = (
+            select(OpportunityModel)
+            .where(OpportunityModel.id.in_(ids))
+            .options(
+                selectinload(OpportunityModel.notes),
+                selectinload(OpportunityModel.offer_items).options(
+                    joinedload(OfferItemModel.product),
+                    joinedload(OfferItemModel.currency),
+                ),
+            )
+        )
+        with self._session_factory() as db:
+            opportunities = tuple(opportunity.to_domain() for opportunity in db.scalars(query))
+        return tuple(OpportunityReadModel.from_domain(opportunity) for opportunity in opportunities)
+
     def get_filtered(self, filters: Iterable[FilterCondition]) -> Sequence[OpportunityReadModel]:
         base_query = select(OpportunityModel)
         query = self._filter_service.get_query_with_filters(
@@ -1,15 +1,17 @@
 from collections.abc import Iterable
 from typing import Sequence
 
-from sqlalchemy import select
+from sqlalchemy import exists, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from building_blocks.application.exceptions import InvalidData
 from building_blocks.infrastructure.exceptions import ObjectAlreadyExists
+from building_blocks.infrastructure.sql.utils import compare_and_swap_version
 from sales.domain.entities.notes import NotesHistory
 from sales.domain.entities.opportunity import Offer, Opportunity
 from sales.domain.repositories.opportunity import OpportunityRepository
+from sales.domain.value_objects.opportunity_stage import CLOSED_STAGES
 from sales.infrastructure.sql.opportunity.models import (
     CurrencyModel,
     OfferItemModel,
@@ -48,6 +50,12 @@ class OpportunitySQLRepository(OpportunityRepository):
         opportunities = tuple(self.db.scalars(query))
         return opportunities
 
+    def has_open_opportunities(self, customer_id: str) -> bool:
+        open_opportunities = exists().where(
+            OpportunityModel.customer_id == customer_id, OpportunityModel.stage_name.not_in(CLOSED_STAGES)
+        )
+        return bool(self.db.scalar(select(open_opportunities)))
+
     def create(self, opportunity: Opportunity) -> None:
         opportunity_in_db = OpportunityModel.from_domain(opportunity)
         offer_items_in_db = self._create_offer_items(opportunity.offer, opportunity_id=opportunity.id)
@@ -58,6 +66,7 @@ class OpportunitySQLRepository(OpportunityRepository):
             raise ObjectAlreadyExists(f"Opportunity with id={opportunity.id} already exists") from e
 
     def update(self, opportunity: Opportunity) -> None:
+        compare_and_swap_version(db=self.db, model=OpportunityModel, aggregate=opportunity)
         updated_opportunity = OpportunityModel.from_domain(opportunity)
         self.db.merge(updated_opportunity)
 
@@ -32,3 +32,9 @@ class SalesRepresentativeSQLQueryService(SalesRepresentativeQueryService):
         with self._session_factory() as db:
             representatives = tuple(representative.to_domain() for representative in db.scalars(query))
         return tuple(SalesRepresentativeReadModel.from_domain(representative) for representative in representatives)
+
+    def get_by_ids(self, ids: Sequence[str]) -> Sequence[SalesRepresentativeReadModel]:
+        query = select(SalesRepresentativeModel).where(SalesRepresentativeModel.id.in_(ids))
+        with self._session_factory() as db:
+            representatives = tuple(representative.to_domain() for representative in db.scalars(query))
+        return tuple(SalesRepresentativeReadModel.from_domain(representative) for representative in representatives)
@@ -1,4 +1,4 @@
-from sqlalchemy import select
+from sqlalchemy import literal, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
@@ -19,6 +19,10 @@ class SalesRepresentativeSQLRepository(SalesRepresentativeRepository):
             return None
         return representative.to_domain()
 
+    def exists(self, representative_id: str) -> bool:
+        query = select(literal(1)).where(SalesRepresentativeModel.id == representative_id)
+        return self.db.scalar(query) is not None
+
     def create(self, representative: SalesRepresentative) -> None:
         representative_in_db = SalesRepresentativeModel.from_domain(representative)
         try:
@@ -4,6 +4,10 @@ from fastapi import Request
 
 from authentication.infrastructure.service.base import AuthenticationService
 from building_blocks.infrastructure.vo_service import ValueObjectService
+from sales.application.analytics.command import PipelineStatsCommandUseCase
+from sales.application.analytics.query import PipelineAnalyticsQueryUseCase
+from sales.application.forecast.command import ExchangeRateCommandUseCase
+from sales.application.forecast.query import ForecastQueryUseCase
 from sales.application.lead.command import LeadCommandUseCase
 from sales.application.lead.query import LeadQueryUseCase
 from sales.application.opportunity.command import OpportunityCommandUseCase
@@ -22,6 +26,12 @@ class SalesApplicationContainer(Protocol):
     opportunity_command_use_case: OpportunityCommandUseCase
     opportunity_query_use_case: OpportunityQueryUseCase
 
+    pipeline_analytics_query_use_case: PipelineAnalyticsQueryUseCase
+    pipeline_stats_command_use_case: PipelineStatsCommandUseCase
+
+    forecast_query_use_case: ForecastQueryUseCase
+    exchange_rate_command_use_case: ExchangeRateCommandUseCase
+
     auth_service: AuthenticationService
 
     currency_vo_service: ValueObjectService
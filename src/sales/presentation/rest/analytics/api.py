@@ -0,0 +1,51 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query, Request, status
+
+from authentication.presentation.rest.deps import get_current_user, is_admin
+from building_blocks.presentation.responses import BasicErrorResponse
+from sales.application.analytics.command import PipelineStatsCommandUseCase
+from sales.application.analytics.query import PipelineAnalyticsQueryUseCase
+from sales.application.analytics.query_model import PipelineDimension, PipelineStatsReadModel
+from sales.presentation.container import get_container
+
+router = APIRouter(prefix="/analytics", tags=["analytics"], dependencies=[Depends(get_current_user)])
+
+
+def get_analytics_query_use_case(request: Request) -> PipelineAnalyticsQueryUseCase:
+    container = get_container(request)
+    return container.pipeline_analytics_query_use_case
+
+
+def get_pipeline_stats_command_use_case(request: Request) -> PipelineStatsCommandUseCase:
+    container = get_container(request)
+    return container.pipeline_stats_command_use_case
+
+
+@router.get("/pipeline", response_model=list[PipelineStatsReadModel])
+def get_pipeline_stats(
+    analytics_query_use_case: Annotated[PipelineAnalyticsQueryUseCase, Depends(get_analytics_query_use_case)],
+    group_by: Annotated[list[PipelineDimension] | None, Query()] = None,
+) -> None:
+    stats = analytics_query_use_case.get_pipeline_stats(group_by=group_by or [])
+    return stats
+
+
+@router.post(
+    "/pipeline/rebuild",
+    response_model=list[PipelineStatsReadModel],
+    dependencies=[Depends(is_admin)],
+    responses={
+        status.HTTP_403_FORBIDDEN: {"model": BasicErrorResponse},
+    },
+)
+def rebuild_pipeline_stats(
+    pipeline_stats_command_use_case: Annotated[
+        PipelineStatsCommandUseCase, Depends(get_pipeline_stats_command_use_case)
+    ],
+    analytics_query_use_case: Annotated[PipelineAnalyticsQueryUseCase, Depends(get_analytics_query_use_case)],
+) -> None:
+    """For admins only."""
+    pipeline_stats_command_use_case.rebuild()
+    stats = analytics_query_use_case.get_pipeline_stats(group_by=["owner", "stage", "currency"])
+    return stats
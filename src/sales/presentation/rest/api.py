@@ -1,6 +1,8 @@
 from fastapi import APIRouter, status
 
 from building_blocks.presentation.responses import BasicErrorResponse
+from sales.presentation.rest.analytics.api import router as analytics_router
+from sales.presentation.rest.forecast.api import router as forecast_router
 from sales.presentation.rest.lead.api import router as lead_router
 from sales.presentation.rest.opportunity.api import router as opportunity_router
 from sales.presentation.rest.sales_representative.api import router as sr_router
@@ -11,3 +13,5 @@ router.include_router(lead_router)
 router.include_router(opportunity_router)
 router.include_router(sr_router)
 router.include_router(vo_router)
+router.include_router(analytics_router)
+router.include_router(forecast_router)
@@ -0,0 +1,68 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+
+from authentication.presentation.rest.deps import get_current_user, is_admin
+from building_blocks.application.exceptions import InvalidData
+from building_blocks.presentation.responses import BasicErrorResponse, UnprocessableEntityResponse
+from sales.application.forecast.command import ExchangeRateCommandUseCase
+from sales.application.forecast.command_model import ExchangeRateCreateUpdateModel
+from sales.application.forecast.query import ForecastQueryUseCase
+from sales.application.forecast.query_model import ExchangeRateReadModel, ForecastReadModel
+from sales.presentation.container import get_container
+
+router = APIRouter(prefix="/forecast", tags=["forecast"], dependencies=[Depends(get_current_user)])
+
+
+def get_forecast_query_use_case(request: Request) -> ForecastQueryUseCase:
+    container = get_container(request)
+    return container.forecast_query_use_case
+
+
+def get_exchange_rate_command_use_case(request: Request) -> ExchangeRateCommandUseCase:
+    container = get_container(request)
+    return container.exchange_rate_command_use_case
+
+
+@router.get(
+    "/",
+    response_model=list[ForecastReadModel],
+    responses={
+        status.HTTP_422_UNPROCESSABLE_ENTITY: {"model": UnprocessableEntityResponse},
+    },
+)
+def get_forecast(
+    forecast_query_use_case: Annotated[ForecastQueryUseCase, Depends(get_forecast_query_use_case)],
+    currency: Annotated[str, Query(min_length=3, max_length=3)],
+) -> None:
+    try:
+        forecast = forecast_query_use_case.get_forecast(currency=currency)
+    except InvalidData as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=e.message) from e
+    return forecast
+
+
+@router.get("/exchange-rates", response_model=list[ExchangeRateReadModel])
+def get_exchange_rates(
+    forecast_query_use_case: Annotated[ForecastQueryUseCase, Depends(get_forecast_query_use_case)],
+) -> None:
+    rates = forecast_query_use_case.get_exchange_rates()
+    return rates
+
+
+@router.put(
+    "/exchange-rates",
+    response_model=list[ExchangeRateReadModel],
+    dependencies=[Depends(is_admin)],
+    responses={
+        status.HTTP_403_FORBIDDEN: {"model": BasicErrorResponse},
+        status.HTTP_422_UNPROCESSABLE_ENTITY: {"model": UnprocessableEntityResponse},
+    },
+)
+def set_exchange_rates(
+    exchange_rate_command_use_case: Annotated[ExchangeRateCommandUseCase, Depends(get_exchange_rate_command_use_case)],
+    data: list[ExchangeRateCreateUpdateModel],
+) -> None:
+    """For admins only."""
+    rates = exchange_rate_command_use_case.set_rates(data)
+    return rates
@@ -1,15 +1,27 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Path, Request, Response, UploadFile, status
 
 from authentication.infrastructure.service.base import UserReadModel
-from authentication.presentation.rest.deps import get_current_user
+from authentication.presentation.rest.deps import get_current_user, is_admin
 from building_blocks.application.exceptions import ConflictingAction, ForbiddenAction, InvalidData, ObjectDoesNotExist
+from building_blocks.presentation.params import IdsQuery, IfMatchHeader, format_etag, parse_etag, split_ids
 from building_blocks.presentation.responses import BasicErrorResponse, UnprocessableEntityResponse
+from building_blocks.presentation.uploads import read_records
 from sales.application.lead.command import LeadCommandUseCase
-from sales.application.lead.command_model import AssignmentUpdateModel, LeadCreateModel, LeadUpdateModel
+from sales.application.lead.command_model import (
+    AssignmentUpdateModel,
+    LeadCreateModel,
+    LeadsReassignmentModel,
+    LeadUpdateModel,
+)
 from sales.application.lead.query import LeadQueryUseCase
-from sales.application.lead.query_model import AssignmentReadModel, LeadReadModel
+from sales.application.lead.query_model import (
+    AssignmentReadModel,
+    LeadImportResultReadModel,
+    LeadReadModel,
+    LeadsReassignmentReadModel,
+)
 from sales.application.notes.command_model import NoteCreateModel
 from sales.application.notes.query_model import NoteReadModel
 from sales.presentation.container import get_container
@@ -30,6 +42,7 @@ def get_lead_command_use_case(request: Request) -> LeadCommandUseCase:
 @router.get(
     "/",
     response_model=list[LeadReadModel],
+    responses={status.HTTP_422_UNPROCESSABLE_ENTITY: {"model": UnprocessableEntityResponse}},
 )
 def get_leads(
     lead_query_use_case: Annotated[LeadQueryUseCase, Depends(get_lead_query_use_case)],
@@ -37,7 +50,14 @@ def get_leads(
     salesman_id: str | None = None,
     contact_phone: str | None = None,
     contact_email: str | None = None,
+    ids: IdsQuery = None,
 ) -> None:
+    if ids is not None:
+        try:
+            leads = lead_query_use_case.get_by_ids(split_ids(ids))
+        except InvalidData as e:
+            raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=e.message) from e
+        return leads
     leads = lead_query_use_case.get_filtered(
         owner_id=salesman_id,
         customer_id=customer_id,
@@ -64,6 +84,48 @@ def create_lead(
     return lead
 
 
+@router.post(
+    "/import",
+    response_model=LeadImportResultReadModel,
+    responses={status.HTTP_422_UNPROCESSABLE_ENTITY: {"model": UnprocessableEntityResponse}},
+)
+def import_leads(
+    lead_command_use_case: Annotated[LeadCommandUseCase, Depends(get_lead_command_use_case)],
+    file: UploadFile,
+    current_user: Annotated[UserReadModel, Depends(get_current_user)],
+) -> None:
+    try:
+        result = lead_command_use_case.import_leads(rows=read_records(file), creator_id=current_user.salesman_id)
+    except InvalidData as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=e.message) from e
+    return result
+
+
+@router.post(
+    "/reassign",
+    response_model=LeadsReassignmentReadModel,
+    dependencies=[Depends(is_admin)],
+    responses={
+        status.HTTP_403_FORBIDDEN: {"model": BasicErrorResponse},
+        status.HTTP_409_CONFLICT: {"model": BasicErrorResponse},
+        status.HTTP_422_UNPROCESSABLE_ENTITY: {"model": UnprocessableEntityResponse},
+    },
+)
+def reassign_leads(
+    lead_command_use_case: Annotated[LeadCommandUseCase, Depends(get_lead_command_use_case)],
+    current_user: Annotated[UserReadModel, Depends(get_current_user)],
+    data: LeadsReassignmentModel,
+) -> None:
+    """For admins only."""
+    try:
+        result = lead_command_use_case.reassign_leads(data, requestor_id=current_user.salesman_id)
+    except InvalidData as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=e.message) from e
+    except ConflictingAction as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=e.message) from e
+    return result
+
+
 @router.get(
     "/{lead_id}",
     response_model=LeadReadModel,
@@ -72,11 +134,13 @@ def create_lead(
 def get_single_lead(
     lead_query_use_case: Annotated[LeadQueryUseCase, Depends(get_lead_query_use_case)],
     lead_id: Annotated[str, Path],
+    response: Response,
 ) -> None:
     try:
         lead = lead_query_use_case.get(lead_id)
     except ObjectDoesNotExist as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message) from e
+    response.headers["ETag"] = format_etag(lead.version)
     return lead
 
 
@@ -86,6 +150,7 @@ def get_single_lead(
     responses={
         status.HTTP_403_FORBIDDEN: {"model": BasicErrorResponse},
         status.HTTP_404_NOT_FOUND: {"model": BasicErrorResponse},
+        status.HTTP_409_CONFLICT: {"model": BasicErrorResponse},
         status.HTTP_422_UNPROCESSABLE_ENTITY: {"model": UnprocessableEntityResponse},
     },
 )
@@ -94,15 +159,25 @@ def update_lead(
     data: LeadUpdateModel,
     lead_id: Annotated[str, Path],
     current_user: Annotated[UserReadModel, Depends(get_current_user)],
+    response: Response,
+    if_match: IfMatchHeader = None,
 ) -> None:
     try:
-        lead = lead_command_use_case.update(lead_id=lead_id, editor_id=current_user.salesman_id, lead_data=data)
+        lead = lead_command_use_case.update(
+            lead_id=lead_id,
+            editor_id=current_user.salesman_id,
+            lead_data=data,
+            expected_version=parse_etag(if_match),
+        )
     except ForbiddenAction as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message) from e
     except InvalidData as e:
         raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=e.message) from e
     except ObjectDoesNotExist as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message) from e
+    except ConflictingAction as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=e.message) from e
+    response.headers["ETag"] = format_etag(lead.version)
     return lead
 
 
@@ -179,6 +254,7 @@ def get_lead_notes(
     responses={
         status.HTTP_403_FORBIDDEN: {"model": BasicErrorResponse},
         status.HTTP_404_NOT_FOUND: {"model": BasicErrorResponse},
+        status.HTTP_409_CONFLICT: {"model": BasicErrorResponse},
     },
 )
 def create_note(
@@ -193,4 +269,6 @@ def create_note(
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message) from e
     except ObjectDoesNotExist as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message) from e
+    except ConflictingAction as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=e.message) from e
     return note
@@ -1,10 +1,11 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Path, Request, Response, status
 
 from authentication.infrastructure.service.base import UserReadModel
 from authentication.presentation.rest.deps import get_current_user
-from building_blocks.application.exceptions import ForbiddenAction, InvalidData, ObjectDoesNotExist
+from building_blocks.application.exceptions import ConflictingAction, ForbiddenAction, InvalidData, ObjectDoesNotExist
+from building_blocks.presentation.params import IdsQuery, IfMatchHeader, format_etag, parse_etag, split_ids
 from building_blocks.presentation.responses import BasicErrorResponse, UnprocessableEntityResponse
 from sales.application.notes.command_model import NoteCreateModel
 from sales.application.notes.query_model import NoteReadModel
@@ -33,14 +34,25 @@ def get_op_command_use_case(request: Request) -> OpportunityCommandUseCase:
     return container.opportunity_command_use_case
 
 
-@router.get("/", response_model=list[OpportunityReadModel])
+@router.get(
+    "/",
+    response_model=list[OpportunityReadModel],
+    responses={status.HTTP_422_UNPROCESSABLE_ENTITY: {"model": UnprocessableEntityResponse}},
+)
 def get_opportunities(
     op_query_use_case: Annotated[OpportunityQueryUseCase, Depends(get_op_query_use_case)],
     customer_id: str | None = None,
     owner_id: str | None = None,
     stage: OpportunityStageName | None = None,
     priority: PriorityLevel | None = None,
+    ids: IdsQuery = None,
 ) -> None:
+    if ids is not None:
+        try:
+            opportunities = op_query_use_case.get_by_ids(split_ids(ids))
+        except InvalidData as e:
+            raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=e.message) from e
+        return opportunities
     opportunities = op_query_use_case.get_filtered(
         customer_id=customer_id, owner_id=owner_id, stage=stage, priority=priority
     )
@@ -76,11 +88,13 @@ def create_opportunity(
 def get_single_opportunity(
     op_query_use_case: Annotated[OpportunityQueryUseCase, Depends(get_op_query_use_case)],
     opportunity_id: Annotated[str, Path],
+    response: Response,
 ) -> None:
     try:
         opportunity = op_query_use_case.get(opportunity_id)
     except ObjectDoesNotExist as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message) from e
+    response.headers["ETag"] = format_etag(opportunity.version)
     return opportunity
 
 
@@ -90,6 +104,7 @@ def get_single_opportunity(
     responses={
         status.HTTP_403_FORBIDDEN: {"model": BasicErrorResponse},
         status.HTTP_404_NOT_FOUND: {"model": BasicErrorResponse},
+        status.HTTP_409_CONFLICT: {"model": BasicErrorResponse},
         status.HTTP_422_UNPROCESSABLE_ENTITY: {"model": UnprocessableEntityResponse},
     },
 )
@@ -98,10 +113,15 @@ def update_opportunity(
     data: OpportunityUpdateModel,
     opportunity_id: Annotated[str, Path],
     current_user: Annotated[UserReadModel, Depends(get_current_user)],
+    response: Response,
+    if_match: IfMatchHeader = None,
 ) -> None:
     try:
         opportunity = op_command_use_case.update(
-            opportunity_id=opportunity_id, editor_id=current_user.salesman_id, data=data
+            opportunity_id=opportunity_id,
+            editor_id=current_user.salesman_id,
+            data=data,
+            expected_version=parse_etag(if_match),
         )
     except ForbiddenAction as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message) from e
@@ -109,6 +129,9 @@ def update_opportunity(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message) from e
     except InvalidData as e:
         raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=e.message) from e
+    except ConflictingAction as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=e.message) from e
+    response.headers["ETag"] = format_etag(opportunity.version)
     return opportunity
 
 
@@ -136,6 +159,7 @@ def get_opportunity_offer(
     responses={
         status.HTTP_403_FORBIDDEN: {"model": BasicErrorResponse},
         status.HTTP_404_NOT_FOUND: {"model": BasicErrorResponse},
+        status.HTTP_409_CONFLICT: {"model": BasicErrorResponse},
         status.HTTP_422_UNPROCESSABLE_ENTITY: {"model": UnprocessableEntityResponse},
     },
 )
@@ -144,10 +168,15 @@ def update_opportunity_offer(
     data: list[OfferItemCreateUpdateModel],
     opportunity_id: Annotated[str, Path],
     current_user: Annotated[UserReadModel, Depends(get_current_user)],
+    response: Response,
+    if_match: IfMatchHeader = None,
 ) -> None:
     try:
-        offer_items = op_command_use_case.update_offer(
-            opportunity_id=opportunity_id, editor_id=current_user.salesman_id, data=data
+        offer = op_command_use_case.update_offer(
+            opportunity_id=opportunity_id,
+            editor_id=current_user.salesman_id,
+            data=data,
+            expected_version=parse_etag(if_match),
         )
     except ObjectDoesNotExist as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message) from e
@@ -155,7 +184,10 @@ def update_opportunity_offer(
         raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=e.message) from e
     except ForbiddenAction as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message) from e
-    return offer_items
+    except ConflictingAction as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=e.message) from e
+    response.headers["ETag"] = format_etag(offer.version)
+    return offer.result
 
 
 @router.get(
@@ -182,6 +214,7 @@ def get_opportunity_notes(
     responses={
         status.HTTP_403_FORBIDDEN: {"model": BasicErrorResponse},
         status.HTTP_404_NOT_FOUND: {"model": BasicErrorResponse},
+        status.HTTP_409_CONFLICT: {"model": BasicErrorResponse},
     },
 )
 def create_note(
@@ -198,4 +231,6 @@ def create_note(
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message) from e
     except ObjectDoesNotExist as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message) from e
+    except ConflictingAction as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=e.message) from e
     return note
@@ -5,7 +5,8 @@ from fastapi import APIRouter, Depends, HTTPException, Path, Request, status
 from authentication.infrastructure.exceptions import AuthenticationServiceFailed, InvalidUserCreationData
 from authentication.infrastructure.service.base import AuthenticationService, UserCreateModel, UserReadModel
 from authentication.presentation.rest.deps import get_auth_service, get_current_user, is_admin
-from building_blocks.application.exceptions import ForbiddenAction, ObjectDoesNotExist
+from building_blocks.application.exceptions import ForbiddenAction, InvalidData, ObjectDoesNotExist
+from building_blocks.presentation.params import IdsQuery, split_ids
 from building_blocks.presentation.responses import BasicErrorResponse, UnprocessableEntityResponse
 from sales.application.sales_representative.command import SalesRepresentativeCommandUseCase
 from sales.application.sales_representative.command_model import (
@@ -29,11 +30,26 @@ def get_sr_command_use_case(request: Request) -> SalesRepresentativeCommandUseCa
     return container.sr_command_use_case
 
 
-@router.get("/", response_model=list[SalesRepresentativeReadModel], dependencies=[Depends(is_admin)])
+@router.get(
+    "/",
+    response_model=list[SalesRepresentativeReadModel],
+    dependencies=[Depends(is_admin)],
+    responses={
+        status.HTTP_403_FORBIDDEN: {"model": BasicErrorResponse},
+        status.HTTP_422_UNPROCESSABLE_ENTITY: {"model": UnprocessableEntityResponse},
+    },
+)
 def get_sales_representatives(
     sr_query_use_case: Annotated[SalesRepresentativeQueryUseCase, Depends(get_sr_query_use_case)],
+    ids: IdsQuery = None,
 ) -> None:
     """For admins only."""
+    if ids is not None:
+        try:
+            representatives = sr_query_use_case.get_by_ids(split_ids(ids))
+        except InvalidData as e:
+            raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=e.message) from e
+        return representatives
     representatives = sr_query_use_case.get_all()
     return representatives
 
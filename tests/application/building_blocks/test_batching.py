@@ -0,0 +1,114 @@
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from threading import Barrier
+
+import pytest
+
+from building_blocks.application.batching import GroupCommitBatcher, ImmediateCommandBatcher
+
+
+class DummyException(Exception):
+    pass
+
+
+class InMemoryGroupCommitBatcher(GroupCommitBatcher):
+    def __init__(self, window: float = 0.05, max_batch_size: int = 64, fail_commit: bool = False) -> None:
+        super().__init__(window=window, max_batch_size=max_batch_size)
+        self.fail_commit = fail_commit
+        self.commits = 0
+        self.rollbacks = 0
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        yield
+        if self.fail_commit:
+            raise DummyException
+        self.commits += 1
+
+    @contextmanager
+    def _isolated(self, transaction: None) -> Iterator[None]:
+        try:
+            yield
+        except Exception:
+            self.rollbacks += 1
+            raise
+
+
+def submit_concurrently(batcher: GroupCommitBatcher, commands: list[Callable[[], str]]) -> list[str | Exception]:
+    barrier = Barrier(len(commands))
+
+    def submit(command: Callable[[], str]) -> str | Exception:
+        barrier.wait()
+        try:
+            return batcher.submit(command)
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=len(commands)) as executor:
+        return list(executor.map(submit, commands))
+
+
+def make_command(value: str) -> Callable[[], str]:
+    def command() -> str:
+        return value
+
+    return command
+
+
+def failing_command() -> str:
+    raise DummyException
+
+
+def test_immediate_batcher_runs_command() -> None:
+    assert ImmediateCommandBatcher().submit(lambda: "result") == "result"
+
+
+def test_single_command_is_executed_in_own_batch() -> None:
+    batcher = InMemoryGroupCommitBatcher(window=0.001)
+
+    result = batcher.submit(lambda: "result")
+
+    assert result == "result"
+    assert batcher.commits == 1
+
+
+def test_concurrent_commands_are_committed_together() -> None:
+    batcher = InMemoryGroupCommitBatcher(window=1.0, max_batch_size=4)
+    commands = [make_command(str(i)) for i in range(4)]
+
+    results = submit_concurrently(batcher, commands)
+
+    assert results == ["0", "1", "2", "3"]
+    assert batcher.commits == 1
+
+
+def test_failing_command_does_not_affect_other_commands_in_batch() -> None:
+    batcher = InMemoryGroupCommitBatcher(window=1.0, max_batch_size=3)
+    commands = [make_command("ok"), failing_command, make_command("ok")]
+
+    results = submit_concurrently(batcher, commands)
+
+    assert results[0] == results[2] == "ok"
+    assert isinstance(results[1], DummyException)
+    assert batcher.rollbacks == 1
+    assert batcher.commits == 1
+
+
+def test_failed_commit_is_reported_to_every_command_in_batch() -> None:
+    batcher = InMemoryGroupCommitBatcher(window=1.0, max_batch_size=3, fail_commit=True)
+    commands = [make_command(str(i)) for i in range(3)]
+
+    results = submit_concurrently(batcher, commands)
+
+    assert all(isinstance(result, DummyException) for result in results)
+
+
+@pytest.mark.parametrize("max_batch_size", [1, 2])
+def test_batch_is_executed_once_it_is_full(max_batch_size: int) -> None:
+    batcher = InMemoryGroupCommitBatcher(window=10.0, max_batch_size=max_batch_size)
+    commands = [make_command(str(i)) for i in range(max_batch_size)]
+
+    results = submit_concurrently(batcher, commands)
+
+    assert sorted(results) == [str(i) for i in range(max_batch_size)]
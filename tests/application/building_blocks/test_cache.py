@@ -0,0 +1,70 @@
+import pytest
+
+from building_blocks.application.cache import TTLCache
+
+TTL = 5.0
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture()
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture()
+def cache(clock: FakeClock) -> TTLCache[str, str]:
+    return TTLCache(ttl=TTL, clock=clock)
+
+
+def test_get_returns_cached_value(cache: TTLCache[str, str]) -> None:
+    cache.set("key", "value")
+
+    assert cache.get("key") == "value"
+
+
+def test_get_returns_none_if_not_cached(cache: TTLCache[str, str]) -> None:
+    assert cache.get("key") is None
+
+
+def test_get_returns_none_if_expired(cache: TTLCache[str, str], clock: FakeClock) -> None:
+    cache.set("key", "value")
+    clock.now += TTL
+
+    assert cache.get("key") is None
+
+
+def test_invalidate(cache: TTLCache[str, str]) -> None:
+    cache.set("key", "value")
+
+    cache.invalidate("key")
+
+    assert cache.get("key") is None
+
+
+def test_clear(cache: TTLCache[str, str]) -> None:
+    cache.set("key", "value")
+    cache.set("other key", "other value")
+
+    cache.clear()
+
+    assert cache.get("key") is None
+    assert cache.get("other key") is None
+
+
+def test_hits_and_misses_are_counted(cache: TTLCache[str, str], clock: FakeClock) -> None:
+    cache.set("key", "value")
+
+    cache.get("key")
+    cache.get("other key")
+    clock.now += TTL
+    cache.get("key")
+
+    assert cache.hits == 1
+    assert cache.misses == 2
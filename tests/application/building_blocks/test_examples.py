@@ -0,0 +1,25 @@
+from unittest.mock import Mock
+
+from pydantic import BaseModel, Field
+
+from building_blocks.application.examples import get_faker, lazy_examples
+
+FIELD_EXAMPLE = "some_value_1"
+
+
+def test_lazy_examples_are_built_on_schema_generation() -> None:
+    factory = Mock(return_value=[FIELD_EXAMPLE])
+
+    class CustomModel(BaseModel):
+        some_field: str = Field(json_schema_extra=lazy_examples(factory))
+
+    factory.assert_not_called()
+
+    schema = CustomModel.model_json_schema()
+
+    factory.assert_called_once_with(get_faker())
+    assert schema["properties"]["some_field"]["examples"] == [FIELD_EXAMPLE]
+
+
+def test_get_faker_is_cached() -> None:
+    assert get_faker() is get_faker()
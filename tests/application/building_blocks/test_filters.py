@@ -2,8 +2,8 @@ from collections.abc import Callable
 
 import pytest
 
-from building_blocks.application.exceptions import InvalidFilterType
-from building_blocks.application.filters import BaseFilterResolver, FilterConditionType
+from building_blocks.application.exceptions import InvalidData, InvalidFilterType
+from building_blocks.application.filters import MAX_LOOKUP_IDS, BaseFilterResolver, FilterConditionType, get_lookup_ids
 
 FilterFunction = Callable[[], str]
 
@@ -44,3 +44,16 @@ def test_resolve_returns_correct_filter_function(
 def test_resolve_with_wrong_condition_type_should_fail(resolver: CustomFilterResolver) -> None:
     with pytest.raises(InvalidFilterType):
         resolver.resolve(FilterConditionType.SEARCH)
+
+
+def test_get_lookup_ids_returns_unique_ids_in_order() -> None:
+    assert get_lookup_ids(["id_2", "id_1", "id_2"]) == ("id_2", "id_1")
+
+
+def test_get_lookup_ids_resolves_a_200_row_table_at_once() -> None:
+    assert len(get_lookup_ids(f"id_{i}" for i in range(200))) == 200
+
+
+def test_get_lookup_ids_with_too_many_ids_should_fail() -> None:
+    with pytest.raises(InvalidData):
+        get_lookup_ids(f"id_{i}" for i in range(MAX_LOOKUP_IDS + 1))
@@ -0,0 +1,83 @@
+from collections.abc import Iterator
+
+import pytest
+
+from building_blocks.application.instrumentation import (
+    RequestTimings,
+    RollingHistogram,
+    end_request_timings,
+    record_timing,
+    start_request_timings,
+    timed,
+    timed_use_case,
+)
+
+
+class DummyUseCase:
+    value = "value"
+
+    def run(self, argument: str) -> str:
+        return argument
+
+
+@pytest.fixture()
+def timings() -> Iterator[RequestTimings]:
+    timings, token = start_request_timings()
+    yield timings
+    end_request_timings(token)
+
+
+def test_record_timing_accumulates_count_and_time(timings: RequestTimings) -> None:
+    record_timing("sql", 0.25)
+    record_timing("sql", 0.5)
+
+    metric = timings.get("sql")
+
+    assert metric.count == 2
+    assert metric.seconds == 0.75
+
+
+def test_record_timing_without_active_request_is_ignored() -> None:
+    record_timing("sql", 0.25)
+
+
+def test_timed_records_elapsed_time(timings: RequestTimings) -> None:
+    with timed("auth"):
+        pass
+
+    assert timings.get("auth").count == 1
+
+
+def test_timed_use_case_records_public_method_calls(timings: RequestTimings) -> None:
+    use_case = timed_use_case(DummyUseCase())
+
+    result = use_case.run("argument")
+
+    assert result == "argument"
+    assert use_case.value == "value"
+    assert timings.get("DummyUseCase.run").count == 1
+
+
+def test_rolling_histogram_snapshot() -> None:
+    histogram = RollingHistogram(buckets=(0.1, 1.0), window=100)
+    for value in (0.05, 0.2, 0.3, 2.0):
+        histogram.observe("GET /customers", value)
+
+    snapshot = histogram.snapshot()["GET /customers"]
+
+    assert snapshot.count == 4
+    assert snapshot.total == pytest.approx(2.55)
+    assert snapshot.buckets == ((0.1, 1), (1.0, 3))
+    assert snapshot.p50 == 0.2
+    assert snapshot.max == 2.0
+
+
+def test_rolling_histogram_keeps_only_most_recent_observations() -> None:
+    histogram = RollingHistogram(window=2)
+    for value in (5.0, 0.1, 0.2):
+        histogram.observe("GET /customers", value)
+
+    snapshot = histogram.snapshot()["GET /customers"]
+
+    assert snapshot.count == 2
+    assert snapshot.max == 0.2
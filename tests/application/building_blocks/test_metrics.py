@@ -0,0 +1,56 @@
+from building_blocks.application.metrics import CallbackMetric, Counter, Histogram, MetricsRegistry
+
+
+def test_counter_is_rendered_per_label_set() -> None:
+    registry = MetricsRegistry()
+    counter = registry.register(Counter("shelf_opens_total", "Shelf opens."))
+    counter.inc(mode="read")
+    counter.inc(mode="read")
+    counter.inc(mode="write")
+
+    rendered = registry.render()
+
+    assert "# HELP shelf_opens_total Shelf opens.\n# TYPE shelf_opens_total counter\n" in rendered
+    assert 'shelf_opens_total{mode="read"} 2.0' in rendered
+    assert 'shelf_opens_total{mode="write"} 1.0' in rendered
+
+
+def test_histogram_buckets_are_cumulative() -> None:
+    registry = MetricsRegistry()
+    histogram = registry.register(Histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0)))
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(value, route="/customers")
+
+    rendered = registry.render()
+
+    assert 'latency_seconds_bucket{route="/customers",le="0.1"} 2' in rendered
+    assert 'latency_seconds_bucket{route="/customers",le="1.0"} 3' in rendered
+    assert 'latency_seconds_bucket{route="/customers",le="+Inf"} 4' in rendered
+    assert 'latency_seconds_sum{route="/customers"} 2.65' in rendered
+    assert 'latency_seconds_count{route="/customers"} 4' in rendered
+
+
+def test_callback_metric_is_collected_on_render() -> None:
+    registry = MetricsRegistry()
+    values = {"checked_out": 1}
+    registry.register(
+        CallbackMetric("pool_connections", "Pool.", "gauge", lambda: [({"state": k}, v) for k, v in values.items()])
+    )
+    values["checked_out"] = 3
+
+    assert 'pool_connections{state="checked_out"} 3' in registry.render()
+
+
+def test_label_values_are_escaped() -> None:
+    registry = MetricsRegistry()
+    counter = registry.register(Counter("requests_total", "Requests."))
+    counter.inc(route='/a"b')
+
+    assert 'requests_total{route="/a\\"b"} 1.0' in registry.render()
+
+
+def test_extra_metrics_are_rendered_with_registered_ones() -> None:
+    registry = MetricsRegistry()
+    extra = CallbackMetric("cache_hits_total", "Hits.", "counter", lambda: [({"cache": "status"}, 5)])
+
+    assert 'cache_hits_total{cache="status"} 5' in registry.render(extra)
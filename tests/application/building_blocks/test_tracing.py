@@ -0,0 +1,90 @@
+from collections.abc import Iterator
+
+import pytest
+
+from building_blocks.application.tracing import STATUS_ERROR, Span, SpanExporter, traced, traced_calls, tracer
+
+
+class InMemorySpanExporter(SpanExporter):
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+
+    def export(self, span: Span) -> None:
+        self.spans.append(span)
+
+
+class DummyException(Exception):
+    pass
+
+
+class DummyRepository:
+    def get(self, id: str) -> str:
+        return id
+
+
+@pytest.fixture()
+def exporter() -> Iterator[InMemorySpanExporter]:
+    exporter = InMemorySpanExporter()
+    tracer.configure(exporter)
+    yield exporter
+    tracer.configure(None)
+
+
+def test_disabled_tracer_does_not_create_spans() -> None:
+    with tracer.span("request") as span:
+        assert span is None
+
+
+def test_nested_spans_share_trace(exporter: InMemorySpanExporter) -> None:
+    with tracer.span("request"):
+        with tracer.span("use case"):
+            pass
+
+    child, parent = exporter.spans
+    assert child.trace_id == parent.trace_id
+    assert child.parent_id == parent.span_id
+    assert parent.parent_id is None
+    assert child.end_time_ns >= child.start_time_ns
+
+
+def test_span_records_error(exporter: InMemorySpanExporter) -> None:
+    with pytest.raises(DummyException):
+        with tracer.span("use case"):
+            raise DummyException
+
+    assert exporter.spans[0].status == STATUS_ERROR
+    assert exporter.spans[0].attributes["exception.type"] == "DummyException"
+
+
+def test_traced_decorator(exporter: InMemorySpanExporter) -> None:
+    @traced("to_domain")
+    def to_domain() -> str:
+        return "entity"
+
+    assert to_domain() == "entity"
+    assert [span.name for span in exporter.spans] == ["to_domain"]
+
+
+def test_traced_calls_returns_target_if_tracing_is_disabled() -> None:
+    repository = DummyRepository()
+
+    assert traced_calls(repository) is repository
+
+
+def test_traced_calls_traces_public_methods(exporter: InMemorySpanExporter) -> None:
+    repository = traced_calls(DummyRepository())
+
+    assert repository.get("id") == "id"
+    assert [span.name for span in exporter.spans] == ["DummyRepository.get"]
+
+
+def test_span_dict_follows_opentelemetry_shape(exporter: InMemorySpanExporter) -> None:
+    with tracer.span("request", **{"http.method": "GET"}):
+        pass
+
+    data = exporter.spans[0].to_dict()
+    assert data["name"] == "request"
+    assert data["context"]["trace_id"].startswith("0x")
+    assert len(data["context"]["trace_id"]) == 34
+    assert data["attributes"] == {"http.method": "GET"}
+    assert data["status"] == {"status_code": "UNSET"}
@@ -2,9 +2,16 @@ from unittest.mock import MagicMock
 
 import pytest
 
-from building_blocks.application.exceptions import ConflictingAction, ForbiddenAction, InvalidData, ObjectDoesNotExist
+from building_blocks.application.exceptions import (
+    ConcurrentModification,
+    ConflictingAction,
+    ForbiddenAction,
+    InvalidData,
+    ObjectDoesNotExist,
+)
 from building_blocks.domain.exceptions import DomainException, DuplicateEntry
-from customer_management.application.command import CustomerCommandUseCase, CustomerUnitOfWork
+from building_blocks.infrastructure.exceptions import ObjectAlreadyExists
+from customer_management.application.command import CustomerCommandUseCase, CustomerImportUseCase, CustomerUnitOfWork
 from customer_management.application.command_model import (
     AddressDataCreateUpdateModel,
     CompanyInfoCreateUpdateModel,
@@ -15,7 +22,9 @@ from customer_management.application.command_model import (
     CustomerCreateModel,
     CustomerUpdateModel,
     LanguageCreateUpdateModel,
+    RelationManagerReassignmentModel,
 )
+from customer_management.application.query_model import CountryReadModel, LanguageReadModel
 from customer_management.domain.entities.customer import Customer
 from customer_management.domain.exceptions import (
     CannotConvertArchivedCustomer,
@@ -60,10 +69,13 @@ def customer_command_use_case(
 ) -> CustomerCommandUseCase:
     salesman_service = MagicMock()
     opportunity_service = MagicMock()
+    opportunity_service.customer_has_open_opportunities.return_value = False
+    customer_status_cache = MagicMock()
     return CustomerCommandUseCase(
         customer_uow=customer_uow,
         sales_rep_service=salesman_service,
         opportunity_service=opportunity_service,
+        customer_status_cache=customer_status_cache,
     )
 
 
@@ -452,16 +464,201 @@ def test_convert_or_archive_by_non_relation_manager_should_fail(
         getattr(customer_command_use_case, method_name)(customer_id="customer-1", requestor_id="salesman-1")
 
 
+@pytest.mark.parametrize("method_name", ["convert", "archive"])
+def test_convert_or_archive_invalidates_cached_customer_status(
+    customer_uow: CustomerUnitOfWork,
+    customer_command_use_case: CustomerCommandUseCase,
+    mock_customer: MagicMock,
+    method_name: str,
+) -> None:
+    customer_uow.__enter__().repository.get.return_value = mock_customer
+
+    getattr(customer_command_use_case, method_name)(customer_id="customer-1", requestor_id="salesman-1")
+
+    customer_command_use_case.customer_status_cache.invalidate.assert_called_once_with("customer-1")
+
+
 def test_archive_customer_with_not_closed_opportunities_should_fail(
     customer_uow: CustomerUnitOfWork,
     customer_command_use_case: CustomerCommandUseCase,
     mock_customer: MagicMock,
 ) -> None:
-    mock_not_closed_opportunity = MagicMock(stage_name="initial")
     customer_uow.__enter__().repository.get.return_value = mock_customer
-    customer_command_use_case.opportunity_service.get_opportunities_by_customer.return_value = (
-        mock_not_closed_opportunity,
-    )
+    customer_command_use_case.opportunity_service.customer_has_open_opportunities.return_value = True
 
     with pytest.raises(InvalidData):
         customer_command_use_case.archive(customer_id="customer-1", requestor_id="salesman-1")
+
+
+@pytest.fixture()
+def customer_import_use_case(customer_uow: CustomerUnitOfWork) -> CustomerImportUseCase:
+    country_vo_service = MagicMock()
+    country_vo_service.get_all.return_value = [CountryReadModel(code="pl", name="Polska")]
+    language_vo_service = MagicMock()
+    language_vo_service.get_all.return_value = [LanguageReadModel(code="pl", name="polski")]
+    return CustomerImportUseCase(
+        customer_uow=customer_uow,
+        sales_rep_service=MagicMock(),
+        country_vo_service=country_vo_service,
+        language_vo_service=language_vo_service,
+    )
+
+
+@pytest.fixture()
+def customer_import_record() -> dict:
+    return {
+        "relation_manager_id": "salesman-1",
+        "company_info": {
+            "name": "company name",
+            "industry": "automotive",
+            "size": "medium",
+            "legal_form": "limited",
+            "address": address_example.model_dump(),
+        },
+        "contact_persons": [
+            {
+                "first_name": "Jan",
+                "last_name": "Kowalski",
+                "job_title": "CEO",
+                "preferred_language": language_example.model_dump(),
+                "contact_methods": [valid_contact_method_example.model_dump()],
+            }
+        ],
+    }
+
+
+def test_import_customers(
+    customer_uow: CustomerUnitOfWork, customer_import_use_case: CustomerImportUseCase, customer_import_record: dict
+) -> None:
+    other_record = {**customer_import_record, "contact_persons": []}
+
+    result = customer_import_use_case.import_customers(records=[customer_import_record, other_record], batch_size=1)
+
+    assert result.imported_count == 2
+    assert result.errors == []
+    assert customer_uow.__enter__().repository.create_many.call_count == 2
+    imported_customer = customer_uow.__enter__().repository.create_many.call_args_list[0].args[0][0]
+    assert len(imported_customer.contact_persons) == 1
+
+
+def test_import_customers_checks_relation_manager_once(
+    customer_import_use_case: CustomerImportUseCase, customer_import_record: dict
+) -> None:
+    records = [{**customer_import_record, "contact_persons": []} for _ in range(3)]
+
+    customer_import_use_case.import_customers(records=records)
+
+    customer_import_use_case.sales_rep_service.salesman_exists.assert_called_once_with("salesman-1")
+
+
+def test_import_customers_reports_invalid_rows(
+    customer_uow: CustomerUnitOfWork, customer_import_use_case: CustomerImportUseCase, customer_import_record: dict
+) -> None:
+    person = customer_import_record["contact_persons"][0]
+    company_info = customer_import_record["company_info"]
+    records = [
+        customer_import_record,
+        {**customer_import_record, "relation_manager_id": None},
+        {**customer_import_record, "company_info": {**company_info, "industry": "invalid"}},
+        {
+            **customer_import_record,
+            "company_info": {
+                **company_info,
+                "address": {**company_info["address"], "country": {"code": "xx", "name": "X"}},
+            },
+        },
+        {**customer_import_record, "contact_persons": [{**person, "preferred_language": {"code": "xx", "name": "X"}}]},
+        customer_import_record,
+    ]
+
+    result = customer_import_use_case.import_customers(records=records)
+
+    assert result.imported_count == 1
+    assert [error.row for error in result.errors] == [2, 3, 4, 5, 6]
+    assert "already used" in result.errors[-1].detail
+    assert len(customer_uow.__enter__().repository.create_many.call_args.args[0]) == 1
+
+
+def test_import_customers_reports_contact_methods_already_in_database(
+    customer_uow: CustomerUnitOfWork, customer_import_use_case: CustomerImportUseCase, customer_import_record: dict
+) -> None:
+    repository = customer_uow.__enter__().repository
+    repository.get_used_contact_method_values.return_value = {valid_contact_method_example.value}
+    other_record = {**customer_import_record, "contact_persons": []}
+
+    result = customer_import_use_case.import_customers(records=[customer_import_record, other_record])
+
+    assert result.imported_count == 1
+    assert [error.row for error in result.errors] == [1]
+    assert "already used" in result.errors[0].detail
+    repository.get_used_contact_method_values.assert_called_once_with({valid_contact_method_example.value})
+    assert len(repository.create_many.call_args.args[0]) == 1
+
+
+def test_import_customers_reports_batch_rejected_by_repository(
+    customer_uow: CustomerUnitOfWork, customer_import_use_case: CustomerImportUseCase, customer_import_record: dict
+) -> None:
+    customer_uow.__enter__().repository.create_many.side_effect = [ObjectAlreadyExists("Already exists"), None]
+    other_record = {**customer_import_record, "contact_persons": []}
+    records = [customer_import_record, other_record, other_record]
+
+    result = customer_import_use_case.import_customers(records=records, batch_size=2)
+
+    assert result.imported_count == 1
+    assert [error.row for error in result.errors] == [1, 2]
+
+
+def test_import_customers_with_invalid_relation_manager_should_report_error(
+    customer_import_use_case: CustomerImportUseCase, customer_import_record: dict
+) -> None:
+    customer_import_use_case.sales_rep_service.salesman_exists.return_value = False
+
+    result = customer_import_use_case.import_customers(records=[customer_import_record])
+
+    assert result.imported_count == 0
+    assert len(result.errors) == 1
+
+
+def test_reassign_relation_manager(
+    customer_uow: CustomerUnitOfWork, customer_command_use_case: CustomerCommandUseCase
+) -> None:
+    customer_uow.__enter__().repository.reassign_relation_manager.return_value = 2
+    data = RelationManagerReassignmentModel(
+        current_relation_manager_id="salesman-1", new_relation_manager_id="salesman-2"
+    )
+
+    result = customer_command_use_case.reassign_relation_manager(data)
+
+    assert result.reassigned_count == 2
+    customer_uow.__enter__().repository.reassign_relation_manager.assert_called_once_with(
+        current_relation_manager_id="salesman-1", new_relation_manager_id="salesman-2"
+    )
+
+
+@pytest.mark.parametrize("new_relation_manager_id", ["salesman-1", "invalid"])
+def test_reassign_relation_manager_with_invalid_data_should_fail(
+    customer_uow: CustomerUnitOfWork, customer_command_use_case: CustomerCommandUseCase, new_relation_manager_id: str
+) -> None:
+    customer_command_use_case.sales_rep_service.salesman_exists.return_value = new_relation_manager_id != "invalid"
+    data = RelationManagerReassignmentModel(
+        current_relation_manager_id="salesman-1", new_relation_manager_id=new_relation_manager_id
+    )
+
+    with pytest.raises(InvalidData):
+        customer_command_use_case.reassign_relation_manager(data)
+
+    customer_uow.__enter__().repository.reassign_relation_manager.assert_not_called()
+
+
+def test_update_with_stale_version_should_fail(
+    customer_uow: CustomerUnitOfWork, customer_command_use_case: CustomerCommandUseCase, mock_customer: MagicMock
+) -> None:
+    mock_customer.version = 2
+    customer_uow.__enter__().repository.get.return_value = mock_customer
+
+    with pytest.raises(ConcurrentModification):
+        customer_command_use_case.update(
+            customer_id="customer-1", editor_id="salesman-1", customer_data=CustomerUpdateModel(), expected_version=1
+        )
+
+    customer_uow.__enter__().repository.update.assert_not_called()
@@ -0,0 +1,29 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from building_blocks.application.exceptions import ObjectDoesNotExist
+from customer_overview.application.query import CustomerOverviewQueryUseCase
+from customer_overview.application.query_service import CustomerOverviewQueryService
+
+
+@pytest.fixture()
+def mock_customer_overview_query_service() -> MagicMock:
+    return MagicMock(CustomerOverviewQueryService)
+
+
+@pytest.fixture()
+def customer_overview_query_use_case(
+    mock_customer_overview_query_service: MagicMock,
+) -> CustomerOverviewQueryUseCase:
+    return CustomerOverviewQueryUseCase(customer_overview_query_service=mock_customer_overview_query_service)
+
+
+def test_get_non_existent_customer_overview_should_fail(
+    customer_overview_query_use_case: CustomerOverviewQueryUseCase,
+    mock_customer_overview_query_service: MagicMock,
+) -> None:
+    mock_customer_overview_query_service.get.return_value = None
+
+    with pytest.raises(ObjectDoesNotExist):
+        customer_overview_query_use_case.get("customer_id")
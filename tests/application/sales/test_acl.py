@@ -0,0 +1,64 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from building_blocks.application.cache import TTLCache
+from building_blocks.application.exceptions import ObjectDoesNotExist
+from sales.application.acl import CustomerService, CustomerUnitOfWork
+
+
+@pytest.fixture()
+def customer_uow() -> CustomerUnitOfWork:
+    return MagicMock()
+
+
+@pytest.fixture()
+def customer_service(customer_uow: CustomerUnitOfWork) -> CustomerService:
+    return CustomerService(customer_uow=customer_uow, status_cache=TTLCache(ttl=60))
+
+
+def test_get_customer_status_caches_status(customer_uow: CustomerUnitOfWork, customer_service: CustomerService) -> None:
+    customer_uow.__enter__().repository.get_status.return_value = "initial"
+
+    customer_service.get_customer_status("customer-1")
+    status = customer_service.get_customer_status("customer-1")
+
+    assert status == "initial"
+    customer_uow.__enter__().repository.get_status.assert_called_once_with("customer-1")
+
+
+def test_get_customer_status_of_non_existent_customer_should_fail(
+    customer_uow: CustomerUnitOfWork, customer_service: CustomerService
+) -> None:
+    customer_uow.__enter__().repository.get_status.return_value = None
+
+    with pytest.raises(ObjectDoesNotExist):
+        customer_service.get_customer_status("customer-1")
+
+
+def test_get_customer_status_after_invalidation_reads_repository(
+    customer_uow: CustomerUnitOfWork, customer_service: CustomerService
+) -> None:
+    customer_uow.__enter__().repository.get_status.side_effect = ["initial", "converted"]
+    customer_service.get_customer_status("customer-1")
+
+    customer_service.status_cache.invalidate("customer-1")
+
+    assert customer_service.get_customer_status("customer-1") == "converted"
+
+
+def test_customer_exists_uses_cached_status(
+    customer_uow: CustomerUnitOfWork, customer_service: CustomerService
+) -> None:
+    customer_service.status_cache.set("customer-1", "initial")
+
+    assert customer_service.customer_exists("customer-1")
+    customer_uow.__enter__().repository.exists.assert_not_called()
+
+
+def test_customer_exists_queries_repository_if_not_cached(
+    customer_uow: CustomerUnitOfWork, customer_service: CustomerService
+) -> None:
+    customer_uow.__enter__().repository.exists.return_value = False
+
+    assert not customer_service.customer_exists("customer-1")
@@ -0,0 +1,63 @@
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+
+from building_blocks.application.exceptions import InvalidData
+from sales.application.forecast.query import ForecastQueryUseCase
+from sales.application.forecast.query_model import ExchangeRateReadModel, MonthlyPipelineValueReadModel
+from sales.application.forecast.query_service import ForecastQueryService
+
+
+@pytest.fixture()
+def mock_forecast_query_service() -> MagicMock:
+    query_service = MagicMock(ForecastQueryService)
+    query_service.get_exchange_rates.return_value = (
+        ExchangeRateReadModel(iso_code="EUR", rate=Decimal("4")),
+        ExchangeRateReadModel(iso_code="PLN", rate=Decimal("1")),
+    )
+    query_service.get_monthly_pipeline_values.return_value = (
+        MonthlyPipelineValueReadModel(
+            owner_id="owner_1", month="2024-01", stage="proposal", currency="PLN", amount=Decimal("100")
+        ),
+        MonthlyPipelineValueReadModel(
+            owner_id="owner_1", month="2024-01", stage="negotiation", currency="EUR", amount=Decimal("10")
+        ),
+        MonthlyPipelineValueReadModel(
+            owner_id="owner_2", month="2024-02", stage="closed-lost", currency="PLN", amount=Decimal("50")
+        ),
+    )
+    return query_service
+
+
+@pytest.fixture()
+def forecast_query_use_case(mock_forecast_query_service: MagicMock) -> ForecastQueryUseCase:
+    return ForecastQueryUseCase(forecast_query_service=mock_forecast_query_service)
+
+
+def test_get_forecast_converts_and_weights_amounts(forecast_query_use_case: ForecastQueryUseCase) -> None:
+    forecast = forecast_query_use_case.get_forecast(currency="pln")
+
+    result = {(entry.owner_id, entry.month): entry for entry in forecast}
+    assert result[("owner_1", "2024-01")].currency == "PLN"
+    assert result[("owner_1", "2024-01")].pipeline_amount == Decimal("140.00")
+    assert result[("owner_1", "2024-01")].weighted_amount == Decimal("54.00")
+    assert result[("owner_2", "2024-02")].pipeline_amount == Decimal("50.00")
+    assert result[("owner_2", "2024-02")].weighted_amount == Decimal("0.00")
+
+
+def test_get_forecast_with_custom_stage_weights(mock_forecast_query_service: MagicMock) -> None:
+    use_case = ForecastQueryUseCase(
+        forecast_query_service=mock_forecast_query_service, stage_weights={"proposal": Decimal("1")}
+    )
+
+    forecast = use_case.get_forecast(currency="EUR")
+
+    result = {(entry.owner_id, entry.month): entry for entry in forecast}
+    assert result[("owner_1", "2024-01")].pipeline_amount == Decimal("35.00")
+    assert result[("owner_1", "2024-01")].weighted_amount == Decimal("25.00")
+
+
+def test_get_forecast_without_exchange_rate_should_fail(forecast_query_use_case: ForecastQueryUseCase) -> None:
+    with pytest.raises(InvalidData):
+        forecast_query_use_case.get_forecast(currency="USD")
@@ -2,17 +2,26 @@ from unittest.mock import MagicMock
 
 import pytest
 
-from building_blocks.application.exceptions import ConflictingAction, ForbiddenAction, InvalidData, ObjectDoesNotExist
+from building_blocks.application.exceptions import (
+    ConcurrentModification,
+    ConflictingAction,
+    ForbiddenAction,
+    InvalidData,
+    ObjectDoesNotExist,
+)
 from building_blocks.domain.exceptions import DomainException, InvalidEmailAddress, InvalidPhoneNumber, ValueNotAllowed
+from building_blocks.infrastructure.exceptions import ObjectAlreadyExists
 from sales.application.lead.command import LeadCommandUseCase, LeadUnitOfWork
 from sales.application.lead.command_model import (
     AssignmentUpdateModel,
     ContactDataCreateUpdateModel,
     LeadCreateModel,
+    LeadsReassignmentModel,
     LeadUpdateModel,
 )
 from sales.domain.entities.lead import Lead
 from sales.domain.exceptions import (
+    CanCreateOnlyOneLeadPerCustomer,
     EmailOrPhoneNumberShouldBeSet,
     LeadAlreadyAssignedToSalesman,
     OnlyOwnerCanEditNotes,
@@ -118,7 +127,7 @@ def test_create_lead_with_invalid_salesman_id_should_fail(
     lead_uow: LeadUnitOfWork,
     lead_command_use_case: LeadCommandUseCase,
 ) -> None:
-    lead_command_use_case.salesman_uow.__enter__().repository.get.return_value = None
+    lead_command_use_case.salesman_uow.__enter__().repository.exists.return_value = False
     data = MagicMock()
 
     with pytest.raises(InvalidData):
@@ -131,6 +140,8 @@ def test_create_lead_should_fail_if_customer_already_has_a_lead(
     lead_uow: LeadUnitOfWork,
     lead_command_use_case: LeadCommandUseCase,
 ) -> None:
+    lead_uow.__enter__().repository.create.side_effect = CanCreateOnlyOneLeadPerCustomer
+    lead_command_use_case.customer_service.get_customer_status.return_value = SalesCustomerStatusName.INITIAL
     data = LeadCreateModel(
         customer_id="customer-1",
         source="ads",
@@ -145,14 +156,11 @@ def test_create_lead_should_fail_if_customer_already_has_a_lead(
     with pytest.raises(InvalidData):
         lead_command_use_case.create(lead_data=data, creator_id="salesman-1")
 
-    lead_uow.__enter__().repository.create.assert_not_called()
-
 
 def test_create_lead_should_fail_if_customer_has_not_initial_status(
     lead_uow: LeadUnitOfWork,
     lead_command_use_case: LeadCommandUseCase,
 ) -> None:
-    lead_uow.__enter__().repository.get_by_customer.return_value = None
     lead_command_use_case.customer_service.get_customer_status.return_value = SalesCustomerStatusName.CONVERTED
     data = LeadCreateModel(
         customer_id="customer-1",
@@ -175,7 +183,7 @@ def test_update_lead_assignment_with_invalid_salesman_id_should_fail(
     lead_uow: LeadUnitOfWork,
     lead_command_use_case: LeadCommandUseCase,
 ) -> None:
-    lead_command_use_case.salesman_uow.__enter__().repository.get.return_value = None
+    lead_command_use_case.salesman_uow.__enter__().repository.exists.return_value = False
     data = AssignmentUpdateModel(new_salesman_id="invalid id")
 
     with pytest.raises(InvalidData):
@@ -333,3 +341,165 @@ def test_update_assignment_by_unauthorized_user_should_fail(
         lead_command_use_case.update_assignment(
             lead_id="lead-1", requestor_id="salesman-1", assignment_data=MagicMock()
         )
+
+
+@pytest.fixture()
+def lead_import_rows() -> list[dict[str, str]]:
+    return [
+        {
+            "customer_id": "customer-1",
+            "source": "website",
+            "first_name": "John",
+            "last_name": "Doe",
+            "phone": "",
+            "email": "john@example.com",
+        },
+        {
+            "customer_id": "customer-2",
+            "source": "cold call",
+            "first_name": "Jane",
+            "last_name": "Doe",
+            "phone": "+48123123123",
+            "email": "",
+        },
+    ]
+
+
+def test_import_leads(
+    lead_uow: LeadUnitOfWork, lead_command_use_case: LeadCommandUseCase, lead_import_rows: list[dict[str, str]]
+) -> None:
+    lead_command_use_case.customer_service.get_customer_statuses.return_value = {
+        "customer-1": SalesCustomerStatusName.INITIAL,
+        "customer-2": SalesCustomerStatusName.INITIAL,
+    }
+    lead_uow.__enter__().repository.get_customers_with_lead.return_value = set()
+
+    result = lead_command_use_case.import_leads(rows=lead_import_rows, creator_id="salesman-1")
+
+    assert result.imported_count == 2
+    assert result.errors == []
+    created_leads = lead_uow.__enter__().repository.create_many.call_args.args[0]
+    assert [lead.customer_id for lead in created_leads] == ["customer-1", "customer-2"]
+
+
+def test_import_leads_creates_leads_in_batches(
+    lead_uow: LeadUnitOfWork, lead_command_use_case: LeadCommandUseCase, lead_import_rows: list[dict[str, str]]
+) -> None:
+    lead_command_use_case.customer_service.get_customer_statuses.return_value = {
+        "customer-1": SalesCustomerStatusName.INITIAL,
+        "customer-2": SalesCustomerStatusName.INITIAL,
+    }
+    lead_uow.__enter__().repository.get_customers_with_lead.return_value = set()
+
+    result = lead_command_use_case.import_leads(rows=lead_import_rows, creator_id="salesman-1", batch_size=1)
+
+    assert result.imported_count == 2
+    assert lead_uow.__enter__().repository.create_many.call_count == 2
+
+
+def test_import_leads_reports_invalid_rows(
+    lead_uow: LeadUnitOfWork, lead_command_use_case: LeadCommandUseCase, lead_import_rows: list[dict[str, str]]
+) -> None:
+    valid_row = lead_import_rows[0]
+    rows = [
+        valid_row,
+        {**valid_row, "customer_id": "customer-2", "email": "invalid email"},
+        {**valid_row, "customer_id": "customer-3", "source": "invalid source"},
+        {key: value for key, value in valid_row.items() if key != "first_name"},
+        {**valid_row, "customer_id": "non-existent"},
+        {**valid_row, "customer_id": "customer-4"},
+        {**valid_row, "customer_id": "customer-5"},
+        valid_row,
+    ]
+    lead_command_use_case.customer_service.get_customer_statuses.return_value = {
+        "customer-1": SalesCustomerStatusName.INITIAL,
+        "customer-4": SalesCustomerStatusName.CONVERTED,
+        "customer-5": SalesCustomerStatusName.INITIAL,
+    }
+    lead_uow.__enter__().repository.get_customers_with_lead.return_value = {"customer-5"}
+
+    result = lead_command_use_case.import_leads(rows=rows, creator_id="salesman-1")
+
+    assert result.imported_count == 1
+    assert [error.row for error in result.errors] == [2, 3, 4, 5, 6, 7, 8]
+
+
+@pytest.mark.parametrize("exception", [CanCreateOnlyOneLeadPerCustomer, ObjectAlreadyExists])
+def test_import_leads_reports_rows_of_batch_rejected_by_repository(
+    lead_uow: LeadUnitOfWork,
+    lead_command_use_case: LeadCommandUseCase,
+    lead_import_rows: list[dict[str, str]],
+    exception: type[Exception],
+) -> None:
+    lead_command_use_case.customer_service.get_customer_statuses.return_value = {
+        "customer-1": SalesCustomerStatusName.INITIAL,
+        "customer-2": SalesCustomerStatusName.INITIAL,
+    }
+    lead_uow.__enter__().repository.get_customers_with_lead.return_value = set()
+    lead_uow.__enter__().repository.create_many.side_effect = [exception(), None]
+
+    result = lead_command_use_case.import_leads(rows=lead_import_rows, creator_id="salesman-1", batch_size=1)
+
+    assert result.imported_count == 1
+    assert [error.row for error in result.errors] == [1]
+
+
+def test_import_leads_with_invalid_salesman_id_should_fail(
+    lead_uow: LeadUnitOfWork, lead_command_use_case: LeadCommandUseCase, lead_import_rows: list[dict[str, str]]
+) -> None:
+    lead_command_use_case.salesman_uow.__enter__().repository.exists.return_value = False
+
+    with pytest.raises(InvalidData):
+        lead_command_use_case.import_leads(rows=lead_import_rows, creator_id="salesman-1")
+
+    lead_uow.__enter__().repository.create_many.assert_not_called()
+
+
+def test_reassign_leads(lead_uow: LeadUnitOfWork, lead_command_use_case: LeadCommandUseCase) -> None:
+    lead_uow.__enter__().repository.reassign_leads.return_value = 3
+    data = LeadsReassignmentModel(current_salesman_id="salesman-1", new_salesman_id="salesman-2")
+
+    result = lead_command_use_case.reassign_leads(data, requestor_id="admin-1")
+
+    assert result.reassigned_count == 3
+    assignment = lead_uow.__enter__().repository.reassign_leads.call_args.args[0]
+    assert assignment.previous_owner_id == "salesman-1"
+    assert assignment.new_owner_id == "salesman-2"
+    assert assignment.assigned_by_id == "admin-1"
+
+
+def test_reassign_leads_to_the_same_salesman_should_fail(
+    lead_uow: LeadUnitOfWork, lead_command_use_case: LeadCommandUseCase
+) -> None:
+    data = LeadsReassignmentModel(current_salesman_id="salesman-1", new_salesman_id="salesman-1")
+
+    with pytest.raises(ConflictingAction):
+        lead_command_use_case.reassign_leads(data, requestor_id="admin-1")
+
+    lead_uow.__enter__().repository.reassign_leads.assert_not_called()
+
+
+def test_reassign_leads_to_invalid_salesman_should_fail(
+    lead_uow: LeadUnitOfWork, lead_command_use_case: LeadCommandUseCase
+) -> None:
+    lead_command_use_case.salesman_uow.__enter__().repository.exists.return_value = False
+    data = LeadsReassignmentModel(current_salesman_id="salesman-1", new_salesman_id="salesman-2")
+
+    with pytest.raises(InvalidData):
+        lead_command_use_case.reassign_leads(data, requestor_id="admin-1")
+
+    lead_uow.__enter__().repository.reassign_leads.assert_not_called()
+
+
+def test_update_with_stale_version_should_fail(
+    lead_uow: LeadUnitOfWork, lead_command_use_case: LeadCommandUseCase, mock_lead: MagicMock
+) -> None:
+    mock_lead.version = 2
+    lead_uow.__enter__().repository.get.return_value = mock_lead
+
+    with pytest.raises(ConcurrentModification):
+        lead_command_use_case.update(
+            lead_id="lead-1", editor_id="salesman-1", lead_data=LeadUpdateModel(), expected_version=1
+        )
+
+    lead_uow.__enter__().repository.update.assert_not_called()
@@ -3,7 +3,12 @@ from unittest.mock import MagicMock
 
 import pytest
 
-from building_blocks.application.exceptions import ForbiddenAction, InvalidData, ObjectDoesNotExist
+from building_blocks.application.exceptions import (
+    ConcurrentModification,
+    ForbiddenAction,
+    InvalidData,
+    ObjectDoesNotExist,
+)
 from building_blocks.domain.exceptions import DomainException
 from sales.application.opportunity.command import OpportunityCommandUseCase, OpportunityUnitOfWork
 from sales.application.opportunity.command_model import (
@@ -119,7 +124,7 @@ def test_create_opportunity_with_invalid_salesman_id_should_fail(
     opportunity_uow: OpportunityUnitOfWork,
     opportunity_command_use_case: OpportunityCommandUseCase,
 ) -> None:
-    opportunity_command_use_case.salesman_uow.__enter__().repository.get.return_value = None
+    opportunity_command_use_case.salesman_uow.__enter__().repository.exists.return_value = False
     data = MagicMock()
 
     with pytest.raises(InvalidData):
@@ -147,6 +152,25 @@ def test_create_opportunity_should_fail_if_customer_has_not_converted_status(
     opportunity_uow.__enter__().repository.create.assert_not_called()
 
 
+def test_create_opportunity_should_update_pipeline_stats(
+    opportunity_uow: OpportunityUnitOfWork,
+    opportunity_command_use_case: OpportunityCommandUseCase,
+) -> None:
+    opportunity_command_use_case.customer_service.get_customer_status.return_value = SalesCustomerStatusName.CONVERTED
+    data = OpportunityCreateModel(
+        customer_id="customer_1",
+        source="ads",
+        priority="medium",
+        offer=[valid_offer_item_example, valid_offer_item_example],
+    )
+
+    opportunity_command_use_case.create(data=data, creator_id="salesman-1")
+
+    opportunity_uow.__enter__().pipeline_stats.apply.assert_called_once_with(
+        {("salesman-1", "qualification", "USD"): (Decimal("200"), 2)}
+    )
+
+
 @pytest.mark.parametrize(
     "data",
     [
@@ -262,3 +286,19 @@ def test_calling_method_by_unauthorized_user_should_fail(
         getattr(opportunity_command_use_case, method_name)(
             opportunity_id="opp-1", editor_id="salesman-1", **data_kwargs
         )
+
+
+def test_update_with_stale_version_should_fail(
+    opportunity_uow: OpportunityUnitOfWork,
+    opportunity_command_use_case: OpportunityCommandUseCase,
+    mock_opportunity: MagicMock,
+) -> None:
+    mock_opportunity.version = 2
+    opportunity_uow.__enter__().repository.get.return_value = mock_opportunity
+
+    with pytest.raises(ConcurrentModification):
+        opportunity_command_use_case.update(
+            opportunity_id="opp-1", editor_id="salesman-1", data=OpportunityUpdateModel(), expected_version=1
+        )
+
+    opportunity_uow.__enter__().repository.update.assert_not_called()
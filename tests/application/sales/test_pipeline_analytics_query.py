@@ -0,0 +1,27 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from sales.application.analytics.query import PipelineAnalyticsQueryUseCase
+from sales.application.analytics.query_service import PipelineAnalyticsQueryService
+
+
+@pytest.fixture()
+def mock_analytics_query_service() -> PipelineAnalyticsQueryService:
+    return MagicMock(PipelineAnalyticsQueryService)
+
+
+@pytest.fixture()
+def analytics_query_use_case(
+    mock_analytics_query_service: PipelineAnalyticsQueryService,
+) -> PipelineAnalyticsQueryUseCase:
+    return PipelineAnalyticsQueryUseCase(analytics_query_service=mock_analytics_query_service)
+
+
+def test_get_pipeline_stats_should_pass_unique_dimensions_in_order(
+    analytics_query_use_case: PipelineAnalyticsQueryUseCase,
+    mock_analytics_query_service: MagicMock,
+) -> None:
+    analytics_query_use_case.get_pipeline_stats(group_by=["owner", "stage", "owner"])
+
+    mock_analytics_query_service.get_pipeline_stats.assert_called_once_with(("owner", "stage"))
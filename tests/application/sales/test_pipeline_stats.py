@@ -0,0 +1,71 @@
+from decimal import Decimal
+
+import pytest
+
+from sales.application.analytics.pipeline_stats import get_pipeline_contribution, get_pipeline_stats_delta
+from sales.domain.entities.opportunity import Opportunity
+from sales.domain.value_objects.acquisition_source import AcquisitionSource
+from sales.domain.value_objects.money.currency import Currency
+from sales.domain.value_objects.money.money import Money
+from sales.domain.value_objects.offer_item import OfferItem
+from sales.domain.value_objects.opportunity_stage import OpportunityStage
+from sales.domain.value_objects.priority import Priority
+from sales.domain.value_objects.product import Product
+
+
+def create_offer_item(iso_code: str, amount: str) -> OfferItem:
+    currency = Currency(name=iso_code, iso_code=iso_code)
+    return OfferItem(product=Product(name="product"), value=Money(currency=currency, amount=Decimal(amount)))
+
+
+@pytest.fixture()
+def opportunity() -> Opportunity:
+    return Opportunity.make(
+        id="opp-1",
+        created_by_id="salesman-1",
+        customer_id="customer-1",
+        source=AcquisitionSource(name="ads"),
+        stage=OpportunityStage(name="qualification"),
+        priority=Priority(level="medium"),
+        offer=(
+            create_offer_item("USD", "100"),
+            create_offer_item("USD", "50.5"),
+            create_offer_item("EUR", "10"),
+        ),
+    )
+
+
+def test_get_pipeline_contribution_groups_offer_items(opportunity: Opportunity) -> None:
+    contribution = get_pipeline_contribution(opportunity)
+
+    assert contribution == {
+        ("salesman-1", "qualification", "USD"): (Decimal("150.5"), 2),
+        ("salesman-1", "qualification", "EUR"): (Decimal("10"), 1),
+    }
+
+
+def test_get_pipeline_stats_delta_contains_only_changed_keys(opportunity: Opportunity) -> None:
+    before = get_pipeline_contribution(opportunity)
+    opportunity.modify_offer(
+        new_offer=(create_offer_item("USD", "100"), create_offer_item("USD", "50.5"), create_offer_item("NOK", "5")),
+        editor_id="salesman-1",
+    )
+    after = get_pipeline_contribution(opportunity)
+
+    delta = get_pipeline_stats_delta(before=before, after=after)
+
+    assert delta == {
+        ("salesman-1", "qualification", "EUR"): (Decimal("-10"), -1),
+        ("salesman-1", "qualification", "NOK"): (Decimal("5"), 1),
+    }
+
+
+def test_get_pipeline_stats_delta_moves_stats_between_stages(opportunity: Opportunity) -> None:
+    before = get_pipeline_contribution(opportunity)
+    opportunity.update(editor_id="salesman-1", stage=OpportunityStage(name="proposal"))
+    after = get_pipeline_contribution(opportunity)
+
+    delta = get_pipeline_stats_delta(before=before, after=after)
+
+    assert delta[("salesman-1", "qualification", "USD")] == (Decimal("-150.5"), -2)
+    assert delta[("salesman-1", "proposal", "USD")] == (Decimal("150.5"), 2)
@@ -30,3 +30,12 @@ def test_calling_method_wrong_sales_representative_id_should_fail(
 
     with pytest.raises(ObjectDoesNotExist):
         getattr(sr_query_use_case, method_name)(sales_representative_id)
+
+
+def test_get_by_ids_should_pass_unique_ids_in_order(
+    sr_query_use_case: SalesRepresentativeQueryUseCase,
+    mock_sr_query_service: MagicMock,
+) -> None:
+    sr_query_use_case.get_by_ids(["id_2", "id_1", "id_2"])
+
+    mock_sr_query_service.get_by_ids.assert_called_once_with(("id_2", "id_1"))
@@ -38,6 +38,19 @@ def test_container_manager_correctly_builds_container(
     assert isinstance(container, app_container_class)
 
 
+def test_container_manager_reads_persistence_engine_when_building(
+    container_manager: type[ContainerManager],
+    app_container_class: type[DummyApplicationContainer],
+    engine_name: str,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("PERSISTENCE_ENGINE", engine_name)
+
+    container = container_manager.build()
+
+    assert isinstance(container, app_container_class)
+
+
 def test_build_with_invalid_persistence_engine_should_fail(
     container_manager: type[ContainerManager],
 ) -> None:
@@ -0,0 +1,25 @@
+from unittest.mock import MagicMock
+
+from containers.container import ApplicationContainer
+
+
+class DummyApplicationContainer(ApplicationContainer):
+    def __init__(self) -> None:
+        self.language_vo_service = MagicMock()
+        self.country_vo_service = MagicMock()
+        self.currency_vo_service = MagicMock()
+        self.product_vo_service = MagicMock()
+
+
+def test_warm_up_loads_reference_data() -> None:
+    container = DummyApplicationContainer()
+
+    container.warm_up()
+
+    for vo_service in (
+        container.language_vo_service,
+        container.country_vo_service,
+        container.currency_vo_service,
+        container.product_vo_service,
+    ):
+        vo_service.get_all.assert_called_once_with()
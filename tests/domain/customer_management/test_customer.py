@@ -1,6 +1,3 @@
-from collections.abc import Sequence
-from unittest.mock import MagicMock
-
 import pytest
 
 from building_blocks.domain.exceptions import DuplicateEntry, InvalidEmailAddress, InvalidPhoneNumber, ValueNotAllowed
@@ -450,28 +447,10 @@ def test_remove_contact_person_by_non_relation_manager_should_fail(
         customer_with_contact_persons.remove_contact_person(editor_id="non manager", id_to_remove=person_id)
 
 
-@pytest.mark.parametrize(
-    "opportunities",
-    [
-        tuple(),
-        (MagicMock(stage_name="closed-won"), MagicMock(stage_name="closed-lost")),
-    ],
-)
-def test_ensure_all_opportunities_are_closed_should_not_fail_if_does_not_have_open_opportunities(
-    opportunities: Sequence,
-) -> None:
-    ensure_all_opportunities_are_closed(opportunities)
+def test_ensure_all_opportunities_are_closed_should_not_fail_if_does_not_have_open_opportunities() -> None:
+    ensure_all_opportunities_are_closed(has_open_opportunities=False)
 
 
-@pytest.mark.parametrize(
-    "opportunities",
-    [
-        (MagicMock(stage_name="closed-won"), MagicMock(stage_name="other")),
-        (MagicMock(stage_name="other"),),
-    ],
-)
-def test_ensure_all_opportunities_are_closed_should_fail_if_has_open_opportunities(
-    opportunities: Sequence,
-) -> None:
+def test_ensure_all_opportunities_are_closed_should_fail_if_has_open_opportunities() -> None:
     with pytest.raises(CustomerStillHasNotClosedOpportunities):
-        ensure_all_opportunities_are_closed(opportunities)
+        ensure_all_opportunities_are_closed(has_open_opportunities=True)
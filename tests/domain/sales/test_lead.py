@@ -1,5 +1,4 @@
 import datetime as dt
-from unittest.mock import MagicMock
 
 import pytest
 
@@ -8,14 +7,13 @@ from sales.domain.entities.lead import Lead
 from sales.domain.entities.lead_assignments import LeadAssignments
 from sales.domain.entities.notes import Notes
 from sales.domain.exceptions import (
-    CanCreateOnlyOneLeadPerCustomer,
     LeadAlreadyAssignedToSalesman,
     LeadCanBeCreatedOnlyForInitialCustomer,
     OnlyOwnerCanEditNotes,
     OnlyOwnerCanModifyLeadData,
     UnauthorizedLeadOwnerChange,
 )
-from sales.domain.service.lead import ensure_customer_has_initial_status, ensure_one_lead_per_customer
+from sales.domain.service.lead import create_leads_reassignment, ensure_customer_has_initial_status
 from sales.domain.service.shared import SalesCustomerStatusName
 from sales.domain.value_objects.acquisition_source import AcquisitionSource
 from sales.domain.value_objects.contact_data import ContactData
@@ -23,11 +21,6 @@ from sales.domain.value_objects.lead_assignment_entry import LeadAssignmentEntry
 from sales.domain.value_objects.note import Note
 
 
-@pytest.fixture()
-def lead_repo() -> MagicMock:
-    return MagicMock()
-
-
 @pytest.fixture()
 def contact_data() -> ContactData:
     return ContactData(
@@ -211,6 +204,28 @@ def test_assign_salesman_by_non_owner_should_fail(lead: Lead) -> None:
         lead.assign_salesman(new_salesman_id="salesman_3", requestor_id="salesman_4")
 
 
+def test_apply_reassignment_by_non_owner(lead: Lead) -> None:
+    lead.assign_salesman(new_salesman_id="salesman_2", requestor_id="salesman_1")
+
+    lead.apply_reassignment(
+        create_leads_reassignment(current_salesman_id="salesman_2", new_salesman_id="salesman_3", requestor_id="admin")
+    )
+
+    assert lead.assigned_salesman_id == "salesman_3"
+    assert lead.most_recent_assignment.assigned_by_id == "admin"
+
+
+def test_apply_reassignment_of_other_owner_should_fail(lead: Lead) -> None:
+    lead.assign_salesman(new_salesman_id="salesman_2", requestor_id="salesman_1")
+
+    with pytest.raises(UnauthorizedLeadOwnerChange):
+        lead.apply_reassignment(
+            create_leads_reassignment(
+                current_salesman_id="salesman_3", new_salesman_id="salesman_4", requestor_id="admin"
+            )
+        )
+
+
 def test_change_note_by_assigned_salesman(lead: Lead) -> None:
     lead.assign_salesman(new_salesman_id="salesman_1", requestor_id="salesman_1")
     lead.change_note(new_content="Updated Note", editor_id="salesman_1")
@@ -254,19 +269,6 @@ def test_assigning_lead_to_current_owner_should_fail(lead: Lead) -> None:
         lead.assign_salesman(new_salesman_id=lead.assigned_salesman_id, requestor_id=lead.assigned_salesman_id)
 
 
-def test_ensure_one_lead_per_customer_should_not_fail_when_lead_does_not_exist(lead_repo: MagicMock) -> None:
-    lead_repo.get_by_customer.return_value = None
-
-    ensure_one_lead_per_customer(lead_repo=lead_repo, customer_id="customer id")
-
-
-def test_ensure_one_lead_per_customer_should_fail_if_lead_already_exists(lead_repo: MagicMock) -> None:
-    lead_repo.get_by_customer.return_value = MagicMock()
-
-    with pytest.raises(CanCreateOnlyOneLeadPerCustomer):
-        ensure_one_lead_per_customer(lead_repo=lead_repo, customer_id="customer id")
-
-
 def test_ensure_customer_has_initial_status_should_not_fail_if_customer_has_initial_status() -> None:
     ensure_customer_has_initial_status(SalesCustomerStatusName.INITIAL)
 
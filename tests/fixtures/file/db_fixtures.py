@@ -7,6 +7,9 @@ FILE_TEST_DATA_FOLDER = Path(__file__).parent.parent.parent / "infrastructure/fi
 FILE_LEAD_TEST_DATA_PATH = FILE_TEST_DATA_FOLDER / "test-lead"
 FILE_CUSTOMER_TEST_DATA_PATH = FILE_TEST_DATA_FOLDER / "test-customer"
 FILE_OPPORTUNITY_TEST_DATA_PATH = FILE_TEST_DATA_FOLDER / "test-opportunity"
+FILE_PIPELINE_STATS_TEST_DATA_PATH = FILE_TEST_DATA_FOLDER / "test-pipeline-stats"
+FILE_OPEN_OPPORTUNITIES_TEST_DATA_PATH = FILE_TEST_DATA_FOLDER / "test-open-opportunities"
+FILE_EXCHANGE_RATES_TEST_DATA_PATH = FILE_TEST_DATA_FOLDER / "test-exchange-rates"
 FILE_SALES_REPRESENTATIVE_TEST_DATA_PATH = FILE_TEST_DATA_FOLDER / "test-sales-representative"
 FILE_VO_TEST_DATA_PATH = FILE_TEST_DATA_FOLDER / "test-vo"
 
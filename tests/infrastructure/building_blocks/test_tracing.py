@@ -0,0 +1,44 @@
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from building_blocks.application.tracing import Span
+from building_blocks.infrastructure.tracing import ConsoleSpanExporter, FileSpanExporter, get_span_exporter
+
+
+@pytest.fixture()
+def span() -> Span:
+    return Span(name="request", trace_id="a" * 32, span_id="b" * 16, parent_id=None, start_time_ns=1, end_time_ns=2)
+
+
+def test_console_exporter_writes_json_line(span: Span) -> None:
+    stream = io.StringIO()
+
+    ConsoleSpanExporter(stream).export(span)
+
+    assert json.loads(stream.getvalue())["name"] == "request"
+
+
+def test_file_exporter_appends_json_lines(span: Span, tmp_path: Path) -> None:
+    exporter = FileSpanExporter(tmp_path / "traces.jsonl")
+
+    exporter.export(span)
+    exporter.export(span)
+
+    lines = (tmp_path / "traces.jsonl").read_text().splitlines()
+    assert len(lines) == 2
+    assert json.loads(lines[0])["context"]["span_id"] == "0x" + "b" * 16
+
+
+@pytest.mark.parametrize(
+    "name,exporter_type", [("off", type(None)), ("console", ConsoleSpanExporter), ("FILE", FileSpanExporter)]
+)
+def test_get_span_exporter(name: str, exporter_type: type) -> None:
+    assert isinstance(get_span_exporter(name), exporter_type)
+
+
+def test_get_span_exporter_with_invalid_name_should_fail() -> None:
+    with pytest.raises(ValueError):
+        get_span_exporter("jaeger")
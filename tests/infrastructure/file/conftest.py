@@ -1,5 +1,7 @@
 import pytest
 
+from building_blocks.application.cache import TTLCache
+from containers.container import CUSTOMER_STATUS_CACHE_TTL
 from customer_management.application.acl import OpportunityService, SalesRepresentativeService
 from customer_management.application.command import CustomerCommandUseCase
 from customer_management.infrastructure.file.customer.command import CustomerFileUnitOfWork
@@ -8,7 +10,7 @@ from sales.application.lead.command import LeadCommandUseCase
 from sales.application.opportunity.command import OpportunityCommandUseCase
 from sales.application.sales_representative.command import SalesRepresentativeCommandUseCase
 from sales.infrastructure.file.lead.command import LeadFileUnitOfWork
-from sales.infrastructure.file.opportunity.command import OpportunityFileUnitOfWork
+from sales.infrastructure.file.opportunity.command import OpenOpportunitiesFileUnitOfWork, OpportunityFileUnitOfWork
 from sales.infrastructure.file.sales_representative.command import SalesRepresentativeFileUnitOfWork
 from tests.fixtures.file.data_fixtures import (
     address,
@@ -33,16 +35,23 @@ from tests.fixtures.file.data_fixtures import (
 from tests.fixtures.file.db_fixtures import (
     FILE_CUSTOMER_TEST_DATA_PATH,
     FILE_LEAD_TEST_DATA_PATH,
+    FILE_OPEN_OPPORTUNITIES_TEST_DATA_PATH,
     FILE_OPPORTUNITY_TEST_DATA_PATH,
+    FILE_PIPELINE_STATS_TEST_DATA_PATH,
     FILE_SALES_REPRESENTATIVE_TEST_DATA_PATH,
     clear_file_test_data,
 )
 
 
 @pytest.fixture(scope="session")
-def customer_service() -> ICustomerService:
+def customer_status_cache() -> TTLCache[str, str]:
+    return TTLCache(ttl=CUSTOMER_STATUS_CACHE_TTL)
+
+
+@pytest.fixture(scope="session")
+def customer_service(customer_status_cache: TTLCache[str, str]) -> ICustomerService:
     customer_uow = CustomerFileUnitOfWork(FILE_CUSTOMER_TEST_DATA_PATH)
-    return CustomerService(customer_uow=customer_uow)
+    return CustomerService(customer_uow=customer_uow, status_cache=customer_status_cache)
 
 
 @pytest.fixture(scope="session")
@@ -52,7 +61,9 @@ def sr_uow() -> SalesRepresentativeFileUnitOfWork:
 
 @pytest.fixture(scope="session")
 def opportunity_uow() -> OpportunityFileUnitOfWork:
-    return OpportunityFileUnitOfWork(FILE_OPPORTUNITY_TEST_DATA_PATH)
+    return OpportunityFileUnitOfWork(
+        FILE_OPPORTUNITY_TEST_DATA_PATH, FILE_PIPELINE_STATS_TEST_DATA_PATH, FILE_OPEN_OPPORTUNITIES_TEST_DATA_PATH
+    )
 
 
 @pytest.fixture(scope="session")
@@ -90,13 +101,15 @@ def opportunity_command_use_case(
 def customer_command_use_case(
     sr_uow: SalesRepresentativeFileUnitOfWork,
     opportunity_uow: OpportunityFileUnitOfWork,
+    customer_status_cache: TTLCache[str, str],
 ) -> CustomerCommandUseCase:
     sales_rep_service = SalesRepresentativeService(salesman_uow=sr_uow)
-    opportunity_service = OpportunityService(opportunity_uow=opportunity_uow)
+    opportunity_service = OpportunityService(opportunity_uow=OpenOpportunitiesFileUnitOfWork(opportunity_uow))
     uow = CustomerFileUnitOfWork(FILE_CUSTOMER_TEST_DATA_PATH)
     command_use_case = CustomerCommandUseCase(
         customer_uow=uow,
         sales_rep_service=sales_rep_service,
         opportunity_service=opportunity_service,
+        customer_status_cache=customer_status_cache,
     )
     return command_use_case
@@ -81,3 +81,11 @@ def test_methods_should_return_none_if_not_found(query_service: CustomerFileQuer
     customer = getattr(query_service, method_name)(customer_id="invalid id")
 
     assert customer is None
+
+
+def test_get_by_ids(query_service: CustomerFileQueryService, all_customers: Sequence[CustomerReadModel]) -> None:
+    ids = [entry.id for entry in all_customers[:2]]
+
+    result = query_service.get_by_ids([*ids, "invalid id"])
+
+    assert {entry.id for entry in result} == set(ids)
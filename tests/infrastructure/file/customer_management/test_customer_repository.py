@@ -1,8 +1,10 @@
+from types import SimpleNamespace
 from uuid import uuid4
 
 import pytest
-from attrs import define
+from attrs import define, field
 
+from building_blocks.application.exceptions import ConcurrentModification
 from building_blocks.infrastructure.exceptions import ObjectAlreadyExists
 from customer_management.infrastructure.file.customer.repository import CustomerFileRepository
 
@@ -13,6 +15,12 @@ pytestmark = pytest.mark.integration
 class DummyCustomer:
     id: str
     relation_manager_id: str
+    status: str = "initial"
+    version: int = 1
+    contact_persons: list = field(factory=list)
+
+    def update(self, editor_id: str, relation_manager_id: str) -> None:
+        self.relation_manager_id = relation_manager_id
 
 
 @pytest.fixture(scope="session")
@@ -59,3 +67,69 @@ def test_update(customer_repo: CustomerFileRepository, customer: DummyCustomer)
 
     fetched_customer = customer_repo.get(customer.id)
     assert fetched_customer.relation_manager_id == new_salesman_id
+
+
+def test_update_with_stale_version_should_fail() -> None:
+    customer_repo = CustomerFileRepository(db={})
+    customer = DummyCustomer(id=str(uuid4()), relation_manager_id="some id")
+    customer_repo.create(customer)
+    stale_customer = DummyCustomer(id=customer.id, relation_manager_id="new id", version=0)
+
+    with pytest.raises(ConcurrentModification):
+        customer_repo.update(stale_customer)
+
+
+def test_get_statuses(customer_repo: CustomerFileRepository, customer: DummyCustomer) -> None:
+    statuses = customer_repo.get_statuses([customer.id, "invalid id"])
+
+    assert statuses == {customer.id: customer.status}
+
+
+def test_exists(customer_repo: CustomerFileRepository, customer: DummyCustomer) -> None:
+    assert customer_repo.exists(customer.id)
+    assert not customer_repo.exists("invalid id")
+
+
+def test_get_status(customer_repo: CustomerFileRepository, customer: DummyCustomer) -> None:
+    assert customer_repo.get_status(customer.id) == customer.status
+    assert customer_repo.get_status("invalid id") is None
+
+
+def test_create_many() -> None:
+    customer_repo = CustomerFileRepository(db={})
+    customers = [DummyCustomer(id=str(uuid4()), relation_manager_id="some id") for _ in range(2)]
+
+    customer_repo.create_many(customers)
+
+    assert all(customer_repo.get(customer.id) is not None for customer in customers)
+
+
+def test_create_many_with_existing_id_should_fail(
+    customer_repo: CustomerFileRepository, customer: DummyCustomer
+) -> None:
+    with pytest.raises(ObjectAlreadyExists):
+        customer_repo.create_many([customer])
+
+
+def test_reassign_relation_manager() -> None:
+    customer_repo = CustomerFileRepository(db={})
+    customers = [DummyCustomer(id=str(uuid4()), relation_manager_id=salesman_id) for salesman_id in ("old", "other")]
+    customer_repo.create_many(customers)
+
+    reassigned_count = customer_repo.reassign_relation_manager(
+        current_relation_manager_id="old", new_relation_manager_id="new"
+    )
+
+    assert reassigned_count == 1
+    assert [customer_repo.get(customer.id).relation_manager_id for customer in customers] == ["new", "other"]
+    assert [customer_repo.get(customer.id).version for customer in customers] == [2, 1]
+
+
+def test_get_used_contact_method_values() -> None:
+    customer_repo = CustomerFileRepository(db={})
+    person = SimpleNamespace(contact_methods=[SimpleNamespace(value="used@example.com")])
+    customer_repo.create(DummyCustomer(id=str(uuid4()), relation_manager_id="some id", contact_persons=[person]))
+
+    used_values = customer_repo.get_used_contact_method_values(["used@example.com", "unused@example.com"])
+
+    assert used_values == {"used@example.com"}
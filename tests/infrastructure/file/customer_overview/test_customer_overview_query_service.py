@@ -0,0 +1,53 @@
+import pytest
+
+from customer_management.application.query_model import CustomerReadModel
+from customer_overview.infrastructure.file.query_service import CustomerOverviewFileQueryService
+from sales.application.lead.query_model import LeadReadModel
+from sales.application.opportunity.query_model import OpportunityReadModel
+from tests.fixtures.file.db_fixtures import (
+    FILE_CUSTOMER_TEST_DATA_PATH,
+    FILE_LEAD_TEST_DATA_PATH,
+    FILE_OPPORTUNITY_TEST_DATA_PATH,
+)
+
+
+@pytest.fixture()
+def query_service() -> CustomerOverviewFileQueryService:
+    return CustomerOverviewFileQueryService(
+        customers_file_path=FILE_CUSTOMER_TEST_DATA_PATH,
+        leads_file_path=FILE_LEAD_TEST_DATA_PATH,
+        opportunities_file_path=FILE_OPPORTUNITY_TEST_DATA_PATH,
+    )
+
+
+@pytest.mark.usefixtures("opportunity_2", "opportunity_3", "lead_1")
+def test_get_returns_customer_with_opportunities(
+    query_service: CustomerOverviewFileQueryService,
+    customer_1: CustomerReadModel,
+    opportunity_1: OpportunityReadModel,
+) -> None:
+    overview = query_service.get(customer_1.id)
+
+    assert overview is not None
+    assert overview.customer.id == customer_1.id
+    assert len(overview.contact_persons) == 1
+    opportunities = {opportunity.id: opportunity for opportunity in overview.opportunities}
+    assert len(opportunities) >= 3
+    assert opportunities[opportunity_1.id].offer_totals
+    assert len(opportunities[opportunity_1.id].latest_notes) == 1
+
+
+def test_get_returns_customer_with_lead(
+    query_service: CustomerOverviewFileQueryService,
+    lead_1: LeadReadModel,
+) -> None:
+    overview = query_service.get(lead_1.customer_id)
+
+    assert overview is not None
+    assert overview.lead is not None
+    assert overview.lead.id == lead_1.id
+    assert overview.opportunities == []
+
+
+def test_get_non_existent_customer_returns_none(query_service: CustomerOverviewFileQueryService) -> None:
+    assert query_service.get("invalid_id") is None
@@ -0,0 +1,70 @@
+from decimal import Decimal
+
+import pytest
+
+from sales.application.forecast.command import ExchangeRateCommandUseCase
+from sales.application.forecast.command_model import ExchangeRateCreateUpdateModel
+from sales.application.opportunity.query_model import OpportunityReadModel
+from sales.infrastructure.file.forecast.command import ExchangeRateFileUnitOfWork
+from sales.infrastructure.file.forecast.query_service import ForecastFileQueryService
+from sales.infrastructure.file.opportunity.query_service import OpportunityFileQueryService
+from tests.fixtures.file.db_fixtures import FILE_EXCHANGE_RATES_TEST_DATA_PATH, FILE_OPPORTUNITY_TEST_DATA_PATH
+
+
+@pytest.fixture()
+def query_service() -> ForecastFileQueryService:
+    return ForecastFileQueryService(
+        opportunities_file_path=FILE_OPPORTUNITY_TEST_DATA_PATH,
+        exchange_rates_file_path=FILE_EXCHANGE_RATES_TEST_DATA_PATH,
+    )
+
+
+@pytest.fixture()
+def exchange_rate_command_use_case() -> ExchangeRateCommandUseCase:
+    return ExchangeRateCommandUseCase(exchange_rate_uow=ExchangeRateFileUnitOfWork(FILE_EXCHANGE_RATES_TEST_DATA_PATH))
+
+
+@pytest.mark.usefixtures("opportunity_1", "opportunity_2", "opportunity_3")
+def test_get_monthly_pipeline_values_matches_offers(query_service: ForecastFileQueryService) -> None:
+    opportunity_qs = OpportunityFileQueryService(opportunities_file_path=FILE_OPPORTUNITY_TEST_DATA_PATH)
+    expected: dict[tuple[str, str], Decimal] = {}
+    for opportunity in opportunity_qs.get_all():
+        for offer_item in opportunity_qs.get_offer(opportunity.id) or ():
+            key = (opportunity.owner_id, offer_item.value.currency.iso_code)
+            expected[key] = expected.get(key, Decimal()) + offer_item.value.amount
+
+    values = query_service.get_monthly_pipeline_values()
+
+    result: dict[tuple[str, str], Decimal] = {}
+    for value in values:
+        key = (value.owner_id, value.currency)
+        result[key] = result.get(key, Decimal()) + value.amount
+    assert result == expected
+    assert all(len(value.month) == len("YYYY-MM") for value in values)
+
+
+def test_get_monthly_pipeline_values_groups_by_stage(
+    query_service: ForecastFileQueryService, opportunity_1: OpportunityReadModel
+) -> None:
+    values = query_service.get_monthly_pipeline_values()
+
+    keys = [(value.owner_id, value.month, value.stage, value.currency) for value in values]
+    assert len(keys) == len(set(keys))
+    assert opportunity_1.stage in {value.stage for value in values if value.owner_id == opportunity_1.owner_id}
+
+
+def test_set_exchange_rates_replaces_previous_rates(
+    query_service: ForecastFileQueryService,
+    exchange_rate_command_use_case: ExchangeRateCommandUseCase,
+) -> None:
+    exchange_rate_command_use_case.set_rates([ExchangeRateCreateUpdateModel(iso_code="GBP", rate=Decimal("5.1"))])
+    exchange_rate_command_use_case.set_rates(
+        [
+            ExchangeRateCreateUpdateModel(iso_code="usd", rate=Decimal("4.02")),
+            ExchangeRateCreateUpdateModel(iso_code="PLN", rate=Decimal("1")),
+        ]
+    )
+
+    rates = query_service.get_exchange_rates()
+
+    assert [(rate.iso_code, rate.rate) for rate in rates] == [("PLN", Decimal("1")), ("USD", Decimal("4.02"))]
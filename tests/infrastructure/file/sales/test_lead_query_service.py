@@ -73,3 +73,11 @@ def test_methods_should_return_none_if_not_found(query_service: LeadFileQuerySer
     lead = getattr(query_service, method_name)(lead_id="invalid id")
 
     assert lead is None
+
+
+def test_get_by_ids(query_service: LeadFileQueryService, all_leads: Sequence[LeadReadModel]) -> None:
+    ids = [entry.id for entry in all_leads[:2]]
+
+    result = query_service.get_by_ids([*ids, "invalid id"])
+
+    assert {entry.id for entry in result} == set(ids)
@@ -3,7 +3,13 @@ from uuid import uuid4
 import pytest
 from attrs import define
 
+from building_blocks.application.exceptions import ConcurrentModification
 from building_blocks.infrastructure.exceptions import ObjectAlreadyExists
+from sales.domain.entities.lead import Lead
+from sales.domain.exceptions import CanCreateOnlyOneLeadPerCustomer
+from sales.domain.service.lead import create_leads_reassignment
+from sales.domain.value_objects.acquisition_source import AcquisitionSource
+from sales.domain.value_objects.contact_data import ContactData
 from sales.infrastructure.file.lead.repository import LeadFileRepository
 
 pytestmark = pytest.mark.integration
@@ -13,6 +19,11 @@ pytestmark = pytest.mark.integration
 class DummyLead:
     id: str
     assigned_salesman_id: str
+    customer_id: str = "some customer"
+    version: int = 1
+
+    def assign_salesman(self, new_salesman_id: str, requestor_id: str) -> None:
+        self.assigned_salesman_id = new_salesman_id
 
 
 @pytest.fixture(scope="session")
@@ -49,6 +60,20 @@ def test_create_with_existing_id_should_fail(lead_repo: LeadFileRepository, lead
         lead_repo.create(lead)
 
 
+def test_create_second_lead_for_customer_should_fail(lead_repo: LeadFileRepository, lead: DummyLead) -> None:
+    other_lead = DummyLead(id=str(uuid4()), assigned_salesman_id="some id", customer_id=lead.customer_id)
+
+    with pytest.raises(CanCreateOnlyOneLeadPerCustomer):
+        lead_repo.create(other_lead)
+
+
+def test_get_by_customer(lead_repo: LeadFileRepository, lead: DummyLead) -> None:
+    fetched_lead = lead_repo.get_by_customer(lead.customer_id)
+
+    assert fetched_lead is not None
+    assert fetched_lead.id == lead.id
+
+
 def test_update(lead_repo: LeadFileRepository, lead: DummyLead) -> None:
     new_salesman_id = "new id"
     updated_lead = DummyLead(id=lead.id, assigned_salesman_id=new_salesman_id)
@@ -57,3 +82,63 @@ def test_update(lead_repo: LeadFileRepository, lead: DummyLead) -> None:
 
     fetched_lead = lead_repo.get(lead.id)
     assert fetched_lead.assigned_salesman_id == new_salesman_id
+
+
+def test_update_with_stale_version_should_fail() -> None:
+    lead_repo = LeadFileRepository(db={})
+    lead = DummyLead(id=str(uuid4()), assigned_salesman_id="some id")
+    lead_repo.create(lead)
+    stale_lead = DummyLead(id=lead.id, assigned_salesman_id="new id", version=0)
+
+    with pytest.raises(ConcurrentModification):
+        lead_repo.update(stale_lead)
+
+
+def test_create_many_and_get_customers_with_lead() -> None:
+    lead_repo = LeadFileRepository(db={})
+    leads = [DummyLead(id=str(uuid4()), assigned_salesman_id="some id", customer_id=f"customer {i}") for i in range(2)]
+
+    lead_repo.create_many(leads)
+
+    assert lead_repo.get_customers_with_lead(["customer 0", "customer 1", "no lead"]) == {"customer 0", "customer 1"}
+
+
+def test_create_many_with_existing_id_should_fail(lead_repo: LeadFileRepository, lead: DummyLead) -> None:
+    with pytest.raises(ObjectAlreadyExists):
+        lead_repo.create_many([lead])
+
+
+def test_create_many_with_duplicated_customer_should_fail() -> None:
+    lead_repo = LeadFileRepository(db={})
+    leads = [DummyLead(id=str(uuid4()), assigned_salesman_id="some id") for _ in range(2)]
+
+    with pytest.raises(CanCreateOnlyOneLeadPerCustomer):
+        lead_repo.create_many(leads)
+
+
+def test_reassign_leads() -> None:
+    lead_repo = LeadFileRepository(db={})
+    leads = [
+        Lead.make(
+            id=str(uuid4()),
+            customer_id=f"customer {i}",
+            created_by_salesman_id=salesman_id,
+            contact_data=ContactData(first_name="Jan", last_name="Kowalski", email=f"jan{i}@example.com"),
+            source=AcquisitionSource(name="cold call"),
+        ).assign_salesman(new_salesman_id=salesman_id, requestor_id=salesman_id)
+        for i, salesman_id in enumerate(("old", "old", "other"))
+    ]
+    lead_repo.create_many(leads)
+
+    reassigned_count = lead_repo.reassign_leads(
+        create_leads_reassignment(current_salesman_id="old", new_salesman_id="new", requestor_id="admin")
+    )
+
+    assert reassigned_count == 2
+    assert [lead_repo.get(lead.id).assigned_salesman_id for lead in leads] == ["new", "new", "other"]
+    assert [lead_repo.get(lead.id).most_recent_assignment.assigned_by_id for lead in leads] == [
+        "admin",
+        "admin",
+        "other",
+    ]
+    assert [lead_repo.get(lead.id).version for lead in leads] == [2, 2, 1]
@@ -0,0 +1,46 @@
+import shelve
+from pathlib import Path
+
+import pytest
+from attrs import define
+
+from sales.infrastructure.file.opportunity.command import OpenOpportunitiesFileUnitOfWork, OpportunityFileUnitOfWork
+
+pytestmark = pytest.mark.integration
+
+
+@define
+class DummyOpportunity:
+    id: str
+    customer_id: str
+    stage_name: str = "qualification"
+    version: int = 1
+
+
+@pytest.fixture()
+def opportunity_uow(tmp_path: Path) -> OpportunityFileUnitOfWork:
+    with shelve.open(tmp_path / "opportunities") as db:
+        db["opportunity id"] = DummyOpportunity(id="opportunity id", customer_id="customer")
+    return OpportunityFileUnitOfWork(
+        tmp_path / "opportunities", tmp_path / "pipeline-stats", tmp_path / "open-opportunities"
+    )
+
+
+def test_missing_index_should_be_built_on_first_probe(opportunity_uow: OpportunityFileUnitOfWork) -> None:
+    with OpenOpportunitiesFileUnitOfWork(opportunity_uow) as uow:
+        assert uow.repository.has_open_opportunities("customer")
+        assert not uow.repository.has_open_opportunities("customer without opportunities")
+
+
+def test_probe_should_not_open_the_opportunities(
+    opportunity_uow: OpportunityFileUnitOfWork, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    with OpenOpportunitiesFileUnitOfWork(opportunity_uow):
+        pass
+
+    def fail() -> None:
+        raise AssertionError("The opportunities were opened")
+
+    monkeypatch.setattr(opportunity_uow, "begin", fail)
+    with OpenOpportunitiesFileUnitOfWork(opportunity_uow) as uow:
+        assert uow.repository.has_open_opportunities("customer")
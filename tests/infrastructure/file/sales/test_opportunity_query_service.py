@@ -89,3 +89,13 @@ def test_methods_should_return_none_if_not_found(query_service: OpportunityFileQ
     opportunity = getattr(query_service, method_name)(opportunity_id="invalid id")
 
     assert opportunity is None
+
+
+def test_get_by_ids(
+    query_service: OpportunityFileQueryService, all_opportunities: Sequence[OpportunityReadModel]
+) -> None:
+    ids = [entry.id for entry in all_opportunities[:2]]
+
+    result = query_service.get_by_ids([*ids, "invalid id"])
+
+    assert {entry.id for entry in result} == set(ids)
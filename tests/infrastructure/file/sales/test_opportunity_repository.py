@@ -1,10 +1,12 @@
+from unittest.mock import MagicMock
 from uuid import uuid4
 
 import pytest
 from attrs import define
 
+from building_blocks.application.exceptions import ConcurrentModification
 from building_blocks.infrastructure.exceptions import ObjectAlreadyExists
-from sales.infrastructure.file.opportunity.repository import OpportunityFileRepository
+from sales.infrastructure.file.opportunity.repository import INDEX_BUILT_KEY, OpportunityFileRepository
 
 pytestmark = pytest.mark.integration
 
@@ -13,6 +15,9 @@ pytestmark = pytest.mark.integration
 class DummyOpportunity:
     id: str
     owner_id: str
+    customer_id: str = "some customer"
+    stage_name: str = "qualification"
+    version: int = 1
 
 
 @pytest.fixture(scope="session")
@@ -61,3 +66,58 @@ def test_update(opportunity_repo: OpportunityFileRepository, opportunity: DummyO
 
     fetched_opportunity = opportunity_repo.get(opportunity.id)
     assert fetched_opportunity.owner_id == new_salesman_id
+
+
+def test_update_with_stale_version_should_fail() -> None:
+    opportunity_repo = OpportunityFileRepository(db={})
+    opportunity = DummyOpportunity(id=str(uuid4()), owner_id="some id")
+    opportunity_repo.create(opportunity)
+    stale_opportunity = DummyOpportunity(id=opportunity.id, owner_id="new id", version=0)
+
+    with pytest.raises(ConcurrentModification):
+        opportunity_repo.update(stale_opportunity)
+
+
+def test_has_open_opportunities() -> None:
+    opportunity_repo = OpportunityFileRepository(db={})
+    opportunity = DummyOpportunity(id=str(uuid4()), owner_id="some id")
+    opportunity_repo.create(opportunity)
+
+    assert opportunity_repo.has_open_opportunities(opportunity.customer_id)
+    assert not opportunity_repo.has_open_opportunities("customer without opportunities")
+
+
+def test_has_open_opportunities_should_ignore_closed_opportunities() -> None:
+    opportunity = DummyOpportunity(id=str(uuid4()), owner_id="some id")
+    opportunity_repo = OpportunityFileRepository(db={opportunity.id: opportunity})
+    assert opportunity_repo.has_open_opportunities(opportunity.customer_id)
+
+    opportunity_repo.update(DummyOpportunity(id=opportunity.id, owner_id="some id", stage_name="closed-won"))
+
+    assert not opportunity_repo.has_open_opportunities(opportunity.customer_id)
+
+
+def test_open_opportunities_index_should_be_reused_across_repositories() -> None:
+    opportunity = DummyOpportunity(id=str(uuid4()), owner_id="some id")
+    db = MagicMock(wraps={opportunity.id: opportunity})
+    open_opportunities_db: dict[str, set[str]] = {}
+    OpportunityFileRepository(db=db, open_opportunities_db=open_opportunities_db).has_open_opportunities("customer")
+    db.values.reset_mock()
+
+    opportunity_repo = OpportunityFileRepository(db=db, open_opportunities_db=open_opportunities_db)
+
+    assert opportunity_repo.has_open_opportunities(opportunity.customer_id)
+    db.values.assert_not_called()
+
+
+def test_rebuild_open_opportunities_index() -> None:
+    opportunity = DummyOpportunity(id=str(uuid4()), owner_id="some id")
+    open_opportunities_db = {INDEX_BUILT_KEY: set(), "stale customer": {"stale id"}}
+    opportunity_repo = OpportunityFileRepository(
+        db={opportunity.id: opportunity}, open_opportunities_db=open_opportunities_db
+    )
+
+    opportunity_repo.rebuild_open_opportunities_index()
+
+    assert opportunity_repo.has_open_opportunities(opportunity.customer_id)
+    assert not opportunity_repo.has_open_opportunities("stale customer")
@@ -50,3 +50,13 @@ def test_get_should_return_none_if_not_found(
     representative = query_service.get(representative_id="invalid id")
 
     assert representative is None
+
+
+def test_get_by_ids(
+    query_service: SalesRepresentativeFileQueryService, all_srs: Sequence[SalesRepresentativeReadModel]
+) -> None:
+    ids = [entry.id for entry in all_srs[:2]]
+
+    result = query_service.get_by_ids([*ids, "invalid id"])
+
+    assert {entry.id for entry in result} == set(ids)
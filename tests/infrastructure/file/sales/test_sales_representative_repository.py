@@ -53,6 +53,11 @@ def test_create_with_existing_id_should_fail(
         sr_repo.create(sales_rep)
 
 
+def test_exists(sr_repo: SalesRepresentativeFileRepository, sales_rep: DummySalesRep) -> None:
+    assert sr_repo.exists(sales_rep.id)
+    assert not sr_repo.exists("invalid id")
+
+
 def test_update(sr_repo: SalesRepresentativeFileRepository, sales_rep: DummySalesRep) -> None:
     new_first_name = "Mariusz"
     updated_sales_rep = DummySalesRep(id=sales_rep.id, first_name=new_first_name)
@@ -0,0 +1,29 @@
+from decimal import Decimal
+
+import pytest
+
+from sales.application.forecast.query import DEFAULT_STAGE_WEIGHTS
+from sales.infrastructure.config import get_forecast_stage_weights
+
+
+def test_forecast_stage_weights_default(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("FORECAST_STAGE_WEIGHTS", raising=False)
+
+    assert get_forecast_stage_weights() == DEFAULT_STAGE_WEIGHTS
+
+
+def test_forecast_stage_weights_override_defaults(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("FORECAST_STAGE_WEIGHTS", "qualification=0.2, proposal=0.5")
+
+    weights = get_forecast_stage_weights()
+
+    assert weights["qualification"] == Decimal("0.2")
+    assert weights["proposal"] == Decimal("0.5")
+    assert weights["negotiation"] == DEFAULT_STAGE_WEIGHTS["negotiation"]
+
+
+def test_invalid_forecast_stage_weight_should_fail(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("FORECAST_STAGE_WEIGHTS", "proposal=high")
+
+    with pytest.raises(ValueError):
+        get_forecast_stage_weights()
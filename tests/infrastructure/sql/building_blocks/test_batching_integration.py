@@ -0,0 +1,59 @@
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+from typing import ContextManager
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.orm import Session
+
+from building_blocks.application.command import BaseUnitOfWork
+from building_blocks.infrastructure.sql.batching import SQLGroupCommitBatcher
+from sales.infrastructure.sql.opportunity.models import ProductModel
+from tests.infrastructure.sql.building_blocks.test_uow_integration import DummyException, SQLUnitOfWork
+
+pytestmark = pytest.mark.integration
+
+
+@pytest.fixture()
+def product_ids(session_factory: Callable[[], ContextManager[Session]]) -> Iterator[list[str]]:
+    ids = [str(uuid4()) for _ in range(3)]
+    yield ids
+    with session_factory() as db:
+        db.query(ProductModel).filter(ProductModel.id.in_(ids)).delete()
+        db.commit()
+
+
+def add_product(uow: BaseUnitOfWork, product_id: str, fail: bool = False) -> str:
+    with uow:
+        uow.repository.add(id=product_id, value=f"product {product_id}")
+        if fail:
+            raise DummyException
+    return product_id
+
+
+def test_batch_commits_successful_commands_and_isolates_failed_one(
+    session_factory: Callable[[], ContextManager[Session]], product_ids: list[str]
+) -> None:
+    batcher = SQLGroupCommitBatcher(session_factory, window=1.0, max_batch_size=len(product_ids))
+    barrier = Barrier(len(product_ids))
+
+    def submit(args: tuple[int, str]) -> str | Exception:
+        index, product_id = args
+        uow = SQLUnitOfWork(session_factory=session_factory)
+        barrier.wait()
+        try:
+            return batcher.submit(lambda: add_product(uow=uow, product_id=product_id, fail=index == 1))
+        except DummyException as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=len(product_ids)) as executor:
+        results = list(executor.map(submit, enumerate(product_ids)))
+
+    assert results[0] == product_ids[0]
+    assert isinstance(results[1], DummyException)
+    assert results[2] == product_ids[2]
+    with session_factory() as db:
+        assert db.get(ProductModel, product_ids[0]) is not None
+        assert db.get(ProductModel, product_ids[1]) is None
+        assert db.get(ProductModel, product_ids[2]) is not None
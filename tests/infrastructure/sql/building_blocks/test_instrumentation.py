@@ -0,0 +1,88 @@
+from collections.abc import Iterator
+
+import pytest
+from sqlalchemy import Engine, create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from building_blocks.application.instrumentation import RequestTimings, end_request_timings, start_request_timings
+from building_blocks.infrastructure.sql.instrumentation import SQL_TIMING_NAME, explain_query_plan, instrument_engine
+
+
+@pytest.fixture()
+def engine() -> Iterator[Engine]:
+    engine = create_engine("sqlite://")
+    instrument_engine(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture()
+def timings() -> Iterator[RequestTimings]:
+    timings, token = start_request_timings()
+    yield timings
+    end_request_timings(token)
+
+
+def test_executed_statements_are_counted(engine: Engine, timings: RequestTimings) -> None:
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        connection.execute(text("SELECT 2"))
+
+    assert timings.get(SQL_TIMING_NAME).count == 2
+
+
+def test_failed_statement_is_not_counted(engine: Engine, timings: RequestTimings) -> None:
+    with engine.connect() as connection:
+        with pytest.raises(OperationalError):
+            connection.execute(text("SELECT * FROM missing_table"))
+        connection.execute(text("SELECT 1"))
+
+        assert timings.get(SQL_TIMING_NAME).count == 1
+        assert connection.info["statement_started_at"] == []
+
+
+@pytest.fixture()
+def slow_query_engine() -> Iterator[Engine]:
+    engine = create_engine("sqlite://")
+    instrument_engine(engine, slow_query_threshold=0)
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE lead (id TEXT PRIMARY KEY, customer_id TEXT)"))
+    yield engine
+    engine.dispose()
+
+
+def test_slow_query_is_logged_with_parameters_caller_and_plan(
+    slow_query_engine: Engine, caplog: pytest.LogCaptureFixture
+) -> None:
+    with slow_query_engine.connect() as connection:
+        connection.execute(text("SELECT * FROM lead WHERE customer_id = :customer_id"), {"customer_id": "customer"})
+
+    message = caplog.records[-1].getMessage()
+    assert "SELECT * FROM lead WHERE customer_id = ?" in message
+    assert "('customer',)" in message
+    assert "test_slow_query_is_logged_with_parameters_caller_and_plan" in message
+    assert "SCAN lead" in message
+
+
+def test_queries_below_threshold_are_not_logged(caplog: pytest.LogCaptureFixture) -> None:
+    engine = create_engine("sqlite://")
+    instrument_engine(engine, slow_query_threshold=60)
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+    assert caplog.records == []
+    engine.dispose()
+
+
+def test_explain_query_plan_shows_index_usage(slow_query_engine: Engine) -> None:
+    with slow_query_engine.connect() as connection:
+        plan = explain_query_plan(connection, statement="SELECT * FROM lead WHERE id = ?", parameters=("id",))
+
+    assert plan is not None
+    assert "SEARCH lead USING INDEX" in plan
+
+
+def test_explain_query_plan_skips_non_query_statements(slow_query_engine: Engine) -> None:
+    with slow_query_engine.connect() as connection:
+        assert explain_query_plan(connection, statement="PRAGMA journal_mode", parameters=()) is None
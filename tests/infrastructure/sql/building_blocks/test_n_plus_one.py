@@ -0,0 +1,85 @@
+from collections.abc import Iterator
+
+import pytest
+from sqlalchemy import ForeignKey, create_engine, event, select
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column, relationship, selectinload, sessionmaker
+
+from building_blocks.infrastructure.exceptions import NPlusOneQueryDetected
+from building_blocks.infrastructure.sql.n_plus_one import NPlusOneDetector, normalize_statement
+
+
+class DummyBase(DeclarativeBase):
+    pass
+
+
+class CountryModel(DummyBase):
+    __tablename__ = "country"
+
+    code: Mapped[str] = mapped_column(primary_key=True)
+
+
+class AddressModel(DummyBase):
+    __tablename__ = "address"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    country_code: Mapped[str] = mapped_column(ForeignKey("country.code"))
+    country: Mapped[CountryModel] = relationship()
+
+    def to_domain(self) -> str:
+        return self.country.code
+
+
+def create_session(detector: NPlusOneDetector) -> Session:
+    engine = create_engine("sqlite://")
+    DummyBase.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    with factory() as db:
+        db.add_all(CountryModel(code=code) for code in ("PL", "DE", "FR"))
+        db.add_all(AddressModel(id=i, country_code=code) for i, code in enumerate(("PL", "DE", "FR")))
+        db.commit()
+    event.listen(factory, "do_orm_execute", detector)
+    return factory()
+
+
+@pytest.fixture()
+def session() -> Iterator[Session]:
+    with create_session(NPlusOneDetector(threshold=3)) as db:
+        yield db
+
+
+@pytest.fixture()
+def raising_session() -> Iterator[Session]:
+    with create_session(NPlusOneDetector(threshold=3, raise_on_detection=True)) as db:
+        yield db
+
+
+def test_normalize_statement() -> None:
+    statement = "SELECT *\n  FROM country\n WHERE code IN (__[POSTCOMPILE_code_1])"
+
+    assert normalize_statement(statement) == "SELECT * FROM country WHERE code IN (?)"
+
+
+def test_repeated_lazy_loads_are_reported_with_call_site(session: Session, caplog: pytest.LogCaptureFixture) -> None:
+    addresses = session.scalars(select(AddressModel)).all()
+
+    [address.to_domain() for address in addresses]
+
+    assert len(caplog.records) == 1
+    message = caplog.records[0].getMessage()
+    assert "relationship of AddressModel loaded 3 times" in message
+    assert "AddressModel.to_domain" in message
+
+
+def test_eager_loads_are_not_reported(session: Session, caplog: pytest.LogCaptureFixture) -> None:
+    addresses = session.scalars(select(AddressModel).options(selectinload(AddressModel.country))).all()
+
+    [address.to_domain() for address in addresses]
+
+    assert caplog.records == []
+
+
+def test_repeated_lazy_loads_raise_in_raise_mode(raising_session: Session) -> None:
+    addresses = raising_session.scalars(select(AddressModel)).all()
+
+    with pytest.raises(NPlusOneQueryDetected):
+        [address.to_domain() for address in addresses]
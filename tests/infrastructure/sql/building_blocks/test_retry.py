@@ -0,0 +1,44 @@
+import sqlite3
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from building_blocks.infrastructure.sql.retry import RetryMetrics, RetryPolicy, is_database_locked
+
+
+@pytest.mark.parametrize(
+    "message,expected",
+    [("database is locked", True), ("database table is locked", True), ("no such table: lead", False)],
+)
+def test_is_database_locked(message: str, expected: bool) -> None:
+    error = OperationalError("SELECT 1", {}, sqlite3.OperationalError(message))
+
+    assert is_database_locked(error) is expected
+
+
+@pytest.mark.parametrize("attempt,expected", [(1, 0.1), (2, 0.2), (3, 0.4), (4, 0.5), (10, 0.5)])
+def test_retry_policy_backoff_grows_exponentially_up_to_max_delay(attempt: int, expected: float) -> None:
+    policy = RetryPolicy(base_delay=0.1, max_delay=0.5)
+
+    assert policy.get_delay(attempt, rand=lambda: 1.0) == pytest.approx(expected)
+
+
+def test_retry_policy_delay_is_jittered() -> None:
+    policy = RetryPolicy(base_delay=0.1, max_delay=0.5)
+
+    assert policy.get_delay(3, rand=lambda: 0.5) == pytest.approx(0.2)
+
+
+def test_retry_metrics_record() -> None:
+    metrics = RetryMetrics()
+
+    metrics.record(attempts=1, wait_seconds=0.0, acquired=True)
+    metrics.record(attempts=3, wait_seconds=0.25, acquired=True)
+    metrics.record(attempts=5, wait_seconds=0.5, acquired=False)
+
+    assert metrics.snapshot() == {
+        "lock_acquisitions": 2,
+        "retries": 6,
+        "exhausted": 1,
+        "lock_wait_seconds": 0.75,
+    }
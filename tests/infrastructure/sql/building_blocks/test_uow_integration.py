@@ -1,15 +1,20 @@
+import sqlite3
 from collections.abc import Callable, Iterator
 from typing import ContextManager
 from uuid import uuid4
 
 import pytest
 from attrs import define
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import Session
 
 from building_blocks.application.command import BaseUnitOfWork
 from building_blocks.infrastructure.sql.command import BaseSQLUnitOfWork
+from building_blocks.infrastructure.sql.retry import RetryMetrics, RetryPolicy
 from sales.domain.value_objects.product import Product
 from sales.infrastructure.sql.opportunity.models import ProductModel
+from tests.fixtures.sql.db_fixtures import SQL_TEST_DB_URL
 
 pytestmark = pytest.mark.integration
 
@@ -112,3 +117,44 @@ def test_uow_context_manager_exception_should_rollback(
     with session_factory() as db:
         product = db.get(ProductModel, product_id)
         assert product is None
+
+
+def test_nested_uow_changes_are_rolled_back_with_outer_transaction(
+    uow: SQLUnitOfWork, product_id: str, session_factory: Callable[[], ContextManager[Session]]
+) -> None:
+    nested_uow = SQLUnitOfWork(session_factory=session_factory)
+    try:
+        with uow:
+            with nested_uow as nested:
+                nested.repository.add(id=product_id, value="some product")
+            raise DummyException
+    except DummyException:
+        pass
+
+    with session_factory() as db:
+        product = db.get(ProductModel, product_id)
+        assert product is None
+
+
+@pytest.fixture()
+def locked_database() -> Iterator[None]:
+    connection = sqlite3.connect(make_url(SQL_TEST_DB_URL).database, isolation_level=None)
+    connection.execute("BEGIN IMMEDIATE")
+    yield
+    connection.rollback()
+    connection.close()
+
+
+@pytest.mark.usefixtures("locked_database")
+def test_uow_gives_up_when_database_stays_locked(session_factory: Callable[[], ContextManager[Session]]) -> None:
+    class ImpatientSQLUnitOfWork(SQLUnitOfWork):
+        retry_policy = RetryPolicy(max_attempts=2, base_delay=0)
+        retry_metrics = RetryMetrics()
+
+    uow = ImpatientSQLUnitOfWork(session_factory=session_factory, write_lock=True)
+
+    with pytest.raises(OperationalError):
+        uow.begin()
+
+    assert uow.retry_metrics.snapshot()["exhausted"] == 1
+    assert uow.repository is None
@@ -1,12 +1,16 @@
+import contextvars
+import sqlite3
 from collections.abc import Callable, Iterator
 from unittest.mock import MagicMock
 
 import pytest
 from attrs import define
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import Session
 
 from building_blocks.infrastructure.exceptions import NoActiveTransaction, TransactionAlreadyActive
 from building_blocks.infrastructure.sql.command import BaseSQLUnitOfWork
+from building_blocks.infrastructure.sql.retry import RetryMetrics, RetryPolicy
 
 
 @define
@@ -18,6 +22,14 @@ class SQLUnitOfWork(BaseSQLUnitOfWork[DummyRepository]):
     RepositoryType = DummyRepository
 
 
+class RetryingSQLUnitOfWork(SQLUnitOfWork):
+    retry_policy = RetryPolicy(max_attempts=3, base_delay=0)
+
+
+def database_locked_error() -> OperationalError:
+    return OperationalError("BEGIN IMMEDIATE", {}, sqlite3.OperationalError("database is locked"))
+
+
 @pytest.fixture()
 def mock_session() -> MagicMock:
     session = MagicMock(spec=Session, name="SESSION")
@@ -31,11 +43,29 @@ def mock_session_factory(mock_session: MagicMock) -> Iterator[MagicMock]:
     return factory
 
 
+@pytest.fixture()
+def sqlite_session(mock_session: MagicMock) -> MagicMock:
+    mock_session.get_bind.return_value.dialect.name = "sqlite"
+    return mock_session
+
+
+@pytest.fixture()
+def retrying_uow(mock_session_factory: Callable[[], MagicMock]) -> RetryingSQLUnitOfWork:
+    uow = RetryingSQLUnitOfWork(session_factory=mock_session_factory, write_lock=True)
+    uow.retry_metrics = RetryMetrics()
+    return uow
+
+
 @pytest.fixture()
 def uow(mock_session_factory: Callable[[], MagicMock]) -> SQLUnitOfWork:
     return SQLUnitOfWork(session_factory=mock_session_factory)
 
 
+@pytest.fixture()
+def other_uow(mock_session_factory: Callable[[], MagicMock]) -> SQLUnitOfWork:
+    return SQLUnitOfWork(session_factory=mock_session_factory)
+
+
 def test_begin_starts_transaction(uow: SQLUnitOfWork, mock_session: MagicMock) -> None:
     uow.begin()
 
@@ -76,3 +106,160 @@ def test_cannot_commit_without_started_transaction(uow: SQLUnitOfWork) -> None:
 def test_cannot_rollback_without_started_transaction(uow: SQLUnitOfWork) -> None:
     with pytest.raises(NoActiveTransaction):
         uow.rollback()
+
+
+def test_nested_uow_joins_active_transaction(
+    uow: SQLUnitOfWork, other_uow: SQLUnitOfWork, mock_session: MagicMock, mock_session_factory: MagicMock
+) -> None:
+    uow.begin()
+
+    other_uow.begin()
+
+    mock_session_factory.assert_called_once()
+    mock_session.begin.assert_called_once()
+    assert other_uow.repository.session is mock_session
+    uow.rollback()
+
+
+def test_nested_uow_commit_does_not_commit_active_transaction(
+    uow: SQLUnitOfWork, other_uow: SQLUnitOfWork, mock_session: MagicMock
+) -> None:
+    uow.begin()
+    other_uow.begin()
+
+    other_uow.commit()
+
+    mock_session.flush.assert_called_once()
+    mock_session.commit.assert_not_called()
+    uow.commit()
+    mock_session.commit.assert_called_once()
+
+
+def test_nested_uow_rollback_leaves_rollback_to_outer_uow(
+    uow: SQLUnitOfWork, other_uow: SQLUnitOfWork, mock_session: MagicMock
+) -> None:
+    uow.begin()
+    other_uow.begin()
+
+    other_uow.rollback()
+
+    mock_session.rollback.assert_not_called()
+    assert other_uow.repository is None
+    uow.rollback()
+
+
+def test_uow_does_not_join_transaction_from_other_session_factory(uow: SQLUnitOfWork, mock_session: MagicMock) -> None:
+    other_session = MagicMock(spec=Session)
+    other_session_factory = MagicMock()
+    other_session_factory.return_value.__enter__.return_value = other_session
+    other_uow = SQLUnitOfWork(session_factory=other_session_factory)
+    uow.begin()
+
+    other_uow.begin()
+
+    assert other_uow.repository.session is other_session
+    other_uow.rollback()
+    uow.rollback()
+
+
+def test_begin_does_not_lock_non_sqlite_database(uow: SQLUnitOfWork, mock_session: MagicMock) -> None:
+    mock_session.get_bind.return_value.dialect.name = "postgresql"
+
+    uow.begin()
+
+    mock_session.execute.assert_not_called()
+    uow.rollback()
+
+
+def test_begin_does_not_lock_without_write_lock(uow: SQLUnitOfWork, sqlite_session: MagicMock) -> None:
+    uow.begin()
+
+    sqlite_session.execute.assert_not_called()
+    uow.rollback()
+
+
+def test_uow_keeps_transaction_state_per_context(uow: SQLUnitOfWork, mock_session: MagicMock) -> None:
+    uow.begin()
+
+    other_context_session = contextvars.Context().run(lambda: uow._session)
+
+    assert other_context_session is None
+    assert uow.repository is not None
+    uow.rollback()
+
+
+def test_uow_shared_between_contexts_can_begin_concurrently(
+    mock_session_factory: MagicMock, mock_session: MagicMock
+) -> None:
+    uow = SQLUnitOfWork(session_factory=mock_session_factory)
+    other_session = MagicMock(spec=Session, name="OTHER SESSION")
+    mock_session_factory.return_value.__enter__.side_effect = [mock_session, other_session]
+    other_context = contextvars.Context()
+    uow.begin()
+
+    other_context.run(uow.begin)
+
+    assert uow.repository.session is mock_session
+    assert other_context.run(lambda: uow.repository.session) is other_session
+    other_context.run(uow.commit)
+    uow.rollback()
+    other_session.commit.assert_called_once()
+    mock_session.rollback.assert_called_once()
+
+
+def test_begin_acquires_sqlite_write_lock(retrying_uow: RetryingSQLUnitOfWork, sqlite_session: MagicMock) -> None:
+    retrying_uow.begin()
+
+    sqlite_session.execute.assert_called_once()
+    assert retrying_uow.retry_metrics.snapshot()["lock_acquisitions"] == 1
+    assert retrying_uow.retry_metrics.snapshot()["retries"] == 0
+    retrying_uow.rollback()
+
+
+def test_begin_retries_when_database_is_locked(retrying_uow: RetryingSQLUnitOfWork, sqlite_session: MagicMock) -> None:
+    sqlite_session.execute.side_effect = [database_locked_error(), None]
+
+    retrying_uow.begin()
+
+    assert sqlite_session.execute.call_count == 2
+    assert retrying_uow.repository is not None
+    assert retrying_uow.retry_metrics.snapshot()["retries"] == 1
+    retrying_uow.rollback()
+
+
+def test_begin_gives_up_after_max_attempts(retrying_uow: RetryingSQLUnitOfWork, sqlite_session: MagicMock) -> None:
+    sqlite_session.execute.side_effect = database_locked_error()
+
+    with pytest.raises(OperationalError):
+        retrying_uow.begin()
+
+    assert sqlite_session.execute.call_count == 3
+    sqlite_session.rollback.assert_called_once()
+    assert retrying_uow.repository is None
+    assert retrying_uow.retry_metrics.snapshot()["exhausted"] == 1
+
+
+def test_begin_does_not_retry_other_operational_errors(
+    retrying_uow: RetryingSQLUnitOfWork, sqlite_session: MagicMock
+) -> None:
+    sqlite_session.execute.side_effect = OperationalError(
+        "BEGIN IMMEDIATE", {}, sqlite3.OperationalError("disk I/O error")
+    )
+
+    with pytest.raises(OperationalError):
+        retrying_uow.begin()
+
+    sqlite_session.execute.assert_called_once()
+    assert retrying_uow.retry_metrics.snapshot()["retries"] == 0
+
+
+def test_uow_can_begin_again_after_failed_lock(retrying_uow: RetryingSQLUnitOfWork, sqlite_session: MagicMock) -> None:
+    sqlite_session.execute.side_effect = database_locked_error()
+    with pytest.raises(OperationalError):
+        retrying_uow.begin()
+    sqlite_session.execute.side_effect = None
+
+    retrying_uow.begin()
+
+    assert retrying_uow.repository is not None
+    retrying_uow.rollback()
@@ -1,10 +1,13 @@
 from collections.abc import Callable, Iterator
-from typing import ContextManager
+from typing import Any, ContextManager
 
 import pytest
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 
+from building_blocks.application.cache import TTLCache
 from building_blocks.infrastructure.sql.db import DbConnectionManager
+from containers.container import CUSTOMER_STATUS_CACHE_TTL
 from customer_management.application.acl import OpportunityService, SalesRepresentativeService
 from customer_management.application.command import CustomerCommandUseCase
 from customer_management.infrastructure.sql.customer.command import CustomerSQLUnitOfWork
@@ -26,10 +29,31 @@ def one_off_session() -> Iterator[Session]:
     DbConnectionManager._engine.dispose()
 
 
+@pytest.fixture()
+def executed_statements(session_factory: Callable[[], ContextManager[Session]]) -> Iterator[list[str]]:
+    with session_factory() as db:
+        engine = db.get_bind()
+    statements: list[str] = []
+
+    def count_statement(*args: Any) -> None:
+        statements.append(args[2])
+
+    event.listen(engine, "before_cursor_execute", count_statement)
+    yield statements
+    event.remove(engine, "before_cursor_execute", count_statement)
+
+
+@pytest.fixture(scope="session")
+def customer_status_cache() -> TTLCache[str, str]:
+    return TTLCache(ttl=CUSTOMER_STATUS_CACHE_TTL)
+
+
 @pytest.fixture(scope="session")
-def customer_service(session_factory: Callable[[], ContextManager[Session]]) -> ICustomerService:
+def customer_service(
+    session_factory: Callable[[], ContextManager[Session]], customer_status_cache: TTLCache[str, str]
+) -> ICustomerService:
     customer_uow = CustomerSQLUnitOfWork(session_factory)
-    return CustomerService(customer_uow=customer_uow)
+    return CustomerService(customer_uow=customer_uow, status_cache=customer_status_cache)
 
 
 @pytest.fixture(scope="session")
@@ -80,6 +104,7 @@ def customer_command_use_case(
     sr_uow: SalesRepresentativeSQLUnitOfWork,
     opportunity_uow: OpportunitySQLUnitOfWork,
     session_factory: Callable[[], ContextManager[Session]],
+    customer_status_cache: TTLCache[str, str],
 ) -> CustomerCommandUseCase:
     sales_rep_service = SalesRepresentativeService(salesman_uow=sr_uow)
     opportunity_service = OpportunityService(opportunity_uow=opportunity_uow)
@@ -88,5 +113,6 @@ def customer_command_use_case(
         customer_uow=uow,
         sales_rep_service=sales_rep_service,
         opportunity_service=opportunity_service,
+        customer_status_cache=customer_status_cache,
     )
     return command_use_case
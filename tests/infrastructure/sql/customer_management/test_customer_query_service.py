@@ -10,6 +10,8 @@ from customer_management.application.query_model import CustomerReadModel
 from customer_management.infrastructure.sql.customer.query_service import CustomerSQLQueryService
 from sales.application.sales_representative.query_model import SalesRepresentativeReadModel
 
+MAX_GET_BY_IDS_QUERIES = 3
+
 
 @pytest.fixture()
 def all_customers(
@@ -82,3 +84,20 @@ def test_methods_should_return_none_if_not_found(query_service: CustomerSQLQuery
     customer = getattr(query_service, method_name)(customer_id="invalid id")
 
     assert customer is None
+
+
+def test_get_by_ids(query_service: CustomerSQLQueryService, all_customers: Sequence[CustomerReadModel]) -> None:
+    ids = [entry.id for entry in all_customers[:2]]
+
+    result = query_service.get_by_ids([*ids, "invalid id"])
+
+    assert {entry.id for entry in result} == set(ids)
+
+
+def test_get_by_ids_loads_relations_in_bounded_number_of_queries(
+    query_service: CustomerSQLQueryService, all_customers: Sequence[CustomerReadModel], executed_statements: list[str]
+) -> None:
+    result = query_service.get_by_ids([entry.id for entry in all_customers])
+
+    assert len(result) == len(all_customers)
+    assert len(executed_statements) <= MAX_GET_BY_IDS_QUERIES
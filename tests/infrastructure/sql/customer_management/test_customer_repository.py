@@ -1,8 +1,8 @@
 import pytest
 from sqlalchemy.orm import Session
 
-from building_blocks.application.exceptions import InvalidData
-from building_blocks.infrastructure.exceptions import ObjectAlreadyExists, ServerError
+from building_blocks.application.exceptions import ConcurrentModification, InvalidData
+from building_blocks.infrastructure.exceptions import ObjectAlreadyExists
 from customer_management.domain.entities.customer.customer import Customer
 from customer_management.domain.value_objects.address import Address
 from customer_management.domain.value_objects.company_info import CompanyInfo
@@ -232,7 +232,26 @@ def test_update_updates_contact_persons(
 def test_update_with_wrong_customer_id_should_fail(customer_repo: CustomerSQLRepository, customer: Customer) -> None:
     customer.id = "wrong id"
 
-    with pytest.raises(ServerError):
+    with pytest.raises(ConcurrentModification):
+        customer_repo.update(customer)
+
+
+def test_update_increments_version(customer_repo: CustomerSQLRepository, customer: Customer) -> None:
+    customer_repo.create(customer)
+
+    customer_repo.update(customer)
+
+    fetched_customer = customer_repo.get(customer.id)
+    assert customer.version == 2
+    assert fetched_customer.version == 2
+
+
+def test_update_with_stale_version_should_fail(customer_repo: CustomerSQLRepository, customer: Customer) -> None:
+    customer_repo.create(customer)
+    customer_repo.update(customer)
+    customer.version = 1
+
+    with pytest.raises(ConcurrentModification):
         customer_repo.update(customer)
 
 
@@ -265,3 +284,77 @@ def test_create_with_invalid_country_should_fail(
 ) -> None:
     with pytest.raises(InvalidData):
         customer_repo.create(customer=customer_with_invalid_country)
+
+
+def test_get_statuses(customer_repo: CustomerSQLRepository, customer: Customer) -> None:
+    customer_repo.create(customer)
+
+    statuses = customer_repo.get_statuses([customer.id, "invalid id"])
+
+    assert statuses == {customer.id: customer.status}
+
+
+def test_exists(customer_repo: CustomerSQLRepository, customer: Customer) -> None:
+    customer_repo.create(customer)
+
+    assert customer_repo.exists(customer.id)
+    assert not customer_repo.exists("invalid id")
+
+
+def test_get_status(customer_repo: CustomerSQLRepository, customer: Customer) -> None:
+    customer_repo.create(customer)
+
+    assert customer_repo.get_status(customer.id) == customer.status
+    assert customer_repo.get_status("invalid id") is None
+
+
+def test_create_many(
+    customer_repo: CustomerSQLRepository, customer_with_contact_persons: Customer, company_info: CompanyInfo
+) -> None:
+    other_customer = Customer(id="other id", relation_manager_id="salesman", company_info=company_info)
+
+    customer_repo.create_many([customer_with_contact_persons, other_customer])
+
+    fetched_customer = customer_repo.get(customer_with_contact_persons.id)
+    assert fetched_customer is not None
+    assert fetched_customer.company_info == customer_with_contact_persons.company_info
+    assert fetched_customer.contact_persons == customer_with_contact_persons.contact_persons
+    assert customer_repo.get(other_customer.id) is not None
+
+
+def test_create_many_with_existing_id_should_fail(customer_repo: CustomerSQLRepository, customer: Customer) -> None:
+    customer_repo.create(customer)
+
+    with pytest.raises(ObjectAlreadyExists):
+        customer_repo.create_many([customer])
+
+
+@pytest.mark.parametrize("invalid_customer", ["customer_with_invalid_country", "customer_with_invalid_language"])
+def test_create_many_with_invalid_references_should_fail(
+    customer_repo: CustomerSQLRepository, invalid_customer: str, request: pytest.FixtureRequest
+) -> None:
+    with pytest.raises(InvalidData):
+        customer_repo.create_many([request.getfixturevalue(invalid_customer)])
+
+
+def test_reassign_relation_manager(customer_repo: CustomerSQLRepository, customer: Customer) -> None:
+    customer_repo.create(customer)
+
+    reassigned_count = customer_repo.reassign_relation_manager(
+        current_relation_manager_id=customer.relation_manager_id, new_relation_manager_id="new salesman"
+    )
+
+    fetched_customer = customer_repo.get(customer.id)
+    assert reassigned_count == 1
+    assert fetched_customer.relation_manager_id == "new salesman"
+    assert fetched_customer.version == 2
+
+
+def test_get_used_contact_method_values(
+    customer_repo: CustomerSQLRepository, customer_with_contact_persons: Customer, contact_method: ContactMethod
+) -> None:
+    customer_repo.create_many([customer_with_contact_persons])
+
+    used_values = customer_repo.get_used_contact_method_values([contact_method.value, "unused@example.com"])
+
+    assert used_values == {contact_method.value}
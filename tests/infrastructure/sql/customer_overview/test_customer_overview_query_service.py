@@ -0,0 +1,65 @@
+from collections.abc import Callable
+from typing import ContextManager
+
+import pytest
+from sqlalchemy.orm import Session
+
+from customer_management.application.query_model import CustomerReadModel
+from customer_overview.infrastructure.sql.query_service import CustomerOverviewSQLQueryService
+from sales.application.lead.query_model import LeadReadModel
+from sales.application.opportunity.query_model import OpportunityReadModel
+
+MAX_OVERVIEW_QUERIES = 9
+
+
+@pytest.fixture()
+def query_service(session_factory: Callable[[], ContextManager[Session]]) -> CustomerOverviewSQLQueryService:
+    return CustomerOverviewSQLQueryService(session_factory)
+
+
+@pytest.mark.usefixtures("opportunity_2", "opportunity_3")
+def test_get_returns_customer_with_opportunities(
+    query_service: CustomerOverviewSQLQueryService,
+    customer_1: CustomerReadModel,
+    opportunity_1: OpportunityReadModel,
+) -> None:
+    overview = query_service.get(customer_1.id)
+
+    assert overview is not None
+    assert overview.customer.id == customer_1.id
+    assert len(overview.contact_persons) == 1
+    opportunities = {opportunity.id: opportunity for opportunity in overview.opportunities}
+    assert len(opportunities) >= 3
+    assert opportunities[opportunity_1.id].offer_totals
+    assert len(opportunities[opportunity_1.id].latest_notes) == 1
+
+
+def test_get_returns_customer_with_lead(
+    query_service: CustomerOverviewSQLQueryService,
+    lead_1: LeadReadModel,
+) -> None:
+    overview = query_service.get(lead_1.customer_id)
+
+    assert overview is not None
+    assert overview.lead is not None
+    assert overview.lead.id == lead_1.id
+    assert overview.opportunities == []
+
+
+def test_get_non_existent_customer_returns_none(query_service: CustomerOverviewSQLQueryService) -> None:
+    assert query_service.get("invalid_id") is None
+
+
+@pytest.mark.usefixtures("opportunity_1", "opportunity_2", "opportunity_3", "lead_1")
+@pytest.mark.parametrize("customer", ["customer_1", "customer_2"])
+def test_get_executes_bounded_number_of_queries(
+    request: pytest.FixtureRequest,
+    query_service: CustomerOverviewSQLQueryService,
+    executed_statements: list[str],
+    customer: str,
+) -> None:
+    customer_id = request.getfixturevalue(customer).id
+
+    query_service.get(customer_id)
+
+    assert 0 < len(executed_statements) <= MAX_OVERVIEW_QUERIES
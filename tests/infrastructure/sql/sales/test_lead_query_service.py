@@ -11,6 +11,8 @@ from sales.infrastructure.sql.lead.query_service import LeadSQLQueryService
 
 pytestmark = pytest.mark.integration
 
+MAX_GET_BY_IDS_QUERIES = 3
+
 
 @pytest.fixture()
 def all_leads(lead_1: LeadReadModel, lead_2: LeadReadModel) -> Sequence[LeadReadModel]:
@@ -74,3 +76,20 @@ def test_methods_should_return_none_if_not_found(query_service: LeadSQLQueryServ
     lead = getattr(query_service, method_name)(lead_id="invalid id")
 
     assert lead is None
+
+
+def test_get_by_ids(query_service: LeadSQLQueryService, all_leads: Sequence[LeadReadModel]) -> None:
+    ids = [entry.id for entry in all_leads[:2]]
+
+    result = query_service.get_by_ids([*ids, "invalid id"])
+
+    assert {entry.id for entry in result} == set(ids)
+
+
+def test_get_by_ids_loads_relations_in_bounded_number_of_queries(
+    query_service: LeadSQLQueryService, all_leads: Sequence[LeadReadModel], executed_statements: list[str]
+) -> None:
+    result = query_service.get_by_ids([entry.id for entry in all_leads])
+
+    assert len(result) == len(all_leads)
+    assert len(executed_statements) <= MAX_GET_BY_IDS_QUERIES
@@ -1,8 +1,11 @@
 import pytest
 from sqlalchemy.orm import Session
 
+from building_blocks.application.exceptions import ConcurrentModification
 from building_blocks.infrastructure.exceptions import ObjectAlreadyExists
 from sales.domain.entities.lead import Lead
+from sales.domain.exceptions import CanCreateOnlyOneLeadPerCustomer
+from sales.domain.service.lead import create_leads_reassignment
 from sales.domain.value_objects.acquisition_source import AcquisitionSource
 from sales.domain.value_objects.contact_data import ContactData
 from sales.infrastructure.sql.lead.repository import LeadSQLRepository
@@ -28,6 +31,17 @@ def lead() -> Lead:
     return lead
 
 
+@pytest.fixture()
+def lead_with_same_id(lead: Lead) -> Lead:
+    return Lead.make(
+        id=lead.id,
+        customer_id="other customer id",
+        created_by_salesman_id=lead.created_by_salesman_id,
+        contact_data=lead.contact_data,
+        source=lead.source,
+    )
+
+
 def test_create_and_get(lead_repo: LeadSQLRepository, lead: Lead) -> None:
     lead_repo.create(lead)
 
@@ -62,11 +76,11 @@ def test_get_should_return_none_if_not_found(
     assert fetched_lead is None
 
 
-def test_create_with_existing_id_should_fail(lead_repo: LeadSQLRepository, lead: Lead) -> None:
+def test_create_with_existing_id_should_fail(lead_repo: LeadSQLRepository, lead: Lead, lead_with_same_id: Lead) -> None:
     lead_repo.create(lead)
 
     with pytest.raises(ObjectAlreadyExists):
-        lead_repo.create(lead)
+        lead_repo.create(lead_with_same_id)
 
 
 def test_update(lead_repo: LeadSQLRepository, lead: Lead) -> None:
@@ -78,6 +92,16 @@ def test_update(lead_repo: LeadSQLRepository, lead: Lead) -> None:
 
     fetched_lead = lead_repo.get(lead.id)
     assert fetched_lead.source == new_source
+    assert fetched_lead.version == 2
+
+
+def test_update_with_stale_version_should_fail(lead_repo: LeadSQLRepository, lead: Lead) -> None:
+    lead_repo.create(lead)
+    lead_repo.update(lead)
+    lead.version = 1
+
+    with pytest.raises(ConcurrentModification):
+        lead_repo.update(lead)
 
 
 def test_update_updates_assignments(
@@ -106,3 +130,64 @@ def test_update_updates_notes(lead_repo: LeadSQLRepository, lead: Lead) -> None:
 
     fetched_lead = lead_repo.get(lead.id)
     assert fetched_lead.note.content == new_note_content
+
+
+def test_create_second_lead_for_customer_should_fail(lead_repo: LeadSQLRepository, lead: Lead) -> None:
+    other_lead = Lead.make(
+        id="other lead",
+        customer_id=lead.customer_id,
+        created_by_salesman_id=lead.created_by_salesman_id,
+        contact_data=lead.contact_data,
+        source=lead.source,
+    )
+    lead_repo.create(lead)
+
+    with pytest.raises(CanCreateOnlyOneLeadPerCustomer):
+        lead_repo.create(other_lead)
+
+
+def test_create_many_and_get_customers_with_lead(lead_repo: LeadSQLRepository, lead: Lead) -> None:
+    other_lead = Lead.make(
+        id="other lead",
+        customer_id="other customer id",
+        created_by_salesman_id=lead.created_by_salesman_id,
+        contact_data=lead.contact_data,
+        source=lead.source,
+    )
+
+    lead_repo.create_many([lead, other_lead])
+
+    customers_with_lead = lead_repo.get_customers_with_lead([lead.customer_id, other_lead.customer_id, "no lead"])
+    assert customers_with_lead == {lead.customer_id, other_lead.customer_id}
+    assert lead_repo.get(other_lead.id) is not None
+
+
+def test_create_many_with_existing_id_should_fail(
+    lead_repo: LeadSQLRepository, lead: Lead, lead_with_same_id: Lead
+) -> None:
+    lead_repo.create(lead)
+
+    with pytest.raises(ObjectAlreadyExists):
+        lead_repo.create_many([lead_with_same_id])
+
+
+def test_reassign_leads(lead_repo: LeadSQLRepository, lead: Lead) -> None:
+    current_salesman_id = "leaving salesman id"
+    new_salesman_id = "new salesman id"
+    lead_repo.create(lead)
+    lead.assign_salesman(new_salesman_id=current_salesman_id, requestor_id=lead.created_by_salesman_id)
+    lead_repo.update(lead)
+    lead_repo.db.flush()
+
+    reassigned_count = lead_repo.reassign_leads(
+        create_leads_reassignment(
+            current_salesman_id=current_salesman_id, new_salesman_id=new_salesman_id, requestor_id="admin id"
+        )
+    )
+
+    fetched_lead = lead_repo.get(lead.id)
+    assert reassigned_count == 1
+    assert fetched_lead.assigned_salesman_id == new_salesman_id
+    assert len(fetched_lead.assignment_history) == 2
+    assert fetched_lead.most_recent_assignment.assigned_by_id == "admin id"
+    assert fetched_lead.version == 3
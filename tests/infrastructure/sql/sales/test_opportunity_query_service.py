@@ -10,6 +10,8 @@ from sales.application.opportunity.query_model import OpportunityReadModel
 from sales.application.sales_representative.query_model import SalesRepresentativeReadModel
 from sales.infrastructure.sql.opportunity.query_service import OpportunitySQLQueryService
 
+MAX_GET_BY_IDS_QUERIES = 3
+
 
 @pytest.fixture()
 def all_opportunities(
@@ -89,3 +91,24 @@ def test_methods_should_return_none_if_not_found(query_service: OpportunitySQLQu
     opportunity = getattr(query_service, method_name)(opportunity_id="invalid id")
 
     assert opportunity is None
+
+
+def test_get_by_ids(
+    query_service: OpportunitySQLQueryService, all_opportunities: Sequence[OpportunityReadModel]
+) -> None:
+    ids = [entry.id for entry in all_opportunities[:2]]
+
+    result = query_service.get_by_ids([*ids, "invalid id"])
+
+    assert {entry.id for entry in result} == set(ids)
+
+
+def test_get_by_ids_loads_relations_in_bounded_number_of_queries(
+    query_service: OpportunitySQLQueryService,
+    all_opportunities: Sequence[OpportunityReadModel],
+    executed_statements: list[str],
+) -> None:
+    result = query_service.get_by_ids([entry.id for entry in all_opportunities])
+
+    assert len(result) == len(all_opportunities)
+    assert len(executed_statements) <= MAX_GET_BY_IDS_QUERIES
@@ -3,7 +3,7 @@ from decimal import Decimal
 import pytest
 from sqlalchemy.orm import Session
 
-from building_blocks.application.exceptions import InvalidData
+from building_blocks.application.exceptions import ConcurrentModification, InvalidData
 from building_blocks.infrastructure.exceptions import ObjectAlreadyExists
 from sales.domain.entities.opportunity import Opportunity
 from sales.domain.value_objects.acquisition_source import AcquisitionSource
@@ -169,6 +169,37 @@ def test_update(opportunity_repo: OpportunitySQLRepository, opportunity: Opportu
 
     fetched_opportunity = opportunity_repo.get(opportunity.id)
     assert fetched_opportunity.source == new_source
+    assert fetched_opportunity.version == 2
+
+
+def test_update_with_stale_version_should_fail(
+    opportunity_repo: OpportunitySQLRepository, opportunity: Opportunity
+) -> None:
+    opportunity_repo.create(opportunity)
+    opportunity_repo.update(opportunity)
+    opportunity.version = 1
+
+    with pytest.raises(ConcurrentModification):
+        opportunity_repo.update(opportunity)
+
+
+def test_has_open_opportunities(opportunity_repo: OpportunitySQLRepository, opportunity: Opportunity) -> None:
+    opportunity_repo.create(opportunity)
+
+    assert opportunity_repo.has_open_opportunities(opportunity.customer_id)
+    assert not opportunity_repo.has_open_opportunities("customer without opportunities")
+
+
+def test_has_open_opportunities_should_ignore_closed_opportunities(
+    opportunity_repo: OpportunitySQLRepository, opportunity: Opportunity
+) -> None:
+    opportunity_repo.create(opportunity)
+    opportunity.update(editor_id=opportunity.owner_id, stage=OpportunityStage(name="closed-won"))
+
+    opportunity_repo.update(opportunity)
+    opportunity_repo.db.flush()
+
+    assert not opportunity_repo.has_open_opportunities(opportunity.customer_id)
 
 
 def test_update_updates_notes(opportunity_repo: OpportunitySQLRepository, opportunity: Opportunity) -> None:
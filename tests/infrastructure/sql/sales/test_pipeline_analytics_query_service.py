@@ -0,0 +1,132 @@
+from collections import Counter
+from collections.abc import Callable, Sequence
+from decimal import Decimal
+from typing import ContextManager
+
+import pytest
+from sqlalchemy.orm import Session
+
+from sales.application.analytics.command import PipelineStatsCommandUseCase
+from sales.application.analytics.query_model import PipelineStatsReadModel
+from sales.application.opportunity.command import OpportunityCommandUseCase
+from sales.application.opportunity.command_model import MoneyCreateUpdateModel, OfferItemCreateUpdateModel
+from sales.application.opportunity.query_model import OpportunityReadModel
+from sales.infrastructure.sql.analytics.query_service import PipelineAnalyticsSQLQueryService
+from sales.infrastructure.sql.opportunity.command import OpportunitySQLUnitOfWork
+from sales.infrastructure.sql.opportunity.query_service import OpportunitySQLQueryService
+
+PipelineStatsByKey = dict[tuple[str | None, str | None, str | None], tuple[Decimal, int]]
+
+
+def get_stats_by_key(stats: Sequence[PipelineStatsReadModel]) -> PipelineStatsByKey:
+    return {(entry.owner_id, entry.stage, entry.currency): (entry.total_amount, entry.items_count) for entry in stats}
+
+
+@pytest.fixture()
+def query_service(session_factory: Callable[[], ContextManager[Session]]) -> PipelineAnalyticsSQLQueryService:
+    return PipelineAnalyticsSQLQueryService(session_factory)
+
+
+@pytest.fixture()
+def expected_totals_by_owner(
+    session_factory: Callable[[], ContextManager[Session]],
+    opportunity_1: OpportunityReadModel,
+    opportunity_2: OpportunityReadModel,
+    opportunity_3: OpportunityReadModel,
+) -> tuple[dict[str, Decimal], Counter[str]]:
+    opportunity_qs = OpportunitySQLQueryService(session_factory)
+    totals: dict[str, Decimal] = {}
+    counts: Counter[str] = Counter()
+    for opportunity in opportunity_qs.get_all():
+        for offer_item in opportunity_qs.get_offer(opportunity.id) or ():
+            totals[opportunity.owner_id] = totals.get(opportunity.owner_id, Decimal()) + offer_item.value.amount
+            counts[opportunity.owner_id] += 1
+    return totals, counts
+
+
+def test_get_pipeline_stats_grouped_by_owner(
+    query_service: PipelineAnalyticsSQLQueryService,
+    expected_totals_by_owner: tuple[dict[str, Decimal], Counter[str]],
+) -> None:
+    expected_totals, expected_counts = expected_totals_by_owner
+
+    stats = query_service.get_pipeline_stats(group_by=["owner"])
+
+    assert {entry.owner_id: entry.total_amount for entry in stats} == expected_totals
+    assert {entry.owner_id: entry.items_count for entry in stats} == expected_counts
+    assert all(entry.stage is None and entry.currency is None for entry in stats)
+
+
+def test_get_pipeline_stats_without_grouping_returns_single_total(
+    query_service: PipelineAnalyticsSQLQueryService,
+    expected_totals_by_owner: tuple[dict[str, Decimal], Counter[str]],
+) -> None:
+    expected_totals, expected_counts = expected_totals_by_owner
+
+    stats = query_service.get_pipeline_stats(group_by=[])
+
+    assert len(stats) == 1
+    assert stats[0].total_amount == sum(expected_totals.values())
+    assert stats[0].items_count == expected_counts.total()
+
+
+@pytest.mark.parametrize("group_by", [[], ["owner"], ["stage", "priority"]])
+@pytest.mark.usefixtures("expected_totals_by_owner")
+def test_get_pipeline_stats_quantizes_totals_to_cents(
+    query_service: PipelineAnalyticsSQLQueryService, group_by: list[str]
+) -> None:
+    stats = query_service.get_pipeline_stats(group_by=group_by)
+
+    assert stats
+    assert all(entry.total_amount.as_tuple().exponent == -2 for entry in stats)
+
+
+def test_get_pipeline_stats_grouped_by_multiple_dimensions(
+    query_service: PipelineAnalyticsSQLQueryService,
+    opportunity_1: OpportunityReadModel,
+) -> None:
+    stats = query_service.get_pipeline_stats(group_by=["stage", "currency"])
+
+    keys = [(entry.stage, entry.currency) for entry in stats]
+    assert len(keys) == len(set(keys))
+    assert (opportunity_1.stage, "USD") in keys
+
+
+def test_update_offer_updates_materialized_stats(
+    query_service: PipelineAnalyticsSQLQueryService,
+    opportunity_command_use_case: OpportunityCommandUseCase,
+    opportunity_1: OpportunityReadModel,
+    offer_item: OfferItemCreateUpdateModel,
+) -> None:
+    group_by = ["owner", "stage", "currency"]
+    key = (opportunity_1.owner_id, opportunity_1.stage, offer_item.value.currency.iso_code)
+    extra_item = OfferItemCreateUpdateModel(
+        product=offer_item.product,
+        value=MoneyCreateUpdateModel(currency=offer_item.value.currency, amount=Decimal("1.01")),
+    )
+    stats_before = get_stats_by_key(query_service.get_pipeline_stats(group_by=group_by))
+
+    opportunity_command_use_case.update_offer(
+        opportunity_id=opportunity_1.id, editor_id=opportunity_1.owner_id, data=[offer_item, extra_item]
+    )
+    stats_after = get_stats_by_key(query_service.get_pipeline_stats(group_by=group_by))
+    opportunity_command_use_case.update_offer(
+        opportunity_id=opportunity_1.id, editor_id=opportunity_1.owner_id, data=[offer_item]
+    )
+
+    amount_before, count_before = stats_before[key]
+    assert stats_after[key] == (amount_before + Decimal("1.01"), count_before + 1)
+    assert get_stats_by_key(query_service.get_pipeline_stats(group_by=group_by)) == stats_before
+
+
+@pytest.mark.usefixtures("opportunity_1", "opportunity_2", "opportunity_3")
+def test_rebuild_does_not_change_incrementally_maintained_stats(
+    query_service: PipelineAnalyticsSQLQueryService,
+    opportunity_uow: OpportunitySQLUnitOfWork,
+) -> None:
+    group_by = ["owner", "stage", "currency"]
+    stats_before = get_stats_by_key(query_service.get_pipeline_stats(group_by=group_by))
+
+    PipelineStatsCommandUseCase(opportunity_uow=opportunity_uow).rebuild()
+
+    assert get_stats_by_key(query_service.get_pipeline_stats(group_by=group_by)) == stats_before
@@ -9,6 +9,8 @@ from sales.infrastructure.sql.sales_representative.query_service import SalesRep
 
 pytestmark = pytest.mark.integration
 
+MAX_GET_BY_IDS_QUERIES = 1
+
 
 @pytest.fixture()
 def all_srs(
@@ -51,3 +53,24 @@ def test_get_should_return_none_if_not_found(
     representative = query_service.get(representative_id="invalid id")
 
     assert representative is None
+
+
+def test_get_by_ids(
+    query_service: SalesRepresentativeSQLQueryService, all_srs: Sequence[SalesRepresentativeReadModel]
+) -> None:
+    ids = [entry.id for entry in all_srs[:2]]
+
+    result = query_service.get_by_ids([*ids, "invalid id"])
+
+    assert {entry.id for entry in result} == set(ids)
+
+
+def test_get_by_ids_loads_relations_in_bounded_number_of_queries(
+    query_service: SalesRepresentativeSQLQueryService,
+    all_srs: Sequence[SalesRepresentativeReadModel],
+    executed_statements: list[str],
+) -> None:
+    result = query_service.get_by_ids([entry.id for entry in all_srs])
+
+    assert len(result) == len(all_srs)
+    assert len(executed_statements) <= MAX_GET_BY_IDS_QUERIES
@@ -9,14 +9,18 @@ from sqlalchemy.orm import Session
 
 from authentication.infrastructure.service.base import UserReadModel
 from authentication.infrastructure.service.firebase import FirebaseAuthenticationService, FirebaseUserReadModel
+from building_blocks.application.cache import TTLCache
+from building_blocks.infrastructure.sql.batching import SQLGroupCommitBatcher
 from building_blocks.infrastructure.sql.vo_service import SQLValueObjectService
-from containers.container import ApplicationContainer
+from building_blocks.presentation.instrumentation import InstrumentationMiddleware
+from containers.container import CUSTOMER_STATUS_CACHE_TTL, ApplicationContainer
 from customer_management.application.acl import OpportunityService, SalesRepresentativeService
 from customer_management.application.command import CustomerCommandUseCase
 from customer_management.application.query_model import CountryReadModel, LanguageReadModel
 from customer_management.infrastructure.sql.customer.command import CustomerSQLUnitOfWork
 from customer_management.infrastructure.sql.customer.models import CountryModel, LanguageModel
 from customer_management.infrastructure.sql.customer.query_service import CustomerSQLQueryService
+from customer_overview.infrastructure.sql.query_service import CustomerOverviewSQLQueryService
 from entrypoints.rest import app as main_app, bind_container
 from sales.application.acl import CustomerService
 from sales.application.lead.command import LeadCommandUseCase
@@ -24,6 +28,9 @@ from sales.application.opportunity.command import OpportunityCommandUseCase
 from sales.application.opportunity.query_model import CurrencyReadModel, ProductReadModel
 from sales.application.sales_representative.command import SalesRepresentativeCommandUseCase
 from sales.application.sales_representative.query_model import SalesRepresentativeReadModel
+from sales.infrastructure.sql.analytics.query_service import PipelineAnalyticsSQLQueryService
+from sales.infrastructure.sql.forecast.command import ExchangeRateSQLUnitOfWork
+from sales.infrastructure.sql.forecast.query_service import ForecastSQLQueryService
 from sales.infrastructure.sql.lead.command import LeadSQLUnitOfWork
 from sales.infrastructure.sql.lead.query_service import LeadSQLQueryService
 from sales.infrastructure.sql.opportunity.command import OpportunitySQLUnitOfWork
@@ -39,19 +46,28 @@ class TestingContainer(ApplicationContainer):
         self._auth_service.verify_token.return_value = FirebaseUserReadModel.from_token_data(user_data)
         self._auth_service.has_role.return_value = False
 
-        self._customer_uow = CustomerSQLUnitOfWork(session_factory)
-        self._lead_uow = LeadSQLUnitOfWork(session_factory)
-        self._opportunity_uow = OpportunitySQLUnitOfWork(session_factory)
-        self._sr_uow = SalesRepresentativeSQLUnitOfWork(session_factory)
+        self._customer_uow = CustomerSQLUnitOfWork(session_factory, write_lock=True)
+        self._lead_uow = LeadSQLUnitOfWork(session_factory, write_lock=True)
+        self._opportunity_uow = OpportunitySQLUnitOfWork(session_factory, write_lock=True)
+        self._sr_uow = SalesRepresentativeSQLUnitOfWork(session_factory, write_lock=True)
+        self._exchange_rate_uow = ExchangeRateSQLUnitOfWork(session_factory, write_lock=True)
 
-        self._customer_service = CustomerService(customer_uow=self._customer_uow)
-        self._sr_service = SalesRepresentativeService(salesman_uow=self._sr_uow)
-        self._opportunity_service = OpportunityService(opportunity_uow=self._opportunity_uow)
+        # the ACL services only read, so their units of work do not take the SQLite write lock
+        self._customer_status_cache = TTLCache(ttl=CUSTOMER_STATUS_CACHE_TTL)
+        self._customer_service = CustomerService(
+            customer_uow=CustomerSQLUnitOfWork(session_factory), status_cache=self._customer_status_cache
+        )
+        self._sr_service = SalesRepresentativeService(salesman_uow=SalesRepresentativeSQLUnitOfWork(session_factory))
+        self._opportunity_service = OpportunityService(opportunity_uow=OpportunitySQLUnitOfWork(session_factory))
+        self._command_batcher = SQLGroupCommitBatcher(session_factory, window=0.001)
 
         self._customer_qs = CustomerSQLQueryService(session_factory)
         self._lead_qs = LeadSQLQueryService(session_factory)
         self._opportunity_qs = OpportunitySQLQueryService(session_factory)
         self._sr_qs = SalesRepresentativeSQLQueryService(session_factory)
+        self._analytics_qs = PipelineAnalyticsSQLQueryService(session_factory)
+        self._forecast_qs = ForecastSQLQueryService(session_factory)
+        self._customer_overview_qs = CustomerOverviewSQLQueryService(session_factory)
 
         self.language_vo_service = SQLValueObjectService(
             session_factory=session_factory, model=LanguageModel, read_model=LanguageReadModel
@@ -136,6 +152,7 @@ def set_user_admin(mock_auth_service: MagicMock) -> Iterator[None]:
 @pytest.fixture(scope="session")
 def client(testing_container: ApplicationContainer, auth_headers: dict) -> Iterator[TestClient]:
     app = FastAPI()
+    app.add_middleware(InstrumentationMiddleware)
     app.include_router(main_app.router)
     bind_container(app, testing_container)
 
@@ -1,8 +1,11 @@
+import json
+
 import pytest
 from fastapi import status
 from fastapi.testclient import TestClient
 
-from customer_management.application.command import CustomerCommandUseCase
+from building_blocks.application.filters import MAX_LOOKUP_IDS
+from customer_management.application.command import IMPORT_BATCH_SIZE, CustomerCommandUseCase
 from customer_management.application.command_model import (
     CompanyInfoCreateUpdateModel,
     ContactMethodCreateUpdateModel,
@@ -80,6 +83,26 @@ def test_get_customers_without_filters(client: TestClient) -> None:
     assert len(result) == 7
 
 
+def test_get_customers_by_ids(
+    client: TestClient,
+    api_customer_without_contact_persons: CustomerReadModel,
+    api_customer_with_contact_persons: CustomerReadModel,
+) -> None:
+    ids = [api_customer_without_contact_persons.id, api_customer_with_contact_persons.id]
+    r = client.get(f"/customers?ids={','.join(ids)}")
+    result = r.json()
+
+    assert r.status_code == status.HTTP_200_OK
+    assert {entry.get("id") for entry in result} == set(ids)
+
+
+def test_get_customers_by_too_many_ids_should_fail(client: TestClient) -> None:
+    ids = [f"id_{i}" for i in range(MAX_LOOKUP_IDS + 1)]
+    r = client.get(f"/customers?ids={','.join(ids)}")
+
+    assert r.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
 def test_get_customers_with_filters(client: TestClient, customer_2: CustomerReadModel) -> None:
     query_params = {
         "relation_manager_id": customer_2.relation_manager_id,
@@ -145,6 +168,137 @@ def test_create_customer_with_invalid_data_should_fail(client: TestClient) -> No
     assert r.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
 
+@pytest.mark.usefixtures("set_user_admin")
+def test_import_customers_reports_invalid_rows(
+    client: TestClient, representative_3: SalesRepresentativeReadModel, country: Country
+) -> None:
+    header = (
+        "relation_manager_id,company_info.name,company_info.industry,company_info.size,company_info.legal_form,"
+        "company_info.address.street,company_info.address.street_no,company_info.address.postal_code,"
+        "company_info.address.city,company_info.address.country.code,company_info.address.country.name"
+    )
+    address = f"Testowa,1,11-222,Testowo,{country.code},{country.name}"
+    content = "\n".join(
+        [
+            header,
+            f"invalid id,Company Ltd.,automotive,medium,limited,{address}",
+            f"{representative_3.id},Company Ltd.,invalid,medium,limited,{address}",
+        ]
+    )
+
+    r = client.post("/customers/import", files={"file": ("customers.csv", content, "text/csv")})
+    result = r.json()
+
+    assert r.status_code == status.HTTP_200_OK
+    assert result.get("imported_count") == 0
+    assert [error.get("row") for error in result.get("errors")] == [1, 2]
+    assert "Relation manager" in result.get("errors")[0].get("detail")
+
+
+@pytest.mark.usefixtures("set_user_admin")
+def test_import_customers_reports_contact_methods_already_in_database(
+    client: TestClient, representative_3: SalesRepresentativeReadModel, country: Country, language: Language
+) -> None:
+    contact_person = {
+        "first_name": "Jan",
+        "last_name": "Kowalski",
+        "job_title": "CEO",
+        "preferred_language": {"code": language.code, "name": language.name},
+        "contact_methods": [{"type": "email", "value": "import.duplicate@example.com", "is_preferred": True}],
+    }
+    records = [
+        {
+            "relation_manager_id": representative_3.id,
+            "company_info": {
+                "name": "Company Ltd.",
+                "industry": "automotive",
+                "size": "medium",
+                "legal_form": "limited",
+                "address": {
+                    "street": "Testowa",
+                    "street_no": "1",
+                    "postal_code": "11-222",
+                    "city": "Testowo",
+                    "country": {"code": country.code, "name": country.name},
+                },
+            },
+            "contact_persons": contact_persons,
+        }
+        for contact_persons in ([], [contact_person])
+    ]
+    content = "\n".join(json.dumps(record) for record in records)
+
+    first = client.post("/customers/import", files={"file": ("customers.jsonl", content, "application/jsonl")})
+    second = client.post("/customers/import", files={"file": ("customers.jsonl", content, "application/jsonl")})
+
+    assert first.json().get("imported_count") == 2
+    assert second.status_code == status.HTTP_200_OK
+    assert second.json().get("imported_count") == 1
+    assert [error.get("row") for error in second.json().get("errors")] == [2]
+    assert "already used" in second.json().get("errors")[0].get("detail")
+
+
+@pytest.mark.usefixtures("set_user_admin")
+def test_import_customers_with_malformed_file_should_fail(client: TestClient) -> None:
+    r = client.post("/customers/import", files={"file": ("customers.jsonl", "{not json", "application/jsonl")})
+
+    assert r.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.usefixtures("set_user_admin")
+def test_import_customers_with_file_malformed_after_first_batch_should_not_import_anything(
+    client: TestClient, representative_3: SalesRepresentativeReadModel, country: Country
+) -> None:
+    record = {
+        "relation_manager_id": representative_3.id,
+        "company_info": {
+            "name": "Malformed Import Ltd.",
+            "industry": "automotive",
+            "size": "medium",
+            "legal_form": "limited",
+            "address": {
+                "street": "Testowa",
+                "street_no": "1",
+                "postal_code": "11-222",
+                "city": "Testowo",
+                "country": {"code": country.code, "name": country.name},
+            },
+        },
+    }
+    content = "\n".join([*(json.dumps(record) for _ in range(IMPORT_BATCH_SIZE + 1)), "{not json"])
+
+    r = client.post("/customers/import", files={"file": ("customers.jsonl", content, "application/jsonl")})
+
+    assert r.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert client.get("/customers/", params={"company_name": "Malformed Import Ltd."}).json() == []
+
+
+def test_import_customers_by_non_admin_should_fail(client: TestClient) -> None:
+    r = client.post("/customers/import", files={"file": ("customers.csv", "", "text/csv")})
+
+    assert r.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.usefixtures("set_user_admin")
+def test_reassign_relation_manager(client: TestClient, representative_1: SalesRepresentativeReadModel) -> None:
+    data = {"current_relation_manager_id": "salesman without customers", "new_relation_manager_id": representative_1.id}
+
+    r = client.post("/customers/reassign", json=data)
+    result = r.json()
+
+    assert r.status_code == status.HTTP_200_OK
+    assert result.get("reassigned_count") == 0
+
+
+@pytest.mark.usefixtures("set_user_admin")
+def test_reassign_relation_manager_with_invalid_data_should_fail(client: TestClient) -> None:
+    data = {"current_relation_manager_id": "salesman without customers", "new_relation_manager_id": "invalid"}
+
+    r = client.post("/customers/reassign", json=data)
+
+    assert r.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
 @pytest.mark.usefixtures("change_user_salesman_id")
 def test_update_customer(
     client: TestClient,
@@ -202,6 +356,7 @@ def test_get_customer(client: TestClient, customer_1: CustomerReadModel) -> None
 
     assert r.status_code == status.HTTP_200_OK
     assert result.get("id") == customer_1.id
+    assert r.headers["ETag"] == f'"{result.get("version")}"'
 
 
 def test_get_customer_with_invalid_id_should_fail(client: TestClient) -> None:
@@ -210,6 +365,19 @@ def test_get_customer_with_invalid_id_should_fail(client: TestClient) -> None:
     assert r.status_code == status.HTTP_404_NOT_FOUND
 
 
+@pytest.mark.usefixtures("change_user_salesman_id")
+def test_update_customer_with_stale_etag_should_fail(
+    client: TestClient, api_customer_without_contact_persons: CustomerReadModel
+) -> None:
+    customer_url = f"/customers/{api_customer_without_contact_persons.id}"
+    etag = client.get(customer_url).headers["ETag"]
+    client.put(customer_url, json={})
+
+    r = client.put(customer_url, json={}, headers={"If-Match": etag})
+
+    assert r.status_code == status.HTTP_409_CONFLICT
+
+
 @pytest.mark.usefixtures("change_user_salesman_id")
 def test_convert_customer(client: TestClient, api_customer_with_contact_persons: CustomerReadModel) -> None:
     r = client.post(f"/customers/{api_customer_with_contact_persons.id}/convert")
@@ -399,6 +567,24 @@ def test_update_customers_contact_person(
     assert r.status_code == status.HTTP_200_OK
     assert result.get("first_name") == data["first_name"]
     assert result.get("last_name") == data["last_name"]
+    assert r.headers["ETag"] == client.get(f"/customers/{api_customer_with_contact_persons.id}").headers["ETag"]
+
+
+@pytest.mark.usefixtures("change_user_salesman_id")
+def test_update_customers_contact_person_with_stale_etag_should_fail(
+    client: TestClient, api_customer_with_contact_persons: CustomerReadModel, api_contact_person: ContactPersonReadModel
+) -> None:
+    customer_url = f"/customers/{api_customer_with_contact_persons.id}"
+    etag = client.get(customer_url).headers["ETag"]
+    client.put(customer_url, json={})
+
+    r = client.put(
+        f"{customer_url}/contact-persons/{api_contact_person.id}",
+        json={"first_name": "Jan"},
+        headers={"If-Match": etag},
+    )
+
+    assert r.status_code == status.HTTP_409_CONFLICT
 
 
 def test_update_customers_contact_person_by_non_relation_manager_should_fail(
@@ -0,0 +1,25 @@
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from customer_management.application.query_model import CustomerReadModel
+from sales.application.opportunity.query_model import OpportunityReadModel
+
+pytestmark = pytest.mark.integration
+
+
+def test_get_customer_overview(
+    client: TestClient, customer_1: CustomerReadModel, opportunity_1: OpportunityReadModel
+) -> None:
+    r = client.get(f"/customers/{customer_1.id}/overview")
+    result = r.json()
+
+    assert r.status_code == status.HTTP_200_OK
+    assert result.get("customer").get("id") == customer_1.id
+    assert opportunity_1.id in {opportunity.get("id") for opportunity in result.get("opportunities")}
+
+
+def test_get_non_existent_customer_overview_should_fail(client: TestClient) -> None:
+    r = client.get("/customers/invalid_id/overview")
+
+    assert r.status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,40 @@
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from sales.application.opportunity.query_model import OpportunityReadModel
+
+pytestmark = pytest.mark.integration
+
+
+@pytest.mark.usefixtures("opportunity_1", "opportunity_2", "opportunity_3")
+def test_get_pipeline_stats(client: TestClient, opportunity_1: OpportunityReadModel) -> None:
+    r = client.get("/analytics/pipeline?group_by=owner&group_by=stage")
+    result = r.json()
+
+    assert r.status_code == status.HTTP_200_OK
+    owners = {entry.get("owner_id") for entry in result}
+    assert opportunity_1.owner_id in owners
+    assert all(entry.get("currency") is None for entry in result)
+
+
+def test_get_pipeline_stats_with_invalid_dimension_should_fail(client: TestClient) -> None:
+    r = client.get("/analytics/pipeline?group_by=invalid")
+
+    assert r.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+def test_rebuild_pipeline_stats_by_non_admin_should_fail(client: TestClient) -> None:
+    r = client.post("/analytics/pipeline/rebuild")
+
+    assert r.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.usefixtures("set_user_admin")
+def test_rebuild_pipeline_stats(client: TestClient, opportunity_1: OpportunityReadModel) -> None:
+    r = client.post("/analytics/pipeline/rebuild")
+    result = r.json()
+
+    assert r.status_code == status.HTTP_200_OK
+    assert opportunity_1.owner_id in {entry.get("owner_id") for entry in result}
+    assert all(entry.get("priority") is None for entry in result)
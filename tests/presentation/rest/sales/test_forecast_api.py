@@ -0,0 +1,43 @@
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from sales.application.opportunity.query_model import OpportunityReadModel
+
+pytestmark = pytest.mark.integration
+
+
+def test_set_exchange_rates_by_non_admin_should_fail(client: TestClient) -> None:
+    r = client.put("/forecast/exchange-rates", json=[{"iso_code": "USD", "rate": "4.00"}])
+
+    assert r.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.usefixtures("set_user_admin")
+def test_set_exchange_rates(client: TestClient) -> None:
+    r = client.put("/forecast/exchange-rates", json=[{"iso_code": "usd", "rate": "4.00"}])
+    result = r.json()
+
+    assert r.status_code == status.HTTP_200_OK
+    assert [entry.get("iso_code") for entry in result] == ["USD"]
+    assert [entry.get("iso_code") for entry in client.get("/forecast/exchange-rates").json()] == ["USD"]
+
+
+@pytest.mark.usefixtures("set_user_admin")
+def test_get_forecast(client: TestClient, opportunity_1: OpportunityReadModel) -> None:
+    rates = [{"iso_code": "USD", "rate": "4.00"}, {"iso_code": "PLN", "rate": "1.00"}]
+    client.put("/forecast/exchange-rates", json=rates)
+
+    r = client.get("/forecast/?currency=PLN")
+    result = r.json()
+
+    assert r.status_code == status.HTTP_200_OK
+    assert opportunity_1.owner_id in {entry.get("owner_id") for entry in result}
+    assert all(entry.get("currency") == "PLN" for entry in result)
+
+
+@pytest.mark.usefixtures("opportunity_1")
+def test_get_forecast_without_exchange_rate_should_fail(client: TestClient) -> None:
+    r = client.get("/forecast/?currency=XYZ")
+
+    assert r.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
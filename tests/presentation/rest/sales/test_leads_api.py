@@ -119,6 +119,28 @@ def test_create_lead_with_invalid_data_should_fail(client: TestClient) -> None:
     assert r.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
 
+@pytest.mark.usefixtures("change_user_salesman_id")
+def test_import_leads_reports_invalid_rows(
+    client: TestClient, customer_1: CustomerReadModel, lead_1: LeadReadModel
+) -> None:
+    content = "\n".join(
+        [
+            "customer_id,source,first_name,last_name,phone,email",
+            f"{customer_1.id},website,Jan,Kowalski,,jan@example.com",
+            f"{lead_1.customer_id},website,Jan,Kowalski,,jan@example.com",
+            "invalid id,website,Jan,Kowalski,,jan@example.com",
+            f"{customer_1.id},website,Jan,Kowalski,,invalid",
+        ]
+    )
+
+    r = client.post("/leads/import", files={"file": ("leads.csv", content, "text/csv")})
+    result = r.json()
+
+    assert r.status_code == status.HTTP_200_OK
+    assert result.get("imported_count") == 0
+    assert [error.get("row") for error in result.get("errors")] == [1, 2, 3, 4]
+
+
 @pytest.mark.usefixtures("change_user_salesman_id")
 def test_update_lead(client: TestClient, lead_1: LeadReadModel) -> None:
     data = {
@@ -160,6 +182,34 @@ def test_update_lead_with_invalid_data_should_fail(client: TestClient, lead_1: L
     assert r.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
 
+@pytest.mark.usefixtures("change_user_salesman_id")
+def test_update_lead_with_matching_etag(client: TestClient, lead_1: LeadReadModel) -> None:
+    etag = client.get(f"/leads/{lead_1.id}").headers["ETag"]
+
+    r = client.put(f"/leads/{lead_1.id}", json={}, headers={"If-Match": etag})
+
+    assert r.status_code == status.HTTP_200_OK
+    assert r.headers["ETag"] == f'"{r.json().get("version")}"'
+    assert r.headers["ETag"] != etag
+
+
+@pytest.mark.usefixtures("change_user_salesman_id")
+def test_update_lead_with_stale_etag_should_fail(client: TestClient, lead_1: LeadReadModel) -> None:
+    etag = client.get(f"/leads/{lead_1.id}").headers["ETag"]
+    client.put(f"/leads/{lead_1.id}", json={})
+
+    r = client.put(f"/leads/{lead_1.id}", json={}, headers={"If-Match": etag})
+
+    assert r.status_code == status.HTTP_409_CONFLICT
+
+
+@pytest.mark.usefixtures("change_user_salesman_id")
+def test_update_lead_with_malformed_etag_should_fail(client: TestClient, lead_1: LeadReadModel) -> None:
+    r = client.put(f"/leads/{lead_1.id}", json={}, headers={"If-Match": "invalid"})
+
+    assert r.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
 @pytest.mark.usefixtures("change_user_salesman_id")
 def test_assign_lead(client: TestClient, lead_2: LeadReadModel, representative_1: SalesRepresentativeReadModel) -> None:
     r = client.post(f"/leads/{lead_2.id}/assignments", json={"new_salesman_id": representative_1.id})
@@ -242,3 +292,31 @@ def test_calling_leads_endpoints_by_guest_should_fail(client: TestClient, url: s
     r = getattr(client, method)(url, headers={"Authorization": ""})
 
     assert r.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.usefixtures("set_user_admin")
+def test_reassign_leads(client: TestClient, representative_1: SalesRepresentativeReadModel) -> None:
+    data = {"current_salesman_id": "salesman without leads", "new_salesman_id": representative_1.id}
+
+    r = client.post("/leads/reassign", json=data)
+    result = r.json()
+
+    assert r.status_code == status.HTTP_200_OK
+    assert result.get("reassigned_count") == 0
+
+
+@pytest.mark.usefixtures("set_user_admin")
+def test_reassign_leads_to_the_same_salesman_should_fail(
+    client: TestClient, representative_1: SalesRepresentativeReadModel
+) -> None:
+    data = {"current_salesman_id": representative_1.id, "new_salesman_id": representative_1.id}
+
+    r = client.post("/leads/reassign", json=data)
+
+    assert r.status_code == status.HTTP_409_CONFLICT
+
+
+def test_reassign_leads_by_non_admin_should_fail(client: TestClient) -> None:
+    r = client.post("/leads/reassign", json={"current_salesman_id": "a", "new_salesman_id": "b"})
+
+    assert r.status_code == status.HTTP_403_FORBIDDEN
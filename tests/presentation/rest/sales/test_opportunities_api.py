@@ -35,6 +35,16 @@ def test_get_opportunities_with_filters(client: TestClient, opportunity_1: Oppor
     assert result[0].get("id") == opportunity_1.id
 
 
+def test_get_opportunities_by_ids(
+    client: TestClient, opportunity_1: OpportunityReadModel, opportunity_2: OpportunityReadModel
+) -> None:
+    r = client.get(f"/opportunities?ids={opportunity_1.id},{opportunity_2.id},invalid_id")
+    result = r.json()
+
+    assert r.status_code == status.HTTP_200_OK
+    assert {entry.get("id") for entry in result} == {opportunity_1.id, opportunity_2.id}
+
+
 def test_get_opportunity(client: TestClient, opportunity_1: OpportunityReadModel) -> None:
     r = client.get(f"/opportunities/{opportunity_1.id}")
     result = r.json()
@@ -143,6 +153,18 @@ def test_update_opportunity(client: TestClient, opportunity_1: OpportunityReadMo
     assert result.get("stage") == data["stage"]
 
 
+@pytest.mark.usefixtures("change_user_salesman_id")
+def test_update_opportunity_with_stale_etag_should_fail(
+    client: TestClient, opportunity_1: OpportunityReadModel
+) -> None:
+    etag = client.get(f"/opportunities/{opportunity_1.id}").headers["ETag"]
+    client.put(f"/opportunities/{opportunity_1.id}", json={})
+
+    r = client.put(f"/opportunities/{opportunity_1.id}", json={}, headers={"If-Match": etag})
+
+    assert r.status_code == status.HTTP_409_CONFLICT
+
+
 def test_update_opportunity_with_invalid_id_should_fail(client: TestClient) -> None:
     r = client.put("/opportunities/invalid", json={})
 
@@ -184,6 +206,19 @@ def test_update_opportunity_offer(
     assert len(result) == 1
     assert fetched_product.get("name") == product_2.name
     assert fetched_value.get("amount") == data[0]["value"]["amount"]
+    assert r.headers["ETag"] == client.get(f"/opportunities/{opportunity_1.id}").headers["ETag"]
+
+
+@pytest.mark.usefixtures("change_user_salesman_id")
+def test_update_opportunity_offer_with_stale_etag_should_fail(
+    client: TestClient, opportunity_1: OpportunityReadModel
+) -> None:
+    etag = client.get(f"/opportunities/{opportunity_1.id}").headers["ETag"]
+    client.put(f"/opportunities/{opportunity_1.id}", json={})
+
+    r = client.put(f"/opportunities/{opportunity_1.id}/offer-items", json=[], headers={"If-Match": etag})
+
+    assert r.status_code == status.HTTP_409_CONFLICT
 
 
 def test_update_opportunity_offer_with_invalid_id_should_fail(client: TestClient) -> None:
@@ -0,0 +1,62 @@
+from collections.abc import Iterator
+
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from building_blocks.application.instrumentation import request_histogram
+from building_blocks.application.tracing import tracer
+from tests.application.building_blocks.test_tracing import InMemorySpanExporter
+
+pytestmark = pytest.mark.integration
+
+
+def test_response_has_server_timing_header(client: TestClient) -> None:
+    r = client.get("/customers")
+    server_timing = r.headers["Server-Timing"]
+
+    assert r.status_code == status.HTTP_200_OK
+    assert server_timing.startswith("total;dur=")
+    assert "auth;dur=" in server_timing
+    assert "sql;dur=" in server_timing
+    assert "CustomerQueryUseCase." in server_timing
+
+
+def test_request_latency_is_recorded_per_route(client: TestClient) -> None:
+    client.get("/auth/users/me")
+
+    snapshot = request_histogram.snapshot()
+
+    assert snapshot["GET /auth/users/me"].count >= 1
+
+
+def test_metrics_are_exposed_in_prometheus_format(client: TestClient) -> None:
+    client.get("/customers/")
+
+    r = client.get("/metrics")
+
+    assert r.status_code == status.HTTP_200_OK
+    assert r.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "# TYPE http_request_duration_seconds histogram" in r.text
+    assert 'http_request_duration_seconds_count{method="GET",route="/customers/"}' in r.text
+    assert "sql_pool_checkout_wait_seconds_count" in r.text
+    assert 'cache_hits_total{cache="customer_status"}' in r.text
+    assert "sqlite_write_lock_acquisitions_total" in r.text
+
+
+@pytest.fixture()
+def exporter() -> Iterator[InMemorySpanExporter]:
+    exporter = InMemorySpanExporter()
+    tracer.configure(exporter)
+    yield exporter
+    tracer.configure(None)
+
+
+def test_request_is_traced_from_router_to_use_case(client: TestClient, exporter: InMemorySpanExporter) -> None:
+    client.get("/customers/")
+
+    spans = {span.name: span for span in exporter.spans}
+    root = spans["GET /customers/"]
+    assert root.parent_id is None
+    assert spans["CustomerQueryUseCase.get_filtered"].parent_id == root.span_id
+    assert spans["CustomerQueryUseCase.get_filtered"].trace_id == root.trace_id
@@ -0,0 +1,40 @@
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pytest_mock import MockerFixture
+
+from entrypoints.rest import lifespan
+
+
+@pytest.fixture()
+def container(mocker: MockerFixture) -> MagicMock:
+    container = MagicMock()
+    mocker.patch("entrypoints.rest.ContainerManager.build", return_value=container)
+    return container
+
+
+@pytest.fixture()
+def app() -> FastAPI:
+    return FastAPI(lifespan=lifespan)
+
+
+def test_container_is_built_on_startup(app: FastAPI, container: MagicMock) -> None:
+    assert not hasattr(app.state, "container")
+
+    with TestClient(app):
+        assert app.state.container is container
+
+    container.warm_up.assert_not_called()
+
+
+def test_container_is_warmed_up_on_startup_when_enabled(
+    app: FastAPI, container: MagicMock, mocker: MockerFixture, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("PREWARM_ON_STARTUP", "true")
+    openapi = mocker.spy(app, "openapi")
+
+    with TestClient(app):
+        container.warm_up.assert_called_once_with()
+        openapi.assert_called_once_with()